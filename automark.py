@@ -20,17 +20,19 @@ process.
 """
 
 import os
+import random
 import re
+import threading
 
-from time import sleep
+from hashlib import sha1
 
 from comments import check_comment_quality
+from backends import create_backend
 from execcode import ExecCode
 from variables import check_variable_name_quality
 from indentation import check_indentation
-from srctransform import load_source
+from srctransform import combine_sources, load_source, parse_source
 
-from SOAPpy import WSDL
 
 __all__ = ('Automark')
 
@@ -53,17 +55,76 @@ class Automark(object):
     """
     OUTPUT_CHECKS = 0
 
-    def __init__(self, filename, credentials_file, build_dir):
+    """
+    INPUT_FILES and OUTPUT_FILES list any files in the build folder that the 
+    program reads from or writes to, in addition to stdin and stdout. These 
+    are used to decide whether a cached execution can be replayed.
+    """
+    INPUT_FILES = []
+    OUTPUT_FILES = []
+
+    """
+    If seed is set, the random inputs generated for each program depend only 
+    on the seed and the program, so that marking the same program again 
+    produces the same inputs. This allows previous executions to be replayed 
+    from the execution cache.
+    """
+    seed = None
+
+    """
+    If sandboxes is set to a SandboxPool, each marking uses a build folder 
+    of its own from the pool rather than the build folder provided, so that 
+    several markings can safely happen at the same time.
+    """
+    sandboxes = None
+
+    """
+    The name of the backend used to compile and execute the code (see 
+    backends.py). The local backend starts javac and java for each program.
+    """
+    backend = 'local'
+
+    """
+    How long to wait for a submission to complete, as a multiple of the 
+    CPU time limit for executing it. This allows for the code being compiled 
+    and for the submission being queued behind others.
+    """
+    wait_time_factor = 30
+
+    # Inputs are generated using the shared random number generator, so 
+    # only one marking can generate them at a time
+    _inputs_lock = threading.Lock()
+
+    def __init__(
+            self, filename, credentials_file, build_dir, artifacts=None, 
+            source=None, program_tree=None, companions=None):
         """
         Initialise the Automark class.
         
+        Marking happens in two phases. In the collection phase the code is 
+        loaded, then compiled and executed with generated inputs. In the 
+        scoring phase the results are checked and marks assigned. If 
+        artifacts from a previous marking (see get_artifacts()) are 
+        provided, the collection phase is skipped and the code is scored 
+        using them instead.
+        
         Attributes:
             filename: The Java source file to mark.
             credentials_file: File containing username and password on 
                 separate lines. The contents are ignored if the execution is 
                 to be done locally. If using Sphere Engine, these should be 
                 ideone credentials.
-            build_dir: Temporary folder to store build and execution files.
+            build_dir: Temporary folder to store build and execution files. 
+                This isn't used if sandboxes have been set up.
+            artifacts: Artifacts collected from a previous marking of the 
+                code (optional).
+            source: The contents of the Java source file, if they've already 
+                been read, for example from a zip archive (optional).
+            program_tree: The AST for the Java source file, if it's already 
+                been parsed (optional).
+            companions: The other files of a multi-file submission, which 
+                are compiled along with the file, as a list of [program, 
+                program_tree] pairs (optional).
         """
         # Read in the credentials from file
         with open(credentials_file) as file:
@@ -72,11 +133,11 @@ class Automark(object):
 
         self._score = 0
         self._filename = filename
+        self._source = source
+        self._program_tree = program_tree
+        self._companions = companions or []
         self._classname = os.path.splitext(os.path.split(filename)[1])[0]
 
-        # Load in the program file
-        self._program_structure = load_source(filename)
-
         # Initialise the inputs
         self._stdin = ''
         self._execution_comments = ''
@@ -105,13 +166,44 @@ class Automark(object):
         self._build_dir = build_dir
         self._extra_program_input = []
         self._extra_program_output = []
+        self._execution = None
+
+        if Automark.sandboxes == None:
+            self._collect_and_score(filename, artifacts)
+        else:
+            # Mark in an isolated build folder
+            self._build_dir = Automark.sandboxes.acquire()
+            try:
+                self._collect_and_score(filename, artifacts)
+            finally:
+                Automark.sandboxes.release(self._build_dir)
+                self._build_dir = build_dir
+        
+        print 'Final score: {:g}\n'.format(self.get_total_score())
+
+    def _collect_and_score(self, filename, artifacts):
+        """
+        For internal use, collect the artifacts needed for marking the code 
+        if they weren't provided, then score the code.
+        """
+        if artifacts == None:
+            # Load in the program file and collect the execution results
+            self._program_structure = load_source(
+                filename, self._source, self._program_tree)
+            program_structure = self._program_structure
+            companions = self._companions
+            self._execution = self.execute_program()
+            # Setting up the inputs may have transformed the program, but 
+            # the remaining checks are performed on the submitted program
+            self._program_structure = program_structure
+            self._companions = companions
+        else:
+            self.restore_artifacts(artifacts)
 
         self._comment_score = self.check_comment_quality()
         self._variables_score = self.check_variable_name_quality()
         self._indentation_score = self.check_indentation()
         self._execution_score = self.check_execution()
-        
-        print 'Final score: {:g}\n'.format(self.get_total_score())
 
     def setup_inputs(self):
         """
@@ -124,6 +216,24 @@ class Automark(object):
         stdin = ""
         return [stdin]
 
+    def transform_programs(self, transform):
+        """
+        Transform the code of the program and of the other files of a 
+        multi-file submission before they're executed. For example, tasks 
+        use this to change the files the code reads and writes, so that 
+        they can control them.
+        
+        Args:
+            transform: Function taking the code of a file and its AST (which 
+                is None if it couldn't be parsed), and returning the 
+                transformed code.
+        """
+        self._program_structure = self._program_structure._replace(
+            program = transform(self._program_structure.program, 
+            self._program_structure.program_tree))
+        self._companions = [[transform(companion, tree), tree] 
+            for companion, tree in self._companions]
+
     def check_output_correctness(self, output, inputs):
         """
         Checks whether outputs generated conform to the task requirements.
@@ -243,6 +353,41 @@ class Automark(object):
         """
         return self._execution_score
 
+    def get_artifacts(self):
+        """
+        Return the raw artifacts collected while marking the code.
+        
+        The artifacts include the program structure, the generated inputs 
+        and the results of the execution. They can be passed in when 
+        creating a new instance to score the code again (for example, with 
+        different thresholds) without having to execute it.
+        """
+        artifacts = {'program_structure': self._program_structure, 
+            'inputs': self._inputs, 'stdin': self._stdin, 
+            'extra_program_input': self._extra_program_input, 
+            'execution': self._execution}
+        return artifacts
+
+    def restore_artifacts(self, artifacts):
+        """
+        Restore the artifacts returned by get_artifacts(), ready for the 
+        code to be scored again.
+        
+        A task that keeps any other state generated while setting up the 
+        inputs, which is needed for scoring, should override both this and 
+        get_artifacts() to include it.
+        """
+        self._program_structure = artifacts['program_structure']
+        if self._program_structure.program_tree == None:
+            # The AST is left out of artifacts too deeply nested to save
+            self._program_structure = self._program_structure._replace(
+                program_tree=parse_source(self._filename, 
+                self._program_structure.full_program)[1])
+        self._inputs = artifacts['inputs']
+        self._stdin = artifacts['stdin']
+        self._extra_program_input = artifacts['extra_program_input']
+        self._execution = artifacts['execution']
+
     def get_extra_program_inputs(self):
         """
         Return the extra program inputs that were needed, beyond stdin.
@@ -398,6 +543,14 @@ class Automark(object):
         """
         return Automark.clean_text(self._program_output)
         
+    def get_output_truncated(self):
+        """
+        Return True if the program generated too much output, so only the 
+        start and end of the output were kept.
+        """
+        return (self._execution != None) and self._execution.get(
+            'truncated', False)
+
     def get_execution_comments(self):
         """
         Return human-readable comments generated by the marking process.
@@ -441,29 +594,36 @@ class Automark(object):
         return unicode(s, getpreferredencoding(), "replace").encode(
             'ascii', 'replace')
 
-    def check_execution(self):
+    @staticmethod
+    def get_wait_time_limit():
         """
-        Generate inputs, execute code, check outputs and assign marks.
-        
-        Perform the actual process of marking some code. The full process 
-        involves generating any inputs, compiling and executing the code, 
-        checking any outputs, then calculating a mark as a result.
-        Other factors including checking indentation quality, variable 
-        quality and comment quality are also performed.
+        Return how long to wait for a submission to complete, in seconds, 
+        before giving up on it.
+        """
+        cpu_limit = ExecCode.cpu_limit
+        if cpu_limit == None:
+            cpu_limit = 10
+        return cpu_limit * Automark.wait_time_factor
+
+    def execute_program(self):
+        """
+        Generate inputs, then compile and execute the code.
         
-        Although it can be, in general it's not expected that this method 
-        should need to be overriden, since replicating the it requires 
-        lots of work. Instead, the other methods (e.g. check_indentation(), 
-        setup_inputs() etc.) should be overriden instead. This method 
-        calls all of them to do the marking calculations.
+        This is the collection phase of the marking process. The inputs are 
+        stored and the raw results of the execution are returned, ready to 
+        be scored by check_execution(). Any files listed in OUTPUT_FILES are 
+        collected from the build folder as part of the results.
         
-        Returns the resulting mark from performing all of these operations.
+        Returns a dictionary containing the error status, result code, time, 
+        memory, stdout, stderr and compiler output of the execution, and 
+        a dictionary mapping output filenames to their contents.
         """
-        execution_score = 0
-        #return execution_score
-        # Creating wsdl client
-        #wsdl_object = WSDL.Proxy('http://ideone.com/api/1/service.wsdl')
-        wsdl_object = ExecCode(self._build_dir, self._classname)
+        execution = {'error': 'OK', 'result': 0, 'time': 0.0, 'memory': 0, 
+            'output': '', 'stderr': '', 'cmpinfo': '', 'truncated': False, 
+            'files': {}}
+        # Create the backend client
+        wsdl_object = create_backend(Automark.backend, self._build_dir, 
+            self._classname, self.INPUT_FILES, self.OUTPUT_FILES)
 
         # Check the available languages
         #response = wsdl_object.getLanguages(self._user, self._password);
@@ -474,60 +634,113 @@ class Automark(object):
         #        {'value': 'C++11 (gcc-4.8.1)', 'key': 44}
 
         # Choose random input variables
-        self._inputs = self.setup_inputs()
+        with Automark._inputs_lock:
+            if Automark.seed != None:
+                program = self._program_structure.program
+                if isinstance(program, unicode):
+                    program = program.encode('utf-8')
+                random.seed(int(sha1(str(Automark.seed) + '\n' 
+                    + self._classname + '\n' + program).hexdigest(), 16))
+            self._inputs = self.setup_inputs()
         self._stdin = self._inputs[0]
 
-        error = 'OK'
+        # The other files of a multi-file submission are compiled along with 
+        # the program
+        program = combine_sources(self._program_structure.program, 
+            self._program_structure.program_tree, self._companions)
         response = wsdl_object.createSubmission(self._user, self._password, 
-            self._program_structure.program, 10, self._stdin, True, True)
-        error = Automark.get_error_status(response)
-        if error != 'OK':
-            print 'Error: ' + error
+            program, 10, self._stdin, True, True)
+        execution['error'] = Automark.get_error_status(response)
+        if execution['error'] != 'OK':
+            print 'Error: ' + execution['error']
         else:
             link = Automark._get_value(response, 'link')
 
-            # Periodically check the submission status
-            status = -1;
-            wait_time = 1
-            while status != 0:
-                sleep(wait_time)
-                wait_time = 3
-                response = wsdl_object.getSubmissionStatus(
-                    self._user, self._password, link)
+            # Every backend lets us block until the submission has 
+            # completed, so we can move on as soon as it's done
+            response = wsdl_object.wait_for_submission(
+                Automark.get_wait_time_limit())
+            Automark.check_error_status(response)
+            status = Automark._get_value(response, 'status')
+
+            if status != 0:
+                # The submission didn't complete in time, so give up on it
+                print 'Error: the submission didn\'t complete in time'
+                wsdl_object.cancel_submission()
+                execution['result'] = 20
+            else:
+                # Find out what happened to the program
+                response = wsdl_object.getSubmissionDetails(
+                    self._user, self._password, link, False, False, True, True, 
+                    True)
                 Automark.check_error_status(response)
-                status = Automark._get_value(response, 'status')
-                Automark.check_submissions_status (status)
+                for key in ['result', 'time', 'memory', 'output', 'stderr', 
+                        'cmpinfo']:
+                    execution[key] = Automark._get_value(response, key)
+                # Not all backends report whether the output was truncated
+                execution['truncated'] = \
+                    (Automark._get_value(response, 'truncated') == True)
+
+                # Collect any files generated by the program
+                for name in self.OUTPUT_FILES:
+                    path = os.path.join(self._build_dir, name)
+                    if os.path.exists(path):
+                        with open(path, 'rb') as file:
+                            execution['files'][name] = file.read()
+
+        return execution
 
-            # Find out what happened to the program
-            result = Automark._get_value(response, 'result')
+    def check_execution(self):
+        """
+        Check the outputs of the execution and assign marks.
+        
+        This is the scoring phase for the execution, which works from the 
+        results collected by execute_program(), so the code isn't executed 
+        again. Any output files collected are restored to the build folder 
+        before the outputs are checked.
+        
+        Although it can be, in general it's not expected that this method 
+        should need to be overriden, since replicating the it requires 
+        lots of work. Instead, the other methods (e.g. 
+        check_output_correctness(), check_execute_result() etc.) should be 
+        overriden instead. This method calls them to do the marking 
+        calculations.
+        
+        Returns the resulting mark from performing all of these operations.
+        """
+        execution_score = 0
+        execution = self._execution
+        if execution['error'] == 'OK':
+            if self.OUTPUT_FILES and not os.path.exists(self._build_dir):
+                os.makedirs(self._build_dir)
+            for name in self.OUTPUT_FILES:
+                path = os.path.join(self._build_dir, name)
+                if name in execution['files']:
+                    with open(path, 'wb') as file:
+                        file.write(execution['files'][name])
+                elif os.path.exists(path):
+                    os.remove(path)
+
+            result = execution['result']
             self._execution_result = result
             execution_score += self.check_execute_result(result)
             if result == 11:
                 print 'Compilation error'
-                response = wsdl_object.getSubmissionDetails(
-                    self._user, self._password, link, False, False, False, 
-                    False, True)
-                cmpinfo = Automark._get_value(response, 'cmpinfo')
+                cmpinfo = execution['cmpinfo']
                 #print 'Compilation output: ' + cmpinfo
                 self._program_output = cmpinfo
                 self._execution_comments = 'Program failed to compile.'
             elif result == 12:
                 print 'Runtime error'
-                response = wsdl_object.getSubmissionDetails(
-                    self._user, self._password, link, False, False, False, 
-                    True, False)
-                stderr_output = Automark._get_value(response, 'stderr')
+                stderr_output = execution['stderr']
                 #print 'Runtime error: ' + stderr_output
                 self._program_output = stderr_output
                 self._execution_comments = \
                     'Runtime error occurred during execution.'
             elif result == 13:
                 print 'Time limit exceeded'
-                response = wsdl_object.getSubmissionDetails(
-                    self._user, self._password, link, False, False, True, 
-                    False, False)
-                self._execution_time = Automark._get_value(response, 'time')
-                output = Automark._get_value(response, 'output')
+                self._execution_time = execution['time']
+                output = execution['output']
                 self._program_output = output
                 result = self.check_output_correctness(output, self._inputs)
                 execution_score += result[0]
@@ -537,34 +750,36 @@ class Automark(object):
                     execution_score -= 1
                 self._execution_comments = \
                     'Execution failed to complete (time limit exceeded).'
+            elif result == 16:
+                print 'Output limit exceeded'
+                self._execution_time = execution['time']
+                output = execution['output']
+                self._program_output = output
+                result = self.check_output_correctness(output, self._inputs)
+                execution_score += result[0]
+                self._output_check = result[2]
+                if result[0] > 0:
+                    execution_score -= 1
+                self._execution_comments = \
+                    'Execution failed to complete (output limit exceeded). ' \
+                    'Only the start and end of the output are shown.'
             elif result == 17:
                 print 'Memory limit exceeded'
-                response = wsdl_object.getSubmissionDetails(
-                    self._user, self._password, link, False, False, False, 
-                    False, False)
-                self._memory_used = Automark._get_value(response, 'memory')
+                self._memory_used = execution['memory']
                 print 'Memory used: {} bytes'.format(self._memory_used)
                 self._execution_comments = \
                     'Execution failed to complete (ran out of memory).'
             elif result == 19:
                 print 'Illegal system call'
-                response = wsdl_object.getSubmissionDetails(
-                    self._user, self._password, link, False, False, False, 
-                    True, False)
-                stderr_output = Automark._get_value(response, 'stderr')
+                stderr_output = execution['stderr']
                 print 'Error output: ' + stderr_output
                 self._program_output = stderr_output
                 self._execution_comments = \
                     'Execution failed to complete (illegal system call).'
             elif result == 15:
-                response = wsdl_object.getSubmissionDetails(
-                    self._user, self._password, link, False, False, True, 
-                    False, False)
-                Automark.check_error_status(response)
-                self._execution_time = Automark._get_value(response, 'time')
-                self._memory_used = Automark._get_value(response, 'memory')
-                date = Automark._get_value(response, 'date')
-                output = Automark._get_value(response, 'output')
+                self._execution_time = execution['time']
+                self._memory_used = execution['memory']
+                output = execution['output']
                 self._program_output = output
                 result = self.check_output_correctness(output, self._inputs)
                 execution_score += result[0]
@@ -38,7 +38,9 @@ class Automark(automark.Automark):
     """
     OUTPUT_CHECKS = 2
 
-    def __init__(self, filename, credentialsFile, build_dir):
+    def __init__(
+            self, filename, credentialsFile, build_dir, artifacts=None, 
+            source=None, program_tree=None, companions=None):
         """
         Initialise the Automark class.
         
@@ -49,8 +51,19 @@ class Automark(automark.Automark):
                 to be done locally. If using Sphere Engine, these should be 
                 ideone credentials.
             build_dir: Temporary folder to store build and execution files.
+            artifacts: Artifacts collected from a previous marking of the 
+                code. If provided, the code is scored using these rather 
+                than being executed again (optional).
+            source: The contents of the Java source file, if they've already 
+                been read, for example from a zip archive (optional).
+            program_tree: The AST for the Java source file, if it's already 
+                been parsed (optional).
+            companions: The other files of a multi-file submission, which 
+                are compiled along with the file (optional).
         """
-        automark.Automark.__init__(self, filename, credentialsFile, build_dir)
+        automark.Automark.__init__(
+            self, filename, credentialsFile, build_dir, artifacts, source, 
+            program_tree, companions)
 
     def setup_inputs(self):
         """
@@ -20,6 +20,7 @@ import re
 from math import trunc
 from random import randint
 from plyjext.model import Visitor
+from plyjext.walker import walk
 
 import automark
 from execcode import ExecCode
@@ -41,7 +42,12 @@ class Automark(automark.Automark):
     """
     OUTPUT_CHECKS = 5
 
-    def __init__(self, filename, credentials_file, build_dir):
+    # Files the program reads from and writes to in the build folder
+    INPUT_FILES = ['input.txt']
+
+    def __init__(
+            self, filename, credentials_file, build_dir, artifacts=None, 
+            source=None, program_tree=None, companions=None):
         """
         Initialise the Automark class.
         
@@ -52,8 +58,19 @@ class Automark(automark.Automark):
                 to be done locally. If using Sphere Engine, these should be 
                 ideone credentials.
             build_dir: Temporary folder to store build and execution files.
+            artifacts: Artifacts collected from a previous marking of the 
+                code. If provided, the code is scored using these rather 
+                than being executed again (optional).
+            source: The contents of the Java source file, if they've already 
+                been read, for example from a zip archive (optional).
+            program_tree: The AST for the Java source file, if it's already 
+                been parsed (optional).
+            companions: The other files of a multi-file submission, which 
+                are compiled along with the file (optional).
         """
-        automark.Automark.__init__(self, filename, credentials_file, build_dir)
+        automark.Automark.__init__(
+            self, filename, credentials_file, build_dir, artifacts, source, 
+            program_tree, companions)
 
     def setup_inputs(self):
         """
@@ -61,20 +78,9 @@ class Automark(automark.Automark):
         
         Generates random values to store in the input.txt file.
         """
-        # Establish the name of the input file
-        find_file_input = FileReader_Visitor()
-        if self._program_structure.program_tree != None:
-            self._program_structure.program_tree.accept(find_file_input)
-
-        # Replace the input file with "input.txt" so we can control it
-        if len(find_file_input.filename) > 0:
-            transformed = re.sub(
-                r'(FileReader\s*\(\s*)(' + re.escape(
-                find_file_input.filename[0][0]) + 
-                ')(\s*\))', r'\1"input.txt"\3', 
-                self._program_structure.program)
-            self._program_structure = self._program_structure._replace(
-                program = transformed)
+        # Replace the input file with "input.txt" in every file of the 
+        # submission so we can control it
+        self.transform_programs(Automark._replace_input_file)
 
         # Generate variables for the input file
         ship_length = randint(20, 100)
@@ -116,6 +122,24 @@ class Automark(automark.Automark):
             container_width, container_height, container_weight, 
             ship_max_weight]
 
+    @staticmethod
+    def _replace_input_file(program, program_tree):
+        """
+        Internal method, replace the name of the file passed to FileReader 
+        in the code of a file with "input.txt".
+        """
+        # Establish the name of the input file
+        find_file_input = FileReader_Visitor()
+        if program_tree != None:
+            walk(program_tree, find_file_input)
+
+        if len(find_file_input.filename) > 0:
+            program = re.sub(
+                r'(FileReader\s*\(\s*)(' + re.escape(
+                find_file_input.filename[0][0]) + 
+                ')(\s*\))', r'\1"input.txt"\3', program)
+        return program
+
     def check_output_correctness(self, output, inputs):
         """
         Checks whether outputs generated conform to the task requirements.
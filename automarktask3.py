@@ -19,6 +19,7 @@ import re
 
 from random import randint
 from plyjext.model import Visitor
+from plyjext.walker import walk
 
 import automark
 from execcode import ExecCode
@@ -40,7 +41,13 @@ class Automark(automark.Automark):
     """
     OUTPUT_CHECKS = 6
 
-    def __init__(self, filename, credentials_file, build_dir):
+    # Files the program reads from and writes to in the build folder
+    INPUT_FILES = ['input.txt']
+    OUTPUT_FILES = ['output.txt']
+
+    def __init__(
+            self, filename, credentials_file, build_dir, artifacts=None, 
+            source=None, program_tree=None, companions=None):
         """
         Initialise the Automark class.
         
@@ -51,8 +58,19 @@ class Automark(automark.Automark):
                 to be done locally. If using Sphere Engine, these should be 
                 ideone credentials.
             build_dir: Temporary folder to store build and execution files.
+            artifacts: Artifacts collected from a previous marking of the 
+                code. If provided, the code is scored using these rather 
+                than being executed again (optional).
+            source: The contents of the Java source file, if they've already 
+                been read, for example from a zip archive (optional).
+            program_tree: The AST for the Java source file, if it's already 
+                been parsed (optional).
+            companions: The other files of a multi-file submission, which 
+                are compiled along with the file (optional).
         """
-        automark.Automark.__init__(self, filename, credentials_file, build_dir)
+        automark.Automark.__init__(
+            self, filename, credentials_file, build_dir, artifacts, source, 
+            program_tree, companions)
 
     def setup_inputs(self):
         """
@@ -60,35 +78,9 @@ class Automark(automark.Automark):
         
         Generates random values to pass via the input.txt file and stdin.
         """
-        # Establish the name of the input file
-        find_file_input = InstanceCreationParam_Visitor('FileReader')
-        if self._program_structure.program_tree != None:
-            self._program_structure.program_tree.accept(find_file_input)
-
-        # Replace the input file with "input.txt" so we can control it
-        filename = find_file_input.get_param_list()
-        if len(filename) > 0:
-            transformed = re.sub(
-                r'(FileReader\s*\(\s*)(' + re.escape(filename[0][0]) + 
-                ')(\s*\))', r'\1"input.txt"\3', 
-                self._program_structure.program)
-            self._program_structure = self._program_structure._replace(
-                program = transformed)
-
-        # Establish the name of the output file
-        find_file_output = InstanceCreationParam_Visitor('PrintWriter')
-        if self._program_structure.program_tree != None:
-            self._program_structure.program_tree.accept(find_file_output)
-
-        # Replace the output file with "output.txt" so we can control it
-        filename = find_file_output.get_param_list()
-        if len(filename) > 0:
-            transformed = re.sub(
-                r'(PrintWriter\s*\(\s*)(' + re.escape(filename[0][0]) + 
-                ')(\s*\))', r'\1"output.txt"\3', 
-                self._program_structure.program)
-            self._program_structure = self._program_structure._replace(
-                program = transformed)
+        # Replace the input and output files with "input.txt" and 
+        # "output.txt" in every file of the submission so we can control them
+        self.transform_programs(Automark._replace_files)
 
         # Generate the input file
         journey_costs = []
@@ -141,6 +133,34 @@ class Automark(automark.Automark):
         return [stdin, num_of_ships, ship_ids, journey_ids, journey_costs, 
             recommended_max]
 
+    @staticmethod
+    def _replace_files(program, program_tree):
+        """
+        Internal method, replace the names of the files passed to FileReader 
+        and PrintWriter in the code of a file with "input.txt" and 
+        "output.txt".
+        """
+        # Establish the names of the input and output files in a single walk
+        find_file_input = InstanceCreationParam_Visitor('FileReader')
+        find_file_output = InstanceCreationParam_Visitor('PrintWriter')
+        if program_tree != None:
+            walk(program_tree, find_file_input, find_file_output)
+
+        # Replace the input file
+        filename = find_file_input.get_param_list()
+        if len(filename) > 0:
+            program = re.sub(
+                r'(FileReader\s*\(\s*)(' + re.escape(filename[0][0]) + 
+                ')(\s*\))', r'\1"input.txt"\3', program)
+
+        # Replace the output file
+        filename = find_file_output.get_param_list()
+        if len(filename) > 0:
+            program = re.sub(
+                r'(PrintWriter\s*\(\s*)(' + re.escape(filename[0][0]) + 
+                ')(\s*\))', r'\1"output.txt"\3', program)
+        return program
+
     def check_output_correctness(self, output, inputs):
         """
         Checks whether outputs generated conform to the task requirements.
@@ -329,8 +349,15 @@ class Automark(automark.Automark):
 
         # Load in the output file
         file_to_read = os.path.join(self._build_dir, "output.txt")
-        with open(file_to_read) as output_file:
-            file_output = output_file.read()
+        try:
+            with open(file_to_read) as output_file:
+                file_output = output_file.read()
+        except IOError:
+            # The program didn't produce an output file, so it's treated as 
+            # empty
+            file_output = ''
+            execution_comments += ("Your program didn't create an output "
+                "file.\n")
         file_output = Automark.clean_text(file_output)
 
         # It can be useful to display the output file for manual checking
@@ -19,6 +19,7 @@ import re
 
 from random import randint
 from plyjext.model import Visitor, Literal
+from plyjext.walker import walk
 
 import automark
 from execcode import ExecCode
@@ -41,7 +42,12 @@ class Automark(automark.Automark):
     """
     OUTPUT_CHECKS = 3
 
-    def __init__(self, filename, credentials_file, build_dir):
+    # Files the program reads from and writes to in the build folder
+    INPUT_FILES = ['port-account.txt', 'transaction-list.txt']
+
+    def __init__(
+            self, filename, credentials_file, build_dir, artifacts=None, 
+            source=None, program_tree=None, companions=None):
         """
         Initialise the Automark class.
         
@@ -52,8 +58,19 @@ class Automark(automark.Automark):
                 to be done locally. If using Sphere Engine, these should be 
                 ideone credentials.
             build_dir: Temporary folder to store build and execution files.
-        """
-        automark.Automark.__init__(self, filename, credentials_file, build_dir)
+            artifacts: Artifacts collected from a previous marking of the 
+                code. If provided, the code is scored using these rather 
+                than being executed again (optional).
+            source: The contents of the Java source file, if they've already 
+                been read, for example from a zip archive (optional).
+            program_tree: The AST for the Java source file, if it's already 
+                been parsed (optional).
+            companions: The other files of a multi-file submission, which 
+                are compiled along with the file (optional).
+        """
+        automark.Automark.__init__(
+            self, filename, credentials_file, build_dir, artifacts, source, 
+            program_tree, companions)
 
     def setup_inputs(self):
         """
@@ -63,31 +80,29 @@ class Automark(automark.Automark):
         """
         # Find the username, password and account name
 	    find_vars = Field_Visitor()
+	    find_local_vars = Variable_Visitor()
 	    if self._program_structure.program_tree != None:
-		    self._program_structure.program_tree.accept(find_vars)
+		    walk(self._program_structure.program_tree, find_vars, 
+		        find_local_vars)
 
         self._username = ""
-        self._password = ""
+        self._account_password = ""
         self._account_number = ""
         for var in find_vars.variables:
             if re.search(re.escape("pass"), var[1], re.IGNORECASE) != None:
-                self._password = var[2].strip('"')
+                self._account_password = var[2].strip('"')
             if re.search(re.escape("name"), var[1], re.IGNORECASE) != None:
                 self._username = var[2].strip('"')
             if re.search(re.escape("numb"), var[1], re.IGNORECASE) != None:
                 self._account_number = var[2].strip('"')
 
         #print self._username
-        #print self._password
+        #print self._account_password
         #print self._account_number
-	    find_vars = Variable_Visitor()
-	    if self._program_structure.program_tree != None:
-		    self._program_structure.program_tree.accept(find_vars)
-
-        for var in find_vars.variables:
-            if not self._password:
+        for var in find_local_vars.variables:
+            if not self._account_password:
                 if re.search(re.escape("pass"), var[1], re.IGNORECASE) != None:
-                    self._password = var[2].strip('"')
+                    self._account_password = var[2].strip('"')
             if not self._username:
                 if re.search(re.escape("name"), var[1], re.IGNORECASE) != None:
                     self._username = var[2].strip('"')
@@ -96,7 +111,7 @@ class Automark(automark.Automark):
                     self._account_number = var[2].strip('"')
 
         #print self._username
-        #print self._password
+        #print self._account_password
         #print self._account_number
 
         # Clear out the folder
@@ -126,7 +141,8 @@ class Automark(automark.Automark):
         menus = 0
 
         # Login to the account system
-        stdin += "{}\n{}\n".format(self._account_number, self._password)
+        stdin += "{}\n{}\n".format(
+            self._account_number, self._account_password)
         menus += 1
 
         # Output the current balance
@@ -170,6 +186,27 @@ class Automark(automark.Automark):
 
         return [stdin, transactions, menus]
 
+    def get_artifacts(self):
+        """
+        Return the raw artifacts collected while marking the code.
+        
+        As well as the artifacts common to all tasks, these include the 
+        account details found in the code, which are needed for scoring.
+        """
+        artifacts = automark.Automark.get_artifacts(self)
+        artifacts['account'] = [self._username, self._account_password, 
+            self._account_number]
+        return artifacts
+
+    def restore_artifacts(self, artifacts):
+        """
+        Restore the artifacts returned by get_artifacts(), ready for the 
+        code to be scored again.
+        """
+        automark.Automark.restore_artifacts(self, artifacts)
+        self._username, self._account_password, self._account_number = \
+            artifacts['account']
+
     def check_output_correctness(self, output, inputs):
         """
         Checks whether outputs generated conform to the task requirements.
@@ -235,13 +272,15 @@ class Automark(automark.Automark):
         logged_in = False
         if section_num < 5:
             execution_comments += ("Log to account {} attempted with "
-                "password {}.\n").format(self._account_number, self._password)
+                "password {}.\n").format(
+                self._account_number, self._account_password)
             execution_comments += "Account name: {}.\n".format(self._username)
             execution_comments += ("Failed to login or couldn't complete all "
                 "{:d} of the operations.\n").format(menus)
         else:
             execution_comments += ("Successfully logged in to account {} with "
-                "password {}.\n").format(self._account_number, self._password)
+                "password {}.\n").format(
+                self._account_number, self._account_password)
             execution_comments += "Account name: {}.\n".format(self._username)
             logged_in = True
 
@@ -0,0 +1,553 @@
+# vim: et:ts=4:textwidth=80
+
+# Automark
+#
+# David Llewellyn-Jones
+# Liverpool John Moores University
+# 18/12/2014
+# Released under the GPL v.3. See the LICENSE file for more details.
+
+"""
+Choose where submissions are compiled and executed.
+
+Every backend derives from Backend, which defines the same interface as the
+ideone Sphere Engine API (createSubmission(), getSubmissionStatus() and
+getSubmissionDetails()), along with wait_for_submission() to block until a
+submission completes and cancel_submission() to give up on it. The backends
+are:
+
+    local: Start javac and java for each submission (see ExecCode).
+    warm: Compile and execute using a long-lived JVM (see WarmJVM).
+    remote: Send submissions to a Sphere Engine style server over HTTP, such
+        as the stand-in provided by standin.py.
+
+The remote backend keeps a single connection open to the server, and
+submissions created at around the same time are sent in a single request.
+The status of all submissions in progress is then collected in a single
+request too, rather than one per submission, so many marking processes on
+several hosts can share one server without flooding it with requests.
+"""
+
+import base64
+import httplib
+import json
+import os
+import socket
+import threading
+import urlparse
+
+from execcode import ExecCode, Status
+
+__all__ = ('Backend', 'LocalBackend', 'WarmBackend', 'RemoteBackend',
+    'BACKENDS', 'create_backend')
+
+
+class Backend(object):
+    """
+    The interface shared by all backends.
+
+    A backend is created for each program to be executed, and is used for a
+    single submission. Files listed as input files are read from the temp
+    folder before the program is executed, and files listed as output files
+    are left in the temp folder once it completes.
+    """
+
+    def __init__(self, tempfolder, classname, input_files=None,
+            output_files=None):
+        """
+        Initialise the Backend class.
+
+        Attributes:
+            tempfolder: Folder to build and execute the code in.
+            classname: The name of the class containing main().
+            input_files: Names of any files in the temp folder that the
+                program reads from (optional).
+            output_files: Names of any files in the temp folder that the
+                program writes to (optional).
+        """
+        self._tempfolder = tempfolder
+        self._classname = classname
+        self._input_files = input_files or []
+        self._output_files = output_files or []
+
+    # This doesn't confirm to PEP 8, but has been left to match the ideone API
+    def createSubmission(
+            self, user, password, sourceCode, language, input, run, private):
+        """
+        Create a new piece of code to be compiled and executed.
+        """
+        raise NotImplementedError()
+
+    # This doesn't confirm to PEP 8, but has been left to match the ideone API
+    def getSubmissionStatus(self, user, password, link):
+        """
+        Get the status of the code submission.
+        """
+        raise NotImplementedError()
+
+    def wait_for_submission(self, timeout=None):
+        """
+        Block until the submission has finished compiling and executing,
+        then return its status. If the timeout (in seconds) expires first,
+        the current status is returned.
+        """
+        raise NotImplementedError()
+
+    def cancel_submission(self):
+        """
+        Stop a submission that's queued or in progress, so that it completes
+        with an internal error. Backends that can't stop a submission leave
+        it to run to completion.
+        """
+        pass
+
+    # This doesn't confirm to PEP 8, but has been left to match the ideone API
+    def getSubmissionDetails(
+            self, user, password, link, withSource, withInput, withOutput,
+            withStderr, withCmpinfo):
+        """
+        Get detailed information about a submission compilation and execution.
+        """
+        raise NotImplementedError()
+
+
+# The local backends use the implementation of the interface in ExecCode, so
+# it comes first
+class LocalBackend(ExecCode, Backend):
+    """
+    Compile and execute submissions by starting javac and java for each. The
+    warm JVM is used anyway if ExecCode.warm_jvm is set.
+    """
+    pass
+
+
+class WarmBackend(ExecCode, Backend):
+    """
+    Compile and execute submissions using a long-lived JVM, falling back to
+    starting javac and java if it fails.
+    """
+
+    def __init__(self, tempfolder, classname, input_files=None,
+            output_files=None):
+        """
+        Initialise the WarmBackend class.
+        """
+        ExecCode.__init__(self, tempfolder, classname, input_files,
+            output_files, warm_jvm=True)
+
+
+class RemoteBackend(Backend):
+    """
+    Compile and execute submissions on a Sphere Engine style server.
+
+    Set RemoteBackend.url to the address of the server (for example,
+    http://localhost:8080/api). The credentials passed to createSubmission()
+    are sent to the server with each submission.
+    """
+
+    # The address of the server
+    url = None
+
+    # Dispatchers for each server, shared by all submissions in the process
+    _dispatchers = {}
+    _dispatchers_lock = threading.Lock()
+
+    def __init__(self, tempfolder, classname, input_files=None,
+            output_files=None):
+        """
+        Initialise the RemoteBackend class.
+
+        A ValueError is raised if RemoteBackend.url isn't a usable address.
+        """
+        RemoteBackend.check_url(RemoteBackend.url)
+        Backend.__init__(
+            self, tempfolder, classname, input_files, output_files)
+        self._submission = None
+        self._input = ''
+        self._sourceCode = ''
+
+    # This doesn't confirm to PEP 8, but has been left to match the ideone API
+    def createSubmission(
+            self, user, password, sourceCode, language, input, run, private):
+        """
+        Create a new piece of code to be compiled and executed.
+
+        The submission is queued to be sent to the server along with any
+        others created at around the same time.
+        """
+        self._sourceCode = sourceCode
+        self._input = input
+        files = {}
+        for name in self._input_files:
+            files[name] = None
+            path = os.path.join(self._tempfolder, name)
+            if os.path.exists(path):
+                with open(path, 'rb') as file:
+                    files[name] = base64.b64encode(file.read())
+        request = {'user': user, 'password': password,
+            'sourceCode': sourceCode, 'language': language, 'input': input,
+            'run': run, 'private': private, 'classname': self._classname,
+            'files': files, 'outputFiles': self._output_files}
+        self._submission = _RemoteSubmission(
+            request, self._tempfolder, self._output_files)
+        RemoteBackend._get_dispatcher(RemoteBackend.url).submit(
+            self._submission)
+        return {'item': [Status('error', 'OK'), Status('link', 0)]}
+
+    # This doesn't confirm to PEP 8, but has been left to match the ideone API
+    def getSubmissionStatus(self, user, password, link):
+        """
+        Get the status of the code submission.
+        """
+        return self._submission.get_status()
+
+    def wait_for_submission(self, timeout=None):
+        """
+        Block until the submission has finished compiling and executing,
+        then return its status.
+        """
+        self._submission.wait(timeout)
+        return self._submission.get_status()
+
+    # This doesn't confirm to PEP 8, but has been left to match the ideone API
+    def getSubmissionDetails(
+            self, user, password, link, withSource, withInput, withOutput,
+            withStderr, withCmpinfo):
+        """
+        Get detailed information about a submission compilation and execution.
+        """
+        details = self._submission.get_details()
+        response = {'item': []}
+        for key in ['error', 'time', 'status', 'result', 'memory', 'signal',
+                'truncated', 'public']:
+            response['item'].append(Status(key, details[key]))
+        # Some of the return key-value pairs are optional
+        if withInput:
+            response['item'].append(Status('input', self._input))
+        if withOutput:
+            response['item'].append(Status('output', details['output']))
+        if withStderr:
+            response['item'].append(Status('stderr', details['stderr']))
+        if withCmpinfo:
+            response['item'].append(Status('cmpinfo', details['cmpinfo']))
+        if withSource:
+            response['item'].append(Status('source', self._sourceCode))
+        return response
+
+    @staticmethod
+    def check_url(url):
+        """
+        Check that an address can be used for the server, raising a
+        ValueError with a message explaining the problem if it can't.
+
+        Args:
+            url: The address of the server, or None if it hasn't been set.
+        """
+        if url == None:
+            raise ValueError('No URL was given for the remote backend')
+        parts = urlparse.urlsplit(url)
+        if (parts.scheme not in ('http', 'https')) or (parts.netloc == ''):
+            raise ValueError('The URL for the remote backend must be an '
+                'http or https address including the host: ' + url)
+
+    @staticmethod
+    def _get_dispatcher(url):
+        """
+        For internal use, return the dispatcher for a server, creating it if
+        this is the first submission sent to the server.
+        """
+        with RemoteBackend._dispatchers_lock:
+            if url not in RemoteBackend._dispatchers:
+                RemoteBackend._dispatchers[url] = _Dispatcher(url)
+            return RemoteBackend._dispatchers[url]
+
+
+class _RemoteSubmission(object):
+    """
+    Internal class, the state of a submission sent to a remote server.
+    """
+
+    def __init__(self, request, tempfolder, output_files):
+        """
+        Initialise the _RemoteSubmission class.
+        """
+        self.request = request
+        self.link = None
+        self._tempfolder = tempfolder
+        self._output_files = output_files
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        self._details = {'error': 'OK', 'time': 0, 'status': -1,
+            'result': 0, 'memory': 0, 'signal': 0, 'truncated': False,
+            'public': False, 'output': '', 'stderr': '', 'cmpinfo': ''}
+
+    def update(self, item):
+        """
+        Record a submission's status or details returned by the server.
+        """
+        if item.get('status') == 0:
+            # Leave any output files where the program would have
+            files = item.get('files') or {}
+            try:
+                for name in self._output_files:
+                    path = os.path.join(self._tempfolder, name)
+                    if name in files:
+                        with open(path, 'wb') as file:
+                            file.write(base64.b64decode(files[name]))
+                    elif os.path.exists(path):
+                        os.remove(path)
+            except (IOError, OSError, TypeError) as error:
+                print 'Failed to write output files: {}'.format(error)
+                item = {'error': 'INTERNAL_ERROR', 'status': 0,
+                    'result': 20}
+        with self._lock:
+            for key in self._details:
+                if key in item:
+                    self._details[key] = item[key]
+        if self._details['status'] == 0:
+            self._finished.set()
+
+    def fail(self, error):
+        """
+        Complete the submission with an internal error.
+        """
+        self.update({'error': error, 'status': 0, 'result': 20})
+
+    def wait(self, timeout=None):
+        """
+        Block until the submission has completed.
+        """
+        self._finished.wait(timeout)
+        return self._finished.is_set()
+
+    def get_status(self):
+        """
+        Return the status of the submission in the same form as
+        ExecCode.getSubmissionStatus().
+        """
+        with self._lock:
+            return {'item': [Status('error', self._details['error']),
+                Status('status', self._details['status']),
+                Status('result', self._details['result'])]}
+
+    def get_details(self):
+        """
+        Return a copy of the details of the submission.
+        """
+        with self._lock:
+            return dict(self._details)
+
+
+class _Dispatcher(object):
+    """
+    Internal class, send submissions to a server and collect their results,
+    using a single connection from a background thread.
+
+    Each time round, the submissions queued since the last time are created
+    in a single request, and the status of all of the submissions in
+    progress is checked in a single request.
+    """
+
+    # How long to wait between checking on submissions in progress, in
+    # seconds
+    POLL_INTERVAL = 0.25
+
+    # The most submissions to create or check on in a single request
+    BATCH_SIZE = 64
+
+    # How long to wait for the server to respond, in seconds
+    TIMEOUT = 60
+
+    def __init__(self, url):
+        """
+        Initialise the _Dispatcher class.
+
+        Attributes:
+            url: The address of the server.
+        """
+        parts = urlparse.urlsplit(url)
+        self._secure = (parts.scheme == 'https')
+        self._host = parts.netloc
+        self._path = parts.path.rstrip('/')
+        self._connection = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._queued = []
+        self._pending = {}
+        self._thread = None
+        self._thread_pid = None
+
+    def submit(self, submission):
+        """
+        Queue a submission to be sent to the server.
+        """
+        with self._lock:
+            if (self._thread == None) or (self._thread_pid != os.getpid()):
+                # Threads don't survive a fork, so there's one per process
+                self._queued = []
+                self._pending = {}
+                self._connection = None
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread_pid = os.getpid()
+                self._thread.start()
+            self._queued.append(submission)
+        self._wakeup.set()
+
+    def _run(self):
+        """
+        For internal use, the dispatcher thread's main loop.
+        """
+        while True:
+            if len(self._pending) > 0:
+                self._wakeup.wait(_Dispatcher.POLL_INTERVAL)
+            else:
+                self._wakeup.wait()
+            self._wakeup.clear()
+            with self._lock:
+                queued = self._queued
+                self._queued = []
+            for start in range(0, len(queued), _Dispatcher.BATCH_SIZE):
+                batch = queued[start:start + _Dispatcher.BATCH_SIZE]
+                try:
+                    self._create(batch)
+                except Exception as error:
+                    # Don't let an unexpected response stop the thread, or
+                    # every submission would wait forever
+                    print 'Failed to create submissions: {}'.format(error)
+                    self._fail(batch)
+            links = self._pending.keys()
+            for start in range(0, len(links), _Dispatcher.BATCH_SIZE):
+                batch = links[start:start + _Dispatcher.BATCH_SIZE]
+                try:
+                    self._check(batch)
+                except Exception as error:
+                    print 'Failed to check submissions: {}'.format(error)
+                    self._fail([self._pending[link] for link in batch
+                        if link in self._pending])
+
+    def _fail(self, submissions):
+        """
+        For internal use, complete a batch of submissions with an internal
+        error, and stop checking on them.
+        """
+        for submission in submissions:
+            if submission.link in self._pending:
+                del self._pending[submission.link]
+            submission.fail('INTERNAL_ERROR')
+
+    def _create(self, submissions):
+        """
+        For internal use, create a batch of submissions on the server.
+        """
+        response = self._request('POST', '/submissions/batch',
+            {'submissions': [submission.request
+            for submission in submissions]})
+        if response['error'] != 'OK':
+            for submission in submissions:
+                submission.fail(response['error'])
+        else:
+            created_list = response['submissions']
+            for submission, created in zip(submissions, created_list):
+                if created['error'] != 'OK':
+                    submission.fail(created['error'])
+                else:
+                    submission.link = created['link']
+                    # The request isn't needed any more
+                    submission.request = None
+                    self._pending[submission.link] = submission
+            # Any the server didn't reply about would never complete
+            for submission in submissions[len(created_list):]:
+                submission.fail('INTERNAL_ERROR')
+
+    def _check(self, links):
+        """
+        For internal use, collect the status of a batch of submissions in
+        progress from the server, along with the details of any that have
+        completed.
+        """
+        response = self._request(
+            'GET', '/submissions?links=' + ','.join(links))
+        items = response.get('submissions', {})
+        for link in links:
+            submission = self._pending[link]
+            if response['error'] != 'OK':
+                submission.fail(response['error'])
+            elif link not in items:
+                submission.fail('PASTE_NOT_FOUND')
+            elif items[link]['error'] != 'OK':
+                submission.fail(items[link]['error'])
+            else:
+                submission.update(items[link])
+            if submission.wait(0):
+                del self._pending[link]
+
+    def _request(self, method, path, body=None):
+        """
+        For internal use, send a request to the server and return its
+        decoded JSON response.
+
+        The connection is kept open between requests. If it's been closed by
+        the server the request is sent again on a new connection. If the
+        server can't be reached, the response is an error.
+        """
+        if body != None:
+            body = json.dumps(body)
+        headers = {'Content-Type': 'application/json',
+            'Connection': 'keep-alive'}
+        response = {'error': 'CONNECTION_ERROR'}
+        for attempt in range(2):
+            try:
+                if self._connection == None:
+                    if self._secure:
+                        self._connection = httplib.HTTPSConnection(
+                            self._host, timeout=_Dispatcher.TIMEOUT)
+                    else:
+                        self._connection = httplib.HTTPConnection(
+                            self._host, timeout=_Dispatcher.TIMEOUT)
+                self._connection.request(
+                    method, self._path + path, body, headers)
+                reply = self._connection.getresponse()
+                data = reply.read()
+                if reply.status == 200:
+                    response = json.loads(data)
+                else:
+                    response = {'error': 'HTTP_{:d}'.format(reply.status)}
+                if reply.getheader('connection', '').lower() == 'close':
+                    self._close()
+                break
+            except (httplib.HTTPException, socket.error, ValueError) as error:
+                print 'Server request failed: {}'.format(error)
+                self._close()
+        return response
+
+    def _close(self):
+        """
+        For internal use, close the connection to the server.
+        """
+        if self._connection != None:
+            self._connection.close()
+            self._connection = None
+
+
+# The backends available, by name
+BACKENDS = {'local': LocalBackend, 'warm': WarmBackend,
+    'remote': RemoteBackend}
+
+
+def create_backend(name, tempfolder, classname, input_files=None,
+        output_files=None):
+    """
+    Return a new instance of the named backend, ready to create a
+    submission.
+
+    Args:
+        name: The name of the backend (one of the keys of BACKENDS).
+        tempfolder: Folder to build and execute the code in.
+        classname: The name of the class containing main().
+        input_files: Names of any files in the temp folder that the program
+            reads from (optional).
+        output_files: Names of any files in the temp folder that the program
+            writes to (optional).
+    """
+    return BACKENDS[name](tempfolder, classname, input_files, output_files)
@@ -21,19 +21,39 @@ Released under the GPL v.3. See the LICENSE file for more details.
 
 """
 
+import binascii
+import cPickle
 import os
+import shutil
+import sys
 
 import automark
 import automarktask1
 import automarktask2
 import automarktask3
 import automarktask4
+import srctransform
 
+from backends import BACKENDS, RemoteBackend
+from cache import CompileCache, ExecutionCache, ParseCache
+from distributed import Coordinator, Worker, parse_address
+from execcode import ExecCode
+from sandbox import SandboxPool
+from scanner import Manifest, SubmissionIndex
+from state import MarkingState
+from srctransform import combine_sources, declares_main, get_type_names, \
+    parse_source, transform_source
 from argparse import ArgumentParser
 from docx import Document
+from multiprocessing import Pool, Process
+from multiprocessing.pool import ThreadPool
+from multiprocessing.util import Finalize
+from scheduler import Scheduler
+from StringIO import StringIO
+from tempfile import mkdtemp
 from time import time
 from xlrd import open_workbook
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZipFile
 
 __all__ = ('BatchMark')
 
@@ -45,6 +65,25 @@ __all__ = ('BatchMark')
 # Feedback template (optional)
 # Student details list (optional)
 # Summary output (optional)
+# Number of parallel marking processes (optional)
+# Use a warm JVM for compilation and execution (optional)
+# Compile all submissions in advance (optional)
+# Cache compiled submissions between runs (optional)
+# Seed for generating inputs, replaying cached executions (optional)
+# Folder to save marking artifacts to (optional)
+# Folder to load marking artifacts from, rather than executing (optional)
+# Maximum output from a program in KB (optional)
+# Number of submissions to compile and execute at once (optional)
+# Backend to compile and execute with (optional)
+# Address of the server for the remote backend (optional)
+# Address to serve marking jobs to workers on (optional)
+# Key workers need to connect, generated at random if not given (optional)
+# Number of worker processes to start on this host (optional)
+# Only mark students whose submissions have changed since the last run 
+# (optional)
+# Read submissions from their zip archives rather than extracting them 
+# (optional)
+# Cache parsed source files between runs (optional)
 
 class BatchMark(object):
     """
@@ -61,12 +100,66 @@ class BatchMark(object):
         feedback_doc_name: Feedback template (optional)
         marking_sheet_name: Student details list (optional)
         summary-out: Summary output (optional)
+        jobs: Number of students to mark in parallel (optional)
+        warm_jvm: Compile and execute using a long-lived JVM (optional)
+        precompile: Compile all submissions in advance (optional)
+        compile_cache: Cache compiled submissions between runs (optional)
+        seed: Seed for generating inputs, replaying cached executions 
+            (optional)
+        collect_dir: Folder to save marking artifacts to (optional)
+        rescore_dir: Folder to load marking artifacts from, rather than 
+            executing (optional)
+        output_limit: Maximum output from a program in KB (optional)
+        in_flight: Number of submissions to compile and execute at once 
+            when marking in a single process (optional)
+        backend: Backend to compile and execute with, one of local, warm 
+            or remote (optional)
+        backend_url: Address of the server, which is needed for the remote 
+            backend (optional)
+        coordinator: Host and port to serve marking jobs to workers on, 
+            rather than marking in this process (optional)
+        authkey: Key workers need to connect to the coordinator. A random 
+            key is generated if one isn't given (optional)
+        local_workers: Number of worker processes to start on this host 
+            when acting as the coordinator (optional)
+        incremental: Only mark students whose submissions have changed 
+            since the last run (optional)
+        stream_archives: Read the java file to mark straight from the 
+            student's zip archive, rather than extracting the archive into 
+            their folder (optional)
+        parse_cache: Cache parsed source files between runs (optional)
 
     """
 
+    # Maximum size of the cache of compiled submissions in bytes
+    COMPILE_CACHE_SIZE = 256 * 1024 * 1024
+
+    # Maximum size of the cache of execution results in bytes
+    EXECUTION_CACHE_SIZE = 256 * 1024 * 1024
+
+    # Maximum size of the cache of parsed source files in bytes
+    PARSE_CACHE_SIZE = 64 * 1024 * 1024
+
+    # Maximum number of lines of program output shown on a feedback sheet. 
+    # Longer outputs are shown as their first and last lines
+    FEEDBACK_OUTPUT_LINES = 200
+
+    # Modules whose code affects the marks, in addition to the task and this 
+    # module. If any of them change, every student is marked again by an 
+    # incremental run
+    SCORING_MODULES = ['automark', 'comments', 'variables', 'indentation', 
+        'srctransform', 'execcode', 'plyjext.parser', 'plyjext.model', 
+        'plyjext.walker']
+
     def __init__(
             self, task, marking_dir, marker_name, build_dir, 
-            feedback_doc_name, marking_sheet_name, summary_out):
+            feedback_doc_name, marking_sheet_name, summary_out, jobs=1, 
+            warm_jvm=False, precompile=False, compile_cache=False, 
+            seed=None, collect_dir=None, rescore_dir=None, 
+            output_limit=None, in_flight=1, backend='local', 
+            backend_url=None, coordinator=None, authkey=None, 
+            local_workers=0, incremental=False, stream_archives=False, 
+            parse_cache=False):
         """
         Initialise the BatchMark class with the attributes needed for it
         to run, and print out those attributes.
@@ -76,8 +169,29 @@ class BatchMark(object):
         print ('Marker name: ' + marker_name)
         print ("Build output folder: " + build_dir)
         print ("Feedback template: " + feedback_doc_name)
-        print ("Marking sheet: " + marking_sheet_name)
+        print ("Marking sheet: " + str(marking_sheet_name))
         print ("Summary output: " + summary_out)
+        print ("Parallel jobs: " + str(jobs))
+        print ("Warm JVM: " + str(warm_jvm))
+        if warm_jvm:
+            print ("Warning: the warm JVM doesn't apply the memory, file size "
+                "or process limits")
+        print ("Precompile: " + str(precompile))
+        print ("Compile cache: " + str(compile_cache))
+        print ("Seed: " + str(seed))
+        print ("Collect artifacts: " + str(collect_dir))
+        print ("Rescore artifacts: " + str(rescore_dir))
+        print ("Output limit: " + str(output_limit))
+        print ("Submissions in flight: " + str(in_flight))
+        print ("Backend: " + backend)
+        if backend_url != None:
+            print ("Backend URL: " + backend_url)
+        if coordinator != None:
+            print ("Coordinator: " + coordinator)
+            print ("Local workers: " + str(local_workers))
+        print ("Incremental: " + str(incremental))
+        print ("Stream archives: " + str(stream_archives))
+        print ("Parse cache: " + str(parse_cache))
 
         self._task = task
         self._marking_dir = marking_dir
@@ -86,6 +200,65 @@ class BatchMark(object):
         self._feedback_doc_name = feedback_doc_name
         self._marking_sheet_name = marking_sheet_name
         self._summary_out = summary_out
+        self._jobs = max(1, jobs)
+        self._warm_jvm = warm_jvm
+        ExecCode.warm_jvm = warm_jvm
+        self._precompile = precompile
+        self._precompiled_folder = None
+        if precompile:
+            self._precompiled_folder = os.path.join(build_dir, 'precompiled')
+            ExecCode.precompiled_folder = self._precompiled_folder
+        if compile_cache:
+            ExecCode.compile_cache = CompileCache(os.path.join(
+                build_dir, 'cache', 'compile'), BatchMark.COMPILE_CACHE_SIZE)
+        self._parse_cache = parse_cache
+        if parse_cache:
+            srctransform.parse_cache = ParseCache(os.path.join(
+                build_dir, 'cache', 'parse'), BatchMark.PARSE_CACHE_SIZE)
+        if output_limit != None:
+            ExecCode.output_limit = output_limit * 1024
+        self._seed = seed
+        self._collect_dir = collect_dir
+        self._rescore_dir = rescore_dir
+        if (collect_dir != None) and not os.path.exists(collect_dir):
+            os.makedirs(collect_dir)
+        automark.Automark.seed = seed
+        if seed != None:
+            # With the same seed a program gets the same inputs every time, 
+            # so its previous execution can be replayed
+            ExecCode.execution_cache = ExecutionCache(os.path.join(
+                build_dir, 'cache', 'execution'), 
+                BatchMark.EXECUTION_CACHE_SIZE)
+
+        if backend not in BACKENDS:
+            print 'Unknown backend. Using the local backend.'
+            backend = 'local'
+        elif backend == 'remote':
+            # Fail now rather than when the first submission is sent
+            RemoteBackend.check_url(backend_url)
+        self._backend = backend
+        self._backend_url = backend_url
+        self._coordinator = coordinator
+        self._authkey = authkey
+        self._local_workers = local_workers
+        self._incremental = incremental
+        # Students the workers gave up on marking
+        self._unmarked = set()
+        self._stream_archives = stream_archives
+        automark.Automark.backend = backend
+        RemoteBackend.url = backend_url
+
+        # Each submission is marked in its own sandbox build folder
+        self._sandboxes = SandboxPool(os.path.join(build_dir, 'sandboxes'))
+        automark.Automark.sandboxes = self._sandboxes
+
+        self._in_flight = max(1, in_flight)
+        self._scheduler = None
+        if (self._in_flight > 1) and (self._jobs == 1):
+            # Compile and execute the submissions from a single thread, 
+            # rather than a thread per submission
+            self._scheduler = Scheduler(self._in_flight)
+            ExecCode.scheduler = self._scheduler
 
         # Select the appropriate task
         tasks = [automark, automarktask1, automarktask2, automarktask3, 
@@ -96,11 +269,16 @@ class BatchMark(object):
             self._task_specific = tasks[0]
             print 'Task number out of bounds. Applying general checks.'
 
-        #load student feedback form as a template
-        self._feedback_document = Document(feedback_doc_name)
+        #load student feedback form as a template. Each student's feedback 
+        #document is created from these bytes in memory
+        with open(feedback_doc_name, 'rb') as file:
+            self._feedback_template = file.read()
         #load my marking sheet 'PT' from workbook
-        self._marking_sheet = open_workbook(
-            marking_sheet_name).sheet_by_name(marker_name)
+        self._marking_sheet = None
+        if marking_sheet_name != None:
+            # Workers are sent student names, so don't need the sheet
+            self._marking_sheet = open_workbook(
+                marking_sheet_name).sheet_by_name(marker_name)
 
     #do things
     def go(self):
@@ -121,25 +299,28 @@ class BatchMark(object):
             self._output_csv_nl(
                 self._task_specific.Automark.get_output_checks_structure())
             self._create_new_feedback_document()
+        if self._scheduler != None:
+            self._scheduler.close()
+        self._sandboxes.close()
 
-    def _unzip_submission(self, student_dir):
+    def _unzip_submission(self, student_dir, manifest):
         """
-        Internal method, cycle through the folders in the given path and
-        extract the contents of any zip archives found.
+        Internal method, extract the contents of the last zip archive in 
+        the manifest of the given path. Any java files extracted are added 
+        to the manifest. When streaming archives, nothing is extracted; the 
+        java files in the archive are added to the manifest, and the one 
+        marked is read from the archive when it's loaded.
         """
-        archive_file = ''
-        for check_dir, _, file in os.walk(student_dir):
-            # Ensure we don't search through metadata folders
-            if '__MACOSX' not in check_dir.split('/'):
-                # This is a folder to check
-                for file_name in file:
-                    if file_name.endswith('.zip'):
-                        # This is a zip archive, so record it
-                        archive_file = os.path.join(check_dir, file_name)
+        archive_file = manifest.get_archive()
         if archive_file != '':
             with ZipFile(archive_file ,'r') as archive:
-                # Extract everything from the archive
-                archive.extractall(student_dir)
+                if self._stream_archives:
+                    # Only the archive's table of contents is read here
+                    manifest.add_archived(archive_file, archive.namelist())
+                else:
+                    # Extract everything from the archive
+                    archive.extractall(student_dir)
+                    manifest.add_extracted(archive.namelist())
                 archive.close()
         else:
             print ('No zip archive')
@@ -176,21 +357,44 @@ class BatchMark(object):
         self._output_csv(items)
         self._summary.write('\n')
 
-    def _mark (self, directory):
+    def _find_project(self, manifest):
         """
-        Internal method, return the last java file found in the 
-        directory.
+        Internal method, parse each java file found in the manifest of a 
+        directory and choose the one to mark. This is the last one with a 
+        main() method, or the last java file if none of them has one. Any 
+        other files that parse, and don't declare the same classes, are 
+        compiled along with it.
+
+        Returns the path of the java file, its contents, its AST and a list 
+        of [program, program_tree] pairs for the other files. The path is 
+        an empty string if there's no java file.
         """
-        java_file = ''
-        for check_dir, _, file in os.walk(directory):
-            # Ensure we don't search through metadata folders
-            if '__MACOSX' not in check_dir.split('/'):
-                # This is a folder to check
-                for file_name in file:
-                    if file_name.endswith('.java'):
-                        # This is a Java file, so record it
-                        java_file = os.path.join(check_dir, file_name)
-        return java_file
+        parsed = []
+        main = -1
+        for path in manifest.sources:
+            source, program_tree = parse_source(
+                path, manifest.read_source(path))
+            parsed.append([path, source, program_tree])
+            if declares_main(program_tree, source):
+                main = len(parsed) - 1
+        if main < 0:
+            main = len(parsed) - 1
+        if main < 0:
+            return ['', None, None, []]
+
+        java_path, source, program_tree = parsed[main]
+        companions = []
+        if program_tree != None:
+            # Prefer the later copies of any files that are duplicated
+            names = set(get_type_names(program_tree))
+            for path, companion, tree in reversed(parsed):
+                type_names = set(get_type_names(tree))
+                if (path != java_path) and (len(type_names) > 0) and (
+                        names.isdisjoint(type_names)):
+                    names.update(type_names)
+                    companions.insert(
+                        0, [transform_source(path, companion), tree])
+        return [java_path, source, program_tree, companions]
 
     def _create_new_feedback_document(self):
         """
@@ -200,63 +404,428 @@ class BatchMark(object):
         summary file.
         """
         print
-        # Cycle through each of the student directories
-        for student_dir, _, file in os.walk(self._marking_dir):
-            student_dir_name = os.path.relpath(student_dir, self._marking_dir)
-
-            # Other than the base folder, check the folder name against 
-            # the list of usernames in the Excel sheet
-            if (student_dir_name is not '.') and (
-                    student_dir_name in self._name_map):
-                print 'Student: {}'.format(student_dir_name)
+        # Collect the student directories to mark. These are sorted so that
+        # the summary file is always written out in the same order, however
+        # many marking processes are used. The marking folder is listed 
+        # once, and the resulting manifest of each student's folder is used 
+        # to find their submission
+        students = []
+        index = SubmissionIndex(self._marking_dir)
+        for student_dir_name in self._name_map:
+            # Check for a folder for each username in the Excel sheet
+            manifest = index.get(student_dir_name)
+            if (student_dir_name != '.') and (manifest != None):
                 student_name = self._name_map[student_dir_name][0] \
                     + ' ' + self._name_map[student_dir_name][1]
-                self._unzip_submission(student_dir)
-                java_path = self._mark(student_dir)
-                if java_path == '':
-                    print 'No java file'
-                    self._write_student_name_to_document(
-                        student_dir, student_dir_name, student_name)
+                students.append([manifest.folder, student_dir_name, 
+                    student_name, manifest])
+        students.sort(key=lambda student: student[1])
+
+        # Students whose submissions haven't changed since the last run 
+        # needn't be marked again
+        state = None
+        previous = {}
+        if self._incremental:
+            state = MarkingState(os.path.join(self._buid_dir, 'state.sqlite'))
+            version = self._get_marking_version()
+            submissions = {}
+            for student in students:
+                submissions[student[1]] = MarkingState.hash_submission(
+                    student[3])
+                found, rows = state.get_rows(student[1], self._task, version, 
+                    submissions[student[1]])
+                if found and self._has_feedback_document(student):
+                    previous[student[1]] = rows
+            print 'Unchanged students: {:d}'.format(len(previous))
+        marked = students
+        students = [student for student in students 
+            if student[1] not in previous]
+
+        if self._precompile and (self._rescore_dir == None) and (
+                self._coordinator == None):
+            self._precompile_submissions(students)
+
+        pool = None
+        if self._coordinator != None:
+            # The students are marked by workers, possibly on other hosts
+            results = self._distribute(students)
+        elif self._jobs > 1:
+            # Mark the students in a pool of worker processes. Each worker 
+            # has its own build folder so the submissions don't interfere 
+            # with one another. The results are returned in the order the 
+            # students were submitted
+            pool = Pool(self._jobs, _initialise_worker, ((
+                self._task, self._marking_dir, self._marker_name, 
+                self._buid_dir, self._feedback_doc_name, 
+                self._marking_sheet_name, self._summary_out, self._seed, 
+                self._collect_dir, self._rescore_dir, self._backend, 
+                self._backend_url, self._stream_archives, 
+                self._parse_cache), 
+                ExecCode.get_settings()))
+            # Only the manifest of each student is sent to the workers, 
+            # which find the project again. A precompiled project's ASTs 
+            # can be too deeply nested to pickle
+            results = pool.imap(_mark_student_worker, 
+                [student[:4] for student in students])
+        elif self._scheduler != None:
+            # Mark several students at once in threads of this process, so 
+            # their submissions are in flight with the scheduler together
+            pool = ThreadPool(self._in_flight)
+            results = pool.imap(
+                lambda student: self._mark_student(*student), students)
+        else:
+            results = (self._mark_student(*student) for student in students)
+
+        for student in marked:
+            if student[1] in previous:
+                print 'Student: {} unchanged'.format(student[1])
+                rows = previous[student[1]]
+            else:
+                rows = next(results)
+                if (state != None) and self._is_final(student[1], rows):
+                    state.put_rows(student[1], self._task, version, 
+                        submissions[student[1]], rows)
+            if rows is not None:
+                # Output the results to the summary csv file
+                self._output_csv_co(rows[0])
+                self._output_csv_co(rows[1])
+                self._output_csv_co(rows[2])
+                self._output_csv_nl(rows[3])
+
+        if self._coordinator != None:
+            # Stop the coordinator and wait for any local workers to finish
+            results.close()
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if state != None:
+            state.close()
+
+    def _get_marking_version(self):
+        """
+        Internal method, return a hash of the marking code, the feedback 
+        template and the settings that affect the marks.
+        """
+        modules = [sys.modules[name] for name in BatchMark.SCORING_MODULES]
+        # This module may be running as __main__ rather than batchmark
+        modules.append(sys.modules[__name__])
+        modules.append(self._task_specific)
+        settings = [self._seed, self._marker_name, ExecCode.output_limit, 
+            ExecCode.memory_limit, ExecCode.cpu_limit, 
+            ExecCode.file_size_limit]
+        return MarkingState.hash_version(
+            modules, [self._feedback_doc_name], settings)
+
+    def _is_final(self, student_dir_name, rows):
+        """
+        Internal method, check whether the results of marking a student can 
+        be reused by later incremental runs.
+        
+        Internal errors (such as losing the connection to the backend or the 
+        JVM crashing) and students the workers gave up on may not happen 
+        next time, so the student is marked again.
+        """
+        final = student_dir_name not in self._unmarked
+        if final and (rows != None):
+            index = automark.Automark.get_internal_stats_structure().index(
+                'Execution result')
+            # The result is 0 if the code was never executed
+            final = rows[2][index] not in [0, 20]
+        return final
+
+    def _has_feedback_document(self, student):
+        """
+        Internal method, check whether a student's feedback document was 
+        written out by a previous run.
+        """
+        filename = os.path.basename(self._feedback_doc_name).replace(
+            'username', student[1])
+        return os.path.exists(student[0] + '/../' + filename)
+
+    def _distribute(self, students):
+        """
+        Internal method, serve the students to be marked as jobs for 
+        workers to take, and generate the results for each student in turn 
+        as they're handed back.
+
+        Each job contains the student's details and an archive of their 
+        folder. The feedback document generated by the worker is written 
+        out here.
+        """
+        with open(self._feedback_doc_name, 'rb') as file:
+            template = file.read()
+        config = {'task': self._task, 'marker_name': self._marker_name, 
+            'template_name': os.path.basename(self._feedback_doc_name), 
+            'template': template, 'seed': self._seed, 
+            'output_limit': ExecCode.output_limit // 1024, 
+            'backend': self._backend, 'backend_url': self._backend_url, 
+            'stream_archives': self._stream_archives}
+        if self._authkey == None:
+            # Jobs are exchanged as pickles, so anyone able to connect could 
+            # run code on the coordinator. Never use a well-known key.
+            self._authkey = binascii.hexlify(os.urandom(16))
+            print 'Workers need the key: ' + self._authkey
+        coordinator = Coordinator(
+            parse_address(self._coordinator), self._authkey, config)
+        print 'Serving jobs on {}:{:d}'.format(*coordinator.address)
+        job_ids = []
+        for student_dir, student_dir_name, student_name, _ in students:
+            job_ids.append(coordinator.add_job({
+                'student_dir_name': student_dir_name, 
+                'student_name': student_name, 
+                'archive': BatchMark._archive_folder(student_dir)}))
+
+        workers = []
+        for count in range(self._local_workers):
+            worker = Process(target=run_worker, args=(
+                coordinator.address, self._authkey, self._buid_dir))
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+
+        try:
+            for student, job_id in zip(students, job_ids):
+                result = coordinator.get_result(job_id)
+                if result == None:
+                    print 'Student: {} could not be marked'.format(student[1])
+                    self._unmarked.add(student[1])
+                    yield None
                 else:
-                    #print 'file: {}'.format(java_path)
-                    # Actually perform the automarking process
-                    marks = self._task_specific.Automark(
-                        java_path, 'credentials.txt', self._buid_dir)
-                    # Output the results to the summary csv file
-                    self._write_details_to_document(
-                        student_dir, student_dir_name, student_name, marks)
-                    self._write_comments_to_document(
-                        student_dir, student_dir_name, marks)
-                    self._output_csv_co(
-                        [student_dir_name, student_name])
-                    self._output_csv_co(
-                        marks.get_scores())
-                    self._output_csv_co(
-                        marks.get_internal_stats())
-                    self._output_csv_nl(
-                        marks.get_output_checks())
+                    print 'Student: {} marked by {} ({:d} comments)'.format(
+                        student[1], result['worker'], len(result['errors']))
+                    if result['feedback'] != None:
+                        filename = os.path.basename(self._feedback_doc_name
+                            ).replace('username', student[1])
+                        with open(student[0] + '/../' + filename, 
+                                'wb') as file:
+                            file.write(result['feedback'])
+                    yield result['rows']
+        finally:
+            # The caller stops taking results after the last student, so 
+            # this runs when the generator is closed
+            coordinator.close()
+            for worker in workers:
+                worker.join()
 
-    def _write_details_to_document(
+    def _mark_job(self, job):
+        """
+        Internal method, mark a student sent by the coordinator.
+
+        The student's folder is unpacked into the marking folder and marked 
+        in the usual way. Returns a dictionary containing the items to 
+        output to the summary csv file, the student's error list and the 
+        contents of their feedback document.
+        """
+        student_dir_name = job['student_dir_name']
+        student_dir = os.path.join(self._marking_dir, student_dir_name)
+        shutil.rmtree(student_dir, True)
+        os.makedirs(student_dir)
+        ZipFile(StringIO(job['archive'])).extractall(student_dir)
+        rows, marks = self._mark_submission(
+            student_dir, student_dir_name, job['student_name'])
+        errors = []
+        if marks != None:
+            errors = marks.get_error_list()
+        feedback = None
+        feedback_file = os.path.join(self._marking_dir, 
+            os.path.basename(self._feedback_doc_name).replace(
+            'username', student_dir_name))
+        if os.path.exists(feedback_file):
+            with open(feedback_file, 'rb') as file:
+                feedback = file.read()
+            os.remove(feedback_file)
+        shutil.rmtree(student_dir, True)
+        return {'rows': rows, 'errors': errors, 'feedback': feedback, 
+            'worker': Worker.get_name()}
+
+    @staticmethod
+    def _archive_folder(folder):
+        """
+        Internal method, return the contents of a folder as a zip archive.
+        """
+        archive = StringIO()
+        with ZipFile(archive, 'w', ZIP_DEFLATED) as zip_file:
+            for path, _, files in os.walk(folder):
+                for name in files:
+                    full_path = os.path.join(path, name)
+                    zip_file.write(
+                        full_path, os.path.relpath(full_path, folder))
+        return archive.getvalue()
+
+    def _precompile_submissions(self, students):
+        """
+        Internal method, unzip every student's submission and compile them 
+        all in a single compiler JVM.
+
+        The project found for each student (see _find_project()) is added 
+        to their entry in the students list, so that the submission needn't 
+        be unzipped or parsed again when it's marked in this process.
+        """
+        submissions = []
+        for student in students:
+            self._unzip_submission(student[0], student[3])
+            project = self._find_project(student[3])
+            student.append(project)
+            java_path, source, program_tree, companions = project
+            if java_path != '':
+                classname = os.path.splitext(os.path.basename(java_path))[0]
+                submissions.append([classname, combine_sources(
+                    transform_source(java_path, source), program_tree, 
+                    companions)])
+        print 'Precompiling {:d} submissions'.format(len(submissions))
+        if not ExecCode.precompile(submissions, self._precompiled_folder):
+            print 'Precompilation failed'
+
+    def _mark_student(
+            self, student_dir, student_dir_name, student_name, manifest=None, 
+            project=None):
+        """
+        Internal method, unzip, compile, execute and test the submission 
+        for a single student and output their feedback file. The manifest 
+        of the student's folder is used to find their submission, and is 
+        created if it isn't provided. If the project returned by 
+        _find_project() is provided, the submission is assumed to have been 
+        unzipped and parsed already. When rescoring, the artifacts saved by 
+        a previous run are scored instead.
+
+        Returns the items to output to the summary csv file, or None if 
+        there was no java file to mark.
+        """
+        return self._mark_submission(student_dir, student_dir_name, 
+            student_name, manifest, project)[0]
+
+    def _mark_submission(
+            self, student_dir, student_dir_name, student_name, manifest=None, 
+            project=None):
+        """
+        Internal method, mark the submission for a single student as 
+        described for _mark_student().
+
+        Returns the items to output to the summary csv file and the marks, 
+        both of which are None if there was no java file to mark.
+        """
+        print 'Student: {}'.format(student_dir_name)
+        marks = None
+        rows = None
+        artifacts = None
+        if self._rescore_dir != None:
+            java_path, artifacts = self._load_artifacts(student_dir_name)
+            project = [java_path, None, None, []]
+        elif project == None:
+            if manifest == None:
+                manifest = Manifest.scan(student_dir)
+            self._unzip_submission(student_dir, manifest)
+            project = self._find_project(manifest)
+        java_path, source, program_tree, companions = project
+        if java_path == '':
+            print 'No java file'
+            self._write_feedback_document(
+                student_dir, student_dir_name, student_name, None)
+        else:
+            #print 'file: {}'.format(java_path)
+            # Actually perform the automarking process
+            if len(companions) > 0:
+                print 'Compiling with {:d} other files'.format(len(companions))
+            marks = self._task_specific.Automark(java_path, 
+                'credentials.txt', self._buid_dir, artifacts, source, 
+                program_tree, companions)
+            if self._collect_dir != None:
+                self._save_artifacts(
+                    student_dir_name, java_path, marks.get_artifacts())
+            self._write_feedback_document(
+                student_dir, student_dir_name, student_name, marks)
+            rows = [[student_dir_name, student_name], marks.get_scores(), 
+                marks.get_internal_stats(), marks.get_output_checks()]
+        return [rows, marks]
+
+    def _get_artifacts_file(self, folder, student_dir_name):
+        """
+        Internal method, return the file used to store the marking 
+        artifacts for a student.
+        """
+        return os.path.join(
+            folder, student_dir_name.replace(os.sep, '_') + '.pickle')
+
+    def _save_artifacts(self, student_dir_name, java_path, artifacts):
+        """
+        Internal method, save the artifacts collected while marking a 
+        student's submission, so it can be rescored later.
+        """
+        artifacts_file = self._get_artifacts_file(
+            self._collect_dir, student_dir_name)
+        try:
+            data = cPickle.dumps(
+                [java_path, artifacts], cPickle.HIGHEST_PROTOCOL)
+        except RuntimeError:
+            # The AST is too deeply nested to pickle, so is left out and 
+            # parsed again when the submission is rescored
+            artifacts = dict(artifacts)
+            artifacts['program_structure'] = \
+                artifacts['program_structure']._replace(program_tree=None)
+            data = cPickle.dumps(
+                [java_path, artifacts], cPickle.HIGHEST_PROTOCOL)
+        with open(artifacts_file, 'wb') as file:
+            file.write(data)
+
+    def _load_artifacts(self, student_dir_name):
+        """
+        Internal method, load the artifacts saved when a student's 
+        submission was previously marked.
+
+        Returns the path of the java file that was marked and the 
+        artifacts, or an empty path if no artifacts were saved.
+        """
+        java_path = ''
+        artifacts = None
+        artifacts_file = self._get_artifacts_file(
+            self._rescore_dir, student_dir_name)
+        if os.path.exists(artifacts_file):
+            with open(artifacts_file, 'rb') as file:
+                java_path, artifacts = cPickle.load(file)
+        else:
+            print 'No artifacts'
+        return [java_path, artifacts]
+
+    def _write_feedback_document(
             self, student_dir, student_dir_name, student_name, marks):
         """
+        Internal method, create a student's feedback document from the 
+        template and save it. The student details, the results of the 
+        marking and the marking comments are all written before the 
+        document is saved. If there are no marks, only the student details 
+        are written.
+        """
+        filename = os.path.basename(self._feedback_doc_name).replace(
+            'username', student_dir_name)
+        feedback_document = Document(StringIO(self._feedback_template))
+        if marks == None:
+            self._write_student_name_to_document(
+                feedback_document, student_dir_name, student_name)
+        else:
+            self._write_details_to_document(
+                feedback_document, student_dir_name, student_name, marks)
+            self._write_comments_to_document(feedback_document, marks)
+        # Save the resulting feedback sheet
+        feedback_document.save(student_dir+'/../'+filename)
+
+    def _write_details_to_document(
+            self, feedback_document, student_dir_name, student_name, marks):
+        """
         Internal method, write out student details and the results of the 
         marking to a feedback document.
         """
         #default cell for student's firstname lastname
-        filename = self._feedback_doc_name.replace(
-            'username', student_dir_name)
-        self._feedback_document.paragraphs[0].text = \
-            self._feedback_document.paragraphs[0].text.replace(
+        feedback_document.paragraphs[0].text = \
+            feedback_document.paragraphs[0].text.replace(
             '<task>', str(self._task))
-        self._feedback_document.tables[0].cell(1,0).text = student_name
-        self._feedback_document.tables[0].cell(1,1).text = student_dir_name
+        feedback_document.tables[0].cell(1,0).text = student_name
+        feedback_document.tables[0].cell(1,1).text = student_dir_name
         # There is no marker now!
-        #self._feedback_document.tables[0].cell(1,2).text = self._marker_name
-        self._feedback_document.tables[0].cell(1,2).text = 'auto'
-        #print student_dir+'/'+filename
+        #feedback_document.tables[0].cell(1,2).text = self._marker_name
+        feedback_document.tables[0].cell(1,2).text = 'auto'
         # Clear tables
         for row in range(1,16):
-            self._feedback_document.tables[2].cell(row, 2).text = ''
+            feedback_document.tables[2].cell(row, 2).text = ''
  
         # Get the marks to provide as feedback
         execution_score = marks.get_execution_score()
@@ -270,50 +839,38 @@ class BatchMark(object):
             efficient_score = 1
             execution_score -= 1
         # Output the info to the marks table in the feedback sheet
-        self._feedback_document.tables[2].cell(
+        feedback_document.tables[2].cell(
             (2 + int(execution_score)), 2).text = '{:g}'.format(
             execution_score)
-        self._feedback_document.tables[2].cell(
+        feedback_document.tables[2].cell(
             9, 2).text = str(indentation_score)
-        self._feedback_document.tables[2].cell(
+        feedback_document.tables[2].cell(
             10, 2).text = str(variables_score)
-        self._feedback_document.tables[2].cell(
+        feedback_document.tables[2].cell(
             11, 2).text = str(efficient_score)
-        self._feedback_document.tables[2].cell(
+        feedback_document.tables[2].cell(
             13 + int(comment_score), 2).text = str(comment_score)
 
         # Output the total score to the marks table in the feedback sheet
-        self._feedback_document.tables[2].cell(
+        feedback_document.tables[2].cell(
             16, 2).text = '{:g}'.format(total_score)
-        # Save the resulting feedback sheet
-        self._feedback_document.save(student_dir+'/../'+filename)
 
     def _write_student_name_to_document(
-            self, student_dir, student_dir_name, student_name):
+            self, feedback_document, student_dir_name, student_name):
         """
         Internal method, write out student details to the feedback 
         document.
         """
         #default cell for student's firstname lastname
-        filename = self._feedback_doc_name.replace(
-            'username', student_dir_name)
-        self._feedback_document.tables[0].cell(1,0).text = student_name
-        self._feedback_document.tables[0].cell(1,1).text = student_dir_name
-        self._feedback_document.tables[0].cell(1,2).text = self._marker_name
-        self._feedback_document.save(student_dir+'/../'+filename)
-        #print student_dir+'/'+filename
+        feedback_document.tables[0].cell(1,0).text = student_name
+        feedback_document.tables[0].cell(1,1).text = student_dir_name
+        feedback_document.tables[0].cell(1,2).text = self._marker_name
 
-    def _write_comments_to_document(
-            self, student_dir, student_dir_name, marks):
+    def _write_comments_to_document(self, feedback_document, marks):
         """
         Internal method, write out marking comments to the feedback 
         document.
         """
-        filename = os.path.basename(
-            self._feedback_doc_name).replace('username', student_dir_name)
-
-        feedback_document = Document(student_dir+'/../'+filename)
-
         # Add the headings
         feedback_document.add_heading('Program Comments', 2)
 
@@ -335,7 +892,7 @@ class BatchMark(object):
         # Output the outputs generated by the program    
         feedback_document.add_heading('Program output', 3)
 
-        output = marks.get_output().splitlines()
+        output = BatchMark._limit_lines(marks.get_output().splitlines())
         for line in output:
             feedback_document.add_paragraph(line, style='CodeChunk')
 
@@ -343,7 +900,7 @@ class BatchMark(object):
         extra_program_outputs = marks.get_extra_program_outputs()
         for extra in extra_program_outputs:
             feedback_document.add_heading(extra[0], 3)
-            extra_lines = extra[1].splitlines()
+            extra_lines = BatchMark._limit_lines(extra[1].splitlines())
             for line in extra_lines:
                 feedback_document.add_paragraph(line, style='CodeChunk')
 
@@ -389,8 +946,19 @@ class BatchMark(object):
                 feedback_document.add_paragraph(
                     '\t  ' + comment[1], style='CodeChunkComment')
 
-        # Save the resulting feedback file out
-        feedback_document.save(student_dir+'/../'+filename)
+    @staticmethod
+    def _limit_lines(lines):
+        """
+        Internal method, return the lines to show on a feedback sheet for 
+        an output. If there are too many, only the first and last lines 
+        are returned, with a line noting how many were left out.
+        """
+        if len(lines) > BatchMark.FEEDBACK_OUTPUT_LINES:
+            keep = BatchMark.FEEDBACK_OUTPUT_LINES // 2
+            omitted = len(lines) - (2 * keep)
+            lines = lines[:keep] + ['... [{:d} lines omitted] ...'.format(
+                omitted)] + lines[-keep:]
+        return lines
 
     def _construct_name_map(self):
         """
@@ -416,6 +984,85 @@ class BatchMark(object):
                 is_constructing_name_map = True
 
 
+# The BatchMark instance used by each worker process when marking in 
+# parallel
+_worker_batchmark = None
+
+
+def _initialise_worker(args, exec_settings):
+    """
+    Internal function, set up the state for a marking worker process.
+
+    Each submission is marked in a sandbox of its own, so the workers can 
+    share the build folder. The execution settings (for example, whether to 
+    use a warm JVM or a compile cache) are copied from the main process.
+    """
+    global _worker_batchmark
+    task, marking_dir, marker_name, build_dir, feedback_doc_name, \
+        marking_sheet_name, summary_out, seed, collect_dir, rescore_dir, \
+        backend, backend_url, stream_archives, parse_cache = args
+    _worker_batchmark = BatchMark(
+        task, marking_dir, marker_name, build_dir, feedback_doc_name, 
+        marking_sheet_name, summary_out, seed=seed, collect_dir=collect_dir, 
+        rescore_dir=rescore_dir, backend=backend, backend_url=backend_url, 
+        stream_archives=stream_archives, parse_cache=parse_cache)
+    ExecCode.set_settings(exec_settings)
+    # Remove the worker's sandboxes when the worker exits
+    Finalize(_worker_batchmark, _worker_batchmark._sandboxes.close, 
+        exitpriority=10)
+
+
+def _mark_student_worker(student):
+    """
+    Internal function, mark a single student from within a worker process.
+    """
+    return _worker_batchmark._mark_student(*student)
+
+
+def run_worker(
+        address, authkey, build_dir, warm_jvm=False, compile_cache=False, 
+        parse_cache=False):
+    """
+    Mark the students served by a coordinator until there are none left.
+
+    The task and the feedback template are provided by the coordinator. 
+    Each student's folder is unpacked into a working folder inside the 
+    build folder to be marked, and the results are handed back to the 
+    coordinator.
+
+    Args:
+        address: Host and port of the coordinator.
+        authkey: Key needed to connect to the coordinator.
+        build_dir: Temp build folder.
+        warm_jvm: Compile and execute using a long-lived JVM (optional).
+        compile_cache: Cache compiled submissions between runs (optional).
+        parse_cache: Cache parsed source files between runs (optional).
+    """
+    worker = Worker(address, authkey)
+    config = worker.get_config()
+    if not os.path.exists(build_dir):
+        os.makedirs(build_dir)
+    work_dir = mkdtemp(prefix='worker-', dir=build_dir)
+    try:
+        feedback_doc_name = os.path.join(work_dir, config['template_name'])
+        with open(feedback_doc_name, 'wb') as file:
+            file.write(config['template'])
+        marking_dir = os.path.join(work_dir, 'students')
+        os.makedirs(marking_dir)
+        batchmark = BatchMark(
+            config['task'], marking_dir, config['marker_name'], build_dir, 
+            feedback_doc_name, None, os.devnull, warm_jvm=warm_jvm, 
+            compile_cache=compile_cache, seed=config['seed'], 
+            output_limit=config['output_limit'], backend=config['backend'], 
+            backend_url=config['backend_url'], 
+            stream_archives=config['stream_archives'], 
+            parse_cache=parse_cache)
+        worker.run(batchmark._mark_job)
+        batchmark._sandboxes.close()
+    finally:
+        shutil.rmtree(work_dir, True)
+
+
 # Task number
 # Folder containing students' folders
 # Marker's initials (optional)
@@ -423,6 +1070,26 @@ class BatchMark(object):
 # Feedback template (optional)
 # Student details list (optional)
 # Summary output (optional)
+# Number of parallel marking processes (optional)
+# Use a warm JVM for compilation and execution (optional)
+# Compile all submissions in advance (optional)
+# Cache compiled submissions between runs (optional)
+# Seed for generating inputs, replaying cached executions (optional)
+# Folder to save marking artifacts to (optional)
+# Folder to load marking artifacts from, rather than executing (optional)
+# Maximum output from a program in KB (optional)
+# Number of submissions to compile and execute at once (optional)
+# Backend to compile and execute with (optional)
+# Address of the server for the remote backend (optional)
+# Address to serve marking jobs to workers on (optional)
+# Key workers need to connect, generated at random if not given (optional)
+# Number of worker processes to start on this host (optional)
+# Address of a coordinator to take marking jobs from (optional)
+# Only mark students whose submissions have changed since the last run 
+# (optional)
+# Read submissions from their zip archives rather than extracting them 
+# (optional)
+# Cache parsed source files between runs (optional)
 
 # Run as a script, but skip this bit if the code is being imported
 if __name__ == "__main__":
@@ -432,9 +1099,10 @@ if __name__ == "__main__":
 
     # Required parameters
     parser.add_argument(
-        'task', metavar='TASK', type=int, help='Task number (e.g. 1)')
+        'task', metavar='TASK', type=int, nargs='?', 
+        help='Task number (e.g. 1)')
     parser.add_argument(
-        'workdir', metavar='WORK', type=str, 
+        'workdir', metavar='WORK', type=str, nargs='?', 
         help='Folder containing students\' folders (e.g. ./DLJ)')
 
     # Optional parameters
@@ -459,12 +1127,115 @@ if __name__ == "__main__":
         '-s', '--summary', metavar='SUMMARY', type=str, 
         help='Summary of marks as a CSV file (default ./summary.csv)', 
         default='./summary.csv')
+    parser.add_argument(
+        '-j', '--jobs', metavar='JOBS', type=int, 
+        help='Number of students to mark in parallel (default 1)', 
+        default=1)
+    parser.add_argument(
+        '-w', '--warm', action='store_true', 
+        help='Compile and execute using a long-lived JVM rather than '
+            'starting javac and java for every student. Only the time and '
+            'output limits are applied')
+    parser.add_argument(
+        '-c', '--precompile', action='store_true', 
+        help='Compile all of the submissions in a single compiler run '
+            'before marking')
+    parser.add_argument(
+        '--no-compile-cache', dest='compile_cache', action='store_false', 
+        help='Don\'t reuse compiled submissions from previous runs')
+    parser.add_argument(
+        '--no-parse-cache', dest='parse_cache', action='store_false', 
+        help='Don\'t reuse parsed source files from previous runs')
+    parser.add_argument(
+        '--seed', metavar='SEED', type=int, 
+        help='Seed for generating the program inputs. Programs that haven\'t '
+            'changed since a previous run with the same seed have their '
+            'results replayed rather than being executed again', 
+        default=None)
+    parser.add_argument(
+        '--output-limit', metavar='KB', type=int, 
+        help='Maximum output a program can generate on stdout or stderr '
+            'before it\'s stopped (default 1024)', 
+        default=None)
+    parser.add_argument(
+        '--collect', metavar='ARTIFACTS', type=str, 
+        help='Folder to save the artifacts collected while marking to, so '
+            'the submissions can be rescored without executing them', 
+        default=None)
+    parser.add_argument(
+        '--rescore', metavar='ARTIFACTS', type=str, 
+        help='Score the submissions using the artifacts saved to the folder '
+            'by a previous run with --collect, rather than executing them', 
+        default=None)
+    parser.add_argument(
+        '--in-flight', metavar='SUBMISSIONS', type=int, 
+        help='Number of submissions to compile and execute at once, managed '
+            'from a single thread (default 1, ignored with --jobs)', 
+        default=1)
+    parser.add_argument(
+        '--backend', metavar='BACKEND', type=str, 
+        choices=sorted(BACKENDS.keys()), 
+        help='Where to compile and execute the programs: local, warm (the '
+            'same as --warm) or remote (default local)', 
+        default='local')
+    parser.add_argument(
+        '--url', metavar='URL', type=str, 
+        help='Address of the server for the remote backend (e.g. '
+            'http://localhost:8080/api)', 
+        default=None)
+    parser.add_argument(
+        '--coordinator', metavar='HOST:PORT', type=str, 
+        help='Serve the students as jobs for workers to mark, listening on '
+            'the given address (e.g. 0.0.0.0:5000)', 
+        default=None)
+    parser.add_argument(
+        '--local-workers', metavar='WORKERS', type=int, 
+        help='Number of worker processes to start on this host when acting '
+            'as the coordinator (default 0)', 
+        default=0)
+    parser.add_argument(
+        '--worker', metavar='HOST:PORT', type=str, 
+        help='Mark students served by the coordinator at the given address, '
+            'rather than marking a folder. TASK and WORK aren\'t needed', 
+        default=None)
+    parser.add_argument(
+        '--authkey', metavar='KEY', type=str, 
+        help='Key workers need to connect to the coordinator. Needed by '
+            'workers; the coordinator generates and prints a random key if '
+            'it isn\'t given', 
+        default=None)
+    parser.add_argument(
+        '--incremental', action='store_true', 
+        help='Only mark students whose submissions, task or marking code '
+            'have changed since the last run, reusing the results of the '
+            'others')
+    parser.add_argument(
+        '--stream-archives', action='store_true', 
+        help='Read the java file to mark straight from each student\'s zip '
+            'archive, rather than extracting the archive into their folder')
 
     # Apply these arguments
     args = parser.parse_args()
+    if args.worker != None:
+        if args.authkey == None:
+            parser.error('--authkey is needed when acting as a worker')
+        run_worker(parse_address(args.worker), args.authkey, args.builddir, 
+            args.warm, args.compile_cache, args.parse_cache)
+        sys.exit(0)
+    if (args.task == None) or (args.workdir == None):
+        parser.error('TASK and WORK are needed unless acting as a worker')
+    if args.backend == 'remote':
+        try:
+            RemoteBackend.check_url(args.url)
+        except ValueError as error:
+            parser.error(str(error) + ' (use --url)')
     batchmark = BatchMark(
         args.task, args.workdir, args.initials, args.builddir, args.template, 
-        args.details, args.summary)
+        args.details, args.summary, args.jobs, args.warm, args.precompile, 
+        args.compile_cache, args.seed, args.collect, args.rescore, 
+        args.output_limit, args.in_flight, args.backend, args.url, 
+        args.coordinator, args.authkey, args.local_workers, 
+        args.incremental, args.stream_archives, args.parse_cache)
     batchmark.go()
 
     # Output the time taken for perforance testing
@@ -0,0 +1,371 @@
+# vim: et:ts=4:textwidth=80
+
+# Automark
+#
+# David Llewellyn-Jones
+# Liverpool John Moores University
+# 18/12/2014
+# Released under the GPL v.3. See the LICENSE file for more details.
+
+"""
+Cache the results of expensive marking operations on disk.
+
+Each cache entry is a folder of files, named after a hash of whatever was
+used to generate them. Entries are written to a temporary folder and then
+renamed into place, so several marking processes can share the same cache.
+When the cache grows beyond its maximum size, the least recently used
+entries are removed.
+"""
+
+import cPickle
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import zlib
+
+from subprocess import PIPE, Popen
+from tempfile import mkdtemp
+from time import time
+
+__all__ = ('DirectoryCache', 'CompileCache', 'ExecutionCache', 'ParseCache')
+
+
+class DirectoryCache(object):
+    """
+    Store folders of files on disk, keyed by a hash.
+
+    The modification time of an entry's folder is updated each time it's
+    used, and is used to decide which entries to evict when the cache is
+    full.
+    """
+
+    # When the cache is full, entries are evicted until it's this fraction of
+    # its maximum size, so it isn't scanned again for every entry stored
+    _EVICT_TO = 0.9
+
+    def __init__(self, folder, max_size):
+        """
+        Initialise the DirectoryCache class.
+
+        Attributes:
+            folder: Folder to store the cache entries in.
+            max_size: Maximum total size of the cache entries in bytes.
+        """
+        self._folder = folder
+        self._max_size = max_size
+        # Running total of the size of the entries, or None until the cache
+        # has been scanned. Entries stored by other processes aren't added,
+        # so the cache is scanned again whenever this exceeds the maximum
+        self._size = None
+
+    @staticmethod
+    def make_key(*parts):
+        """
+        Return a key for the cache from a list of strings.
+        """
+        key = hashlib.sha1()
+        for part in parts:
+            if isinstance(part, unicode):
+                part = part.encode('utf-8')
+            key.update(str(len(part)) + ':')
+            key.update(part)
+        return key.hexdigest()
+
+    def get(self, key):
+        """
+        Return the contents of a cache entry.
+
+        Returns a dictionary mapping filenames to their contents, or None
+        if there's no entry for the key.
+        """
+        entry = os.path.join(self._folder, key)
+        files = None
+        try:
+            if os.path.isdir(entry):
+                files = {}
+                for name in os.listdir(entry):
+                    with open(os.path.join(entry, name), 'rb') as file:
+                        files[name] = file.read()
+                # Mark the entry as recently used
+                os.utime(entry, None)
+        except (IOError, OSError):
+            # The entry was evicted while we were reading it
+            files = None
+        return files
+
+    def put(self, key, files):
+        """
+        Store a cache entry.
+
+        Args:
+            key: The key to store the entry under.
+            files: Dictionary mapping filenames to their contents.
+        """
+        entry = os.path.join(self._folder, key)
+        if not os.path.exists(self._folder):
+            try:
+                os.makedirs(self._folder)
+            except OSError:
+                # Another process created it first
+                pass
+        # Write the entry somewhere else first, so it appears complete
+        staging = mkdtemp(prefix='.staging-', dir=self._folder)
+        for name, contents in files.items():
+            with open(os.path.join(staging, name), 'wb') as file:
+                file.write(contents)
+        try:
+            os.rename(staging, entry)
+            if self._size != None:
+                self._size += sum(
+                    len(contents) for contents in files.values())
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(staging, True)
+        if (self._size == None) or (self._size > self._max_size):
+            self._evict()
+
+    def clear(self):
+        """
+        Remove all of the entries from the cache.
+        """
+        shutil.rmtree(self._folder, True)
+        self._size = 0
+
+    def _evict(self):
+        """
+        For internal use, remove the least recently used entries if the
+        cache is over its maximum size, and update the running total of its
+        size.
+        """
+        entries = []
+        total_size = 0
+        try:
+            for name in os.listdir(self._folder):
+                entry = os.path.join(self._folder, name)
+                if name.startswith('.staging-'):
+                    # Tidy up anything left behind by a crashed process
+                    if os.path.getmtime(entry) < time() - 3600:
+                        shutil.rmtree(entry, True)
+                else:
+                    size = 0
+                    for file in os.listdir(entry):
+                        size += os.path.getsize(os.path.join(entry, file))
+                    entries.append([os.path.getmtime(entry), size, entry])
+                    total_size += size
+        except OSError:
+            # Another process is evicting at the same time
+            pass
+
+        # Remove the oldest entries first
+        entries.sort()
+        target_size = self._max_size
+        if total_size > self._max_size:
+            target_size = self._max_size * DirectoryCache._EVICT_TO
+        for last_used, size, entry in entries:
+            if total_size <= target_size:
+                break
+            shutil.rmtree(entry, True)
+            total_size -= size
+        self._size = total_size
+
+
+class CompileCache(DirectoryCache):
+    """
+    Cache the class files and compiler output for Java source code.
+
+    The key includes the javac version, so changing the JDK won't result in
+    stale class files being used.
+    """
+
+    # The javac version, established the first time it's needed
+    _javac_version = None
+
+    def get_key(self, classname, source_code):
+        """
+        Return the cache key for some source code.
+        """
+        return DirectoryCache.make_key(
+            classname, source_code, CompileCache.get_javac_version())
+
+    @staticmethod
+    def get_javac_version():
+        """
+        Return the version string reported by javac.
+        """
+        if CompileCache._javac_version == None:
+            try:
+                # Older versions of javac output the version on stderr
+                compiler = Popen(
+                    ['javac', '-version'], shell=False, stdin=PIPE,
+                    stdout=PIPE, stderr=PIPE)
+                output = compiler.communicate()
+                CompileCache._javac_version = (output[0] + output[1]).strip()
+            except OSError:
+                CompileCache._javac_version = ''
+        return CompileCache._javac_version
+
+
+class ExecutionCache(DirectoryCache):
+    """
+    Cache the results of compiling and executing a program.
+
+    The key includes the source code, the input on stdin and the contents
+    of any input files, so a program will only be replayed from the cache
+    if it's given exactly the same inputs as before. It also includes the
+    settings the program was executed with (such as its resource limits)
+    and the java and javac versions. Entries hold the details of the
+    execution, the program's stdout and stderr, the compiler output and the
+    contents of any output files the program generated.
+    """
+
+    # The java version, established the first time it's needed
+    _java_version = None
+
+    def get_key(self, classname, source_code, input, input_files, settings):
+        """
+        Return the cache key for an execution.
+
+        Args:
+            classname: The name of the class containing main().
+            source_code: The Java source code.
+            input: Text passed to the program on stdin.
+            input_files: Dictionary mapping input filenames to their
+                contents, or to None if the file doesn't exist.
+            settings: A list of the settings that affect the results of
+                executing the program.
+        """
+        parts = [classname, source_code, input, repr(settings), 
+            CompileCache.get_javac_version(), 
+            ExecutionCache.get_java_version()]
+        for name in sorted(input_files.keys()):
+            parts.append(name)
+            if input_files[name] == None:
+                parts.append('missing')
+            else:
+                parts.append('present')
+                parts.append(input_files[name])
+        return DirectoryCache.make_key(*parts)
+
+    @staticmethod
+    def get_java_version():
+        """
+        Return the version string reported by java.
+        """
+        if ExecutionCache._java_version == None:
+            try:
+                # The version is output on stderr
+                java = Popen(
+                    ['java', '-version'], shell=False, stdin=PIPE,
+                    stdout=PIPE, stderr=PIPE)
+                output = java.communicate()
+                ExecutionCache._java_version = (output[0] + output[1]).strip()
+            except OSError:
+                ExecutionCache._java_version = ''
+        return ExecutionCache._java_version
+
+    def get_execution(self, key):
+        """
+        Return a cached execution.
+
+        Returns a list containing a dictionary of the execution details
+        (result, time, memory and signal), the stdout, stderr and compiler
+        outputs, and a dictionary mapping output filenames to their
+        contents. None is returned if there's no entry for the key.
+        """
+        files = self.get(key)
+        execution = None
+        if files != None:
+            output_files = {}
+            for name in files:
+                if name.startswith('file-'):
+                    output_files[name[len('file-'):]] = files[name]
+            execution = [json.loads(files['details']), 
+                files['stdout'].decode('utf-8'), 
+                files['stderr'].decode('utf-8'), 
+                files['cmpinfo'].decode('utf-8', 'replace'), output_files]
+        return execution
+
+    def put_execution(
+            self, key, details, stdout, stderr, cmpinfo, output_files):
+        """
+        Store the results of an execution.
+
+        The arguments take the same form as the list returned by
+        get_execution().
+        """
+        if isinstance(cmpinfo, unicode):
+            cmpinfo = cmpinfo.encode('utf-8')
+        files = {'details': json.dumps(details), 
+            'stdout': stdout.encode('utf-8'), 
+            'stderr': stderr.encode('utf-8'), 'cmpinfo': cmpinfo}
+        for name in output_files:
+            files['file-' + name] = output_files[name]
+        self.put(key, files)
+
+
+class ParseCache(DirectoryCache):
+    """
+    Cache the ASTs generated by parsing Java source code.
+
+    Each entry holds a single tree, pickled and compressed. The key includes
+    a hash of the parser and the classes the tree is built from, so changing
+    either won't result in stale trees being used.
+    """
+
+    # The parser version, established the first time it's needed
+    _parser_version = None
+
+    def get_key(self, source_code):
+        """
+        Return the cache key for some source code.
+        """
+        return DirectoryCache.make_key(
+            source_code, ParseCache.get_parser_version())
+
+    def get_tree(self, key):
+        """
+        Return a cached AST.
+
+        Returns a list containing whether there's an entry for the key and
+        the AST, which is None if the code couldn't be parsed.
+        """
+        files = self.get(key)
+        found = False
+        tree = None
+        if files != None:
+            try:
+                tree = cPickle.loads(zlib.decompress(files['tree']))
+                found = True
+            except Exception:
+                # The entry is damaged, so the code will be parsed again
+                tree = None
+        return [found, tree]
+
+    def put_tree(self, key, tree):
+        """
+        Store an AST.
+        """
+        try:
+            data = zlib.compress(
+                cPickle.dumps(tree, cPickle.HIGHEST_PROTOCOL))
+        except RuntimeError:
+            # The tree is too deeply nested to pickle, so isn't cached
+            return
+        self.put(key, {'tree': data})
+
+    @staticmethod
+    def get_parser_version():
+        """
+        Return a hash of the plyjext parser and model source code.
+        """
+        if ParseCache._parser_version == None:
+            # Imported here so that the other caches don't need the parser
+            from plyjext import model, parser
+            key = hashlib.sha1()
+            for module in [parser, model]:
+                with open(inspect.getsourcefile(module), 'rb') as file:
+                    key.update(hashlib.sha1(file.read()).hexdigest())
+            ParseCache._parser_version = key.hexdigest()
+        return ParseCache._parser_version
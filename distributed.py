@@ -0,0 +1,330 @@
+# vim: et:ts=4:textwidth=80
+
+# Automark
+#
+# David Llewellyn-Jones
+# Liverpool John Moores University
+# 18/12/2014
+# Released under the GPL v.3. See the LICENSE file for more details.
+
+"""
+Share marking jobs between worker processes on several hosts.
+
+A Coordinator holds a queue of jobs and serves it over TCP. Workers, which
+can be processes on the same host or on other hosts, connect to the
+coordinator, take a job at a time, and hand back the result.
+
+Each job has an ID derived from its contents, so adding the same job twice
+only marks it once, and a result handed back twice is only recorded once.
+A job taken by a worker is leased to it for a limited time. If the worker
+reports that the job failed, or doesn't hand back a result before the lease
+expires (for example, because it crashed), the job is returned to the queue
+to be taken by another worker. A job that fails too many times is given up
+on, so its result is None.
+
+Jobs and results are exchanged as pickles, so anyone who can connect with
+the key can run code on the coordinator. The key must be kept secret.
+"""
+
+import hashlib
+import os
+import socket
+import threading
+
+from collections import deque
+from multiprocessing.managers import BaseManager
+from time import sleep, time
+
+__all__ = ('JobQueue', 'Coordinator', 'Worker', 'parse_address')
+
+
+class JobQueue(object):
+    """
+    The jobs to be done, the workers they're leased to and their results.
+
+    The public methods can be called by workers through a proxy.
+    """
+
+    # How long a worker has to complete a job before it's given to another
+    # worker, in seconds
+    LEASE_TIME = 600
+
+    # The number of times a job is attempted before it's given up on
+    MAX_ATTEMPTS = 3
+
+    def __init__(self, config):
+        """
+        Initialise the JobQueue class.
+
+        Attributes:
+            config: Settings passed to each worker when it connects.
+        """
+        self._config = config
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._jobs = {}
+        self._waiting = deque()
+        self._leases = {}
+        self._attempts = {}
+        self._results = {}
+        self._closed = False
+
+    def get_config(self):
+        """
+        Return the settings for the workers.
+        """
+        return self._config
+
+    def get_job(self, worker):
+        """
+        Lease the next job to a worker.
+
+        Returns the job ID and the job, or None and whether the queue has
+        been closed if there are no jobs waiting.
+        """
+        with self._lock:
+            self._expire_leases()
+            if len(self._waiting) == 0:
+                return [None, self._closed]
+            job_id = self._waiting.popleft()
+            self._leases[job_id] = [worker, time() + JobQueue.LEASE_TIME]
+            self._attempts[job_id] += 1
+            return [job_id, self._jobs[job_id]]
+
+    def complete(self, job_id, worker, result):
+        """
+        Record the result of a job.
+
+        Returns False if the job already has a result, in which case this
+        one is ignored.
+        """
+        with self._lock:
+            if (job_id not in self._jobs) or (job_id in self._results):
+                return False
+            self._results[job_id] = result
+            self._leases.pop(job_id, None)
+            if job_id in self._waiting:
+                # The lease had expired, but the result arrived anyway
+                self._waiting.remove(job_id)
+            self._changed.notify_all()
+            return True
+
+    def fail(self, job_id, worker, error):
+        """
+        Record that a worker couldn't complete a job, so that it's retried.
+        """
+        with self._lock:
+            lease = self._leases.get(job_id)
+            if (lease != None) and (lease[0] == worker):
+                print 'Job failed on {}: {}'.format(worker, error)
+                del self._leases[job_id]
+                self._retry(job_id)
+
+    def add_job(self, job_id, job):
+        """
+        Add a job to the queue, unless a job with the same ID has already
+        been added.
+        """
+        with self._lock:
+            if job_id not in self._jobs:
+                self._jobs[job_id] = job
+                self._attempts[job_id] = 0
+                self._waiting.append(job_id)
+
+    def get_result(self, job_id):
+        """
+        Block until a job has a result, then return it.
+        """
+        with self._lock:
+            while job_id not in self._results:
+                self._expire_leases()
+                # Wake up periodically to check for expired leases
+                self._changed.wait(1.0)
+            return self._results[job_id]
+
+    def close(self):
+        """
+        Tell the workers there will be no more jobs.
+        """
+        with self._lock:
+            self._closed = True
+
+    def _expire_leases(self):
+        """
+        For internal use, return jobs whose leases have expired to the
+        queue. The lock must be held.
+        """
+        now = time()
+        for job_id, lease in self._leases.items():
+            if lease[1] < now:
+                print 'Job lease expired on {}'.format(lease[0])
+                del self._leases[job_id]
+                self._retry(job_id)
+
+    def _retry(self, job_id):
+        """
+        For internal use, return a job to the queue, or give up on it if
+        it's been attempted too many times. The lock must be held.
+        """
+        if self._attempts[job_id] >= JobQueue.MAX_ATTEMPTS:
+            self._results[job_id] = None
+            self._changed.notify_all()
+        else:
+            self._waiting.appendleft(job_id)
+
+
+class _CoordinatorManager(BaseManager):
+    """
+    Internal class, serve the job queue to workers.
+    """
+    pass
+
+
+class _WorkerManager(BaseManager):
+    """
+    Internal class, connect to a coordinator's job queue.
+    """
+    pass
+
+
+_WorkerManager.register('get_queue')
+
+
+class Coordinator(object):
+    """
+    Serve a JobQueue to workers over TCP from a background thread.
+    """
+
+    def __init__(self, address, authkey, config):
+        """
+        Initialise the Coordinator class, and start accepting connections
+        from workers.
+
+        Attributes:
+            address: Host and port to listen on.
+            authkey: Key the workers must provide to connect. This should
+                be long and random.
+            config: Settings passed to each worker when it connects.
+        """
+        self.queue = JobQueue(config)
+        _CoordinatorManager.register('get_queue', callable=self._get_queue)
+        manager = _CoordinatorManager(address=address, authkey=authkey)
+        self._server = manager.get_server()
+        self.address = self._server.address
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def add_job(self, job):
+        """
+        Add a job to the queue.
+
+        Returns the job's ID, which is a hash of the job.
+        """
+        job_id = Coordinator.make_job_id(job)
+        self.queue.add_job(job_id, job)
+        return job_id
+
+    def get_result(self, job_id):
+        """
+        Block until a job has a result, then return it. None is returned if
+        the job was given up on.
+        """
+        return self.queue.get_result(job_id)
+
+    def close(self):
+        """
+        Tell the workers there will be no more jobs.
+        """
+        self.queue.close()
+
+    @staticmethod
+    def make_job_id(job):
+        """
+        Return an ID for a job, which is a dictionary of strings.
+        """
+        key = hashlib.sha1()
+        for name in sorted(job.keys()):
+            value = job[name]
+            if isinstance(value, unicode):
+                value = value.encode('utf-8')
+            key.update('{}:{:d}:'.format(name, len(value)))
+            key.update(value)
+        return key.hexdigest()
+
+    def _get_queue(self):
+        """
+        For internal use, return the job queue to the manager.
+        """
+        return self.queue
+
+
+class Worker(object):
+    """
+    Take jobs from a coordinator and hand back their results.
+    """
+
+    # How long to wait before asking for another job when there are none,
+    # in seconds
+    IDLE_WAIT = 1.0
+
+    def __init__(self, address, authkey):
+        """
+        Initialise the Worker class, connecting to the coordinator.
+
+        Attributes:
+            address: Host and port of the coordinator.
+            authkey: Key needed to connect to the coordinator.
+        """
+        manager = _WorkerManager(address=address, authkey=authkey)
+        manager.connect()
+        self._queue = manager.get_queue()
+        self.name = Worker.get_name()
+
+    @staticmethod
+    def get_name():
+        """
+        Return the name the worker in this process is known by.
+        """
+        return '{}:{:d}'.format(socket.gethostname(), os.getpid())
+
+    def get_config(self):
+        """
+        Return the settings provided by the coordinator.
+        """
+        return self._queue.get_config()
+
+    def run(self, do_job):
+        """
+        Do jobs until the coordinator closes the queue or goes away.
+
+        Args:
+            do_job: Function called with each job, which returns the result.
+                If it raises an exception the job is retried elsewhere.
+        """
+        try:
+            while True:
+                job_id, job = self._queue.get_job(self.name)
+                if job_id == None:
+                    if job:
+                        # The queue's been closed
+                        break
+                    sleep(Worker.IDLE_WAIT)
+                    continue
+                try:
+                    result = do_job(job)
+                except Exception as error:
+                    self._queue.fail(job_id, self.name, repr(error))
+                else:
+                    self._queue.complete(job_id, self.name, result)
+        except (EOFError, IOError):
+            # The coordinator has finished
+            pass
+
+
+def parse_address(address):
+    """
+    Return the host and port from a string of the form host:port.
+    """
+    host, _, port = address.rpartition(':')
+    return (host, int(port))
@@ -16,19 +16,30 @@ create a submission. This is executed with the given intputs, after
 which the outputs are returned for testing.
 """
 
+import errno
+import hashlib
 import os
+import select
+import signal
 import sys
 
 from collections import namedtuple
-from Queue import Queue, Empty
 from time import strftime, time, sleep
-from shutil import copytree
+from shutil import copy
 from subprocess import PIPE, Popen, STDOUT
+from javatools import compile_helper, get_shim_jar
+from warmjvm import WarmJVM
+
+try:
+    import resource
+except ImportError:
+    # Resource limits aren't available on this platform
+    resource = None
 
 Status = namedtuple('Status', ['key', 'value'])
 ON_POSIX = 'posix' in sys.builtin_module_names
 
-__all__ = ('ExecCode')
+__all__ = ('ExecCode', 'OutputBuffer')
 
 
 class ExecCode(object):
@@ -47,20 +58,105 @@ class ExecCode(object):
     # return time, date, status, result, memory, signal, source, input, 
     # output, stderr, cmpinfo
 
-    def __init__(self, tempfolder, classname):
+    # wait_for_submission(timeout)
+    # return error, status, result
+    # Not part of the ideone API. Blocks until the submission completes, so 
+    # callers needn't poll getSubmissionStatus()
+
+    # Set to True to compile and execute submissions using a long-lived JVM
+    # rather than starting javac and java for each submission. If the warm 
+    # JVM fails, execution falls back to starting javac and java. Only the 
+    # output limit and the time limit (as elapsed rather than CPU time) apply 
+    # to the warm JVM; the memory, file size and process limits don't, and 
+    # no memory use is reported
+    warm_jvm = False
+
+    # Folder containing submissions compiled in advance by precompile(), or 
+    # None if submissions should always be compiled when they're executed
+    precompiled_folder = None
+
+    # CompileCache used to avoid recompiling source that's been compiled 
+    # before, or None to always compile
+    compile_cache = None
+
+    # The class-level settings above, which need to be replicated in any 
+    # other process that creates submissions
+    SETTINGS = ('warm_jvm', 'precompiled_folder', 'compile_cache', 
+        'execution_cache', 'memory_limit', 'cpu_limit', 'process_limit', 
+        'file_size_limit', 'output_limit')
+
+    # Limits applied to each program executed locally. The memory limit is 
+    # the maximum Java heap size in bytes and the CPU limit is in seconds. 
+    # The process limit applies to all of the processes and threads of the 
+    # user running the marking, so is off (None) by default. The file size 
+    # limit is the largest file in bytes the program can write
+    memory_limit = 256 * 1024 * 1024
+    cpu_limit = 10
+    process_limit = None
+    file_size_limit = 16 * 1024 * 1024
+
+    # The maximum number of bytes of each of stdout and stderr a program can 
+    # generate. A program that generates more is stopped, and the start and 
+    # end of its output are kept
+    output_limit = 1024 * 1024
+
+    # The size of the chunks output is read in
+    _CHUNK_SIZE = 65536
+
+    # The size of the chunks input is written in. A pipe reported as 
+    # writable is only guaranteed to have room for PIPE_BUF bytes, so 
+    # writing more could block if the program stops reading its input
+    _WRITE_SIZE = getattr(select, 'PIPE_BUF', 512)
+
+    # How often to check whether a program that's closed its output has 
+    # exited, in seconds
+    _EXIT_POLL_INTERVAL = 0.01
+
+    # ExecutionCache used to replay executions of a program given the same 
+    # inputs as a previous run, or None to always execute
+    execution_cache = None
+
+    # Scheduler used to compile and execute submissions from a single 
+    # thread, or None to use a thread per submission. The scheduler belongs 
+    # to the process that created it, so isn't one of the SETTINGS
+    scheduler = None
+
+    def __init__(self, tempfolder, classname, input_files=None, 
+            output_files=None, warm_jvm=None):
         """
         Create a new instane of ExecCode(tempfolder).
+        
+        Attributes:
+            tempfolder: Folder to build and execute the code in.
+            classname: The name of the class containing main().
+            input_files: Names of any files in the temp folder that the 
+                program reads from (optional).
+            output_files: Names of any files in the temp folder that the 
+                program writes to (optional).
+            warm_jvm: Whether to use a long-lived JVM, overriding 
+                ExecCode.warm_jvm (optional).
         """
         # Establish the temp folder
         self._tempfolder = tempfolder
         self._classname = classname
         self._tempsourceleaf = classname + '.java'
+        self._input_files = input_files or []
+        self._output_files = output_files or []
+        self._warm_jvm = warm_jvm
+        if warm_jvm == None:
+            self._warm_jvm = ExecCode.warm_jvm
 
     # This doesn't confirm to PEP 8, but has been left to match the ideone API
     def createSubmission(
-            self, user, password, sourceCode, language, input, run, private):
+            self, user, password, sourceCode, language, input, run, private, 
+            callback=None):
         """
         Create a new piece of code to be compiled and executed.
+
+        If a callback is provided it will be called with the submission 
+        status (as returned by getSubmissionStatus()) as soon as the 
+        compilation and execution completes. Note that it's called from the 
+        thread that performs the execution.
         """
         # Store the persistent info
         self._sourceCode = sourceCode
@@ -71,8 +167,6 @@ class ExecCode(object):
         # Create the temp folder if it doesn't already exist
         if not os.path.exists(self._tempfolder):
             os.makedirs(self._tempfolder)
-        if not os.path.exists(self._tempfolder + '/uk'):
-            copytree('java/uk', self._tempfolder + '/uk')
 
         # Create the temporary source file to build based on the source code 
         # provided
@@ -83,11 +177,17 @@ class ExecCode(object):
 
         # Set up details of the submission in the sub-thread
         self._submission = self.Submission(
-            self._tempfolder, self._tempsource, self._classname, input)
+            self._tempfolder, self._tempsource, self._classname, input, 
+            callback, self._input_files, self._output_files, self._warm_jvm)
         self._status = 1
-        # Spawn the sub-thread to perform compilation and execution of the 
-        # submission
-        self._submission.start()
+        if (ExecCode.scheduler != None) and not self._warm_jvm:
+            # Queue the submission to be compiled and executed alongside the 
+            # others
+            ExecCode.scheduler.submit(self._submission)
+        else:
+            # Spawn the sub-thread to perform compilation and execution of 
+            # the submission
+            self._submission.start()
         status = {'item': [Status('error', 'OK'), Status('link', 0)]}
 
         return status
@@ -107,6 +207,31 @@ class ExecCode(object):
             status = self._submission._get_submission_status()
         return status
 
+    def wait_for_submission(self, timeout=None):
+        """
+        Block until the submission has finished compiling and executing.
+
+        This isn't part of the ideone API, but allows the result to be 
+        collected as soon as the submission completes, rather than having to 
+        periodically poll getSubmissionStatus(). If the timeout (in seconds) 
+        expires first, the current status is returned.
+        """
+        if self._status != 0:
+            self._submission.wait(timeout)
+        return self.getSubmissionStatus('', '', 0)
+
+    def cancel_submission(self):
+        """
+        Stop a submission that's queued or in progress with the scheduler.
+
+        This isn't part of the ideone API. The submission completes with an 
+        internal error. Submissions executed by a thread of their own can't 
+        be cancelled, and run to completion.
+        """
+        if (self._status != 0) and (ExecCode.scheduler != None) and (
+                not self._warm_jvm):
+            ExecCode.scheduler.cancel(self._submission)
+
     # This doesn't confirm to PEP 8, but has been left to match the ideone API
     def getSubmissionDetails(
             self, user, password, link, withSource, withInput, withOutput, 
@@ -124,6 +249,7 @@ class ExecCode(object):
             details['item'].append(Status('result', 0))
             details['item'].append(Status('memory', 0))
             details['item'].append(Status('signal', 0))
+            details['item'].append(Status('truncated', False))
             details['item'].append(Status('public', False))
             if withInput:
                 details['item'].append(Status('input', self._input))
@@ -142,6 +268,86 @@ class ExecCode(object):
             details['item'].append(Status('source', self._sourceCode))
         return details
 
+    @staticmethod
+    def get_settings():
+        """
+        Return the class-level settings as a dictionary.
+        """
+        settings = {}
+        for name in ExecCode.SETTINGS:
+            settings[name] = getattr(ExecCode, name)
+        return settings
+
+    @staticmethod
+    def set_settings(settings):
+        """
+        Apply class-level settings returned by get_settings().
+        """
+        for name in ExecCode.SETTINGS:
+            if name in settings:
+                setattr(ExecCode, name, settings[name])
+
+    @staticmethod
+    def precompile(submissions, folder):
+        """
+        Compile many submissions in advance using a single compiler JVM.
+        
+        Each submission is compiled into its own subfolder of the folder 
+        provided, named after a hash of its class name and source code. If 
+        ExecCode.precompiled_folder is set to the same folder, submissions 
+        created later with identical source will use the results rather 
+        than starting the compiler again. This includes any compilation 
+        errors, so the result can still be reported as a compilation error.
+        
+        Args:
+            submissions: List of [classname, sourceCode] pairs to compile.
+            folder: Folder to store the compiled submissions in.
+            
+        Returns:
+            True if the compiler ran successfully.
+        """
+        sources = []
+        for classname, source_code in submissions:
+            subfolder = os.path.join(
+                folder, ExecCode._source_key(classname, source_code))
+            if not os.path.exists(os.path.join(subfolder, 'result.txt')):
+                # This hasn't been compiled already, so add it to the list
+                if not os.path.exists(subfolder):
+                    os.makedirs(subfolder)
+                source = os.path.abspath(
+                    os.path.join(subfolder, classname + '.java'))
+                with open(source, 'w') as file:
+                    file.write(source_code)
+                sources.append(source)
+
+        success = True
+        if len(sources) > 0:
+            # Compile all of the submissions in one go
+            helperfolder = os.path.join(folder, 'tools')
+            list_file = os.path.join(folder, 'sources.txt')
+            with open(list_file, 'w') as file:
+                file.write('\n'.join(sources) + '\n')
+            success = compile_helper('BatchCompiler', helperfolder)
+            if success:
+                program = Popen(
+                    ['java', '-cp', helperfolder, 'BatchCompiler', 
+                    get_shim_jar(helperfolder), list_file], 
+                    shell=False, cwd='.', stdin=PIPE)
+                program.communicate()
+                success = (program.returncode == 0)
+        return success
+
+    @staticmethod
+    def _source_key(classname, source_code):
+        """
+        Return a key that identifies a piece of source code.
+        """
+        key = hashlib.sha1()
+        key.update(classname)
+        key.update('\0')
+        key.update(source_code)
+        return key.hexdigest()
+
     @staticmethod
     def get_value(response, key):
         """
@@ -233,7 +439,10 @@ class ExecCode(object):
         """
         Threading class to support parallel compilation and execution.
         """
-        def __init__(self, tempfolder, tempsource, classname, input):
+        def __init__(
+                self, tempfolder, tempsource, classname, input, 
+                callback=None, input_files=None, output_files=None, 
+                warm_jvm=False):
             """
             Initialise the thread.
             """
@@ -253,40 +462,221 @@ class ExecCode(object):
             self._compile_result = [0, '']
             self._exec_result = [0, '', '']
             self._maxexectime = 3.0
+            self._timelimitexceeded = False
+            self._outputlimitexceeded = False
+            self._truncated = False
+            self._memory = 0
+            self._input_files = input_files or []
+            self._output_files = output_files or []
+            self._callback = callback
+            self._warm_jvm = warm_jvm
+            self._finished = ExecCode.threading.Event()
             ExecCode.threading.Thread.__init__(self)
 
+        def wait(self, timeout=None):
+            """
+            Block until the compilation and execution has completed.
+            
+            Returns True if the submission completed, or False if the 
+            timeout expired first.
+            """
+            self._finished.wait(timeout)
+            return self._finished.is_set()
+
         def run(self):
             """
             The thread entry point.
             """
+            try:
+                self._compile_and_execute()
+            finally:
+                self._finish()
+
+        def _finish(self):
+            """
+            For internal use, wake up anyone waiting for the submission to 
+            complete and call the callback.
+            """
+            self._finished.set()
+            if self._callback is not None:
+                self._callback(self._get_submission_status())
+
+        def _compile_and_execute(self):
+            """
+            For internal use, compile and execute the submission.
+            """
+            cache_key = None
+            if ExecCode.execution_cache != None:
+                cache_key = self._get_execution_key()
+                if self._replay_execution(cache_key):
+                    # The same program has been executed with the same inputs 
+                    # before, so there's no need to do it again
+                    return
+
+            if not (self._warm_jvm and self._compile_and_execute_warm()):
+                self._compile_and_execute_cold()
+
+            if cache_key != None:
+                self._store_execution(cache_key)
+
+        def _get_execution_key(self):
+            """
+            For internal use, return the execution cache key for the 
+            submission, based on the source, all of its inputs and the 
+            settings that affect how it's executed.
+            """
+            with open(self._tempsource) as file:
+                source_code = file.read()
+            input_files = {}
+            for name in self._input_files:
+                input_files[name] = None
+                path = os.path.join(self._tempfolder, name)
+                if os.path.exists(path):
+                    with open(path, 'rb') as file:
+                        input_files[name] = file.read()
+            settings = [self._maxexectime, self._warm_jvm, 
+                ExecCode.output_limit, ExecCode.memory_limit, 
+                ExecCode.cpu_limit, ExecCode.process_limit, 
+                ExecCode.file_size_limit]
+            return ExecCode.execution_cache.get_key(self._classname, 
+                source_code, self._input, input_files, settings)
+
+        def _replay_execution(self, cache_key):
+            """
+            For internal use, restore the results of a previous execution 
+            from the execution cache, including any output files.
+            
+            Returns False if there was no previous execution.
+            """
+            execution = ExecCode.execution_cache.get_execution(cache_key)
+            if execution == None:
+                return False
+            details, output, stderr, cmpinfo, output_files = execution
+            for name in self._output_files:
+                path = os.path.join(self._tempfolder, name)
+                if name in output_files:
+                    with open(path, 'wb') as file:
+                        file.write(output_files[name])
+                elif os.path.exists(path):
+                    # The file didn't exist after the original execution
+                    os.remove(path)
+            self._cmpinfo = cmpinfo
+            self._output = output
+            self._stderr = stderr
+            self._exec_result = [details['signal'], output, stderr]
+            self._truncated = details.get('truncated', False)
+            self._memory = details['memory']
+            self._time_start = time()
+            self._time_end = self._time_start + details['time']
+            self._set_submission_status('OK', 0, details['result'])
+            return True
+
+        def _store_execution(self, cache_key):
+            """
+            For internal use, store the results of the execution, including 
+            any output files, in the execution cache.
+            """
+            # Internal errors may not happen next time, so aren't stored
+            if self._result in [0, 20]:
+                return
+            output_files = {}
+            for name in self._output_files:
+                path = os.path.join(self._tempfolder, name)
+                if os.path.exists(path):
+                    with open(path, 'rb') as file:
+                        output_files[name] = file.read()
+            details = {'result': self._result, 'memory': self._memory, 
+                'time': (self._time_end - self._time_start), 
+                'signal': self._exec_result[0], 'truncated': self._truncated}
+            ExecCode.execution_cache.put_execution(
+                cache_key, details, self._exec_result[1], 
+                self._exec_result[2], self._cmpinfo, output_files)
+
+        def _compile_and_execute_cold(self):
+            """
+            For internal use, compile and execute the submission by starting 
+            the Java compiler and Java VM as separate processes.
+            """
             # Compile the source file
             self._compile_result = self._compile_source(
                 self._tempfolder, self._tempsource)
-            if self._compile_result[0] != 0:
+            if self._compiled(self._compile_result):
+                # Execute the resulting Java class file
+                self._executed(self._execute(
+                    self._tempfolder, self._classname, self._input))
+
+        def _compiled(self, compile_result):
+            """
+            For internal use, record the result of compiling the submission.
+            
+            Returns True if the compilation was successful, in which case 
+            the submission is ready to execute.
+            """
+            compiled = (compile_result[0] == 0)
+            if not compiled:
                 # The compilation failed, so just return the output from the 
                 # compilation
-                self._cmpinfo = self._compile_result[1]
+                self._cmpinfo = compile_result[1]
                 self._set_submission_status('OK', 0, 11)
             else:
                 # The compilation was successful
                 self._cmpinfo = ''
                 self._set_submission_status('OK', 3, 0)
-                # Execute the resulting Java class file
-                self._exec_result = self._execute(
-                    self._tempfolder, self._classname, self._input)
-                # Capture the returned output from the execution
-                self._output = self._exec_result[1]
-                self._stderr = self._exec_result[2]
-                if self._exec_result[0] != 0:
-                    # The execuation failed, so note the details
-                    self._set_submission_status('OK', 0, 12)
-                else:
-                    if self._timelimitexceeded:
-                        # The execution took too long
-                        self._set_submission_status('OK', 0, 13)
-                    else:
-                        # The execuation was successful
-                        self._set_submission_status('OK', 0, 15)
+            return compiled
+
+        def _executed(self, exec_result):
+            """
+            For internal use, record the result of executing the submission.
+            """
+            self._exec_result = exec_result
+            # Capture the returned output from the execution
+            self._output = self._exec_result[1]
+            self._stderr = self._exec_result[2]
+            self._set_submission_status('OK', 0, 
+                ExecCode.Submission._execute_result(self._exec_result[0], 
+                self._stderr, self._timelimitexceeded, 
+                self._outputlimitexceeded))
+
+        def _compile_and_execute_warm(self):
+            """
+            For internal use, compile and execute the submission using a 
+            long-lived JVM.
+            
+            The program runs in a thread of the shared JVM, so the resource 
+            limits set in ExecCode can't be applied to it, other than the 
+            time and output limits. The time recorded is the time that 
+            elapsed rather than the CPU time, and the memory is recorded as 
+            0.
+            
+            Returns False if the warm JVM couldn't be used, in which case 
+            the submission should be compiled and executed separately.
+            """
+            with open(self._tempsource) as file:
+                source = file.read()
+            self._set_submission_status('OK', 1, 0)
+            self._time_start = time()
+            response = WarmJVM.get_server(self._tempfolder).run(
+                self._classname, source, self._input, self._maxexectime, 
+                ExecCode.output_limit)
+            if (response == None) or (response[0] == 20):
+                # The server failed, so fall back to a separate JVM
+                return False
+
+            # Capture the returned output from the compilation and execution
+            result = response[0]
+            self._cmpinfo = response[1]
+            self._output = response[2]
+            self._stderr = response[3]
+            self._time_end = self._time_start + response[4]
+            # The server keeps the start and end of the output and stops a 
+            # program that writes too much, as for a separate JVM
+            self._truncated = response[5]
+            signal = 0
+            if result == 12:
+                signal = 1
+            self._exec_result = [signal, self._output, self._stderr]
+            self._set_submission_status('OK', 0, result)
+            return True
 
         def _set_submission_status(self, error, status, result):
             """
@@ -320,6 +710,8 @@ class ExecCode(object):
         #  13 - time limit exceeded - the program didn't stop before the time 
         #       limit
         #  15 - success - everything went ok
+        #  16 - output limit exceeded - the program generated more output 
+        #       than it is allowed to (not part of the ideone API)
         #  17 - memory limit exceeded - the program tried to use more memory 
         #       than it is allowed to
         #  19 - illegal system call - the program tried to call illegal 
@@ -353,8 +745,9 @@ class ExecCode(object):
                 self._time_end - self._time_start)))
             details['item'].append(Status('status', self._status))
             details['item'].append(Status('result', self._result))
-            details['item'].append(Status('memory', 0))
+            details['item'].append(Status('memory', self._memory))
             details['item'].append(Status('signal', self._exec_result[0]))
+            details['item'].append(Status('truncated', self._truncated))
             details['item'].append(Status('public', False))
             # Some of the return key-value pairs are optional
             if withInput:
@@ -371,38 +764,141 @@ class ExecCode(object):
             """
             For internal use, compiles the java source code.
             """
-            result = False
-            output = ''
-            if ExecCode._which('javac') == None:
+            compile_result, cache_key = self._reuse_compiled(
+                tempfolder, tempsource)
+            if compile_result != None:
+                result, output = compile_result
+            elif ExecCode._which('javac') == None:
                 # The Java compiler couldn't be found
+                result = False
                 output = 'Java compiler javac could not be found'
                 self._set_submission_status('OK', 0, 20)
             else:
                 # The Java compiler is present
                 self._set_submission_status('OK', 1, 0)
                 # Execuate the compilation as a subprocess
-                program = Popen(
-                    ['javac', '-classpath', tempfolder, '-sourcepath', 
-                    tempfolder, '-d', tempfolder, tempsource], 
-                    shell=False, cwd='.', 
-                    stderr=STDOUT, stdin=PIPE, stdout=PIPE)
+                program = ExecCode.Submission._popen(
+                    ExecCode.Submission._javac_command(tempfolder, tempsource))
                 # Collect any outputs from the compilation process
                 output = program.stdout.read()
                 program.communicate()
                 result = program.returncode
-                if result == 0:
-                    # Compilation error
-                    self._set_submission_status('OK', 0, 11)
-                else:
-                    # Compilation success
-                    self._set_submission_status('OK', 3, 0)
+                self._compiler_finished(tempfolder, cache_key, result, output)
             return [result, output]
 
+        def _reuse_compiled(self, tempfolder, tempsource):
+            """
+            For internal use, use the results of compiling the same source 
+            in advance or on a previous run, if there are any.
+            
+            Returns the compilation result and output, or None if the source 
+            needs to be compiled, along with the key to store the results in 
+            the compile cache under (or None if there's no cache).
+            """
+            compile_result = None
+            with open(tempsource) as file:
+                source_code = file.read()
+            precompiled = self._find_precompiled(source_code)
+            cache_key = None
+            cached = None
+            if (precompiled == None) and (ExecCode.compile_cache != None):
+                cache_key = ExecCode.compile_cache.get_key(
+                    self._classname, source_code)
+                cached = ExecCode.compile_cache.get(cache_key)
+            if precompiled != None:
+                # The source has already been compiled, so use the classes 
+                # and output from that
+                self._set_submission_status('OK', 1, 0)
+                for file in os.listdir(precompiled):
+                    if os.path.splitext(file)[1] == '.class':
+                        copy(os.path.join(precompiled, file), tempfolder)
+                with open(os.path.join(precompiled, 'cmpinfo.txt')) as file:
+                    output = file.read()
+                with open(os.path.join(precompiled, 'result.txt')) as file:
+                    compile_result = [int(file.read()), output]
+            elif cached != None:
+                # The same source was compiled on a previous run, so use the 
+                # cached classes and output
+                self._set_submission_status('OK', 1, 0)
+                for name, contents in cached.items():
+                    if os.path.splitext(name)[1] == '.class':
+                        with open(os.path.join(tempfolder, name), 'wb') as file:
+                            file.write(contents)
+                compile_result = [
+                    int(cached['result.txt']), cached['cmpinfo.txt']]
+            return [compile_result, cache_key]
+
+        @staticmethod
+        def _javac_command(tempfolder, tempsource):
+            """
+            For internal use, return the command to compile the source. The 
+            shim classes are already compiled, so only the submission is 
+            compiled.
+            """
+            shim_jar = get_shim_jar(os.path.join(tempfolder, 'tools'))
+            return ['javac', '-classpath', shim_jar, '-implicit:none', 
+                '-d', tempfolder, tempsource]
+
+        @staticmethod
+        def _popen(command):
+            """
+            For internal use, start a compiler process, with its stdout and 
+            stderr combined.
+            """
+            return Popen(command, shell=False, cwd='.', 
+                stderr=STDOUT, stdin=PIPE, stdout=PIPE, close_fds=ON_POSIX)
+
+        def _compiler_finished(self, tempfolder, cache_key, result, output):
+            """
+            For internal use, update the status once the compiler has 
+            finished, and store the results in the compile cache.
+            """
+            if result == 0:
+                # Compilation error
+                self._set_submission_status('OK', 0, 11)
+            else:
+                # Compilation success
+                self._set_submission_status('OK', 3, 0)
+            if cache_key != None:
+                self._store_compiled(tempfolder, cache_key, result, output)
+
+        @staticmethod
+        def _store_compiled(tempfolder, cache_key, result, output):
+            """
+            For internal use, store the results of a compilation in the 
+            compile cache.
+            """
+            files = {'cmpinfo.txt': output, 'result.txt': str(result)}
+            for name in os.listdir(tempfolder):
+                if os.path.splitext(name)[1] == '.class':
+                    with open(os.path.join(tempfolder, name), 'rb') as file:
+                        files[name] = file.read()
+            ExecCode.compile_cache.put(cache_key, files)
+
+        def _find_precompiled(self, source_code):
+            """
+            For internal use, return the folder containing the results of 
+            compiling the source in advance, or None if there isn't one.
+            """
+            precompiled = None
+            if ExecCode.precompiled_folder != None:
+                folder = os.path.join(ExecCode.precompiled_folder, 
+                    ExecCode._source_key(self._classname, source_code))
+                if os.path.exists(os.path.join(folder, 'result.txt')):
+                    precompiled = folder
+            return precompiled
+
         def _execute(self, tempfolder, classname, input):
             """
             For internal use, executes the java source code.
+            
+            The program is executed with the resource limits set in 
+            ExecCode. Once it completes, the peak memory used and CPU time 
+            taken are recorded as the memory and time for the submission.
             """
             output = ''
+            error = ''
+            result = None
             if ExecCode._which('java') == None:
                 # The Java VM could not be found
                 print 'Java VM could not be found'
@@ -410,60 +906,359 @@ class ExecCode(object):
             else:
                 # The Java VM is present
                 self._time_start = time()
+                deadline = _monotonic() + self._maxexectime
                 # Execute the compiled code as a subprocess
-                program = Popen(
-                    ['java', classname], shell=False, cwd=tempfolder, 
-                    bufsize=1, 
-                    stderr=PIPE, stdin=PIPE, stdout=PIPE, close_fds=ON_POSIX)
-                output_queue = Queue()
-                output_collector = ExecCode.threading.Thread(
-                    target=ExecCode.Submission._enqueue_output, 
-                    args=(program.stdout, output_queue))
-                output_collector.daemon = True
-                output_collector.start()
-                # Pass the input to the running code
-                program.stdin.write(input)
-                # Collect any output form the the running code
-                output = ''
-                exectime = 0.0
-                result = None
+                program = ExecCode.Submission._start_program(
+                    tempfolder, classname)
                 self._timelimitexceeded = False
-                while (result == None) and not self._timelimitexceeded:
-                    program.poll()
-                    try:
-                        line = output_queue.get_nowait()
-                    except Empty:
-                        # No output, wait a bit and check again
-                        sleep(0.1)
-                        result = program.returncode
-                    else:
-                        # We caught some output, so record it
-                        output += line
-                    # Check how long the program's been running for
-                    exectime = time() - self._time_start
-                    if exectime >= self._maxexectime:
-                        # Too long!
-                        self._timelimitexceeded = True
-
-                if self._timelimitexceeded:
-                    program.kill()
-                error = program.stderr.read()
+                if ON_POSIX:
+                    output, error = self._capture(program, input, deadline)
+                else:
+                    output, error = self._capture_simple(program, input)
+                self._time_end = time()
+                self._wait_for_exit(program, deadline)
                 result = program.returncode
                 if result == None:
                     result = 0
-                self._time_end = time()
-            return [result, output.decode("utf-8"), error.decode("utf-8")]
+            # Truncation may have split a character, so replace it
+            return [result, output.decode('utf-8', 'replace'), 
+                error.decode('utf-8', 'replace')]
+
+        def _wait_for_exit(self, program, deadline):
+            """
+            For internal use, wait for the program to exit and record the 
+            resources it used.
+            
+            A program can close its output and carry on running, so it's 
+            killed if it hasn't exited by the deadline. The program's peak 
+            resident memory is stored in bytes, and the end time is adjusted 
+            so that the time recorded is the CPU time the program used, 
+            rather than the time that elapsed.
+            """
+            if resource == None:
+                while (program.poll() == None) and (_monotonic() < deadline):
+                    sleep(ExecCode._EXIT_POLL_INTERVAL)
+                if program.returncode == None:
+                    self._kill_after_deadline(program)
+                    program.wait()
+            else:
+                pid, status, usage = ExecCode.Submission._wait4(program)
+                while (pid == 0) and (_monotonic() < deadline):
+                    sleep(ExecCode._EXIT_POLL_INTERVAL)
+                    pid, status, usage = ExecCode.Submission._wait4(program)
+                if pid == 0:
+                    self._kill_after_deadline(program)
+                    pid, status, usage = os.wait4(program.pid, 0)
+                self._program_exited(program, status, usage)
+
+        def _kill_after_deadline(self, program):
+            """
+            For internal use, kill a program that's still running after the 
+            deadline. It may already be dying, having been killed for 
+            generating too much output.
+            """
+            if not self._outputlimitexceeded:
+                # Too long!
+                self._timelimitexceeded = True
+            program.kill()
+
+        def _program_exited(self, program, status, usage):
+            """
+            For internal use, record the exit status and resource usage 
+            returned by os.wait4() for the program.
+            """
+            ExecCode.Submission._record_exit(program, status)
+            # Linux reports the peak resident memory in kilobytes
+            self._memory = usage.ru_maxrss * 1024
+            self._time_end = self._time_start + (
+                usage.ru_utime + usage.ru_stime)
+
+        @staticmethod
+        def _record_exit(program, status):
+            """
+            For internal use, record the exit status returned by os.wait4() 
+            for a process. Popen didn't see the exit, so it's recorded in the 
+            same way Popen would have.
+            """
+            if os.WIFSIGNALED(status):
+                program.returncode = -os.WTERMSIG(status)
+            else:
+                program.returncode = os.WEXITSTATUS(status)
+
+        @staticmethod
+        def _wait4(program):
+            """
+            For internal use, check whether a process has exited without 
+            blocking. Returns the pid, exit status and resource usage from 
+            os.wait4(), with a pid of 0 if the process is still running.
+            """
+            try:
+                return os.wait4(program.pid, os.WNOHANG)
+            except OSError as error:
+                if error.errno != errno.EINTR:
+                    raise
+                return [0, 0, None]
+
+        @staticmethod
+        def _start_program(tempfolder, classname):
+            """
+            For internal use, start executing the compiled program with the 
+            resource limits applied, returning the process.
+            """
+            limit_resources = None
+            if resource != None:
+                limit_resources = ExecCode.Submission._limit_resources
+            shim_jar = get_shim_jar(os.path.join(tempfolder, 'tools'))
+            program = Popen(
+                ['java', '-Xmx{:d}k'.format(ExecCode.memory_limit // 1024), 
+                '-cp', shim_jar + os.pathsep + '.', classname], 
+                shell=False, cwd=tempfolder, bufsize=0, 
+                stderr=PIPE, stdin=PIPE, stdout=PIPE, close_fds=ON_POSIX, 
+                preexec_fn=limit_resources)
+            return program
 
-        # From http://stackoverflow.com/questions/375427/non-blocking-
-        # read-on-a-subprocess-pipe-in-python
         @staticmethod
-        def _enqueue_output(out, queue):
+        def _limit_resources():
             """
-            For internal use, stores output generated by execution.
+            For internal use, apply the resource limits to the process. This 
+            is called in the child process just before the program starts.
             """
-            for line in iter(out.readline, b''):
-                queue.put(line)
-            out.close()
+            if resource != None:
+                limits = [[resource.RLIMIT_NPROC, ExecCode.process_limit], 
+                    [resource.RLIMIT_FSIZE, ExecCode.file_size_limit]]
+                for limit, value in limits:
+                    if value != None:
+                        resource.setrlimit(limit, (value, value))
+                if ExecCode.cpu_limit != None:
+                    # Allow a second's grace after SIGXCPU before SIGKILL, so 
+                    # the cause of the termination can be established
+                    resource.setrlimit(resource.RLIMIT_CPU, 
+                        (ExecCode.cpu_limit, ExecCode.cpu_limit + 1))
+
+        @staticmethod
+        def _execute_result(
+                returncode, stderr, timelimitexceeded, outputlimitexceeded):
+            """
+            For internal use, return the ideone result code for a program 
+            that has completed execution.
+            """
+            if returncode == None:
+                # The program couldn't be executed
+                result = 20
+            elif outputlimitexceeded:
+                # The program was stopped for generating too much output
+                result = 16
+            elif timelimitexceeded or (returncode == -signal.SIGXCPU):
+                # The program ran out of time or CPU
+                result = 13
+            elif 'java.lang.OutOfMemoryError' in stderr:
+                # The program ran out of heap or couldn't create a thread
+                result = 17
+            elif (returncode == -signal.SIGXFSZ) or (
+                    'File too large' in stderr) or (
+                    'java.lang.SecurityException' in stderr):
+                # The program wrote too much to a file or tried to do 
+                # something it's not allowed to
+                result = 19
+            elif returncode != 0:
+                result = 12
+            else:
+                result = 15
+            return result
+
+        def _capture(self, program, input, deadline):
+            """
+            For internal use, pass the input to the program and collect its 
+            output until it closes its output or the deadline passes.
+            
+            The input is written and the output read in chunks as the program 
+            becomes ready for them, so neither the program nor the marking 
+            can block on a full pipe. If the program generates more than 
+            ExecCode.output_limit bytes on stdout or stderr it's stopped.
+            
+            Returns the program's stdout and stderr.
+            """
+            stdout = program.stdout.fileno()
+            stderr = program.stderr.fileno()
+            outputs = {stdout: OutputBuffer(ExecCode.output_limit), 
+                stderr: OutputBuffer(ExecCode.output_limit)}
+            readers = [stdout, stderr]
+            writers = []
+            pending = input
+            if isinstance(pending, unicode):
+                pending = pending.encode('utf-8')
+            if len(pending) > 0:
+                writers.append(program.stdin.fileno())
+            else:
+                program.stdin.close()
+
+            while (len(readers) > 0) and not self._outputlimitexceeded:
+                remaining = deadline - _monotonic()
+                if remaining <= 0:
+                    # Too long!
+                    self._timelimitexceeded = True
+                    program.kill()
+                    break
+                try:
+                    readable, writable, _ = select.select(
+                        readers, writers, [], remaining)
+                except select.error as error:
+                    if error.args[0] != errno.EINTR:
+                        raise
+                    # Interrupted by a signal, so wait again with the 
+                    # remaining time
+                    continue
+                for descriptor in writable:
+                    try:
+                        written = os.write(
+                            descriptor, pending[:ExecCode._WRITE_SIZE])
+                    except OSError as error:
+                        if error.errno != errno.EPIPE:
+                            raise
+                        # The program isn't reading any more input
+                        written = len(pending)
+                    pending = pending[written:]
+                    if len(pending) == 0:
+                        # Closing stdin lets the program see the end of input
+                        program.stdin.close()
+                        writers = []
+                for descriptor in readable:
+                    data = os.read(descriptor, ExecCode._CHUNK_SIZE)
+                    if len(data) == 0:
+                        readers.remove(descriptor)
+                    else:
+                        outputs[descriptor].write(data)
+                        if outputs[descriptor].truncated:
+                            # Too much!
+                            self._outputlimitexceeded = True
+                            program.kill()
+
+            if not program.stdin.closed:
+                program.stdin.close()
+            return self._truncate(outputs[stdout], outputs[stderr])
+
+        def _capture_simple(self, program, input):
+            """
+            For internal use, pass the input to the program and collect its 
+            output, on platforms where pipes can't be used with select().
+            
+            Returns the program's stdout and stderr.
+            """
+            timer = ExecCode.threading.Timer(
+                self._maxexectime, self._kill_on_timeout, [program])
+            timer.start()
+            try:
+                output, error = program.communicate(input)
+            finally:
+                timer.cancel()
+            buffers = [OutputBuffer(ExecCode.output_limit), 
+                OutputBuffer(ExecCode.output_limit)]
+            buffers[0].write(output)
+            buffers[1].write(error)
+            self._outputlimitexceeded = buffers[0].truncated or \
+                buffers[1].truncated
+            return self._truncate(*buffers)
+
+        def _truncate(self, output, error):
+            """
+            For internal use, return the contents of the stdout and stderr 
+            buffers, noting whether either was truncated.
+            """
+            self._truncated = output.truncated or error.truncated
+            return [output.getvalue(), error.getvalue()]
+
+        def _kill_on_timeout(self, program):
+            """
+            For internal use, kill a program that's exceeded the time limit.
+            """
+            if program.poll() == None:
+                self._timelimitexceeded = True
+                program.kill()
+
+
+class OutputBuffer(object):
+    """
+    Keep the start and end of a stream of output, within a fixed size.
+
+    The first half of the space is filled with the start of the output and 
+    the second half is used as a ring buffer holding the most recent 
+    output. Both are allocated up front, so the memory used doesn't depend 
+    on how much output there is.
+    """
+
+    def __init__(self, limit):
+        """
+        Initialise the OutputBuffer class.
+
+        Attributes:
+            limit: The number of bytes of output to keep.
+        """
+        self._head = bytearray(limit - (limit // 2))
+        self._head_size = 0
+        self._tail = bytearray(limit // 2)
+        self._tail_size = 0
+        self._tail_start = 0
+        self.size = 0
+
+    @property
+    def truncated(self):
+        """
+        True if more output has been written than could be kept.
+        """
+        return self.size > (len(self._head) + len(self._tail))
+
+    def write(self, data):
+        """
+        Add some output to the buffer.
+        """
+        self.size += len(data)
+        space = len(self._head) - self._head_size
+        if space > 0:
+            chunk = data[:space]
+            self._head[self._head_size:self._head_size + len(chunk)] = chunk
+            self._head_size += len(chunk)
+            data = data[space:]
+        capacity = len(self._tail)
+        if (len(data) > 0) and (capacity > 0):
+            if len(data) >= capacity:
+                self._tail[:] = data[-capacity:]
+                self._tail_start = 0
+                self._tail_size = capacity
+            else:
+                end = self._tail_start + len(data)
+                if end <= capacity:
+                    self._tail[self._tail_start:end] = data
+                else:
+                    split = capacity - self._tail_start
+                    self._tail[self._tail_start:] = data[:split]
+                    self._tail[:end - capacity] = data[split:]
+                self._tail_start = end % capacity
+                self._tail_size = min(capacity, self._tail_size + len(data))
+
+    def getvalue(self):
+        """
+        Return the output kept. If the output was truncated, a line noting 
+        how many bytes were omitted separates the start and end.
+        """
+        value = str(self._head[:self._head_size])
+        if self._tail_size < len(self._tail):
+            tail = str(self._tail[:self._tail_size])
+        else:
+            tail = str(self._tail[self._tail_start:] + 
+                self._tail[:self._tail_start])
+        if self.truncated:
+            value += '\n... [{:d} bytes omitted] ...\n'.format(
+                self.size - self._head_size - self._tail_size)
+        return value + tail
+
+
+def _monotonic():
+    """
+    Internal function, return the elapsed time in seconds from an arbitrary 
+    point in the past. Unlike time(), this isn't affected by changes to the 
+    system clock.
+    """
+    return os.times()[4]
 
 
 #program = ExecCode('build', 'CourseworkTask1')
@@ -0,0 +1,94 @@
+// Automark
+//
+// David Llewellyn-Jones
+// Liverpool John Moores University
+// 18/12/2014
+// Released under the GPL v.3. See the LICENSE file for more details.
+
+import java.io.BufferedReader;
+import java.io.File;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.io.OutputStreamWriter;
+import java.io.StringWriter;
+import java.io.Writer;
+import java.util.Arrays;
+import java.util.List;
+import javax.tools.JavaCompiler;
+import javax.tools.StandardJavaFileManager;
+import javax.tools.ToolProvider;
+
+/**
+ * Compile many independent Java source files in a single JVM.
+ *
+ * Takes the classpath to compile against and a file listing the source
+ * files to compile, one per line. Each source file is compiled separately
+ * into the folder that contains it. The compiler output is written to
+ * cmpinfo.txt in that folder, followed by result.txt containing 0 if the
+ * compilation succeeded or 1 if it failed.
+ */
+public class BatchCompiler {
+	public static void main(String[] args) throws IOException {
+		if (args.length < 2) {
+			System.err.println("Usage: BatchCompiler <classpath> <list file>");
+			System.exit(1);
+		}
+
+		JavaCompiler compiler = ToolProvider.getSystemJavaCompiler();
+		if (compiler == null) {
+			System.err.println("No Java compiler is available");
+			System.exit(1);
+		}
+		StandardJavaFileManager fileManager =
+			compiler.getStandardFileManager(null, null, null);
+
+		BufferedReader list = new BufferedReader(new InputStreamReader(
+			new FileInputStream(args[1]), "UTF-8"));
+		try {
+			String line;
+			while ((line = list.readLine()) != null) {
+				if (line.length() > 0) {
+					compile(compiler, fileManager, args[0], new File(line));
+				}
+			}
+		}
+		finally {
+			list.close();
+		}
+		fileManager.close();
+	}
+
+	private static void compile(JavaCompiler compiler,
+			StandardJavaFileManager fileManager, String classpath,
+			File source) throws IOException {
+		File folder = source.getAbsoluteFile().getParentFile();
+		StringWriter output = new StringWriter();
+		List<String> options = Arrays.asList(
+			"-classpath", classpath, "-d", folder.getPath());
+		boolean compiled;
+		try {
+			compiled = compiler.getTask(output, fileManager, null, options,
+				null, fileManager.getJavaFileObjects(source)).call();
+		}
+		catch (RuntimeException e) {
+			output.write(e.toString());
+			compiled = false;
+		}
+		write(new File(folder, "cmpinfo.txt"), output.toString());
+		// Written last, so its presence shows the compilation completed
+		write(new File(folder, "result.txt"), compiled ? "0" : "1");
+	}
+
+	private static void write(File file, String contents) throws IOException {
+		Writer writer = new OutputStreamWriter(
+			new FileOutputStream(file), "UTF-8");
+		try {
+			writer.write(contents);
+		}
+		finally {
+			writer.close();
+		}
+	}
+}
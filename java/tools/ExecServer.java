@@ -0,0 +1,573 @@
+// Automark
+//
+// David Llewellyn-Jones
+// Liverpool John Moores University
+// 18/12/2014
+// Released under the GPL v.3. See the LICENSE file for more details.
+
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.EOFException;
+import java.io.File;
+import java.io.FileDescriptor;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.io.StringWriter;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.net.URI;
+import java.security.Permission;
+import java.util.Arrays;
+import java.util.Collections;
+import java.util.Enumeration;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.zip.ZipEntry;
+import java.util.zip.ZipFile;
+import javax.tools.FileObject;
+import javax.tools.ForwardingJavaFileManager;
+import javax.tools.JavaCompiler;
+import javax.tools.JavaFileObject;
+import javax.tools.SimpleJavaFileObject;
+import javax.tools.StandardJavaFileManager;
+import javax.tools.ToolProvider;
+
+/**
+ * Compile and execute Java programs inside a long-lived JVM.
+ *
+ * Requests are read from stdin and responses written to stdout, using
+ * big-endian ints and length-prefixed UTF-8 strings. Each request holds
+ * the class name, source code, stdin contents, time limit (in ms) and
+ * output limit (in bytes) for a program. Each response holds the
+ * ideone-style result code, compiler output, program stdout, program
+ * stderr, execution time (in ms) and whether the output was truncated.
+ *
+ * Only the start and end of a program's stdout and stderr are kept, within
+ * the output limit, and a program that writes more than that is stopped,
+ * so a program stuck printing in a loop can't use up the server's memory.
+ *
+ * Programs are compiled in memory and run in their own class loader, so
+ * that static state (including the uk.ac.ljmu.automark shim classes, which
+ * are read once from the jar given on the command line) is fresh for every
+ * execution.
+ */
+public class ExecServer {
+	private static final int COMMAND_RUN = 1;
+	private static final int COMMAND_QUIT = 2;
+
+	private static final int RESULT_COMPILATION_ERROR = 11;
+	private static final int RESULT_RUNTIME_ERROR = 12;
+	private static final int RESULT_TIME_LIMIT_EXCEEDED = 13;
+	private static final int RESULT_SUCCESS = 15;
+	private static final int RESULT_OUTPUT_LIMIT_EXCEEDED = 16;
+	private static final int RESULT_INTERNAL_ERROR = 20;
+
+	private static final String SHIM_PACKAGE = "uk.ac.ljmu.automark.";
+
+	// How often to check whether a program has written too much, in ms
+	private static final long OUTPUT_CHECK_INTERVAL = 50;
+
+	// The thread group of the program currently executing, if any
+	private static volatile ThreadGroup activeGroup = null;
+
+	private final File shimJar;
+	private final Map<String, byte[]> shimClasses;
+	private final DataInputStream requests;
+	private final DataOutputStream responses;
+	private final JavaCompiler compiler;
+	// Shared by every compilation, so the class path is only opened once
+	private final StandardJavaFileManager standardFileManager;
+	private final PrintStream console;
+
+	public static void main(String[] args) throws IOException {
+		if (args.length < 1) {
+			System.err.println("Usage: ExecServer <shim jar>");
+			System.exit(1);
+		}
+		File shimJar = new File(args[0]);
+		Map<String, byte[]> shimClasses = readJar(shimJar);
+
+		// Take over stdin and stdout for the protocol, so nothing else can
+		// write to them by accident
+		InputStream in = new FileInputStream(FileDescriptor.in);
+		OutputStream out = new FileOutputStream(FileDescriptor.out);
+		System.setOut(System.err);
+
+		try {
+			System.setSecurityManager(new ExitTrap());
+		}
+		catch (Throwable e) {
+			// Newer JVMs don't support security managers. A call to
+			// System.exit() will then end the server, which the client
+			// notices, falling back to a separate JVM for that program
+		}
+
+		ExecServer server = new ExecServer(shimJar, shimClasses, in, out);
+		server.serve();
+	}
+
+	public ExecServer(File shimJar, Map<String, byte[]> shimClasses,
+			InputStream in, OutputStream out) {
+		this.shimJar = shimJar;
+		this.shimClasses = shimClasses;
+		this.requests = new DataInputStream(in);
+		this.responses = new DataOutputStream(out);
+		this.compiler = ToolProvider.getSystemJavaCompiler();
+		this.standardFileManager = (compiler == null) ? null
+			: compiler.getStandardFileManager(null, null, null);
+		this.console = System.out;
+	}
+
+	/**
+	 * Handle requests until the client closes the connection.
+	 */
+	public void serve() throws IOException {
+		boolean quit = false;
+		while (!quit) {
+			int command;
+			try {
+				command = requests.readInt();
+			}
+			catch (EOFException e) {
+				command = COMMAND_QUIT;
+			}
+
+			if (command == COMMAND_RUN) {
+				String classname = readString();
+				String source = readString();
+				String stdin = readString();
+				int timeout = requests.readInt();
+				int outputLimit = requests.readInt();
+
+				Response response = run(
+					classname, source, stdin, timeout, outputLimit);
+				responses.writeInt(response.result);
+				writeString(response.cmpinfo);
+				writeString(response.stdout);
+				writeString(response.stderr);
+				responses.writeInt(response.time);
+				responses.writeInt(response.truncated ? 1 : 0);
+				responses.flush();
+
+				// If the program couldn't be stopped it may still be
+				// running, so the server can't be trusted any more
+				quit = response.poisoned;
+			}
+			else {
+				quit = true;
+			}
+		}
+		if (standardFileManager != null) {
+			standardFileManager.close();
+		}
+	}
+
+	private String readString() throws IOException {
+		byte[] bytes = new byte[requests.readInt()];
+		requests.readFully(bytes);
+		return new String(bytes, "UTF-8");
+	}
+
+	private void writeString(String value) throws IOException {
+		byte[] bytes = value.getBytes("UTF-8");
+		responses.writeInt(bytes.length);
+		responses.write(bytes);
+	}
+
+	/**
+	 * Compile and execute a single program.
+	 */
+	private Response run(String classname, String source, String stdin,
+			int timeout, int outputLimit) {
+		Response response = new Response();
+		if (compiler == null) {
+			response.result = RESULT_INTERNAL_ERROR;
+			response.cmpinfo = "No Java compiler is available to the server";
+			return response;
+		}
+
+		// Compile the source in memory. The memory file manager isn't
+		// closed, as that would close the shared standard file manager
+		StringWriter compileOutput = new StringWriter();
+		MemoryFileManager fileManager =
+			new MemoryFileManager(standardFileManager);
+		List<String> options = Arrays.asList(
+			"-classpath", shimJar.getPath());
+		List<JavaFileObject> sources = Collections.<JavaFileObject>singletonList(
+			new SourceObject(classname, source));
+		boolean compiled = compiler.getTask(
+			compileOutput, fileManager, null, options, null, sources).call();
+		response.cmpinfo = compileOutput.toString();
+		if (!compiled) {
+			response.result = RESULT_COMPILATION_ERROR;
+			return response;
+		}
+
+		// Execute the program with its own stdin, stdout and stderr
+		OutputBuffer stdout = new OutputBuffer(outputLimit);
+		OutputBuffer stderr = new OutputBuffer(outputLimit);
+		PrintStream programOut = new PrintStream(stdout, true);
+		PrintStream programErr = new PrintStream(stderr, true);
+		ProgramRunner runner = new ProgramRunner(
+			new RunLoader(fileManager.classes, shimClasses), classname,
+			programErr);
+		ThreadGroup group = new ThreadGroup("submission");
+		Thread thread = new Thread(group, runner, "main");
+		thread.setDaemon(true);
+
+		long start = System.nanoTime();
+		try {
+			System.setIn(new ByteArrayInputStream(stdin.getBytes("UTF-8")));
+			System.setOut(programOut);
+			System.setErr(programErr);
+			activeGroup = group;
+			thread.start();
+			// Wait for the program to finish, checking regularly that it
+			// hasn't written too much
+			long remaining = timeout;
+			while (thread.isAlive() && (remaining > 0)
+					&& !stdout.isTruncated() && !stderr.isTruncated()) {
+				thread.join(Math.min(remaining, OUTPUT_CHECK_INTERVAL));
+				remaining = timeout
+					- ((System.nanoTime() - start) / 1000000L);
+			}
+			if (stdout.isTruncated() || stderr.isTruncated()) {
+				response.result = RESULT_OUTPUT_LIMIT_EXCEEDED;
+				stopThreads(group);
+				thread.join(1000);
+				response.poisoned = thread.isAlive();
+			}
+			else if (thread.isAlive()) {
+				response.result = RESULT_TIME_LIMIT_EXCEEDED;
+				stopThreads(group);
+				thread.join(1000);
+				response.poisoned = thread.isAlive();
+			}
+			else if (runner.failed) {
+				response.result = RESULT_RUNTIME_ERROR;
+			}
+			else {
+				response.result = RESULT_SUCCESS;
+			}
+		}
+		catch (Exception e) {
+			response.result = RESULT_INTERNAL_ERROR;
+			e.printStackTrace(programErr);
+		}
+		finally {
+			activeGroup = null;
+			System.setIn(new ByteArrayInputStream(new byte[0]));
+			System.setOut(console);
+			System.setErr(console);
+		}
+		response.time = (int) ((System.nanoTime() - start) / 1000000L);
+
+		// The print streams use the default charset, so decode with it too
+		programOut.flush();
+		programErr.flush();
+		response.stdout = new String(stdout.getValue());
+		response.stderr = new String(stderr.getValue());
+		response.truncated = stdout.isTruncated() || stderr.isTruncated();
+		return response;
+	}
+
+	/**
+	 * Stop all threads started by a program.
+	 *
+	 * Thread.stop() is deprecated and unsupported on recent JVMs, so it's
+	 * called reflectively and any failure is ignored. The caller checks
+	 * whether the program actually stopped.
+	 */
+	private static void stopThreads(ThreadGroup group) {
+		Thread[] threads = new Thread[group.activeCount() + 16];
+		int count = group.enumerate(threads, true);
+		for (int i = 0; i < count; i++) {
+			try {
+				Thread.class.getMethod("stop").invoke(threads[i]);
+			}
+			catch (Throwable e) {
+				// The thread can't be stopped
+			}
+		}
+	}
+
+	private static class Response {
+		int result = RESULT_INTERNAL_ERROR;
+		String cmpinfo = "";
+		String stdout = "";
+		String stderr = "";
+		int time = 0;
+		boolean truncated = false;
+		boolean poisoned = false;
+	}
+
+	/**
+	 * Keep the start and end of a stream of output, within a fixed size.
+	 *
+	 * The first half of the space is filled with the start of the output and
+	 * the second half is used as a ring buffer holding the most recent
+	 * output, as for the OutputBuffer class used by ExecCode.
+	 */
+	private static class OutputBuffer extends OutputStream {
+		private final byte[] head;
+		private int headSize = 0;
+		private final byte[] tail;
+		private int tailSize = 0;
+		private int tailStart = 0;
+		private long size = 0;
+
+		OutputBuffer(int limit) {
+			head = new byte[limit - (limit / 2)];
+			tail = new byte[limit / 2];
+		}
+
+		/**
+		 * Check whether more output has been written than could be kept.
+		 */
+		synchronized boolean isTruncated() {
+			return size > (head.length + tail.length);
+		}
+
+		public void write(int value) {
+			write(new byte[] {(byte) value}, 0, 1);
+		}
+
+		public synchronized void write(byte[] data, int offset, int length) {
+			size += length;
+			int chunk = Math.min(head.length - headSize, length);
+			System.arraycopy(data, offset, head, headSize, chunk);
+			headSize += chunk;
+			offset += chunk;
+			length -= chunk;
+			if (tail.length > 0) {
+				if (length > tail.length) {
+					// Only the end of the data will be kept
+					offset += length - tail.length;
+					length = tail.length;
+				}
+				while (length > 0) {
+					chunk = Math.min(tail.length - tailStart, length);
+					System.arraycopy(data, offset, tail, tailStart, chunk);
+					tailStart = (tailStart + chunk) % tail.length;
+					tailSize = Math.min(tail.length, tailSize + chunk);
+					offset += chunk;
+					length -= chunk;
+				}
+			}
+		}
+
+		/**
+		 * Return the output kept. If the output was truncated, a line noting
+		 * how many bytes were omitted separates the start and end.
+		 */
+		synchronized byte[] getValue() {
+			ByteArrayOutputStream value = new ByteArrayOutputStream();
+			value.write(head, 0, headSize);
+			if (isTruncated()) {
+				byte[] note = ("\n... [" + (size - headSize - tailSize)
+					+ " bytes omitted] ...\n").getBytes();
+				value.write(note, 0, note.length);
+			}
+			if (tailSize < tail.length) {
+				value.write(tail, 0, tailSize);
+			}
+			else {
+				value.write(tail, tailStart, tail.length - tailStart);
+				value.write(tail, 0, tailStart);
+			}
+			return value.toByteArray();
+		}
+	}
+
+	/**
+	 * Invoke the main method of a program, recording whether it failed.
+	 */
+	private static class ProgramRunner implements Runnable {
+		private final ClassLoader loader;
+		private final String classname;
+		private final PrintStream err;
+		volatile boolean failed = false;
+
+		ProgramRunner(ClassLoader loader, String classname, PrintStream err) {
+			this.loader = loader;
+			this.classname = classname;
+			this.err = err;
+		}
+
+		public void run() {
+			try {
+				Class<?> program = loader.loadClass(classname);
+				Method main = program.getMethod("main", String[].class);
+				main.invoke(null, (Object) new String[0]);
+			}
+			catch (InvocationTargetException e) {
+				Throwable cause = e.getCause();
+				if (cause instanceof ExitException) {
+					failed = (((ExitException) cause).status != 0);
+				}
+				else {
+					failed = true;
+					err.print("Exception in thread \"main\" ");
+					cause.printStackTrace(err);
+				}
+			}
+			catch (Throwable e) {
+				failed = true;
+				e.printStackTrace(err);
+			}
+		}
+	}
+
+	/**
+	 * Prevent programs from ending the server by calling System.exit().
+	 */
+	private static class ExitTrap extends SecurityManager {
+		public void checkPermission(Permission perm) {
+		}
+
+		public void checkPermission(Permission perm, Object context) {
+		}
+
+		public void checkExit(int status) {
+			ThreadGroup group = activeGroup;
+			if ((group != null) && group.parentOf(
+					Thread.currentThread().getThreadGroup())) {
+				throw new ExitException(status);
+			}
+		}
+	}
+
+	private static class ExitException extends SecurityException {
+		final int status;
+
+		ExitException(int status) {
+			super("System.exit(" + status + ")");
+			this.status = status;
+		}
+	}
+
+	/**
+	 * Read all of the classes from a jar, keyed by class name.
+	 */
+	private static Map<String, byte[]> readJar(File file) throws IOException {
+		Map<String, byte[]> classes = new HashMap<String, byte[]>();
+		ZipFile jar = new ZipFile(file);
+		try {
+			Enumeration<? extends ZipEntry> entries = jar.entries();
+			while (entries.hasMoreElements()) {
+				ZipEntry entry = entries.nextElement();
+				String name = entry.getName();
+				if (name.endsWith(".class")) {
+					DataInputStream in = new DataInputStream(
+						jar.getInputStream(entry));
+					try {
+						byte[] bytes = new byte[(int) entry.getSize()];
+						in.readFully(bytes);
+						classes.put(name.substring(0, name.length() - 6)
+							.replace('/', '.'), bytes);
+					}
+					finally {
+						in.close();
+					}
+				}
+			}
+		}
+		finally {
+			jar.close();
+		}
+		return classes;
+	}
+
+	/**
+	 * Load the compiled program and a fresh copy of the shim classes.
+	 */
+	private static class RunLoader extends ClassLoader {
+		private final Map<String, ClassObject> classes;
+		private final Map<String, byte[]> shimClasses;
+
+		RunLoader(Map<String, ClassObject> classes,
+				Map<String, byte[]> shimClasses) {
+			// Skip the application class loader so the server's own classes
+			// can't clash with those of the program
+			super(ClassLoader.getSystemClassLoader().getParent());
+			this.classes = classes;
+			this.shimClasses = shimClasses;
+		}
+
+		protected Class<?> findClass(String name)
+				throws ClassNotFoundException {
+			byte[] bytes = null;
+			ClassObject compiled = classes.get(name);
+			if (compiled != null) {
+				bytes = compiled.getBytes();
+			}
+			else if (name.startsWith(SHIM_PACKAGE)) {
+				bytes = shimClasses.get(name);
+			}
+			if (bytes == null) {
+				throw new ClassNotFoundException(name);
+			}
+			return defineClass(name, bytes, 0, bytes.length);
+		}
+	}
+
+	private static class SourceObject extends SimpleJavaFileObject {
+		private final String source;
+
+		SourceObject(String classname, String source) {
+			super(URI.create("string:///" + classname.replace('.', '/')
+				+ Kind.SOURCE.extension), Kind.SOURCE);
+			this.source = source;
+		}
+
+		public CharSequence getCharContent(boolean ignoreEncodingErrors) {
+			return source;
+		}
+	}
+
+	private static class ClassObject extends SimpleJavaFileObject {
+		private final ByteArrayOutputStream bytes =
+			new ByteArrayOutputStream();
+
+		ClassObject(String classname) {
+			super(URI.create("bytes:///" + classname.replace('.', '/')
+				+ Kind.CLASS.extension), Kind.CLASS);
+		}
+
+		public OutputStream openOutputStream() {
+			return bytes;
+		}
+
+		byte[] getBytes() {
+			return bytes.toByteArray();
+		}
+	}
+
+	/**
+	 * Keep the class files generated by the compiler in memory.
+	 */
+	private static class MemoryFileManager
+			extends ForwardingJavaFileManager<StandardJavaFileManager> {
+		final Map<String, ClassObject> classes =
+			new HashMap<String, ClassObject>();
+
+		MemoryFileManager(StandardJavaFileManager fileManager) {
+			super(fileManager);
+		}
+
+		public JavaFileObject getJavaFileForOutput(Location location,
+				String className, JavaFileObject.Kind kind,
+				FileObject sibling) {
+			ClassObject compiled = new ClassObject(className);
+			classes.put(className, compiled);
+			return compiled;
+		}
+	}
+}
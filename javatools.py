@@ -0,0 +1,108 @@
+# vim: et:ts=4:textwidth=80
+
+# Automark
+#
+# David Llewellyn-Jones
+# Liverpool John Moores University
+# 18/12/2014
+# Released under the GPL v.3. See the LICENSE file for more details.
+
+"""
+Build the Java helper programs used to speed up compilation and execution.
+
+The helpers are kept as source in the java/tools folder and are compiled
+the first time they're needed, or whenever the source is newer than the
+compiled class.
+
+The uk.ac.ljmu.automark shim classes, which submissions use in place of
+parts of Swing, are committed already compiled. They're packaged into a jar
+alongside the helpers so they can be put on the classpath rather than being
+copied into every build folder.
+"""
+
+import os
+
+from subprocess import PIPE, Popen
+from tempfile import mkstemp
+from zipfile import ZIP_DEFLATED, ZipFile
+
+__all__ = ('compile_helper', 'get_shim_jar')
+
+
+# The location of the helper sources, relative to the working directory
+HELPER_FOLDER = 'java/tools'
+
+# The location of the compiled shim package, relative to the working 
+# directory, and the name of the jar it's packaged into
+SHIM_ROOT = 'java'
+SHIM_PACKAGE = 'uk/ac/ljmu/automark'
+SHIM_JAR = 'automark-shim.jar'
+
+
+def compile_helper(name, helperfolder):
+    """
+    Compile a Java helper program if it isn't already up-to-date.
+
+    Args:
+        name: The class name of the helper (e.g. ExecServer).
+        helperfolder: Folder to store the compiled helper class in.
+
+    Returns:
+        True if the helper class is available, False if it couldn't be
+        compiled.
+    """
+    source = os.path.join(HELPER_FOLDER, name + '.java')
+    compiled = os.path.join(helperfolder, name + '.class')
+    available = True
+    if not os.path.exists(compiled) or (
+            os.path.getmtime(compiled) < os.path.getmtime(source)):
+        if not os.path.exists(helperfolder):
+            os.makedirs(helperfolder)
+        try:
+            compiler = Popen(
+                ['javac', '-nowarn', '-d', helperfolder, source],
+                shell=False, cwd='.', stdin=PIPE, stdout=PIPE, stderr=PIPE)
+            compiler.communicate()
+            available = (compiler.returncode == 0)
+        except OSError:
+            # The Java compiler couldn't be found
+            available = False
+    return available
+
+
+def get_shim_jar(helperfolder):
+    """
+    Package the shim classes into a jar if it isn't already up-to-date.
+
+    The jar is built from the compiled shim classes in the java folder, so
+    no compiler is needed and nothing is written to the java folder.
+
+    Args:
+        helperfolder: Folder to store the jar in.
+
+    Returns:
+        The absolute path of the jar.
+    """
+    package_folder = os.path.join(SHIM_ROOT, SHIM_PACKAGE)
+    jar_path = os.path.abspath(os.path.join(helperfolder, SHIM_JAR))
+    classes = []
+    newest = 0
+    for name in os.listdir(package_folder):
+        if name.endswith('.class'):
+            classes.append(name)
+            newest = max(newest, os.path.getmtime(
+                os.path.join(package_folder, name)))
+    if not os.path.exists(jar_path) or (
+            os.path.getmtime(jar_path) < newest):
+        if not os.path.exists(helperfolder):
+            os.makedirs(helperfolder)
+        # Write the jar somewhere else first, so that other threads never 
+        # see it half-written
+        handle, staging = mkstemp(prefix='.staging-', dir=helperfolder)
+        os.close(handle)
+        with ZipFile(staging, 'w', ZIP_DEFLATED) as jar:
+            for name in sorted(classes):
+                jar.write(os.path.join(package_folder, name), 
+                    SHIM_PACKAGE + '/' + name)
+        os.rename(staging, jar_path)
+    return jar_path
@@ -3,11 +3,20 @@ class SourceElement(object):
     '''
     A SourceElement is the base class for all elements that occur in a Java
     file parsed by plyj.
+
+    Each subclass lists its fields in _fields and stores them in __slots__,
+    which keeps large trees small. The fields inherited from a base class
+    aren't repeated in the subclass's __slots__. Empty sequence fields
+    default to a shared empty tuple rather than a new list for every node.
     '''
 
+    _fields = ()
+    # The parser sets the label of a labelled statement, which isn't a field
+    # of most nodes
+    __slots__ = ('label',)
+
     def __init__(self):
         super(SourceElement, self).__init__()
-        self._fields = []
 
     def __repr__(self):
         equals = ("{0}={1!r}".format(k, getattr(self, k))
@@ -15,9 +24,21 @@ class SourceElement(object):
         args = ", ".join(equals)
         return "{0}({1})".format(self.__class__.__name__, args)
 
+    def __getstate__(self):
+        state = {}
+        for cls in self.__class__.__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __eq__(self, other):
         try:
-            return self.__dict__ == other.__dict__
+            return self.__getstate__() == other.__getstate__()
         except AttributeError:
             return False
 
@@ -35,7 +56,7 @@ class SourceElement(object):
             for f in self._fields:
                 field = getattr(self, f)
                 if field:
-                    if isinstance(field, list):
+                    if isinstance(field, (list, tuple)):
                         for elem in field:
                             if isinstance(elem, SourceElement):
                                 elem.accept(visitor)
@@ -45,54 +66,60 @@ class SourceElement(object):
 
 
 class CompilationUnit(SourceElement):
+    _fields = ('package_declaration', 'import_declarations',
+               'type_declarations')
+    __slots__ = ('package_declaration', 'import_declarations',
+                 'type_declarations')
 
     def __init__(self, package_declaration=None, import_declarations=None,
                  type_declarations=None):
         super(CompilationUnit, self).__init__()
-        self._fields = [
-            'package_declaration', 'import_declarations', 'type_declarations']
         if import_declarations is None:
-            import_declarations = []
+            import_declarations = ()
         if type_declarations is None:
-            type_declarations = []
+            type_declarations = ()
         self.package_declaration = package_declaration
         self.import_declarations = import_declarations
         self.type_declarations = type_declarations
 
 class PackageDeclaration(SourceElement):
+    _fields = ('name', 'modifiers')
+    __slots__ = ('name', 'modifiers')
 
     def __init__(self, name, modifiers=None):
         super(PackageDeclaration, self).__init__()
-        self._fields = ['name', 'modifiers']
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         self.name = name
         self.modifiers = modifiers
 
 
 class ImportDeclaration(SourceElement):
+    _fields = ('name', 'static', 'on_demand')
+    __slots__ = ('name', 'static', 'on_demand')
 
     def __init__(self, name, static=False, on_demand=False):
         super(ImportDeclaration, self).__init__()
-        self._fields = ['name', 'static', 'on_demand']
         self.name = name
         self.static = static
         self.on_demand = on_demand
 
 
 class ClassDeclaration(SourceElement):
+    _fields = ('name', 'body', 'modifiers', 'type_parameters', 'extends',
+               'implements')
+    __slots__ = ('name', 'body', 'modifiers', 'type_parameters', 'extends',
+                 'implements')
 
     def __init__(self, name, body, modifiers=None, type_parameters=None,
                  extends=None, implements=None):
         super(ClassDeclaration, self).__init__()
-        self._fields = ['name', 'body', 'modifiers',
-                        'type_parameters', 'extends', 'implements']
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         if type_parameters is None:
-            type_parameters = []
+            type_parameters = ()
         if implements is None:
-            implements = []
+            implements = ()
         self.name = name
         self.body = body
         self.modifiers = modifiers
@@ -101,26 +128,29 @@ class ClassDeclaration(SourceElement):
         self.implements = implements
 
 class ClassInitializer(SourceElement):
+    _fields = ('block', 'static')
+    __slots__ = ('block', 'static')
 
     def __init__(self, block, static=False):
         super(ClassInitializer, self).__init__()
-        self._fields = ['block', 'static']
         self.block = block
         self.static = static
 
 class ConstructorDeclaration(SourceElement):
+    _fields = ('name', 'block', 'modifiers', 'type_parameters', 'parameters',
+               'throws')
+    __slots__ = ('name', 'block', 'modifiers', 'type_parameters', 'parameters',
+                 'throws')
 
     def __init__(self, name, block, modifiers=None, type_parameters=None,
                  parameters=None, throws=None):
         super(ConstructorDeclaration, self).__init__()
-        self._fields = ['name', 'block', 'modifiers',
-                        'type_parameters', 'parameters', 'throws']
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         if type_parameters is None:
-            type_parameters = []
+            type_parameters = ()
         if parameters is None:
-            parameters = []
+            parameters = ()
         self.name = name
         self.block = block
         self.modifiers = modifiers
@@ -129,34 +159,36 @@ class ConstructorDeclaration(SourceElement):
         self.throws = throws
 
 class EmptyDeclaration(SourceElement):
-    pass
+    __slots__ = ()
 
 class FieldDeclaration(SourceElement):
+    _fields = ('type', 'variable_declarators', 'modifiers')
+    __slots__ = ('type', 'variable_declarators', 'modifiers')
 
     def __init__(self, type, variable_declarators, modifiers=None):
         super(FieldDeclaration, self).__init__()
-        self._fields = ['type', 'variable_declarators', 'modifiers']
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         self.type = type
         self.variable_declarators = variable_declarators
         self.modifiers = modifiers
 
 class MethodDeclaration(SourceElement):
+    _fields = ('name', 'modifiers', 'type_parameters', 'parameters',
+               'return_type', 'body', 'abstract', 'extended_dims', 'throws')
+    __slots__ = ('name', 'modifiers', 'type_parameters', 'parameters',
+                 'return_type', 'body', 'abstract', 'extended_dims', 'throws')
 
     def __init__(self, name, modifiers=None, type_parameters=None,
                  parameters=None, return_type='void', body=None, abstract=False,
                  extended_dims=0, throws=None):
         super(MethodDeclaration, self).__init__()
-        self._fields = ['name', 'modifiers', 'type_parameters', 'parameters',
-                        'return_type', 'body', 'abstract', 'extended_dims',
-                        'throws']
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         if type_parameters is None:
-            type_parameters = []
+            type_parameters = ()
         if parameters is None:
-            parameters = []
+            parameters = ()
         self.name = name
         self.modifiers = modifiers
         self.type_parameters = type_parameters
@@ -168,12 +200,13 @@ class MethodDeclaration(SourceElement):
         self.throws = throws
 
 class FormalParameter(SourceElement):
+    _fields = ('variable', 'type', 'modifiers', 'vararg')
+    __slots__ = ('variable', 'type', 'modifiers', 'vararg')
 
     def __init__(self, variable, type, modifiers=None, vararg=False):
         super(FormalParameter, self).__init__()
-        self._fields = ['variable', 'type', 'modifiers', 'vararg']
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         self.variable = variable
         self.type = type
         self.modifiers = modifiers
@@ -187,45 +220,48 @@ class Variable(SourceElement):
     # type with two variable declarators;This closely resembles the source code.
     # If the variable is to go away, the type has to be duplicated for every
     # variable...
+    _fields = ('name', 'dimensions', 'lineno')
+    __slots__ = ('name', 'dimensions', 'lineno')
 
     def __init__(self, name, dimensions=0, lineno=0):
         super(Variable, self).__init__()
-        self._fields = ['name', 'dimensions', 'lineno']
         self.name = name
         self.dimensions = dimensions
         self.lineno = lineno
 
 
 class VariableDeclarator(SourceElement):
+    _fields = ('variable', 'initializer')
+    __slots__ = ('variable', 'initializer')
 
     def __init__(self, variable, initializer=None):
         super(VariableDeclarator, self).__init__()
-        self._fields = ['variable', 'initializer']
         self.variable = variable
         self.initializer = initializer
 
 class Throws(SourceElement):
+    _fields = ('types',)
+    __slots__ = ('types',)
 
     def __init__(self, types):
         super(Throws, self).__init__()
-        self._fields = ['types']
         self.types = types
 
 class InterfaceDeclaration(SourceElement):
+    _fields = ('name', 'modifiers', 'extends', 'type_parameters', 'body')
+    __slots__ = ('name', 'modifiers', 'extends', 'type_parameters', 'body')
 
     def __init__(self, name, modifiers=None, extends=None, type_parameters=None,
                  body=None):
         super(InterfaceDeclaration, self).__init__()
-        self._fields = [
-            'name', 'modifiers', 'extends', 'type_parameters', 'body']
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         if extends is None:
-            extends = []
+            extends = ()
         if type_parameters is None:
-            type_parameters = []
+            type_parameters = ()
         if body is None:
-            body = []
+            body = ()
         self.name = name
         self.modifiers = modifiers
         self.extends = extends
@@ -233,20 +269,20 @@ class InterfaceDeclaration(SourceElement):
         self.body = body
 
 class EnumDeclaration(SourceElement):
+    _fields = ('name', 'implements', 'modifiers', 'type_parameters', 'body')
+    __slots__ = ('name', 'implements', 'modifiers', 'type_parameters', 'body')
 
     def __init__(self, name, implements=None, modifiers=None,
                  type_parameters=None, body=None):
         super(EnumDeclaration, self).__init__()
-        self._fields = [
-            'name', 'implements', 'modifiers', 'type_parameters', 'body']
         if implements is None:
-            implements = []
+            implements = ()
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         if type_parameters is None:
-            type_parameters = []
+            type_parameters = ()
         if body is None:
-            body = []
+            body = ()
         self.name = name
         self.implements = implements
         self.modifiers = modifiers
@@ -254,37 +290,39 @@ class EnumDeclaration(SourceElement):
         self.body = body
 
 class EnumConstant(SourceElement):
+    _fields = ('name', 'arguments', 'modifiers', 'body')
+    __slots__ = ('name', 'arguments', 'modifiers', 'body')
 
     def __init__(self, name, arguments=None, modifiers=None, body=None):
         super(EnumConstant, self).__init__()
-        self._fields = ['name', 'arguments', 'modifiers', 'body']
         if arguments is None:
-            arguments = []
+            arguments = ()
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         if body is None:
-            body = []
+            body = ()
         self.name = name
         self.arguments = arguments
         self.modifiers = modifiers
         self.body = body
 
 class AnnotationDeclaration(SourceElement):
+    _fields = ('name', 'modifiers', 'type_parameters', 'extends', 'implements',
+               'body')
+    __slots__ = ('name', 'modifiers', 'type_parameters', 'extends',
+                 'implements', 'body')
 
     def __init__(self, name, modifiers=None, type_parameters=None, extends=None,
                  implements=None, body=None):
         super(AnnotationDeclaration, self).__init__()
-        self._fields = [
-            'name', 'modifiers', 'type_parameters', 'extends', 'implements',
-            'body']
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         if type_parameters is None:
-            type_parameters = []
+            type_parameters = ()
         if implements is None:
-            implements = []
+            implements = ()
         if body is None:
-            body = []
+            body = ()
         self.name = name
         self.modifiers = modifiers
         self.type_parameters = type_parameters
@@ -293,18 +331,20 @@ class AnnotationDeclaration(SourceElement):
         self.body = body
 
 class AnnotationMethodDeclaration(SourceElement):
+    _fields = ('name', 'type', 'parameters', 'default', 'modifiers',
+               'type_parameters', 'extended_dims')
+    __slots__ = ('name', 'type', 'parameters', 'default', 'modifiers',
+                 'type_parameters', 'extended_dims')
 
     def __init__(self, name, type, parameters=None, default=None,
                  modifiers=None, type_parameters=None, extended_dims=0):
         super(AnnotationMethodDeclaration, self).__init__()
-        self._fields = ['name', 'type', 'parameters', 'default',
-                        'modifiers', 'type_parameters', 'extended_dims']
         if parameters is None:
-            parameters = []
+            parameters = ()
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         if type_parameters is None:
-            type_parameters = []
+            type_parameters = ()
         self.name = name
         self.type = type
         self.parameters = parameters
@@ -314,34 +354,39 @@ class AnnotationMethodDeclaration(SourceElement):
         self.extended_dims = extended_dims
 
 class Annotation(SourceElement):
+    _fields = ('name', 'members', 'single_member')
+    __slots__ = ('name', 'members', 'single_member')
 
     def __init__(self, name, members=None, single_member=None):
         super(Annotation, self).__init__()
-        self._fields = ['name', 'members', 'single_member']
         if members is None:
-            members = []
+            members = ()
         self.name = name
         self.members = members
         self.single_member = single_member
 
 
 class AnnotationMember(SourceElement):
+    _fields = ('name', 'value')
+    __slots__ = ('name', 'value')
 
     def __init__(self, name, value):
         super(SourceElement, self).__init__()
-        self._fields = ['name', 'value']
         self.name = name
         self.value = value
 
 
 class Type(SourceElement):
+    _fields = ('name', 'type_arguments', 'enclosed_in', 'dimensions')
+    # The parser also sets dims for generic array types
+    __slots__ = ('name', 'type_arguments', 'enclosed_in', 'dimensions',
+                 'dims')
 
     def __init__(self, name, type_arguments=None, enclosed_in=None,
                  dimensions=0):
         super(Type, self).__init__()
-        self._fields = ['name', 'type_arguments', 'enclosed_in', 'dimensions']
         if type_arguments is None:
-            type_arguments = []
+            type_arguments = ()
         self.name = name
         self.type_arguments = type_arguments
         self.enclosed_in = enclosed_in
@@ -349,138 +394,147 @@ class Type(SourceElement):
 
 
 class Wildcard(SourceElement):
+    _fields = ('bounds',)
+    __slots__ = ('bounds',)
 
     def __init__(self, bounds=None):
         super(Wildcard, self).__init__()
-        self._fields = ['bounds']
         if bounds is None:
-            bounds = []
+            bounds = ()
         self.bounds = bounds
 
 
 class WildcardBound(SourceElement):
+    _fields = ('type', 'extends', '_super')
+    __slots__ = ('type', 'extends', '_super')
 
     def __init__(self, type, extends=False, _super=False):
         super(WildcardBound, self).__init__()
-        self._fields = ['type', 'extends', '_super']
         self.type = type
         self.extends = extends
         self._super = _super
 
 
 class TypeParameter(SourceElement):
+    _fields = ('name', 'extends')
+    __slots__ = ('name', 'extends')
 
     def __init__(self, name, extends=None):
         super(TypeParameter, self).__init__()
-        self._fields = ['name', 'extends']
         if extends is None:
-            extends = []
+            extends = ()
         self.name = name
         self.extends = extends
 
 
 class Expression(SourceElement):
+    _fields = ()
+    __slots__ = ()
 
     def __init__(self):
         super(Expression, self).__init__()
-        self._fields = []
 
 class BinaryExpression(Expression):
+    _fields = ('operator', 'lhs', 'rhs')
+    __slots__ = ('operator', 'lhs', 'rhs')
 
     def __init__(self, operator, lhs, rhs):
         super(BinaryExpression, self).__init__()
-        self._fields = ['operator', 'lhs', 'rhs']
         self.operator = operator
         self.lhs = lhs
         self.rhs = rhs
 
 class Assignment(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Conditional(Expression):
+    _fields = ('predicate', 'if_true', 'if_false')
+    __slots__ = ('predicate', 'if_true', 'if_false')
 
     def __init__(self, predicate, if_true, if_false):
         super(self.__class__, self).__init__()
-        self._fields = ['predicate', 'if_true', 'if_false']
         self.predicate = predicate
         self.if_true = if_true
         self.if_false = if_false
 
 class ConditionalOr(BinaryExpression):
-    pass
+    __slots__ = ()
 
 class ConditionalAnd(BinaryExpression):
-    pass
+    __slots__ = ()
 
 class Or(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Xor(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class And(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Equality(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class InstanceOf(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Relational(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Shift(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Additive(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Multiplicative(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Unary(Expression):
+    _fields = ('sign', 'expression')
+    __slots__ = ('sign', 'expression')
 
     def __init__(self, sign, expression):
         super(Unary, self).__init__()
-        self._fields = ['sign', 'expression']
         self.sign = sign
         self.expression = expression
 
 
 class Cast(Expression):
+    _fields = ('target', 'expression')
+    __slots__ = ('target', 'expression')
 
     def __init__(self, target, expression):
         super(Cast, self).__init__()
-        self._fields = ['target', 'expression']
         self.target = target
         self.expression = expression
 
 
 class Statement(SourceElement):
-    pass
+    __slots__ = ()
 
 class Empty(Statement):
-    pass
+    __slots__ = ()
 
 
 class Block(Statement):
+    _fields = ('statements',)
+    __slots__ = ('statements',)
 
     def __init__(self, statements=None):
         super(Statement, self).__init__()
-        self._fields = ['statements']
         if statements is None:
-            statements = []
+            statements = ()
         self.statements = statements
 
     def __iter__(self):
@@ -488,64 +542,72 @@ class Block(Statement):
             yield s
 
 class VariableDeclaration(Statement, FieldDeclaration):
-    pass
+    __slots__ = ()
 
 class ArrayInitializer(SourceElement):
+    _fields = ('elements',)
+    __slots__ = ('elements',)
+
     def __init__(self, elements=None):
         super(ArrayInitializer, self).__init__()
-        self._fields = ['elements']
         if elements is None:
-            elements = []
+            elements = ()
         self.elements = elements
 
 
 class MethodInvocation(Expression):
+    _fields = ('name', 'arguments', 'type_arguments', 'target')
+    __slots__ = ('name', 'arguments', 'type_arguments', 'target')
+
     def __init__(self, name, arguments=None, type_arguments=None, target=None):
         super(MethodInvocation, self).__init__()
-        self._fields = ['name', 'arguments', 'type_arguments', 'target']
         if arguments is None:
-            arguments = []
+            arguments = ()
         if type_arguments is None:
-            type_arguments = []
+            type_arguments = ()
         self.name = name
         self.arguments = arguments
         self.type_arguments = type_arguments
         self.target = target
 
 class IfThenElse(Statement):
+    _fields = ('predicate', 'if_true', 'if_false')
+    __slots__ = ('predicate', 'if_true', 'if_false')
 
     def __init__(self, predicate, if_true=None, if_false=None):
         super(IfThenElse, self).__init__()
-        self._fields = ['predicate', 'if_true', 'if_false']
         self.predicate = predicate
         self.if_true = if_true
         self.if_false = if_false
 
 class While(Statement):
+    _fields = ('predicate', 'body')
+    __slots__ = ('predicate', 'body')
 
     def __init__(self, predicate, body=None):
         super(While, self).__init__()
-        self._fields = ['predicate', 'body']
         self.predicate = predicate
         self.body = body
 
 class For(Statement):
+    _fields = ('init', 'predicate', 'update', 'body')
+    __slots__ = ('init', 'predicate', 'update', 'body')
 
     def __init__(self, init, predicate, update, body):
         super(For, self).__init__()
-        self._fields = ['init', 'predicate', 'update', 'body']
         self.init = init
         self.predicate = predicate
         self.update = update
         self.body = body
 
 class ForEach(Statement):
+    _fields = ('type', 'variable', 'iterable', 'body', 'modifiers')
+    __slots__ = ('type', 'variable', 'iterable', 'body', 'modifiers')
 
     def __init__(self, type, variable, iterable, body, modifiers=None):
         super(ForEach, self).__init__()
-        self._fields = ['type', 'variable', 'iterable', 'body', 'modifiers']
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         self.type = type
         self.variable = variable
         self.iterable = iterable
@@ -554,91 +616,101 @@ class ForEach(Statement):
 
 
 class Assert(Statement):
+    _fields = ('predicate', 'message')
+    __slots__ = ('predicate', 'message')
 
     def __init__(self, predicate, message=None):
         super(Assert, self).__init__()
-        self._fields = ['predicate', 'message']
         self.predicate = predicate
         self.message = message
 
 
 class Switch(Statement):
+    _fields = ('expression', 'switch_cases')
+    __slots__ = ('expression', 'switch_cases')
 
     def __init__(self, expression, switch_cases):
         super(Switch, self).__init__()
-        self._fields = ['expression', 'switch_cases']
         self.expression = expression
         self.switch_cases = switch_cases
 
 class SwitchCase(SourceElement):
+    _fields = ('cases', 'body')
+    __slots__ = ('cases', 'body')
 
     def __init__(self, cases, body=None):
         super(SwitchCase, self).__init__()
-        self._fields = ['cases', 'body']
         if body is None:
-            body = []
+            body = ()
         self.cases = cases
         self.body = body
 
 class DoWhile(Statement):
+    _fields = ('predicate', 'body')
+    __slots__ = ('predicate', 'body')
 
     def __init__(self, predicate, body=None):
         super(DoWhile, self).__init__()
-        self._fields = ['predicate', 'body']
         self.predicate = predicate
         self.body = body
 
 
 class Continue(Statement):
+    _fields = ('label',)
+    __slots__ = ()
 
     def __init__(self, label=None):
         super(Continue, self).__init__()
-        self._fields = ['label']
         self.label = label
 
 
 class Break(Statement):
+    _fields = ('label',)
+    __slots__ = ()
 
     def __init__(self, label=None):
         super(Break, self).__init__()
-        self._fields = ['label']
         self.label = label
 
 
 class Return(Statement):
+    _fields = ('result',)
+    __slots__ = ('result',)
 
     def __init__(self, result=None):
         super(Return, self).__init__()
-        self._fields = ['result']
         self.result = result
 
 
 class Synchronized(Statement):
+    _fields = ('monitor', 'body')
+    __slots__ = ('monitor', 'body')
 
     def __init__(self, monitor, body):
         super(Synchronized, self).__init__()
-        self._fields = ['monitor', 'body']
         self.monitor = monitor
         self.body = body
 
 
 class Throw(Statement):
+    _fields = ('exception',)
+    __slots__ = ('exception',)
 
     def __init__(self, exception):
         super(Throw, self).__init__()
-        self._fields = ['exception']
         self.exception = exception
 
 
 class Try(Statement):
+    _fields = ('block', 'catches', '_finally', 'resources')
+    __slots__ = ('block', 'catches', '_finally', 'resources')
 
     def __init__(self, block, catches=None, _finally=None, resources=None):
         super(Try, self).__init__()
-        self._fields = ['block', 'catches', '_finally', 'resources']
         if catches is None:
-            catches = []
+            catches = ()
         if resources is None:
-            resources = []
+            resources = ()
         self.block = block
         self.catches = catches
         self._finally = _finally
@@ -655,14 +727,15 @@ class Try(Statement):
 
 
 class Catch(SourceElement):
+    _fields = ('variable', 'modifiers', 'types', 'block')
+    __slots__ = ('variable', 'modifiers', 'types', 'block')
 
     def __init__(self, variable, modifiers=None, types=None, block=None):
         super(Catch, self).__init__()
-        self._fields = ['variable', 'modifiers', 'types', 'block']
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         if types is None:
-            types = []
+            types = ()
         self.variable = variable
         self.modifiers = modifiers
         self.types = types
@@ -670,12 +743,13 @@ class Catch(SourceElement):
 
 
 class Resource(SourceElement):
+    _fields = ('variable', 'type', 'modifiers', 'initializer')
+    __slots__ = ('variable', 'type', 'modifiers', 'initializer')
 
     def __init__(self, variable, type=None, modifiers=None, initializer=None):
         super(Resource, self).__init__()
-        self._fields = ['variable', 'type', 'modifiers', 'initializer']
         if modifiers is None:
-            modifiers = []
+            modifiers = ()
         self.variable = variable
         self.type = type
         self.modifiers = modifiers
@@ -687,14 +761,15 @@ class ConstructorInvocation(Statement):
 
     This is a variant of either this() or super(), NOT a "new" expression.
     """
+    _fields = ('name', 'target', 'type_arguments', 'arguments')
+    __slots__ = ('name', 'target', 'type_arguments', 'arguments')
 
     def __init__(self, name, target=None, type_arguments=None, arguments=None):
         super(ConstructorInvocation, self).__init__()
-        self._fields = ['name', 'target', 'type_arguments', 'arguments']
         if type_arguments is None:
-            type_arguments = []
+            type_arguments = ()
         if arguments is None:
-            arguments = []
+            arguments = ()
         self.name = name
         self.target = target
         self.type_arguments = type_arguments
@@ -702,18 +777,20 @@ class ConstructorInvocation(Statement):
 
 
 class InstanceCreation(Expression):
+    _fields = ('type', 'type_arguments', 'arguments', 'body', 'enclosed_in',
+               'lineno')
+    __slots__ = ('type', 'type_arguments', 'arguments', 'body', 'enclosed_in',
+                 'lineno')
 
     def __init__(self, type, type_arguments=None, arguments=None, body=None,
                  enclosed_in=None, lineno=0):
         super(InstanceCreation, self).__init__()
-        self._fields = [
-            'type', 'type_arguments', 'arguments', 'body', 'enclosed_in', 'lineno']
         if type_arguments is None:
-            type_arguments = []
+            type_arguments = ()
         if arguments is None:
-            arguments = []
+            arguments = ()
         if body is None:
-            body = []
+            body = ()
         self.type = type
         self.type_arguments = type_arguments
         self.arguments = arguments
@@ -723,56 +800,62 @@ class InstanceCreation(Expression):
 
 
 class FieldAccess(Expression):
+    _fields = ('name', 'target')
+    __slots__ = ('name', 'target')
 
     def __init__(self, name, target):
         super(FieldAccess, self).__init__()
-        self._fields = ['name', 'target']
         self.name = name
         self.target = target
 
 
 class ArrayAccess(Expression):
+    _fields = ('index', 'target')
+    __slots__ = ('index', 'target')
 
     def __init__(self, index, target):
         super(ArrayAccess, self).__init__()
-        self._fields = ['index', 'target']
         self.index = index
         self.target = target
 
 
 class ArrayCreation(Expression):
+    _fields = ('type', 'dimensions', 'initializer')
+    __slots__ = ('type', 'dimensions', 'initializer')
 
     def __init__(self, type, dimensions=None, initializer=None):
         super(ArrayCreation, self).__init__()
-        self._fields = ['type', 'dimensions', 'initializer']
         if dimensions is None:
-            dimensions = []
+            dimensions = ()
         self.type = type
         self.dimensions = dimensions
         self.initializer = initializer
 
 
 class Literal(SourceElement):
+    _fields = ('value',)
+    __slots__ = ('value',)
 
     def __init__(self, value):
         super(Literal, self).__init__()
-        self._fields = ['value']
         self.value = value
 
 
 class ClassLiteral(SourceElement):
+    _fields = ('type',)
+    __slots__ = ('type',)
 
     def __init__(self, type):
         super(ClassLiteral, self).__init__()
-        self._fields = ['type']
         self.type = type
 
 
 class Name(SourceElement):
+    _fields = ('value',)
+    __slots__ = ('value',)
 
     def __init__(self, value):
         super(Name, self).__init__()
-        self._fields = ['value']
         self.value = value
 
     def append_name(self, name):
@@ -1,5 +1,9 @@
 #!/usr/bin/env python2
 
+import os
+import sys
+import warnings
+
 import ply.lex as lex
 import ply.yacc as yacc
 from .model import *
@@ -2000,9 +2004,59 @@ class MyParser(ExpressionParser, NameParser, LiteralParser, TypeParser, ClassPar
 
 class Parser(object):
 
+    # The lexer and parser tables are generated in advance by write_tables()
+    # and kept in this package (lextab.py and parsetab.py), so they're loaded
+    # rather than generated, whatever the working directory. They only load
+    # with the version of PLY they were generated with. With any other
+    # version they're generated in memory every time, which is slow, but
+    # nothing is ever written into the package
+    PLY_VERSION = '3.11'
+    _package = __name__.rpartition('.')[0]
+    _outputdir = os.path.dirname(os.path.abspath(__file__))
+
     def __init__(self):
-        self.lexer = lex.lex(module=MyLexer(), optimize=1)
-        self.parser = yacc.yacc(module=MyParser(), start='goal', optimize=1)
+        if yacc.__version__ != self.PLY_VERSION:
+            warnings.warn('The parser tables are for PLY {}, not PLY {}, so '
+                          'they are generated every time'.format(
+                              self.PLY_VERSION, yacc.__version__))
+        # PLY writes the lexer table whenever it's optimising but can't load
+        # the table, so it only optimises if the table will load
+        self.lexer = lex.lex(module=MyLexer(), optimize=self._lextab_loads(),
+                             lextab=self._package + '.lextab',
+                             outputdir=self._outputdir)
+        self.parser = yacc.yacc(module=MyParser(), start='goal', optimize=1,
+                                debug=0, write_tables=False,
+                                tabmodule=self._package + '.parsetab',
+                                outputdir=self._outputdir)
+
+    @classmethod
+    def _lextab_loads(cls):
+        try:
+            lextab = __import__(cls._package + '.lextab', fromlist=['lextab'])
+        except ImportError:
+            return 0
+        # PLY 3.4 checks the table against its own version
+        version = getattr(lex, '__tabversion__', lex.__version__)
+        return int(getattr(lextab, '_tabversion', None) == version)
+
+    @classmethod
+    def write_tables(cls):
+        '''
+        Generate the lexer and parser tables in the package for the version
+        of PLY installed. Run from the top folder, so that the paths recorded
+        in the tables are relative.
+        '''
+        for name in ['lextab', 'parsetab']:
+            for extension in ['.py', '.pyc']:
+                path = os.path.join(cls._outputdir, name + extension)
+                if os.path.exists(path):
+                    os.remove(path)
+            sys.modules.pop(cls._package + '.' + name, None)
+        lex.lex(module=MyLexer(), optimize=1,
+                lextab=cls._package + '.lextab', outputdir=cls._outputdir)
+        yacc.yacc(module=MyParser(), start='goal', optimize=1, debug=0,
+                  write_tables=True, tabmodule=cls._package + '.parsetab',
+                  outputdir=cls._outputdir)
 
     def tokenize_string(self, code):
         self.lexer.input(code)
@@ -0,0 +1,653 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "goalABSTRACT AND AND_ASSIGN ASSERT BLOCK_COMMENT BOOLEAN BREAK BYTE CASE CATCH CHAR CHAR_LITERAL CLASS CONTINUE DEFAULT DIVIDE_ASSIGN DO DOUBLE ELLIPSIS ELSE ENUM EQ EXTENDS FALSE FINAL FINALLY FLOAT FOR GTEQ IF IMPLEMENTS IMPORT INSTANCEOF INT INTERFACE LINE_COMMENT LONG LSHIFT LSHIFT_ASSIGN LTEQ MINUSMINUS MINUS_ASSIGN NAME NATIVE NEQ NEW NULL NUM OR OR_ASSIGN PACKAGE PLUSPLUS PLUS_ASSIGN PRIVATE PROTECTED PUBLIC REMAINDER_ASSIGN RETURN RRSHIFT RRSHIFT_ASSIGN RSHIFT RSHIFT_ASSIGN SHORT STATIC STRICTFP STRING_LITERAL SUPER SWITCH SYNCHRONIZED THIS THROW THROWS TIMES_ASSIGN TRANSIENT TRUE TRY VOID VOLATILE WHILE XOR_ASSIGNexpression : assignment_expressionexpression_not_name : assignment_expression_not_nameassignment_expression : assignment\n                                 | conditional_expressionassignment_expression_not_name : assignment\n                                          | conditional_expression_not_nameassignment : postfix_expression assignment_operator assignment_expressionassignment_operator : '='\n                               | TIMES_ASSIGN\n                               | DIVIDE_ASSIGN\n                               | REMAINDER_ASSIGN\n                               | PLUS_ASSIGN\n                               | MINUS_ASSIGN\n                               | LSHIFT_ASSIGN\n                               | RSHIFT_ASSIGN\n                               | RRSHIFT_ASSIGN\n                               | AND_ASSIGN\n                               | OR_ASSIGN\n                               | XOR_ASSIGNconditional_expression : conditional_or_expression\n                                  | conditional_or_expression '?' expression ':' conditional_expressionconditional_expression_not_name : conditional_or_expression_not_name\n                                           | conditional_or_expression_not_name '?' expression ':' conditional_expression\n                                           | name '?' expression ':' conditional_expressionconditional_or_expression : conditional_and_expression\n                                     | conditional_or_expression OR conditional_and_expressionconditional_or_expression_not_name : conditional_and_expression_not_name\n                                              | conditional_or_expression_not_name OR conditional_and_expression\n                                              | name OR conditional_and_expressionconditional_and_expression : inclusive_or_expression\n                                      | conditional_and_expression AND inclusive_or_expressionconditional_and_expression_not_name : inclusive_or_expression_not_name\n                                               | conditional_and_expression_not_name AND inclusive_or_expression\n                                               | name AND inclusive_or_expressioninclusive_or_expression : exclusive_or_expression\n                                   | inclusive_or_expression '|' exclusive_or_expressioninclusive_or_expression_not_name : exclusive_or_expression_not_name\n                                            | inclusive_or_expression_not_name '|' exclusive_or_expression\n                                            | name '|' exclusive_or_expressionexclusive_or_expression : and_expression\n                                   | exclusive_or_expression '^' and_expressionexclusive_or_expression_not_name : and_expression_not_name\n                                            | exclusive_or_expression_not_name '^' and_expression\n                                            | name '^' and_expressionand_expression : equality_expression\n                          | and_expression '&' equality_expressionand_expression_not_name : equality_expression_not_name\n                                   | and_expression_not_name '&' equality_expression\n                                   | name '&' equality_expressionequality_expression : instanceof_expression\n                               | equality_expression EQ instanceof_expression\n                               | equality_expression NEQ instanceof_expressionequality_expression_not_name : instanceof_expression_not_name\n                                        | equality_expression_not_name EQ instanceof_expression\n                                        | name EQ instanceof_expression\n                                        | equality_expression_not_name NEQ instanceof_expression\n                                        | name NEQ instanceof_expressioninstanceof_expression : relational_expression\n                                 | instanceof_expression INSTANCEOF reference_typeinstanceof_expression_not_name : relational_expression_not_name\n                                          | name INSTANCEOF reference_type\n                                          | instanceof_expression_not_name INSTANCEOF reference_typerelational_expression : shift_expression\n                                 | relational_expression '>' shift_expression\n                                 | relational_expression '<' shift_expression\n                                 | relational_expression GTEQ shift_expression\n                                 | relational_expression LTEQ shift_expressionrelational_expression_not_name : shift_expression_not_name\n                                          | shift_expression_not_name '<' shift_expression\n                                          | name '<' shift_expression\n                                          | shift_expression_not_name '>' shift_expression\n                                          | name '>' shift_expression\n                                          | shift_expression_not_name GTEQ shift_expression\n                                          | name GTEQ shift_expression\n                                          | shift_expression_not_name LTEQ shift_expression\n                                          | name LTEQ shift_expressionshift_expression : additive_expression\n                            | shift_expression LSHIFT additive_expression\n                            | shift_expression RSHIFT additive_expression\n                            | shift_expression RRSHIFT additive_expressionshift_expression_not_name : additive_expression_not_name\n                                     | shift_expression_not_name LSHIFT additive_expression\n                                     | name LSHIFT additive_expression\n                                     | shift_expression_not_name RSHIFT additive_expression\n                                     | name RSHIFT additive_expression\n                                     | shift_expression_not_name RRSHIFT additive_expression\n                                     | name RRSHIFT additive_expressionadditive_expression : multiplicative_expression\n                               | additive_expression '+' multiplicative_expression\n                               | additive_expression '-' multiplicative_expressionadditive_expression_not_name : multiplicative_expression_not_name\n                                        | additive_expression_not_name '+' multiplicative_expression\n                                        | name '+' multiplicative_expression\n                                        | additive_expression_not_name '-' multiplicative_expression\n                                        | name '-' multiplicative_expressionmultiplicative_expression : unary_expression\n                                     | multiplicative_expression '*' unary_expression\n                                     | multiplicative_expression '/' unary_expression\n                                     | multiplicative_expression '%' unary_expressionmultiplicative_expression_not_name : unary_expression_not_name\n                                              | multiplicative_expression_not_name '*' unary_expression\n                                              | name '*' unary_expression\n                                              | multiplicative_expression_not_name '/' unary_expression\n                                              | name '/' unary_expression\n                                              | multiplicative_expression_not_name '%' unary_expression\n                                              | name '%' unary_expressionunary_expression : pre_increment_expression\n                            | pre_decrement_expression\n                            | '+' unary_expression\n                            | '-' unary_expression\n                            | unary_expression_not_plus_minusunary_expression_not_name : pre_increment_expression\n                                     | pre_decrement_expression\n                                     | '+' unary_expression\n                                     | '-' unary_expression\n                                     | unary_expression_not_plus_minus_not_namepre_increment_expression : PLUSPLUS unary_expressionpre_decrement_expression : MINUSMINUS unary_expressionunary_expression_not_plus_minus : postfix_expression\n                                           | '~' unary_expression\n                                           | '!' unary_expression\n                                           | cast_expressionunary_expression_not_plus_minus_not_name : postfix_expression_not_name\n                                                    | '~' unary_expression\n                                                    | '!' unary_expression\n                                                    | cast_expressionpostfix_expression : primary\n                              | name\n                              | post_increment_expression\n                              | post_decrement_expressionpostfix_expression_not_name : primary\n                                       | post_increment_expression\n                                       | post_decrement_expressionpost_increment_expression : postfix_expression PLUSPLUSpost_decrement_expression : postfix_expression MINUSMINUSprimary : primary_no_new_array\n                   | array_creation_with_array_initializer\n                   | array_creation_without_array_initializerprimary_no_new_array : literal\n                                | THIS\n                                | class_instance_creation_expression\n                                | field_access\n                                | method_invocation\n                                | array_accessprimary_no_new_array : '(' name ')'\n                                | '(' expression_not_name ')' primary_no_new_array : name '.' THIS\n                                | name '.' SUPERprimary_no_new_array : name '.' CLASS\n                                | name dims '.' CLASS\n                                | primitive_type dims '.' CLASS\n                                | primitive_type '.' CLASSdims_opt : dimsdims_opt : emptydims : dims_loopdims_loop : one_dim_loop\n                     | dims_loop one_dim_loopone_dim_loop : '[' ']' cast_expression : '(' primitive_type dims_opt ')' unary_expressioncast_expression : '(' name type_arguments dims_opt ')' unary_expression_not_plus_minuscast_expression : '(' name type_arguments '.' class_or_interface_type dims_opt ')' unary_expression_not_plus_minuscast_expression : '(' name ')' unary_expression_not_plus_minuscast_expression : '(' name dims ')' unary_expression_not_plus_minusblock : '{' block_statements_opt '}' block_statements_opt : block_statementsblock_statements_opt : emptyblock_statements : block_statement\n                            | block_statements block_statementblock_statement : local_variable_declaration_statement\n                           | statement\n                           | class_declaration\n                           | interface_declaration\n                           | annotation_type_declaration\n                           | enum_declarationlocal_variable_declaration_statement : local_variable_declaration ';' local_variable_declaration : type variable_declaratorslocal_variable_declaration : modifiers type variable_declaratorsvariable_declarators : variable_declarator\n                                | variable_declarators ',' variable_declaratorvariable_declarator : variable_declarator_id\n                               | variable_declarator_id '=' variable_initializervariable_declarator_id : NAME dims_optvariable_initializer : expression\n                                | array_initializerstatement : statement_without_trailing_substatement\n                     | labeled_statement\n                     | if_then_statement\n                     | if_then_else_statement\n                     | while_statement\n                     | for_statement\n                     | enhanced_for_statementstatement_without_trailing_substatement : block\n                                                   | expression_statement\n                                                   | assert_statement\n                                                   | empty_statement\n                                                   | switch_statement\n                                                   | do_statement\n                                                   | break_statement\n                                                   | continue_statement\n                                                   | return_statement\n                                                   | synchronized_statement\n                                                   | throw_statement\n                                                   | try_statement\n                                                   | try_statement_with_resourcesexpression_statement : statement_expression ';'\n                                | explicit_constructor_invocationstatement_expression : assignment\n                                | pre_increment_expression\n                                | pre_decrement_expression\n                                | post_increment_expression\n                                | post_decrement_expression\n                                | method_invocation\n                                | class_instance_creation_expressioncomma_opt : ','\n                     | emptyarray_initializer : '{' comma_opt '}' array_initializer : '{' variable_initializers '}'\n                             | '{' variable_initializers ',' '}' variable_initializers : variable_initializer\n                                 | variable_initializers ',' variable_initializermethod_invocation : NAME '(' argument_list_opt ')' method_invocation : name '.' type_arguments NAME '(' argument_list_opt ')'\n                             | primary '.' type_arguments NAME '(' argument_list_opt ')'\n                             | SUPER '.' type_arguments NAME '(' argument_list_opt ')' method_invocation : name '.' NAME '(' argument_list_opt ')'\n                             | primary '.' NAME '(' argument_list_opt ')'\n                             | SUPER '.' NAME '(' argument_list_opt ')' labeled_statement : label ':' statementlabeled_statement_no_short_if : label ':' statement_no_short_iflabel : NAMEif_then_statement : IF '(' expression ')' statementif_then_else_statement : IF '(' expression ')' statement_no_short_if ELSE statementif_then_else_statement_no_short_if : IF '(' expression ')' statement_no_short_if ELSE statement_no_short_ifwhile_statement : WHILE '(' expression ')' statementwhile_statement_no_short_if : WHILE '(' expression ')' statement_no_short_iffor_statement : FOR '(' for_init_opt ';' expression_opt ';' for_update_opt ')' statementfor_statement_no_short_if : FOR '(' for_init_opt ';' expression_opt ';' for_update_opt ')' statement_no_short_iffor_init_opt : for_init\n                        | emptyfor_init : statement_expression_list\n                    | local_variable_declarationstatement_expression_list : statement_expression\n                                     | statement_expression_list ',' statement_expressionexpression_opt : expression\n                          | emptyfor_update_opt : for_update\n                          | emptyfor_update : statement_expression_listenhanced_for_statement : enhanced_for_statement_header statementenhanced_for_statement_no_short_if : enhanced_for_statement_header statement_no_short_ifenhanced_for_statement_header : enhanced_for_statement_header_init ':' expression ')' enhanced_for_statement_header_init : FOR '(' type NAME dims_optenhanced_for_statement_header_init : FOR '(' modifiers type NAME dims_optstatement_no_short_if : statement_without_trailing_substatement\n                                 | labeled_statement_no_short_if\n                                 | if_then_else_statement_no_short_if\n                                 | while_statement_no_short_if\n                                 | for_statement_no_short_if\n                                 | enhanced_for_statement_no_short_ifassert_statement : ASSERT expression ';'\n                            | ASSERT expression ':' expression ';' empty_statement : ';' switch_statement : SWITCH '(' expression ')' switch_blockswitch_block : '{' '}' switch_block : '{' switch_block_statements '}' switch_block : '{' switch_labels '}' switch_block : '{' switch_block_statements switch_labels '}' switch_block_statements : switch_block_statement\n                                   | switch_block_statements switch_block_statementswitch_block_statement : switch_labels block_statementsswitch_labels : switch_label\n                         | switch_labels switch_labelswitch_label : CASE constant_expression ':'\n                        | DEFAULT ':' constant_expression : expressiondo_statement : DO statement WHILE '(' expression ')' ';' break_statement : BREAK ';'\n                           | BREAK NAME ';' continue_statement : CONTINUE ';'\n                              | CONTINUE NAME ';' return_statement : RETURN expression_opt ';' synchronized_statement : SYNCHRONIZED '(' expression ')' blockthrow_statement : THROW expression ';' try_statement : TRY try_block catches\n                         | TRY try_block catches_opt finallytry_block : blockcatches : catch_clause\n                   | catches catch_clausecatches_opt : catchescatches_opt : emptycatch_clause : CATCH '(' catch_formal_parameter ')' blockcatch_formal_parameter : modifiers_opt catch_type variable_declarator_idcatch_type : union_typeunion_type : type\n                      | union_type '|' typetry_statement_with_resources : TRY resource_specification try_block catches_opt\n                                        | TRY resource_specification try_block catches_opt finallyresource_specification : '(' resources semi_opt ')' semi_opt : ';'\n                    | emptyresources : resource\n                     | resources trailing_semicolon resourcetrailing_semicolon : ';' resource : type variable_declarator_id '=' variable_initializerresource : modifiers type variable_declarator_id '=' variable_initializerfinally : FINALLY blockexplicit_constructor_invocation : THIS '(' argument_list_opt ')' ';'\n                                           | SUPER '(' argument_list_opt ')' ';' explicit_constructor_invocation : type_arguments SUPER '(' argument_list_opt ')' ';'\n                                           | type_arguments THIS '(' argument_list_opt ')' ';' explicit_constructor_invocation : primary '.' SUPER '(' argument_list_opt ')' ';'\n                                           | name '.' SUPER '(' argument_list_opt ')' ';'\n                                           | primary '.' THIS '(' argument_list_opt ')' ';'\n                                           | name '.' THIS '(' argument_list_opt ')' ';' explicit_constructor_invocation : primary '.' type_arguments SUPER '(' argument_list_opt ')' ';'\n                                           | name '.' type_arguments SUPER '(' argument_list_opt ')' ';'\n                                           | primary '.' type_arguments THIS '(' argument_list_opt ')' ';'\n                                           | name '.' type_arguments THIS '(' argument_list_opt ')' ';' class_instance_creation_expression : NEW type_arguments class_type '(' argument_list_opt ')' class_body_optclass_instance_creation_expression : NEW class_type '(' argument_list_opt ')' class_body_optclass_instance_creation_expression : primary '.' NEW type_arguments class_type '(' argument_list_opt ')' class_body_optclass_instance_creation_expression : primary '.' NEW class_type '(' argument_list_opt ')' class_body_optclass_instance_creation_expression : class_instance_creation_expression_name NEW class_type '(' argument_list_opt ')' class_body_optclass_instance_creation_expression : class_instance_creation_expression_name NEW type_arguments class_type '(' argument_list_opt ')' class_body_optclass_instance_creation_expression_name : name '.' class_body_opt : class_body\n                          | emptyfield_access : primary '.' NAME\n                        | SUPER '.' NAMEarray_access : name '[' expression ']'\n                        | primary_no_new_array '[' expression ']'\n                        | array_creation_with_array_initializer '[' expression ']' array_creation_with_array_initializer : NEW primitive_type dim_with_or_without_exprs array_initializer\n                                                 | NEW class_or_interface_type dim_with_or_without_exprs array_initializerdim_with_or_without_exprs : dim_with_or_without_expr\n                                     | dim_with_or_without_exprs dim_with_or_without_exprdim_with_or_without_expr : '[' expression ']'\n                                    | '[' ']' array_creation_without_array_initializer : NEW primitive_type dim_with_or_without_exprs\n                                                    | NEW class_or_interface_type dim_with_or_without_exprsname : simple_name\n                | qualified_namesimple_name : NAMEqualified_name : name '.' simple_nameliteral : NUM\n                   | CHAR_LITERAL\n                   | STRING_LITERAL\n                   | TRUE\n                   | FALSE\n                   | NULLmodifiers_opt : modifiersmodifiers_opt : emptymodifiers : modifier\n                     | modifiers modifiermodifier : PUBLIC\n                    | PROTECTED\n                    | PRIVATE\n                    | STATIC\n                    | ABSTRACT\n                    | FINAL\n                    | NATIVE\n                    | SYNCHRONIZED\n                    | TRANSIENT\n                    | VOLATILE\n                    | STRICTFP\n                    | annotationtype : primitive_type\n                | reference_typeprimitive_type : BOOLEAN\n                          | VOID\n                          | BYTE\n                          | SHORT\n                          | INT\n                          | LONG\n                          | CHAR\n                          | FLOAT\n                          | DOUBLEreference_type : class_or_interface_type\n                          | array_typeclass_or_interface_type : class_or_interface\n                                   | generic_typeclass_type : class_or_interface_typeclass_or_interface : name\n                              | generic_type '.' namegeneric_type : class_or_interface type_argumentsgeneric_type : class_or_interface '<' '>' array_type : primitive_type dims\n                      | name dimsarray_type : generic_type dimsarray_type : generic_type '.' name dimstype_arguments : '<' type_argument_list1type_argument_list1 : type_argument1\n                               | type_argument_list ',' type_argument1type_argument_list : type_argument\n                              | type_argument_list ',' type_argumenttype_argument : reference_type\n                         | wildcardtype_argument1 : reference_type1\n                          | wildcard1reference_type1 : reference_type '>'\n                           | class_or_interface '<' type_argument_list2type_argument_list2 : type_argument2\n                               | type_argument_list ',' type_argument2type_argument2 : reference_type2\n                          | wildcard2reference_type2 : reference_type RSHIFT\n                           | class_or_interface '<' type_argument_list3type_argument_list3 : type_argument3\n                               | type_argument_list ',' type_argument3type_argument3 : reference_type3\n                          | wildcard3reference_type3 : reference_type RRSHIFTwildcard : '?'\n                    | '?' wildcard_boundswildcard_bounds : EXTENDS reference_type\n                           | SUPER reference_typewildcard1 : '?' '>'\n                     | '?' wildcard_bounds1wildcard_bounds1 : EXTENDS reference_type1\n                            | SUPER reference_type1wildcard2 : '?' RSHIFT\n                     | '?' wildcard_bounds2wildcard_bounds2 : EXTENDS reference_type2\n                            | SUPER reference_type2wildcard3 : '?' RRSHIFT\n                     | '?' wildcard_bounds3wildcard_bounds3 : EXTENDS reference_type3\n                            | SUPER reference_type3type_parameter_header : NAMEtype_parameters : '<' type_parameter_list1type_parameter_list : type_parameter\n                               | type_parameter_list ',' type_parametertype_parameter : type_parameter_header\n                          | type_parameter_header EXTENDS reference_type\n                          | type_parameter_header EXTENDS reference_type additional_bound_listadditional_bound_list : additional_bound\n                                 | additional_bound_list additional_boundadditional_bound : '&' reference_typetype_parameter_list1 : type_parameter1\n                                | type_parameter_list ',' type_parameter1type_parameter1 : type_parameter_header '>'\n                           | type_parameter_header EXTENDS reference_type1\n                           | type_parameter_header EXTENDS reference_type additional_bound_list1additional_bound_list1 : additional_bound1\n                                  | additional_bound_list additional_bound1additional_bound1 : '&' reference_type1type_declaration : class_declaration\n                            | interface_declaration\n                            | enum_declaration\n                            | annotation_type_declarationtype_declaration : ';' class_declaration : class_header class_bodyclass_header : class_header_name class_header_extends_opt class_header_implements_optclass_header_name : class_header_name1 type_parameters\n                             | class_header_name1class_header_name1 : modifiers_opt CLASS NAMEclass_header_extends_opt : class_header_extends\n                                    | emptyclass_header_extends : EXTENDS class_typeclass_header_implements_opt : class_header_implements\n                                       | emptyclass_header_implements : IMPLEMENTS interface_type_listinterface_type_list : interface_type\n                               | interface_type_list ',' interface_typeinterface_type : class_or_interface_typeclass_body : '{' class_body_declarations_opt '}' class_body_declarations_opt : class_body_declarationsclass_body_declarations_opt : emptyclass_body_declarations : class_body_declaration\n                                   | class_body_declarations class_body_declarationclass_body_declaration : class_member_declaration\n                                  | static_initializer\n                                  | constructor_declarationclass_body_declaration : blockclass_member_declaration : field_declaration\n                                    | class_declaration\n                                    | method_declaration\n                                    | interface_declaration\n                                    | enum_declaration\n                                    | annotation_type_declarationclass_member_declaration : ';' field_declaration : modifiers_opt type variable_declarators ';' static_initializer : STATIC blockconstructor_declaration : constructor_header method_bodyconstructor_header : constructor_header_name formal_parameter_list_opt ')' method_header_throws_clause_optconstructor_header_name : modifiers_opt type_parameters NAME '('\n                                   | modifiers_opt NAME '(' formal_parameter_list_opt : formal_parameter_listformal_parameter_list_opt : emptyformal_parameter_list : formal_parameter\n                                 | formal_parameter_list ',' formal_parameterformal_parameter : modifiers_opt type variable_declarator_id\n                            | modifiers_opt type ELLIPSIS variable_declarator_idmethod_header_throws_clause_opt : method_header_throws_clause\n                                           | emptymethod_header_throws_clause : THROWS class_type_listclass_type_list : class_type_elt\n                           | class_type_list ',' class_type_eltclass_type_elt : class_typemethod_body : '{' block_statements_opt '}' method_declaration : abstract_method_declaration\n                              | method_header method_bodyabstract_method_declaration : method_header ';' method_header : method_header_name formal_parameter_list_opt ')' method_header_extended_dims method_header_throws_clause_optmethod_header_name : modifiers_opt type_parameters type NAME '('\n                              | modifiers_opt type NAME '(' method_header_extended_dims : dims_optinterface_declaration : interface_header interface_bodyinterface_header : interface_header_name interface_header_extends_optinterface_header_name : interface_header_name1 type_parameters\n                                 | interface_header_name1interface_header_name1 : modifiers_opt INTERFACE NAMEinterface_header_extends_opt : interface_header_extendsinterface_header_extends_opt : emptyinterface_header_extends : EXTENDS interface_type_listinterface_body : '{' interface_member_declarations_opt '}' interface_member_declarations_opt : interface_member_declarationsinterface_member_declarations_opt : emptyinterface_member_declarations : interface_member_declaration\n                                         | interface_member_declarations interface_member_declarationinterface_member_declaration : constant_declaration\n                                        | abstract_method_declaration\n                                        | class_declaration\n                                        | interface_declaration\n                                        | enum_declaration\n                                        | annotation_type_declarationinterface_member_declaration : ';' constant_declaration : field_declarationenum_declaration : enum_header enum_bodyenum_header : enum_header_name class_header_implements_optenum_header_name : modifiers_opt ENUM NAME\n                            | modifiers_opt ENUM NAME type_parametersenum_body : '{' enum_body_declarations_opt '}' enum_body : '{' ',' enum_body_declarations_opt '}' enum_body : '{' enum_constants ',' enum_body_declarations_opt '}' enum_body : '{' enum_constants enum_body_declarations_opt '}' enum_constants : enum_constant\n                          | enum_constants ',' enum_constantenum_constant : enum_constant_header class_body\n                         | enum_constant_headerenum_constant_header : enum_constant_header_name arguments_optenum_constant_header_name : modifiers_opt NAMEarguments_opt : argumentsarguments_opt : emptyarguments : '(' argument_list_opt ')' argument_list_opt : argument_listargument_list_opt : emptyargument_list : expression\n                         | argument_list ',' expressionenum_body_declarations_opt : enum_declarationsenum_body_declarations_opt : emptyenum_declarations : ';' class_body_declarations_optannotation_type_declaration : annotation_type_declaration_header annotation_type_bodyannotation_type_declaration_header : annotation_type_declaration_header_name class_header_extends_opt class_header_implements_optannotation_type_declaration_header_name : modifiers '@' INTERFACE NAMEannotation_type_declaration_header_name : modifiers '@' INTERFACE NAME type_parametersannotation_type_declaration_header_name : '@' INTERFACE NAME type_parametersannotation_type_declaration_header_name : '@' INTERFACE NAMEannotation_type_body : '{' annotation_type_member_declarations_opt '}' annotation_type_member_declarations_opt : annotation_type_member_declarationsannotation_type_member_declarations_opt : emptyannotation_type_member_declarations : annotation_type_member_declaration\n                                               | annotation_type_member_declarations annotation_type_member_declarationannotation_type_member_declaration : annotation_method_header ';'\n                                              | constant_declaration\n                                              | constructor_declaration\n                                              | type_declarationannotation_method_header : annotation_method_header_name formal_parameter_list_opt ')' method_header_extended_dims annotation_method_header_default_value_optannotation_method_header_name : modifiers_opt type_parameters type NAME '('\n                                         | modifiers_opt type NAME '(' annotation_method_header_default_value_opt : default_value\n                                                      | emptydefault_value : DEFAULT member_valuemember_value : conditional_expression_not_name\n                        | name\n                        | annotation\n                        | member_value_array_initializermember_value_array_initializer : '{' member_values ',' '}'\n                                          | '{' member_values '}' member_value_array_initializer : '{' ',' '}'\n                                          | '{' '}' member_values : member_value\n                         | member_values ',' member_valueannotation : normal_annotation\n                      | marker_annotation\n                      | single_member_annotationnormal_annotation : annotation_name '(' member_value_pairs_opt ')' annotation_name : '@' namemember_value_pairs_opt : member_value_pairsmember_value_pairs_opt : emptymember_value_pairs : member_value_pair\n                              | member_value_pairs ',' member_value_pairmember_value_pair : simple_name '=' member_valuemarker_annotation : annotation_namesingle_member_annotation : annotation_name '(' single_member_annotation_member_value ')' single_member_annotation_member_value : member_valuecompilation_unit : package_declarationcompilation_unit : package_declaration import_declarationscompilation_unit : package_declaration import_declarations type_declarationscompilation_unit : package_declaration type_declarationscompilation_unit : import_declarationscompilation_unit : type_declarationscompilation_unit : import_declarations type_declarationscompilation_unit : emptypackage_declaration : package_declaration_name ';' package_declaration_name : modifiers PACKAGE name\n                                    | PACKAGE nameimport_declarations : import_declaration\n                               | import_declarations import_declarationimport_declaration : single_type_import_declaration\n                              | type_import_on_demand_declaration\n                              | single_static_import_declaration\n                              | static_import_on_demand_declarationsingle_type_import_declaration : IMPORT name ';' type_import_on_demand_declaration : IMPORT name '.' '*' ';' single_static_import_declaration : IMPORT STATIC name ';' static_import_on_demand_declaration : IMPORT STATIC name '.' '*' ';' type_declarations : type_declaration\n                             | type_declarations type_declarationgoal : PLUSPLUS compilation_unitgoal : MINUSMINUS expressiongoal : '*' block_statementempty :"
+    
+_lr_action_items = {'VOID':([3,4,6,9,10,12,13,17,18,19,21,22,24,25,28,38,44,46,47,48,50,51,52,53,54,55,57,61,62,64,65,67,68,69,70,71,77,80,82,83,84,86,89,93,94,98,99,106,107,108,113,114,115,119,121,125,129,130,135,136,138,139,141,142,143,147,151,152,155,164,172,181,183,184,194,202,203,212,216,220,221,222,225,232,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,316,319,320,321,323,325,327,329,338,343,348,350,354,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,386,388,400,406,410,411,417,418,419,421,422,423,424,425,426,427,429,440,441,442,443,444,445,446,447,448,449,450,451,452,453,455,456,458,459,467,479,480,481,482,484,485,486,487,488,489,491,492,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,547,551,552,554,555,560,569,571,572,574,583,589,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,684,685,687,688,690,693,696,698,699,700,706,707,708,711,712,713,714,715,721,723,724,725,777,780,783,784,790,791,792,794,800,801,805,808,809,812,813,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,866,869,873,876,890,893,894,895,896,897,898,899,900,901,902,903,904,908,910,921,922,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,972,973,976,985,986,987,990,993,1000,1002,1004,1005,1008,1010,1011,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1064,1067,1072,1074,1077,1079,1080,1081,1082,1083,1084,1088,1089,1095,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1130,1132,1134,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[56,56,-448,-359,-366,-356,-358,-360,-586,-361,-362,-585,-357,-365,-451,-594,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,56,-341,-189,56,56,-190,-169,-203,-186,-204,56,-172,-362,-198,-196,-199,-262,56,-185,56,-192,-188,-187,56,-201,-170,-352,56,-174,-195,-173,56,-191,56,-342,-200,-197,56,-171,56,56,56,56,56,56,56,-529,-623,-553,-343,-588,-623,-452,56,-354,-623,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,56,-12,-8,-19,56,56,56,56,-205,-249,56,56,56,56,56,56,56,56,-286,56,-279,56,-167,56,56,56,56,-277,-175,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-623,-351,-439,-430,-623,-567,56,-623,-566,-565,-352,-623,-351,-562,-528,-623,-478,-358,56,-473,-477,-469,-481,-352,-623,-501,-472,-471,-479,-476,-475,-480,-474,56,-524,-623,56,-519,-521,-527,-352,-522,-351,-525,-523,-526,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-400,56,56,56,56,-344,-281,56,56,-228,56,56,-284,-287,-290,-623,-280,-164,-168,56,56,56,-278,-260,56,-283,56,56,-533,56,56,-441,-559,56,-352,56,-564,-563,-484,56,-470,-483,56,-502,-503,-466,-595,-587,56,-520,56,-516,-401,-405,-402,-404,56,56,56,56,56,56,56,-303,56,-288,-623,-285,-289,-296,-251,56,56,56,56,56,56,56,56,56,56,56,56,56,-536,-534,-440,-442,-623,-487,56,56,56,-406,-421,-422,56,56,56,56,56,56,56,-307,-282,56,56,-306,-297,56,56,56,56,-234,-263,56,-261,56,-185,-231,-308,56,56,-535,56,-443,-444,-486,-482,-570,-500,-506,-423,-424,-403,-407,-411,-408,-410,-310,-309,56,56,56,56,56,-264,56,-271,56,56,56,56,56,-446,-445,-569,56,-505,-412,-426,56,-425,56,56,-314,-312,56,-291,-313,-311,-274,-272,56,-266,56,-265,-276,-232,56,-427,-428,-409,-318,-316,56,-317,-315,-273,-267,56,56,56,-236,56,56,56,]),'PROTECTED':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,28,29,34,35,37,38,39,40,44,46,47,48,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,125,129,130,135,138,141,142,143,151,194,195,202,203,204,205,206,207,212,214,215,216,220,221,225,226,232,233,283,299,312,316,319,321,325,327,348,350,400,406,417,418,421,422,423,425,426,427,429,430,435,440,441,442,444,445,446,447,449,450,451,452,453,455,456,458,459,479,480,482,484,485,487,488,489,491,492,560,569,574,583,589,592,593,596,597,599,601,602,628,630,637,672,673,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,808,809,812,813,815,816,817,863,864,873,876,881,908,910,924,925,934,943,948,953,957,962,970,985,986,987,990,991,993,1018,1019,1046,1047,1048,1056,1072,1077,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[12,12,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,12,-362,-585,12,-357,-365,-451,12,-608,-610,-612,-594,-611,12,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,12,-192,-188,-187,-201,-170,12,-174,-195,-173,-191,-342,-200,-197,-171,-529,12,12,-553,-619,12,12,12,-343,12,-609,-588,12,-452,-354,-605,12,-508,-205,-249,12,12,-286,-279,-167,12,-277,-175,12,12,12,-567,12,-566,-565,12,12,-562,-528,12,-614,12,-478,-358,-473,-477,-469,-481,12,-501,-472,-471,-479,-476,-475,-480,-474,-524,12,-519,-521,-527,-522,12,-525,-523,-526,-344,-281,-228,12,12,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,12,-559,-564,-563,-484,12,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,-303,12,-288,12,-285,-289,-296,-536,-534,12,-487,-615,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-486,-482,-570,-500,-617,-506,-310,-309,-264,12,-271,12,-569,-505,-314,-312,-291,-313,-311,-274,-272,12,-266,12,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'TRUE':([3,4,54,55,57,61,62,65,68,69,70,71,77,80,82,83,86,89,93,94,98,99,106,107,108,113,115,119,129,130,135,136,138,139,142,143,147,151,152,155,164,181,183,184,194,203,221,222,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,319,320,321,323,325,327,329,338,343,348,350,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,569,571,572,574,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,687,700,713,721,725,790,791,792,794,800,801,805,812,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,890,893,894,902,903,904,908,910,921,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1074,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[124,124,-193,-206,-202,-194,124,-189,124,-190,-169,-203,-186,-204,124,-172,-198,-196,-199,-262,124,-185,124,-192,-188,-187,-201,-170,-174,-195,-173,124,-191,124,-200,-197,124,-171,124,124,124,124,124,124,-529,-553,-452,124,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,124,-12,-8,-19,124,124,124,124,-205,-249,124,124,124,124,124,124,124,-286,124,-279,124,-167,124,124,124,124,-277,-175,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,-281,124,124,-228,-284,-287,-290,-623,-280,-164,-168,124,124,124,-278,-260,124,-283,124,124,-533,124,-559,124,-466,124,-516,124,124,124,124,124,124,124,-288,-285,-289,-296,-251,124,124,124,124,124,124,124,124,124,124,124,124,124,-536,-534,124,124,124,124,124,124,-307,-282,124,-306,-297,124,124,124,124,-234,-263,124,-261,124,-185,-231,-308,124,124,-535,-310,-309,124,124,124,124,124,-264,124,-271,124,124,124,124,124,124,-314,-312,-291,-313,-311,-274,-272,124,-266,124,-265,-276,-232,124,-318,-316,124,-317,-315,-273,-267,124,124,124,-236,124,124,124,]),'(':([3,4,38,54,55,57,61,62,64,65,68,69,70,71,74,77,80,82,83,84,86,89,93,94,97,98,99,100,106,107,108,111,113,115,117,119,127,129,130,135,136,138,139,141,142,143,144,147,148,150,151,152,155,164,179,181,183,184,194,203,212,216,221,222,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,285,289,292,293,298,299,301,303,307,308,309,310,311,312,314,319,320,321,323,325,327,329,331,332,334,335,338,343,348,350,353,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,394,403,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,547,550,553,560,561,562,564,569,571,572,574,584,592,593,594,596,597,599,601,602,603,605,607,609,613,615,619,627,628,629,630,631,632,635,637,640,641,659,670,671,672,678,687,694,700,713,721,725,770,772,775,777,780,783,784,787,788,789,790,791,792,794,800,801,805,812,815,816,817,819,820,821,822,823,824,825,827,828,829,830,832,840,841,847,849,851,852,858,859,860,863,864,875,878,884,890,893,894,895,896,897,902,903,904,908,910,921,924,925,927,928,929,931,932,934,943,946,948,949,952,953,955,957,961,962,964,965,970,984,992,1000,1002,1004,1005,1008,1010,1011,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1074,1079,1080,1082,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1130,1132,1134,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[62,155,222,-193,-206,-202,-194,155,-341,-189,62,-190,-169,-203,303,-186,-204,155,-172,307,-198,-196,-199,-262,312,314,-185,316,62,-192,-188,329,-187,-201,338,-170,343,-174,-195,-173,62,-191,155,-342,-200,-197,-380,314,356,357,-171,155,155,314,343,314,314,314,-529,-553,-343,-588,-452,314,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,155,-12,-8,-19,314,314,314,314,-205,-391,-399,-392,-398,307,-249,155,155,155,571,572,155,62,62,155,-286,155,-279,155,-167,62,155,-381,-382,615,-383,155,155,-277,-175,-385,155,155,314,314,314,155,314,314,314,314,314,314,314,314,314,314,314,314,314,314,314,314,-382,678,314,314,314,314,314,314,314,314,314,314,314,314,314,314,314,314,314,314,314,314,314,314,155,314,314,314,314,314,314,314,314,314,314,155,314,314,314,314,314,314,314,-400,-418,-417,-344,790,791,792,-281,155,155,-228,343,-284,-287,813,-290,-623,-280,-164,-168,820,824,827,829,155,155,840,155,-278,847,-260,155,-386,851,-283,314,314,820,851,-542,-533,155,-559,876,62,-466,314,-516,-419,-420,-393,-401,-405,-402,-404,902,903,904,155,155,155,155,62,155,314,-288,-285,-289,-296,-251,155,927,928,929,155,931,155,62,155,-384,155,155,946,155,62,155,964,314,314,314,-536,-534,985,987,993,314,314,314,-406,-421,-422,155,155,155,-307,-282,155,-306,-297,155,155,155,155,1035,-234,-263,155,-261,62,1056,-185,1057,-231,1059,-308,155,314,-535,1072,1077,-423,-424,-403,-407,-411,-408,-410,-310,-309,62,155,155,155,155,-264,62,-271,62,62,155,62,155,314,-412,-426,-425,-314,-312,-291,-313,-311,-274,-272,62,-266,62,-265,-276,-232,314,-427,-428,-409,-318,-316,62,-317,-315,-273,-267,155,62,62,-236,62,62,62,]),',':([18,22,38,50,58,60,64,72,76,78,79,87,88,90,95,96,101,102,103,118,120,124,126,140,141,144,145,146,149,153,154,156,157,158,159,160,161,162,163,165,166,167,168,170,171,173,175,176,177,178,179,180,182,185,186,187,188,195,212,216,235,236,237,242,251,254,256,257,258,261,262,265,266,269,270,271,272,273,274,276,280,281,284,285,286,288,289,290,291,292,293,294,295,296,300,313,315,331,335,337,342,344,345,346,347,353,355,366,387,389,390,394,398,403,404,405,407,408,409,412,413,414,415,460,462,463,466,467,468,469,473,474,475,478,493,494,495,496,529,530,538,542,543,547,548,549,550,553,556,560,563,564,566,567,575,577,611,612,614,616,621,624,625,626,632,638,641,645,647,648,649,651,652,653,654,655,656,657,659,660,661,662,663,664,665,666,667,668,669,670,671,679,680,681,682,691,692,713,714,715,718,719,720,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,749,750,751,752,753,754,755,756,757,758,759,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,798,803,805,818,830,831,832,833,835,836,838,842,843,844,845,846,855,857,862,867,868,870,877,878,884,886,888,889,891,895,896,897,909,913,916,917,937,938,941,942,967,968,969,971,974,975,977,983,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1017,1022,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1065,1066,1068,1069,1070,1071,1079,1080,1082,1087,1093,1098,1102,1105,1106,1107,1117,1118,1125,1129,1130,1131,1132,1133,1134,1141,1142,1145,1149,1150,1152,],[-586,-585,-594,-584,-381,-211,-341,-213,-346,-210,-209,-136,-378,-144,-138,-142,-137,-379,-208,-345,-212,-348,-349,-350,-342,-380,-207,-139,-347,-130,-30,-141,-128,-140,-129,-108,-25,-96,-111,-20,-88,-63,-107,-35,-127,-77,-58,-143,-122,-45,-343,-50,-40,-119,-1,-3,-4,399,-343,-588,-389,-155,-156,-134,-135,-37,-68,-116,-27,-113,-60,-123,-112,-32,-126,-42,-22,-53,-81,-91,-100,-47,-381,-391,-396,-413,-399,554,-380,-392,-398,-394,-383,-397,-388,-117,-119,-381,-383,-387,-383,623,-623,-178,-180,-385,-118,-109,-120,-121,-110,-382,673,-623,-537,-540,683,-429,-433,-431,-463,686,-465,-133,-575,-132,716,717,-131,-591,-574,-577,-576,686,-384,-157,-158,-7,-114,-124,-146,-125,-115,-400,-387,-414,-418,-417,-388,-344,-149,-343,794,-548,-242,800,-340,-335,-339,-152,623,-182,-153,-154,-386,-36,-145,-147,-148,-31,-26,-97,-99,-98,-79,-78,-80,-41,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,-46,-329,-542,-543,-541,-544,-539,873,-490,-466,-595,-587,890,-582,-581,-390,-43,-84,-73,-75,-82,-86,-69,-71,-33,-85,-74,-95,-70,-44,-83,-106,-57,-49,-93,-102,-104,-72,-61,-34,-29,-55,-76,-87,-39,-38,-48,-28,-62,-92,-94,-101,-105,-103,-56,-54,-384,-419,-415,-420,-416,-396,-393,-395,-401,-396,-413,-405,900,-380,-402,-404,-150,-330,-331,-623,-145,-332,-384,-336,936,-334,-338,-333,-151,-221,-179,-183,-181,-184,-383,-162,-538,-432,-434,-464,623,-623,-623,-592,-580,-579,-593,-406,-421,-422,-549,-243,-182,-623,1039,-219,-337,-623,-163,-159,-21,-545,-436,-435,-492,-491,-583,-578,-24,-23,-415,-423,-416,-424,-396,-403,-407,-396,-413,-411,1084,-408,-410,-225,-182,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-438,-437,-493,-499,1127,-497,-412,-426,-425,-222,800,-223,-623,-319,-220,-218,-323,-623,-224,-415,-427,-416,-428,-396,-409,-322,-623,-324,-161,-498,-321,]),'LONG':([3,4,6,9,10,12,13,17,18,19,21,22,24,25,28,38,44,46,47,48,50,51,52,53,54,55,57,61,62,64,65,67,68,69,70,71,77,80,82,83,84,86,89,93,94,98,99,106,107,108,113,114,115,119,121,125,129,130,135,136,138,139,141,142,143,147,151,152,155,164,172,181,183,184,194,202,203,212,216,220,221,222,225,232,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,316,319,320,321,323,325,327,329,338,343,348,350,354,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,386,388,400,406,410,411,417,418,419,421,422,423,424,425,426,427,429,440,441,442,443,444,445,446,447,448,449,450,451,452,453,455,456,458,459,467,479,480,481,482,484,485,486,487,488,489,491,492,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,547,551,552,554,555,560,569,571,572,574,583,589,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,684,685,687,688,690,693,696,698,699,700,706,707,708,711,712,713,714,715,721,723,724,725,777,780,783,784,790,791,792,794,800,801,805,808,809,812,813,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,866,869,873,876,890,893,894,895,896,897,898,899,900,901,902,903,904,908,910,921,922,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,972,973,976,985,986,987,990,993,1000,1002,1004,1005,1008,1010,1011,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1064,1067,1072,1074,1077,1079,1080,1081,1082,1083,1084,1088,1089,1095,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1130,1132,1134,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[63,63,-448,-359,-366,-356,-358,-360,-586,-361,-362,-585,-357,-365,-451,-594,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,63,-341,-189,63,63,-190,-169,-203,-186,-204,63,-172,-362,-198,-196,-199,-262,63,-185,63,-192,-188,-187,63,-201,-170,-352,63,-174,-195,-173,63,-191,63,-342,-200,-197,63,-171,63,63,63,63,63,63,63,-529,-623,-553,-343,-588,-623,-452,63,-354,-623,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,63,-12,-8,-19,63,63,63,63,-205,-249,63,63,63,63,63,63,63,63,-286,63,-279,63,-167,63,63,63,63,-277,-175,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-623,-351,-439,-430,-623,-567,63,-623,-566,-565,-352,-623,-351,-562,-528,-623,-478,-358,63,-473,-477,-469,-481,-352,-623,-501,-472,-471,-479,-476,-475,-480,-474,63,-524,-623,63,-519,-521,-527,-352,-522,-351,-525,-523,-526,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-400,63,63,63,63,-344,-281,63,63,-228,63,63,-284,-287,-290,-623,-280,-164,-168,63,63,63,-278,-260,63,-283,63,63,-533,63,63,-441,-559,63,-352,63,-564,-563,-484,63,-470,-483,63,-502,-503,-466,-595,-587,63,-520,63,-516,-401,-405,-402,-404,63,63,63,63,63,63,63,-303,63,-288,-623,-285,-289,-296,-251,63,63,63,63,63,63,63,63,63,63,63,63,63,-536,-534,-440,-442,-623,-487,63,63,63,-406,-421,-422,63,63,63,63,63,63,63,-307,-282,63,63,-306,-297,63,63,63,63,-234,-263,63,-261,63,-185,-231,-308,63,63,-535,63,-443,-444,-486,-482,-570,-500,-506,-423,-424,-403,-407,-411,-408,-410,-310,-309,63,63,63,63,63,-264,63,-271,63,63,63,63,63,-446,-445,-569,63,-505,-412,-426,63,-425,63,63,-314,-312,63,-291,-313,-311,-274,-272,63,-266,63,-265,-276,-232,63,-427,-428,-409,-318,-316,63,-317,-315,-273,-267,63,63,63,-236,63,63,63,]),'MINUS_ASSIGN':([59,60,64,72,73,74,76,78,87,90,95,96,101,109,118,120,124,126,127,140,141,146,149,153,156,157,158,159,171,176,179,185,242,251,255,259,260,268,297,361,515,538,560,561,562,563,564,576,579,584,587,603,611,612,614,616,635,641,645,647,659,670,713,785,786,798,818,831,833,835,836,838,842,914,941,942,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1152,],[246,-130,-341,-141,-128,-140,-346,-129,-136,-144,-138,-142,-137,-127,-345,-143,-348,-349,-343,-350,-342,-139,-347,-130,-141,-128,-140,-129,-127,-143,-343,246,-134,-135,-130,-128,-129,-127,-128,-128,-145,-146,-344,-147,-148,-149,-343,-128,-127,-343,-128,-328,-340,-335,-339,-152,-329,-145,-147,-148,-328,-329,-466,-150,-330,-331,-332,-336,-334,-338,-333,-151,-221,-128,-337,-623,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-321,]),'IMPORT':([2,15,23,29,34,35,37,39,207,215,226,435,704,881,991,],[27,-613,27,27,-608,-610,-612,-611,27,-609,-605,-614,-616,-615,-617,]),'<':([3,6,8,9,10,12,13,17,18,19,21,22,24,25,28,38,42,44,46,47,48,50,51,52,53,54,55,57,61,64,65,68,69,70,71,73,76,77,80,83,86,87,89,90,93,94,95,96,99,101,106,107,108,113,114,115,118,119,121,124,126,127,129,130,135,136,138,140,141,142,143,144,146,149,151,153,156,157,158,159,160,162,163,166,167,168,171,172,173,175,176,177,179,185,194,202,203,212,216,220,221,225,232,233,242,251,255,256,257,259,260,261,265,266,268,270,274,276,280,283,291,295,299,302,311,313,315,319,321,325,327,328,335,339,342,348,350,355,358,361,363,366,376,387,389,390,391,400,418,419,422,423,424,425,426,427,429,431,432,433,438,440,441,442,443,444,445,446,447,448,450,451,452,453,455,456,458,459,460,462,463,468,470,479,480,481,482,484,485,486,487,488,489,491,492,493,519,529,530,538,542,543,560,563,564,569,574,576,584,587,592,593,596,597,599,601,602,606,611,612,614,616,628,630,637,641,645,647,651,652,653,654,655,656,659,660,661,662,663,664,665,670,672,687,694,696,698,699,700,706,707,711,712,713,714,715,722,723,725,728,731,732,736,738,741,742,745,746,747,755,762,763,764,765,766,769,782,785,786,798,799,802,805,812,815,816,817,818,819,828,830,831,833,835,836,838,842,849,855,857,863,864,875,908,910,924,925,934,941,942,943,948,949,953,957,962,967,968,970,986,990,1017,1018,1019,1020,1029,1037,1038,1040,1041,1042,1043,1046,1047,1048,1051,1055,1058,1060,1062,1087,1088,1089,1097,1098,1101,1102,1104,1105,1107,1110,1111,1112,1113,1114,1115,1117,1118,1119,1123,1125,1135,1136,1137,1139,1140,1141,1142,1143,1144,1145,1147,1148,1149,1151,1152,1157,1160,],[67,-448,197,-359,-366,-356,-358,-360,-586,-361,-362,-585,-357,-365,-451,-594,197,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,67,-190,-169,-203,-383,-346,-186,-204,-172,-198,-136,-196,-144,-199,-262,-138,-142,-185,-137,67,-192,-188,-187,67,-201,-345,-170,-352,-348,-349,-343,-174,-195,-173,67,-191,-350,-342,-200,-197,354,-139,-347,-171,-130,-141,-128,-140,-129,-108,-96,-111,-88,-63,-107,-127,67,-77,382,-143,-122,-343,-119,-529,-623,-553,-343,-588,-623,-452,-354,-623,-508,-134,-135,-133,503,-116,509,-132,-113,-123,-112,-131,-126,-81,-91,-100,-205,555,-383,-249,67,67,-117,-119,-286,-279,-167,67,67,-383,67,-383,-277,-175,-118,67,640,67,-109,67,-120,-121,-110,67,-623,-567,197,-566,-565,-352,-623,-351,-562,-528,197,-512,-456,197,-623,-478,-358,197,-473,-477,-469,-481,-352,-501,-472,-471,-479,-476,-475,-480,-474,-133,509,-132,-131,-341,-524,-623,197,-519,-521,-527,-352,-522,-351,-525,-523,-526,-384,67,-114,-124,-146,-125,-115,-344,-149,-343,-281,-228,-383,-343,640,-284,-287,-290,-623,-280,-164,-168,67,-340,-335,-339,-152,-278,-260,-283,-145,-147,-148,-97,-99,-98,-79,-78,-80,-328,-89,-90,-66,-67,-65,-64,-329,-533,-559,-343,-564,-563,-484,67,-470,-483,-502,-503,-466,-595,-587,197,-520,-516,-84,-82,-86,-85,-95,-83,-106,-93,-102,-104,-87,-92,-94,-101,-105,-103,-384,901,-150,-330,-331,67,67,-145,-288,-285,-289,-296,-332,-251,67,-384,-336,-334,-338,-333,-151,-221,67,-383,-162,-536,-534,-343,-307,-282,-306,-297,-234,-337,-623,-263,-261,67,-185,-231,-308,-163,-159,-535,-482,-500,-225,-310,-309,67,-226,-623,-217,-216,-326,-320,-327,-264,67,-271,-623,67,67,-227,-160,-222,-314,-312,-291,-223,-313,-623,-311,-319,-218,-274,-272,67,-266,67,-265,-323,-623,-276,-232,-224,-318,-316,67,-317,-315,-322,-623,-273,-267,-324,67,67,-161,-236,-321,67,67,]),'@':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,28,29,34,35,37,38,39,40,44,46,47,48,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,125,129,130,135,138,141,142,143,151,194,195,202,203,204,205,206,207,212,214,215,216,220,221,222,225,226,232,233,283,299,312,316,319,321,325,327,348,350,400,406,417,418,421,422,423,425,426,427,429,430,435,440,441,442,444,445,446,447,449,450,451,452,453,455,456,458,459,467,479,480,482,484,485,487,488,489,491,492,560,569,574,583,589,592,593,596,597,599,601,602,628,630,637,672,673,687,696,698,699,700,704,706,707,711,712,713,714,715,721,723,725,808,809,812,813,815,816,817,863,864,873,876,881,890,908,910,924,925,934,943,948,953,957,962,970,985,986,987,990,991,993,1018,1019,1046,1047,1048,1056,1072,1074,1077,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[30,30,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,30,-362,-585,30,-357,-365,-451,30,-608,-610,-612,-594,-611,223,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,30,-192,-188,-187,-201,-170,223,-174,-195,-173,-191,-342,-200,-197,-171,-529,402,30,-553,-619,223,30,30,-343,30,-609,-588,30,-452,402,-354,-605,30,-508,-205,-249,402,402,-286,-279,-167,30,-277,-175,30,402,402,-567,402,-566,-565,30,223,-562,-528,30,-614,30,-478,-358,-473,-477,-469,-481,402,-501,-472,-471,-479,-476,-475,-480,-474,402,-524,30,-519,-521,-527,-522,223,-525,-523,-526,-344,-281,-228,402,402,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,402,-559,-564,-563,-484,30,-616,-470,-483,-502,-503,-466,-595,-587,402,-520,-516,-303,402,-288,402,-285,-289,-296,-536,-534,402,-487,-615,402,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-486,-482,-570,-500,-617,-506,-310,-309,-264,30,-271,402,-569,402,-505,-314,-312,-291,-313,-311,-274,-272,30,-266,30,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'ENUM':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,26,28,29,34,35,37,38,39,40,44,46,47,48,49,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,121,125,129,130,135,138,141,142,143,151,194,202,203,204,205,206,207,212,214,215,216,220,221,225,226,232,233,283,299,319,321,325,326,327,348,350,400,418,419,422,423,424,425,426,427,429,430,435,440,441,442,443,444,445,446,447,448,450,451,452,453,455,456,458,459,479,480,481,482,484,485,486,487,488,489,491,492,560,569,574,592,593,596,597,599,601,602,628,630,637,672,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,812,815,816,817,863,864,881,908,910,924,925,934,943,948,953,957,962,970,986,990,991,1018,1019,1046,1047,1048,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[-623,-623,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,-623,-362,-585,-623,-357,-365,208,-451,-623,-608,-610,-612,-594,-611,-351,-449,-447,-363,-364,-352,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,-623,-192,-188,-187,-201,-170,-352,-351,-174,-195,-173,-191,-342,-200,-197,-171,-529,-623,-553,-619,-351,-623,-623,-343,-623,-609,-588,-623,-452,-354,-605,-623,-508,-205,-249,-286,-279,-167,-352,-623,-277,-175,-623,-567,208,-566,-565,-352,-623,-351,-562,-528,-623,-614,-623,-478,-358,208,-473,-477,-469,-481,-352,-501,-472,-471,-479,-476,-475,-480,-474,-524,-623,208,-519,-521,-527,-352,-522,-351,-525,-523,-526,-344,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,-564,-563,-484,-623,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,-288,-285,-289,-296,-536,-534,-615,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-482,-500,-617,-310,-309,-264,-623,-271,-314,-312,-291,-313,-311,-274,-272,-623,-266,-623,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'EXTENDS':([5,8,14,31,42,196,227,288,408,409,410,411,432,433,438,547,685,705,722,777,779,780,783,784,866,869,892,895,896,897,973,976,1000,1002,1004,1005,1007,1008,1010,1011,1064,1067,1079,1080,1082,1130,1132,1134,],[192,-455,199,192,-511,-454,-510,551,-429,684,-439,-430,-512,-456,-558,-400,-441,-557,-555,-401,898,-405,-402,-404,-440,-442,-556,-406,-421,-422,-443,-444,-423,-424,-403,-407,1081,-411,-408,-410,-446,-445,-412,-426,-425,-427,-428,-409,]),'RRSHIFT':([64,76,87,88,90,95,96,101,102,118,124,126,140,141,146,149,153,156,157,158,159,160,162,163,166,167,168,171,173,176,177,179,185,212,235,236,237,242,251,255,256,257,259,260,261,265,266,268,270,274,276,280,284,285,289,292,293,295,313,315,353,355,361,366,387,389,390,460,462,463,468,470,494,495,529,530,538,542,543,547,548,550,553,556,560,563,564,587,611,612,614,616,632,641,645,647,651,652,653,654,655,656,659,660,661,662,663,664,665,670,713,726,728,729,730,731,732,733,734,736,737,738,739,741,742,745,746,747,749,754,755,762,763,764,765,766,769,770,772,775,777,780,782,783,784,785,786,798,805,818,831,833,835,836,838,842,855,857,895,896,897,941,942,967,968,1000,1002,1004,1005,1006,1007,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1129,1130,1131,1132,1133,1134,1141,1142,1145,1149,1152,],[-341,-346,-136,-378,-144,-138,-142,-137,-379,-345,-348,-349,-350,-342,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,-88,374,-107,-127,-77,-143,-122,-343,-119,-343,-389,-155,-156,-134,-135,-133,502,-116,527,-132,-113,-123,-112,-131,-126,-81,-91,-100,-381,-391,-399,-392,-398,-383,-117,-119,-385,-118,527,-109,-120,-121,-110,-133,527,-132,-131,-341,-157,-158,-114,-124,-146,-125,-115,-400,-387,-418,-417,-388,-344,-149,-343,527,-340,-335,-339,-152,-386,-145,-147,-148,-97,-99,-98,-79,-78,-80,-328,-89,-90,374,374,374,374,-329,-466,-390,-84,374,374,-82,-86,374,374,-85,374,-95,374,-83,-106,-93,-102,-104,374,374,-87,-92,-94,-101,-105,-103,-384,-419,-420,-393,-401,-405,-380,-402,-404,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-406,-421,-422,-337,-623,-163,-159,-423,-424,-403,-407,1079,1082,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,1079,-427,1079,-428,1079,-409,-322,-623,-324,-161,-321,]),'THIS':([3,4,54,55,57,61,62,65,68,69,70,71,77,80,82,83,85,86,89,93,94,98,99,106,107,108,113,115,119,129,130,135,136,138,139,142,143,147,151,152,155,164,181,183,184,194,203,221,222,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,285,289,292,293,299,301,302,303,307,310,311,312,314,319,320,321,323,325,327,328,329,338,343,348,350,356,357,360,363,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,519,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,547,550,553,559,569,571,572,574,592,593,596,597,599,601,602,604,613,615,627,628,630,631,637,640,641,672,678,687,700,713,721,725,770,772,775,777,780,783,784,790,791,792,794,799,800,801,805,812,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,890,893,894,895,896,897,902,903,904,908,910,921,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,1000,1002,1004,1005,1008,1010,1011,1018,1019,1020,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1074,1079,1080,1082,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1130,1132,1134,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[74,158,-193,-206,-202,-194,158,-189,74,-190,-169,-203,-186,-204,158,-172,308,-198,-196,-199,-262,158,-185,74,-192,-188,-187,-201,-170,-174,-195,-173,74,-191,158,-200,-197,158,-171,158,158,158,158,158,158,-529,-553,-452,158,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,158,-12,-8,-19,158,158,158,158,-205,-391,-399,-392,-398,-249,158,561,158,158,158,74,158,158,-286,158,-279,158,-167,74,605,158,158,158,-277,-175,158,158,158,645,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,645,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,-400,-418,-417,787,-281,158,158,-228,-284,-287,-290,-623,-280,-164,-168,822,158,158,158,-278,-260,158,-283,158,158,-533,158,-559,74,-466,158,-516,-419,-420,-393,-401,-405,-402,-404,158,158,158,158,645,158,158,158,-288,-285,-289,-296,-251,158,158,158,74,158,158,158,158,74,158,158,158,158,-536,-534,158,158,158,-406,-421,-422,158,158,158,-307,-282,158,-306,-297,158,158,158,158,-234,-263,158,-261,74,-185,-231,-308,158,158,-535,-423,-424,-403,-407,-411,-408,-410,-310,-309,645,158,158,158,158,158,-264,74,-271,74,158,158,74,158,158,-412,-426,-425,-314,-312,-291,-313,-311,-274,-272,74,-266,74,-265,-276,-232,158,-427,-428,-409,-318,-316,74,-317,-315,-273,-267,158,74,74,-236,158,74,74,]),'DOUBLE':([3,4,6,9,10,12,13,17,18,19,21,22,24,25,28,38,44,46,47,48,50,51,52,53,54,55,57,61,62,64,65,67,68,69,70,71,77,80,82,83,84,86,89,93,94,98,99,106,107,108,113,114,115,119,121,125,129,130,135,136,138,139,141,142,143,147,151,152,155,164,172,181,183,184,194,202,203,212,216,220,221,222,225,232,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,316,319,320,321,323,325,327,329,338,343,348,350,354,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,386,388,400,406,410,411,417,418,419,421,422,423,424,425,426,427,429,440,441,442,443,444,445,446,447,448,449,450,451,452,453,455,456,458,459,467,479,480,481,482,484,485,486,487,488,489,491,492,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,547,551,552,554,555,560,569,571,572,574,583,589,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,684,685,687,688,690,693,696,698,699,700,706,707,708,711,712,713,714,715,721,723,724,725,777,780,783,784,790,791,792,794,800,801,805,808,809,812,813,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,866,869,873,876,890,893,894,895,896,897,898,899,900,901,902,903,904,908,910,921,922,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,972,973,976,985,986,987,990,993,1000,1002,1004,1005,1008,1010,1011,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1064,1067,1072,1074,1077,1079,1080,1081,1082,1083,1084,1088,1089,1095,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1130,1132,1134,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[75,75,-448,-359,-366,-356,-358,-360,-586,-361,-362,-585,-357,-365,-451,-594,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,75,-341,-189,75,75,-190,-169,-203,-186,-204,75,-172,-362,-198,-196,-199,-262,75,-185,75,-192,-188,-187,75,-201,-170,-352,75,-174,-195,-173,75,-191,75,-342,-200,-197,75,-171,75,75,75,75,75,75,75,-529,-623,-553,-343,-588,-623,-452,75,-354,-623,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,75,-12,-8,-19,75,75,75,75,-205,-249,75,75,75,75,75,75,75,75,-286,75,-279,75,-167,75,75,75,75,-277,-175,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-623,-351,-439,-430,-623,-567,75,-623,-566,-565,-352,-623,-351,-562,-528,-623,-478,-358,75,-473,-477,-469,-481,-352,-623,-501,-472,-471,-479,-476,-475,-480,-474,75,-524,-623,75,-519,-521,-527,-352,-522,-351,-525,-523,-526,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-400,75,75,75,75,-344,-281,75,75,-228,75,75,-284,-287,-290,-623,-280,-164,-168,75,75,75,-278,-260,75,-283,75,75,-533,75,75,-441,-559,75,-352,75,-564,-563,-484,75,-470,-483,75,-502,-503,-466,-595,-587,75,-520,75,-516,-401,-405,-402,-404,75,75,75,75,75,75,75,-303,75,-288,-623,-285,-289,-296,-251,75,75,75,75,75,75,75,75,75,75,75,75,75,-536,-534,-440,-442,-623,-487,75,75,75,-406,-421,-422,75,75,75,75,75,75,75,-307,-282,75,75,-306,-297,75,75,75,75,-234,-263,75,-261,75,-185,-231,-308,75,75,-535,75,-443,-444,-486,-482,-570,-500,-506,-423,-424,-403,-407,-411,-408,-410,-310,-309,75,75,75,75,75,-264,75,-271,75,75,75,75,75,-446,-445,-569,75,-505,-412,-426,75,-425,75,75,-314,-312,75,-291,-313,-311,-274,-272,75,-266,75,-265,-276,-232,75,-427,-428,-409,-318,-316,75,-317,-315,-273,-267,75,75,75,-236,75,75,75,]),'CHAR_LITERAL':([3,4,54,55,57,61,62,65,68,69,70,71,77,80,82,83,86,89,93,94,98,99,106,107,108,113,115,119,129,130,135,136,138,139,142,143,147,151,152,155,164,181,183,184,194,203,221,222,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,319,320,321,323,325,327,329,338,343,348,350,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,569,571,572,574,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,687,700,713,721,725,790,791,792,794,800,801,805,812,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,890,893,894,902,903,904,908,910,921,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1074,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[76,76,-193,-206,-202,-194,76,-189,76,-190,-169,-203,-186,-204,76,-172,-198,-196,-199,-262,76,-185,76,-192,-188,-187,-201,-170,-174,-195,-173,76,-191,76,-200,-197,76,-171,76,76,76,76,76,76,-529,-553,-452,76,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,76,-12,-8,-19,76,76,76,76,-205,-249,76,76,76,76,76,76,76,-286,76,-279,76,-167,76,76,76,76,-277,-175,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-281,76,76,-228,-284,-287,-290,-623,-280,-164,-168,76,76,76,-278,-260,76,-283,76,76,-533,76,-559,76,-466,76,-516,76,76,76,76,76,76,76,-288,-285,-289,-296,-251,76,76,76,76,76,76,76,76,76,76,76,76,76,-536,-534,76,76,76,76,76,76,-307,-282,76,-306,-297,76,76,76,76,-234,-263,76,-261,76,-185,-231,-308,76,76,-535,-310,-309,76,76,76,76,76,-264,76,-271,76,76,76,76,76,76,-314,-312,-291,-313,-311,-274,-272,76,-266,76,-265,-276,-232,76,-318,-316,76,-317,-315,-273,-267,76,76,76,-236,76,76,76,]),'THROWS':([236,237,494,495,625,626,872,885,988,994,],[-155,-156,-157,-158,-153,-154,981,-623,-507,981,]),'TRANSIENT':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,28,29,34,35,37,38,39,40,44,46,47,48,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,125,129,130,135,138,141,142,143,151,194,195,202,203,204,205,206,207,212,214,215,216,220,221,225,226,232,233,283,299,312,316,319,321,325,327,348,350,400,406,417,418,421,422,423,425,426,427,429,430,435,440,441,442,444,445,446,447,449,450,451,452,453,455,456,458,459,479,480,482,484,485,487,488,489,491,492,560,569,574,583,589,592,593,596,597,599,601,602,628,630,637,672,673,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,808,809,812,813,815,816,817,863,864,873,876,881,908,910,924,925,934,943,948,953,957,962,970,985,986,987,990,991,993,1018,1019,1046,1047,1048,1056,1072,1077,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[47,47,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,47,-362,-585,47,-357,-365,-451,47,-608,-610,-612,-594,-611,47,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,47,-192,-188,-187,-201,-170,47,-174,-195,-173,-191,-342,-200,-197,-171,-529,47,47,-553,-619,47,47,47,-343,47,-609,-588,47,-452,-354,-605,47,-508,-205,-249,47,47,-286,-279,-167,47,-277,-175,47,47,47,-567,47,-566,-565,47,47,-562,-528,47,-614,47,-478,-358,-473,-477,-469,-481,47,-501,-472,-471,-479,-476,-475,-480,-474,-524,47,-519,-521,-527,-522,47,-525,-523,-526,-344,-281,-228,47,47,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,47,-559,-564,-563,-484,47,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,-303,47,-288,47,-285,-289,-296,-536,-534,47,-487,-615,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-486,-482,-570,-500,-617,-506,-310,-309,-264,47,-271,47,-569,-505,-314,-312,-291,-313,-311,-274,-272,47,-266,47,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'INTERFACE':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,26,28,29,30,34,35,37,38,39,40,44,46,47,48,49,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,121,125,129,130,135,138,141,142,143,151,194,202,203,204,205,206,207,212,214,215,216,220,221,223,225,226,232,233,283,299,319,321,325,326,327,348,350,400,418,419,422,423,424,425,426,427,429,430,435,440,441,442,443,444,445,446,447,448,450,451,452,453,455,456,458,459,479,480,481,482,484,485,486,487,488,489,491,492,560,569,574,592,593,596,597,599,601,602,628,630,637,672,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,812,815,816,817,863,864,881,908,910,924,925,934,943,948,953,957,962,970,986,990,991,1018,1019,1046,1047,1048,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[-623,-623,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,-623,-362,-585,-623,-357,-365,209,-451,-623,217,-608,-610,-612,-594,-611,-351,-449,-447,-363,-364,-352,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,-623,-192,-188,-187,-201,-170,-352,-351,-174,-195,-173,-191,-342,-200,-197,-171,-529,-623,-553,-619,-351,-623,-623,-343,-623,-609,-588,-623,-452,476,-354,-605,-623,-508,-205,-249,-286,-279,-167,-352,-623,-277,-175,-623,-567,209,-566,-565,-352,-623,-351,-562,-528,-623,-614,-623,-478,-358,209,-473,-477,-469,-481,-352,-501,-472,-471,-479,-476,-475,-480,-474,-524,-623,209,-519,-521,-527,-352,-522,-351,-525,-523,-526,-344,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,-564,-563,-484,-623,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,-288,-285,-289,-296,-536,-534,-615,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-482,-500,-617,-310,-309,-264,-623,-271,-314,-312,-291,-313,-311,-274,-272,-623,-266,-623,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'|':([56,58,63,64,75,76,81,87,88,90,91,95,96,101,102,110,118,123,124,126,132,133,137,140,141,144,146,149,153,154,156,157,158,159,160,162,163,166,167,168,170,171,173,175,176,177,178,179,180,182,185,212,235,236,237,242,251,254,255,256,257,259,260,261,262,265,266,268,269,270,271,273,274,276,280,281,285,289,292,293,313,315,340,342,353,355,361,366,387,389,390,460,462,463,468,470,493,494,495,529,530,538,542,543,547,548,550,553,556,560,563,564,587,611,612,614,616,632,638,641,645,647,648,651,652,653,654,655,656,657,659,660,661,662,663,664,665,666,667,668,669,670,713,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,749,750,751,753,754,755,756,757,758,761,762,763,764,765,766,767,768,770,772,775,777,780,783,784,785,786,798,805,818,831,833,835,836,838,842,855,857,895,896,897,941,942,967,968,1000,1002,1004,1005,1008,1010,1011,1017,1025,1027,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1130,1132,1134,1138,1141,1142,1145,1149,1152,],[-370,-381,-374,-341,-377,-346,-372,-136,-378,-144,-368,-138,-142,-137,-379,-375,-345,-371,-348,-349,-373,-369,-376,-350,-342,-380,-139,-347,-130,360,-141,-128,-140,-129,-108,-96,-111,-88,-63,-107,-35,-127,-77,-58,-143,-122,-45,-343,-50,-40,-119,-343,-389,-155,-156,-134,-135,-37,-133,-68,-116,528,-132,-113,-60,-123,-112,-131,531,-126,-42,-53,-81,-91,-100,-47,-391,-399,-392,-398,-117,-119,-367,-383,-385,-118,528,-109,-120,-121,-110,-133,528,-132,-131,-341,-384,-157,-158,-114,-124,-146,-125,-115,-400,-387,-418,-417,-388,-344,-149,-343,528,-340,-335,-339,-152,-386,-36,-145,-147,-148,360,-97,-99,-98,-79,-78,-80,-41,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,-46,-329,-466,-390,-43,-84,-73,-75,-82,-86,-69,-71,360,-85,-74,-95,-70,-44,-83,-106,-57,-49,-93,-102,-104,-72,-61,360,-55,-76,-87,-39,-38,-48,-62,-92,-94,-101,-105,-103,-56,-54,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-406,-421,-422,-337,-623,-163,-159,-423,-424,-403,-407,-411,-408,-410,-225,1095,-294,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,-427,-428,-409,-295,-322,-623,-324,-161,-321,]),'SHORT':([3,4,6,9,10,12,13,17,18,19,21,22,24,25,28,38,44,46,47,48,50,51,52,53,54,55,57,61,62,64,65,67,68,69,70,71,77,80,82,83,84,86,89,93,94,98,99,106,107,108,113,114,115,119,121,125,129,130,135,136,138,139,141,142,143,147,151,152,155,164,172,181,183,184,194,202,203,212,216,220,221,222,225,232,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,316,319,320,321,323,325,327,329,338,343,348,350,354,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,386,388,400,406,410,411,417,418,419,421,422,423,424,425,426,427,429,440,441,442,443,444,445,446,447,448,449,450,451,452,453,455,456,458,459,467,479,480,481,482,484,485,486,487,488,489,491,492,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,547,551,552,554,555,560,569,571,572,574,583,589,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,684,685,687,688,690,693,696,698,699,700,706,707,708,711,712,713,714,715,721,723,724,725,777,780,783,784,790,791,792,794,800,801,805,808,809,812,813,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,866,869,873,876,890,893,894,895,896,897,898,899,900,901,902,903,904,908,910,921,922,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,972,973,976,985,986,987,990,993,1000,1002,1004,1005,1008,1010,1011,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1064,1067,1072,1074,1077,1079,1080,1081,1082,1083,1084,1088,1089,1095,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1130,1132,1134,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[81,81,-448,-359,-366,-356,-358,-360,-586,-361,-362,-585,-357,-365,-451,-594,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,81,-341,-189,81,81,-190,-169,-203,-186,-204,81,-172,-362,-198,-196,-199,-262,81,-185,81,-192,-188,-187,81,-201,-170,-352,81,-174,-195,-173,81,-191,81,-342,-200,-197,81,-171,81,81,81,81,81,81,81,-529,-623,-553,-343,-588,-623,-452,81,-354,-623,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,81,-12,-8,-19,81,81,81,81,-205,-249,81,81,81,81,81,81,81,81,-286,81,-279,81,-167,81,81,81,81,-277,-175,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-623,-351,-439,-430,-623,-567,81,-623,-566,-565,-352,-623,-351,-562,-528,-623,-478,-358,81,-473,-477,-469,-481,-352,-623,-501,-472,-471,-479,-476,-475,-480,-474,81,-524,-623,81,-519,-521,-527,-352,-522,-351,-525,-523,-526,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-400,81,81,81,81,-344,-281,81,81,-228,81,81,-284,-287,-290,-623,-280,-164,-168,81,81,81,-278,-260,81,-283,81,81,-533,81,81,-441,-559,81,-352,81,-564,-563,-484,81,-470,-483,81,-502,-503,-466,-595,-587,81,-520,81,-516,-401,-405,-402,-404,81,81,81,81,81,81,81,-303,81,-288,-623,-285,-289,-296,-251,81,81,81,81,81,81,81,81,81,81,81,81,81,-536,-534,-440,-442,-623,-487,81,81,81,-406,-421,-422,81,81,81,81,81,81,81,-307,-282,81,81,-306,-297,81,81,81,81,-234,-263,81,-261,81,-185,-231,-308,81,81,-535,81,-443,-444,-486,-482,-570,-500,-506,-423,-424,-403,-407,-411,-408,-410,-310,-309,81,81,81,81,81,-264,81,-271,81,81,81,81,81,-446,-445,-569,81,-505,-412,-426,81,-425,81,81,-314,-312,81,-291,-313,-311,-274,-272,81,-266,81,-265,-276,-232,81,-427,-428,-409,-318,-316,81,-317,-315,-273,-267,81,81,81,-236,81,81,81,]),'RETURN':([3,54,55,57,61,65,68,69,70,71,77,80,83,86,89,93,94,99,106,107,108,113,115,119,129,130,135,136,138,142,143,151,194,203,221,233,283,299,311,319,321,325,327,348,350,569,574,592,593,596,597,599,601,602,628,630,637,672,687,700,713,725,812,815,816,817,819,828,849,863,864,908,910,924,925,934,943,948,949,953,957,962,970,1018,1019,1046,1047,1048,1055,1058,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1137,1139,1140,1143,1144,1147,1148,1151,1157,1160,],[82,-193,-206,-202,-194,-189,82,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,82,-192,-188,-187,-201,-170,-174,-195,-173,82,-191,-200,-197,-171,-529,-553,-452,-508,-205,-249,82,-286,-279,-167,82,-277,-175,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,82,-466,-516,-288,-285,-289,-296,-251,82,82,-536,-534,-307,-282,-306,-297,-234,-263,-261,82,-185,-231,-308,-535,-310,-309,-264,82,-271,82,82,-314,-312,-291,-313,-311,-274,-272,82,-266,82,-265,-276,-232,-318,-316,82,-317,-315,-273,-267,82,82,-236,82,82,]),'SYNCHRONIZED':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,28,29,34,35,37,38,39,40,44,46,47,48,50,51,52,53,54,55,57,61,64,65,68,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,125,129,130,135,136,138,141,142,143,151,194,195,202,203,204,205,206,207,212,214,215,216,220,221,225,226,232,233,283,299,311,312,316,319,321,325,327,348,350,400,406,417,418,421,422,423,425,426,427,429,430,435,440,441,442,444,445,446,447,449,450,451,452,453,455,456,458,459,479,480,482,484,485,487,488,489,491,492,560,569,574,583,589,592,593,596,597,599,601,602,628,630,637,672,673,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,808,809,812,813,815,816,817,819,828,849,863,864,873,876,881,908,910,924,925,934,943,948,949,953,957,962,970,985,986,987,990,991,993,1018,1019,1046,1047,1048,1055,1056,1058,1072,1077,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1137,1139,1140,1143,1144,1147,1148,1151,1157,1160,],[21,84,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,21,-362,-585,21,-357,-365,-451,21,-608,-610,-612,-594,-611,21,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,298,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,84,-192,-188,-187,-201,-170,21,-174,-195,-173,298,-191,-342,-200,-197,-171,-529,21,21,-553,-619,21,21,21,-343,21,-609,-588,21,-452,-354,-605,21,-508,-205,-249,298,21,21,-286,-279,-167,84,-277,-175,21,21,21,-567,21,-566,-565,21,21,-562,-528,21,-614,21,-478,-358,-473,-477,-469,-481,21,-501,-472,-471,-479,-476,-475,-480,-474,-524,21,-519,-521,-527,-522,21,-525,-523,-526,-344,-281,-228,21,21,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,21,-559,-564,-563,-484,84,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,-303,21,-288,21,-285,-289,-296,-251,298,298,-536,-534,21,-487,-615,-307,-282,-306,-297,-234,-263,-261,298,-185,-231,-308,-535,-486,-482,-570,-500,-617,-506,-310,-309,-264,84,-271,298,21,298,-569,-505,-314,-312,-291,-313,-311,-274,-272,84,-266,84,-265,-276,-232,-318,-316,298,-317,-315,-273,-267,298,298,-236,298,298,]),'STATIC':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,27,28,29,34,35,37,38,39,40,44,46,47,48,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,125,129,130,135,138,141,142,143,151,194,195,202,203,204,205,206,207,212,214,215,216,220,221,225,226,232,233,283,299,312,316,319,321,325,327,348,350,400,406,417,418,421,422,423,425,426,427,429,430,435,440,441,442,444,445,446,447,449,450,451,452,453,455,456,458,459,479,480,482,484,485,487,488,489,491,492,560,569,574,583,589,592,593,596,597,599,601,602,628,630,637,672,673,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,808,809,812,813,815,816,817,863,864,873,876,881,908,910,924,925,934,943,948,953,957,962,970,985,986,987,990,991,993,1018,1019,1046,1047,1048,1056,1072,1077,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[13,13,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,13,-362,-585,13,-357,-365,213,-451,13,-608,-610,-612,-594,-611,13,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,13,-192,-188,-187,-201,-170,13,-174,-195,-173,-191,-342,-200,-197,-171,-529,13,13,-553,-619,13,13,13,-343,13,-609,-588,442,-452,-354,-605,13,-508,-205,-249,13,13,-286,-279,-167,13,-277,-175,442,13,13,-567,13,-566,-565,13,13,-562,-528,13,-614,442,-478,-358,-473,-477,-469,-481,13,-501,-472,-471,-479,-476,-475,-480,-474,-524,13,-519,-521,-527,-522,13,-525,-523,-526,-344,-281,-228,13,13,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,13,-559,-564,-563,-484,13,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,-303,13,-288,13,-285,-289,-296,-536,-534,13,-487,-615,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-486,-482,-570,-500,-617,-506,-310,-309,-264,13,-271,13,-569,-505,-314,-312,-291,-313,-311,-274,-272,13,-266,13,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'FINAL':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,28,29,34,35,37,38,39,40,44,46,47,48,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,125,129,130,135,138,141,142,143,151,194,195,202,203,204,205,206,207,212,214,215,216,220,221,225,226,232,233,283,299,312,316,319,321,325,327,348,350,400,406,417,418,421,422,423,425,426,427,429,430,435,440,441,442,444,445,446,447,449,450,451,452,453,455,456,458,459,479,480,482,484,485,487,488,489,491,492,560,569,574,583,589,592,593,596,597,599,601,602,628,630,637,672,673,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,808,809,812,813,815,816,817,863,864,873,876,881,908,910,924,925,934,943,948,953,957,962,970,985,986,987,990,991,993,1018,1019,1046,1047,1048,1056,1072,1077,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[17,17,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,17,-362,-585,17,-357,-365,-451,17,-608,-610,-612,-594,-611,17,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,17,-192,-188,-187,-201,-170,17,-174,-195,-173,-191,-342,-200,-197,-171,-529,17,17,-553,-619,17,17,17,-343,17,-609,-588,17,-452,-354,-605,17,-508,-205,-249,17,17,-286,-279,-167,17,-277,-175,17,17,17,-567,17,-566,-565,17,17,-562,-528,17,-614,17,-478,-358,-473,-477,-469,-481,17,-501,-472,-471,-479,-476,-475,-480,-474,-524,17,-519,-521,-527,-522,17,-525,-523,-526,-344,-281,-228,17,17,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,17,-559,-564,-563,-484,17,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,-303,17,-288,17,-285,-289,-296,-536,-534,17,-487,-615,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-486,-482,-570,-500,-617,-506,-310,-309,-264,17,-271,17,-569,-505,-314,-312,-291,-313,-311,-274,-272,17,-266,17,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'+':([4,62,64,76,82,87,90,95,96,98,101,118,124,126,139,140,141,146,147,149,152,153,155,156,157,158,159,160,162,163,164,166,168,171,173,176,177,179,181,183,184,185,222,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,255,257,259,260,261,264,265,266,267,268,270,274,276,277,278,280,301,303,307,310,313,314,315,320,323,329,338,343,355,356,357,360,361,365,366,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,387,388,389,390,460,462,463,467,468,470,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,529,530,531,532,533,534,536,537,538,539,540,541,542,543,544,545,560,563,564,571,572,587,611,612,613,614,615,616,627,631,640,641,645,647,651,652,653,654,655,656,659,660,661,670,678,713,721,728,731,732,736,738,741,742,745,746,747,755,762,763,764,765,766,785,786,790,791,792,794,798,801,805,818,820,824,827,829,831,832,833,835,836,838,840,842,847,851,855,857,859,860,890,893,894,902,903,904,921,927,928,929,931,941,942,946,964,967,968,1017,1023,1029,1035,1037,1038,1039,1040,1041,1042,1043,1044,1051,1057,1059,1060,1062,1074,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1146,1149,1152,],[164,264,-341,-346,164,-136,-144,-138,-142,164,-137,-345,-348,-349,164,-350,-342,-139,164,-347,164,-130,264,-141,-128,-140,-129,-108,-96,-111,164,-88,-107,-127,377,-143,-122,-343,164,164,164,-119,264,-9,-15,-14,-134,-16,-11,-18,-13,-17,-10,164,-12,-135,-8,-19,-133,-116,516,-132,-113,164,-123,-112,164,-131,-126,536,-91,164,164,-100,164,164,164,164,-117,264,-119,164,164,164,164,164,-118,164,164,164,516,164,-109,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,-120,164,-121,-110,-133,516,-132,264,-131,-341,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,-114,-124,164,164,164,164,164,164,-146,164,164,164,-125,-115,164,164,-344,-149,-343,164,164,516,-340,-335,164,-339,164,-152,164,164,164,-145,-147,-148,-97,-99,-98,377,377,377,-328,-89,-90,-329,164,-466,264,377,377,377,377,-95,377,-106,-93,-102,-104,377,-92,-94,-101,-105,-103,-150,-330,164,164,164,164,-331,164,-145,-332,164,164,164,164,-336,164,-334,-338,-333,-151,164,-221,164,164,-128,-162,164,164,264,164,164,164,164,164,164,164,164,164,164,-337,-623,164,164,-163,-159,-225,164,-226,164,-623,-217,164,-216,-326,-320,-327,164,-623,164,164,-227,-160,264,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,164,-161,-321,]),'/':([64,76,87,90,95,96,101,118,124,126,140,141,146,149,153,156,157,158,159,160,162,163,166,168,171,176,177,179,185,242,251,255,257,259,260,261,265,266,268,270,276,280,313,315,355,361,366,387,389,390,460,462,463,468,470,529,530,538,542,543,560,563,564,587,611,612,614,616,641,645,647,651,652,653,659,660,661,670,713,738,742,745,746,747,762,763,764,765,766,785,786,798,805,818,831,833,835,836,838,842,855,857,941,942,967,968,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1149,1152,],[-341,-346,-136,-144,-138,-142,-137,-345,-348,-349,-350,-342,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,371,-107,-127,-143,-122,-343,-119,-134,-135,-133,-116,518,-132,-113,-123,-112,-131,-126,541,-100,-117,-119,-118,518,-109,-120,-121,-110,-133,518,-132,-131,-341,-114,-124,-146,-125,-115,-344,-149,-343,518,-340,-335,-339,-152,-145,-147,-148,-97,-99,-98,-328,371,371,-329,-466,371,-106,371,-102,-104,371,371,-101,-105,-103,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-337,-623,-163,-159,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-161,-321,]),';':([2,3,6,11,15,18,20,22,23,28,29,34,35,37,38,39,41,44,46,50,52,54,55,57,58,60,61,64,65,66,68,69,70,71,72,76,77,78,79,80,82,83,86,87,88,89,90,93,94,95,96,99,101,102,103,104,106,107,108,113,115,118,119,120,124,126,129,130,131,134,135,136,138,140,141,142,143,144,145,146,149,151,153,154,156,157,158,159,160,161,162,163,165,166,167,168,170,171,173,175,176,177,178,179,180,182,185,186,187,188,194,195,202,203,204,206,207,211,212,214,215,216,219,220,221,226,232,233,235,236,237,242,251,254,256,257,258,261,262,265,266,269,270,271,272,273,274,276,280,281,283,285,289,292,293,299,304,305,306,311,312,313,315,319,321,322,325,327,331,335,342,344,345,346,347,348,349,350,352,353,355,359,366,387,389,390,394,398,399,400,403,404,405,418,420,422,423,425,427,429,430,435,436,440,441,444,445,446,447,450,451,452,453,454,455,456,458,459,460,462,463,468,473,474,475,477,479,480,482,484,485,487,489,490,491,492,493,494,495,496,529,530,538,542,543,547,548,550,553,556,560,563,564,569,574,575,577,578,580,582,585,588,590,592,593,596,597,599,601,602,611,612,614,616,621,624,625,626,628,630,632,637,638,641,645,647,648,649,651,652,653,654,655,656,657,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,679,680,681,682,687,696,698,699,700,702,704,706,707,711,712,713,714,715,720,723,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,749,750,751,752,753,754,755,756,757,758,759,761,762,763,764,765,766,767,768,770,772,775,777,780,783,784,785,786,793,798,801,803,805,812,815,816,817,818,819,828,830,831,833,835,836,838,842,843,844,845,846,848,849,850,857,862,863,864,877,878,879,881,882,884,885,888,889,895,896,897,908,910,911,912,913,915,916,917,919,924,925,934,941,942,943,948,949,953,957,962,967,968,969,970,971,979,982,986,988,989,990,991,994,996,997,998,1000,1002,1004,1005,1008,1010,1011,1015,1016,1017,1018,1019,1022,1024,1029,1033,1036,1037,1038,1040,1041,1042,1043,1046,1047,1048,1051,1053,1055,1056,1058,1060,1062,1069,1070,1071,1073,1075,1076,1078,1079,1080,1082,1085,1086,1087,1088,1089,1094,1097,1098,1099,1100,1101,1102,1104,1105,1107,1110,1111,1112,1113,1114,1115,1117,1118,1119,1121,1123,1125,1128,1130,1132,1134,1135,1136,1137,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1157,1160,],[28,94,-448,-618,-613,-586,28,-585,28,-451,28,-608,-610,-612,-594,-611,226,-449,-447,-584,-450,-193,-206,-202,-381,-211,-194,-341,-189,283,94,-190,-169,-203,-213,-346,-186,-210,-209,-204,-623,-172,-198,-136,-378,-196,-144,-199,-262,-138,-142,-185,-137,-379,-208,321,94,-192,-188,-187,-201,-345,-170,-212,-348,-349,-174,-195,348,350,-173,94,-191,-350,-342,-200,-197,-380,-207,-139,-347,-171,-130,-30,-141,-128,-140,-129,-108,-25,-96,-111,-20,-88,-63,-107,-35,-127,-77,-58,-143,-122,-45,-343,-50,-40,-119,-1,-3,-4,-529,400,28,-553,-619,28,28,435,-343,28,-609,-588,-607,447,-452,-605,485,-508,-389,-155,-156,-134,-135,-37,-68,-116,-27,-113,-60,-123,-112,-32,-126,-42,-22,-53,-81,-91,-100,-47,-205,-391,-399,-392,-398,-249,569,-244,-245,94,-623,-117,-119,-286,-279,599,-167,94,-381,-383,-383,-176,-623,-178,-180,-277,628,-175,630,-385,-118,637,-109,-120,-121,-110,-382,400,400,447,-623,-537,-540,-567,696,-566,-565,28,-562,-528,28,-614,704,447,-478,-473,-477,-469,-481,-501,-472,-471,-479,712,-476,-475,-480,-474,-133,-575,-132,-131,-574,-577,-576,-606,-524,485,-519,-521,-527,-522,-525,712,-523,-526,-384,-157,-158,-7,-114,-124,-146,-125,-115,-400,-387,-418,-417,-388,-344,-149,-343,-281,-228,-242,-240,801,-238,-239,-241,808,-301,-284,-287,-290,-623,-280,-164,-168,-340,-335,-339,-152,-177,-182,-153,-154,-278,-260,-386,-283,-36,-145,-147,-148,-31,-26,-97,-99,-98,-79,-78,-80,-41,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,-46,-329,-542,-533,400,-543,-541,-544,-539,-559,-564,-563,-484,94,881,-616,-470,-483,-502,-503,-466,-595,-587,-581,-520,-516,-390,-43,-84,-73,-75,-82,-86,-69,-71,-33,-85,-74,-95,-70,-44,-83,-106,-57,-49,-93,-102,-104,-72,-61,-34,-29,-55,-76,-87,-39,-38,-48,-28,-62,-92,-94,-101,-105,-103,-56,-54,-419,-420,-393,-401,-405,-402,-404,-150,-330,908,-331,-623,-623,-145,-288,-285,-289,-296,-332,-251,94,-384,-336,-334,-338,-333,-151,-221,-179,-183,-181,-184,948,94,962,-162,-538,-536,-534,986,-623,-623,-615,991,-623,-623,-580,-579,-406,-421,-422,-307,-282,1018,1019,-243,1021,-182,-623,-302,-306,-297,-234,-337,-623,-263,-261,94,-185,-231,-308,-163,-159,-21,-535,-545,-494,-495,-482,-507,-623,-500,-617,-623,-578,-24,-23,-423,-424,-403,-407,-411,-408,-410,1088,1089,-225,-310,-309,-182,-304,-226,1101,1104,-623,-217,-216,-326,-320,-327,-264,94,-271,-623,1119,94,-623,94,-227,-160,-499,-496,-497,-571,-568,-572,-504,-412,-426,-425,1135,1136,-222,-314,-312,-305,-291,-223,1139,1140,-313,-623,-311,-319,-218,-274,-272,94,-266,94,-265,-323,-623,-276,1146,-232,-224,-573,-427,-428,-409,-318,-316,94,-317,-315,-322,-623,-273,-267,-324,-623,94,94,-161,-498,-236,-321,1156,94,94,]),'NEQ':([58,64,76,87,88,90,95,96,101,102,118,124,126,140,141,144,146,149,153,156,157,158,159,160,162,163,166,167,168,171,173,175,176,177,178,179,180,185,212,235,236,237,242,251,255,256,257,259,260,261,262,265,266,268,270,273,274,276,280,281,285,289,292,293,313,315,342,353,355,361,366,387,389,390,460,462,463,468,470,493,494,495,529,530,538,542,543,547,548,550,553,556,560,563,564,587,611,612,614,616,632,641,645,647,651,652,653,654,655,656,659,660,661,662,663,664,665,666,667,668,669,670,713,726,728,729,730,731,732,733,734,736,737,738,739,741,742,743,744,745,746,747,749,750,753,754,755,758,761,762,763,764,765,766,767,768,770,772,775,777,780,783,784,785,786,798,805,818,831,833,835,836,838,842,855,857,895,896,897,941,942,967,968,1000,1002,1004,1005,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1130,1132,1134,1141,1142,1145,1149,1152,],[-381,-341,-346,-136,-378,-144,-138,-142,-137,-379,-345,-348,-349,-350,-342,-380,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,-88,-63,-107,-127,-77,-58,-143,-122,385,-343,-50,-119,-343,-389,-155,-156,-134,-135,-133,-68,-116,513,-132,-113,-60,-123,-112,-131,-126,-53,-81,-91,-100,544,-391,-399,-392,-398,-117,-119,-383,-385,-118,513,-109,-120,-121,-110,-133,513,-132,-131,-341,-384,-157,-158,-114,-124,-146,-125,-115,-400,-387,-418,-417,-388,-344,-149,-343,513,-340,-335,-339,-152,-386,-145,-147,-148,-97,-99,-98,-79,-78,-80,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,385,-329,-466,-390,-84,-73,-75,-82,-86,-69,-71,-85,-74,-95,-70,-83,-106,-57,385,-93,-102,-104,-72,-61,-55,-76,-87,385,-62,-92,-94,-101,-105,-103,-56,-54,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-406,-421,-422,-337,-623,-163,-159,-423,-424,-403,-407,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,-427,-428,-409,-322,-623,-324,-161,-321,]),'?':([58,64,67,76,87,88,90,95,96,101,102,118,124,126,140,141,144,146,149,153,154,156,157,158,159,160,161,162,163,165,166,167,168,170,171,173,175,176,177,178,179,180,182,185,212,235,236,237,242,251,254,255,256,257,258,259,260,261,262,265,266,268,269,270,271,272,273,274,276,280,281,285,289,292,293,313,315,342,353,354,355,361,366,387,389,390,460,462,463,468,470,493,494,495,529,530,538,542,543,547,548,550,553,554,555,556,560,563,564,587,611,612,614,616,632,638,640,641,645,647,648,649,651,652,653,654,655,656,657,659,660,661,662,663,664,665,666,667,668,669,670,713,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,749,750,751,752,753,754,755,756,757,758,759,761,762,763,764,765,766,767,768,770,772,775,777,780,783,784,785,786,798,805,818,831,833,835,836,838,842,855,857,895,896,897,900,901,941,942,967,968,1000,1002,1004,1005,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1079,1080,1082,1084,1087,1098,1102,1105,1107,1117,1118,1125,1130,1132,1134,1141,1142,1145,1149,1152,],[-381,-341,288,-346,-136,-378,-144,-138,-142,-137,-379,-345,-348,-349,-350,-342,-380,-139,-347,-130,-30,-141,-128,-140,-129,-108,-25,-96,-111,368,-88,-63,-107,-35,-127,-77,-58,-143,-122,-45,-343,-50,-40,-119,-343,-389,-155,-156,-134,-135,-37,-133,-68,-116,-27,520,-132,-113,-60,-123,-112,-131,-32,-126,-42,534,-53,-81,-91,-100,-47,-391,-399,-392,-398,-117,-119,-383,-385,288,-118,520,-109,-120,-121,-110,-133,520,-132,-131,-341,-384,-157,-158,-114,-124,-146,-125,-115,-400,-387,-418,-417,288,779,-388,-344,-149,-343,520,-340,-335,-339,-152,-386,-36,288,-145,-147,-148,-31,-26,-97,-99,-98,-79,-78,-80,-41,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,-46,-329,-466,-390,-43,-84,-73,-75,-82,-86,-69,-71,-33,-85,-74,-95,-70,-44,-83,-106,-57,-49,-93,-102,-104,-72,-61,-34,-29,-55,-76,-87,-39,-38,-48,-28,-62,-92,-94,-101,-105,-103,-56,-54,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-406,-421,-422,779,1007,-337,-623,-163,-159,-423,-424,-403,-407,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-412,-426,-425,1007,-222,-223,-623,-319,-218,-323,-623,-224,-427,-428,-409,-322,-623,-324,-161,-321,]),'$end':([1,2,6,11,15,20,23,28,29,33,34,35,37,39,44,46,49,52,54,55,57,58,61,64,65,69,70,71,76,77,80,83,86,87,88,89,90,93,94,95,96,99,101,102,107,108,112,113,115,118,119,124,126,129,130,135,138,140,141,142,143,144,146,149,151,153,154,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,173,175,176,177,178,179,180,182,185,186,187,188,194,203,204,206,207,212,214,215,221,226,233,235,236,237,242,251,283,285,289,292,293,299,313,315,319,321,342,348,350,353,355,366,387,389,390,430,435,493,494,495,496,538,547,548,550,553,556,560,563,564,569,574,592,593,596,597,599,601,611,612,614,616,628,630,632,637,638,641,645,647,648,649,651,652,653,654,655,656,657,659,660,661,662,663,664,665,666,667,668,669,670,672,687,704,713,725,726,770,772,775,777,780,783,784,785,786,798,805,812,815,816,817,818,831,833,835,836,838,842,857,863,864,881,895,896,897,908,910,924,925,934,941,942,943,948,953,957,962,967,968,969,970,991,1000,1002,1004,1005,1008,1010,1011,1017,1018,1019,1029,1037,1038,1040,1041,1042,1043,1046,1051,1060,1062,1079,1080,1082,1087,1088,1089,1097,1098,1101,1102,1104,1105,1107,1113,1115,1117,1118,1119,1123,1125,1130,1132,1134,1135,1136,1139,1140,1141,1142,1144,1145,1149,1151,1152,],[0,-623,-448,-618,-613,-602,-597,-451,-601,-620,-608,-610,-612,-611,-449,-447,-604,-450,-193,-206,-202,-381,-194,-341,-189,-190,-169,-203,-346,-186,-204,-172,-198,-136,-378,-196,-144,-199,-262,-138,-142,-185,-137,-379,-192,-188,-622,-187,-201,-345,-170,-348,-349,-174,-195,-173,-191,-350,-342,-200,-197,-380,-139,-347,-171,-130,-30,-141,-128,-140,-129,-108,-25,-96,-111,-20,-88,-63,-107,-621,-35,-127,-77,-58,-143,-122,-45,-343,-50,-40,-119,-1,-3,-4,-529,-553,-619,-600,-598,-343,-603,-609,-452,-605,-508,-389,-155,-156,-134,-135,-205,-391,-399,-392,-398,-249,-117,-119,-286,-279,-383,-277,-175,-385,-118,-109,-120,-121,-110,-599,-614,-384,-157,-158,-7,-146,-400,-387,-418,-417,-388,-344,-149,-343,-281,-228,-284,-287,-290,-623,-280,-164,-340,-335,-339,-152,-278,-260,-386,-283,-36,-145,-147,-148,-31,-26,-97,-99,-98,-79,-78,-80,-41,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,-46,-329,-533,-559,-616,-466,-516,-390,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-145,-288,-285,-289,-296,-332,-336,-334,-338,-333,-151,-221,-162,-536,-534,-615,-406,-421,-422,-307,-282,-306,-297,-234,-337,-623,-263,-261,-185,-231,-308,-163,-159,-21,-535,-617,-423,-424,-403,-407,-411,-408,-410,-225,-310,-309,-226,-623,-217,-216,-326,-320,-327,-264,-623,-227,-160,-412,-426,-425,-222,-314,-312,-291,-223,-313,-623,-311,-319,-218,-266,-265,-323,-623,-276,-232,-224,-427,-428,-409,-318,-316,-317,-315,-322,-623,-267,-324,-161,-236,-321,]),'FOR':([3,54,55,57,61,65,68,69,70,71,77,80,83,86,89,93,94,99,106,107,108,113,115,119,129,130,135,136,138,142,143,151,194,203,221,233,283,299,311,319,321,325,327,348,350,569,574,592,593,596,597,599,601,602,628,630,637,672,687,700,713,725,812,815,816,817,819,828,849,863,864,908,910,924,925,934,943,948,949,953,957,962,970,1018,1019,1046,1047,1048,1055,1058,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1137,1139,1140,1143,1144,1147,1148,1151,1157,1160,],[97,-193,-206,-202,-194,-189,97,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,97,-192,-188,-187,-201,-170,-174,-195,-173,97,-191,-200,-197,-171,-529,-553,-452,-508,-205,-249,97,-286,-279,-167,97,-277,-175,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,97,-466,-516,-288,-285,-289,-296,-251,97,952,-536,-534,-307,-282,-306,-297,-234,-263,-261,952,-185,-231,-308,-535,-310,-309,-264,97,-271,952,97,-314,-312,-291,-313,-311,-274,-272,97,-266,97,-265,-276,-232,-318,-316,97,-317,-315,-273,-267,952,952,-236,952,952,]),'PLUSPLUS':([0,3,4,54,55,57,59,60,61,62,64,65,68,69,70,71,72,73,74,76,77,78,80,82,83,86,87,89,90,93,94,95,96,98,99,101,106,107,108,109,113,115,118,119,120,124,126,127,129,130,135,136,138,139,140,141,142,143,146,147,149,151,152,153,155,156,157,158,159,164,171,176,179,181,183,184,185,194,203,221,222,233,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,255,259,260,264,267,268,277,278,283,297,299,301,303,307,310,311,312,314,315,319,320,321,323,325,327,329,338,343,348,350,356,357,360,361,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,460,462,463,467,468,470,472,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,538,539,540,541,544,545,560,561,562,563,564,569,571,572,574,576,579,584,587,592,593,596,597,599,601,602,603,611,612,613,614,615,616,627,628,630,631,635,637,640,641,645,647,659,670,672,678,687,700,713,721,725,785,786,790,791,792,794,798,800,801,805,812,815,816,817,818,819,820,824,827,828,829,831,832,833,835,836,838,840,842,847,849,851,855,859,860,863,864,890,893,894,902,903,904,908,910,914,921,924,925,927,928,929,931,934,941,942,943,946,948,949,953,957,962,964,970,1017,1018,1019,1021,1023,1029,1035,1037,1038,1039,1040,1041,1042,1043,1044,1046,1047,1048,1051,1055,1056,1057,1058,1059,1060,1074,1087,1088,1089,1097,1098,1101,1102,1104,1105,1107,1110,1111,1112,1113,1114,1115,1117,1118,1119,1123,1125,1135,1136,1137,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1151,1152,1156,1157,1160,],[2,98,98,-193,-206,-202,242,-130,-194,98,-341,-189,98,-190,-169,-203,-141,-128,-140,-346,-186,-129,-204,98,-172,-198,-136,-196,-144,-199,-262,-138,-142,98,-185,-137,98,-192,-188,-127,-187,-201,-345,-170,-143,-348,-349,-343,-174,-195,-173,98,-191,98,-350,-342,-200,-197,-139,98,-347,-171,98,-130,98,-141,-128,-140,-129,98,-127,-143,-343,98,98,98,242,-529,-553,-452,98,-508,-9,-15,-14,-134,-16,-11,-18,-13,-17,-10,98,-12,-135,-8,-19,-130,-128,-129,98,98,-127,98,98,-205,-128,-249,98,98,98,98,98,98,98,242,-286,98,-279,98,-167,98,98,98,98,-277,-175,98,98,98,-128,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-130,-128,-129,98,-127,-341,242,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-145,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-146,98,98,98,98,98,-344,-147,-148,-149,-343,-281,98,98,-228,-128,-127,-343,-128,-284,-287,-290,-623,-280,-164,-168,-328,-340,-335,98,-339,98,-152,98,-278,-260,98,-329,-283,98,-145,-147,-148,-328,-329,-533,98,-559,98,-466,98,-516,-150,-330,98,98,98,98,-331,98,98,-145,-288,-285,-289,-296,-332,-251,98,98,98,98,98,-336,98,-334,-338,-333,-151,98,-221,98,98,98,-128,98,98,-536,-534,98,98,98,98,98,98,-307,-282,-128,98,-306,-297,98,98,98,98,-234,-337,-623,-263,98,-261,98,-185,-231,-308,98,-535,-225,-310,-309,98,98,-226,98,-623,-217,98,-216,-326,-320,-327,98,-264,98,-271,-623,98,98,98,98,98,-227,98,-222,-314,-312,-291,-223,-313,-623,-311,-319,-218,-274,-272,98,-266,98,-265,-323,-623,-276,-232,-224,-318,-316,98,-317,-315,-322,-623,-273,-267,-324,98,98,98,-236,-321,98,98,98,]),'AND_ASSIGN':([59,60,64,72,73,74,76,78,87,90,95,96,101,109,118,120,124,126,127,140,141,146,149,153,156,157,158,159,171,176,179,185,242,251,255,259,260,268,297,361,515,538,560,561,562,563,564,576,579,584,587,603,611,612,614,616,635,641,645,647,659,670,713,785,786,798,818,831,833,835,836,838,842,914,941,942,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1152,],[247,-130,-341,-141,-128,-140,-346,-129,-136,-144,-138,-142,-137,-127,-345,-143,-348,-349,-343,-350,-342,-139,-347,-130,-141,-128,-140,-129,-127,-143,-343,247,-134,-135,-130,-128,-129,-127,-128,-128,-145,-146,-344,-147,-148,-149,-343,-128,-127,-343,-128,-328,-340,-335,-339,-152,-329,-145,-147,-148,-328,-329,-466,-150,-330,-331,-332,-336,-334,-338,-333,-151,-221,-128,-337,-623,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-321,]),'ELSE':([54,55,57,61,71,80,86,89,93,94,107,115,130,142,143,283,319,321,348,569,592,593,596,597,599,601,628,630,637,812,815,816,817,908,910,924,925,943,948,950,953,954,956,958,959,960,962,1018,1019,1046,1054,1088,1089,1097,1101,1104,1113,1115,1119,1120,1135,1136,1139,1140,1144,1154,1155,1159,1161,],[-193,-206,-202,-194,-203,-204,-198,-196,-199,-262,-192,-201,-195,-200,-197,-205,-286,-279,-277,-281,-284,-287,-290,-623,-280,-164,-278,-260,-283,-288,-285,-289,-296,-307,-282,-306,-297,-263,-261,-256,-254,-259,-255,-257,-258,1058,-308,-310,-309,-264,-250,-314,-312,-291,-313,-311,-266,-265,-276,-229,-318,-316,-317,-315,-267,-235,1157,-233,-237,]),'TRY':([3,54,55,57,61,65,68,69,70,71,77,80,83,86,89,93,94,99,106,107,108,113,115,119,129,130,135,136,138,142,143,151,194,203,221,233,283,299,311,319,321,325,327,348,350,569,574,592,593,596,597,599,601,602,628,630,637,672,687,700,713,725,812,815,816,817,819,828,849,863,864,908,910,924,925,934,943,948,949,953,957,962,970,1018,1019,1046,1047,1048,1055,1058,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1137,1139,1140,1143,1144,1147,1148,1151,1157,1160,],[100,-193,-206,-202,-194,-189,100,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,100,-192,-188,-187,-201,-170,-174,-195,-173,100,-191,-200,-197,-171,-529,-553,-452,-508,-205,-249,100,-286,-279,-167,100,-277,-175,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,100,-466,-516,-288,-285,-289,-296,-251,100,100,-536,-534,-307,-282,-306,-297,-234,-263,-261,100,-185,-231,-308,-535,-310,-309,-264,100,-271,100,100,-314,-312,-291,-313,-311,-274,-272,100,-266,100,-265,-276,-232,-318,-316,100,-317,-315,-273,-267,100,100,-236,100,100,]),'DIVIDE_ASSIGN':([59,60,64,72,73,74,76,78,87,90,95,96,101,109,118,120,124,126,127,140,141,146,149,153,156,157,158,159,171,176,179,185,242,251,255,259,260,268,297,361,515,538,560,561,562,563,564,576,579,584,587,603,611,612,614,616,635,641,645,647,659,670,713,785,786,798,818,831,833,835,836,838,842,914,941,942,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1152,],[248,-130,-341,-141,-128,-140,-346,-129,-136,-144,-138,-142,-137,-127,-345,-143,-348,-349,-343,-350,-342,-139,-347,-130,-141,-128,-140,-129,-127,-143,-343,248,-134,-135,-130,-128,-129,-127,-128,-128,-145,-146,-344,-147,-148,-149,-343,-128,-127,-343,-128,-328,-340,-335,-339,-152,-329,-145,-147,-148,-328,-329,-466,-150,-330,-331,-332,-336,-334,-338,-333,-151,-221,-128,-337,-623,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-321,]),'[':([56,58,63,64,72,73,74,75,76,81,87,90,96,101,110,116,118,120,123,124,126,127,132,133,137,140,141,144,146,149,156,157,158,174,176,179,212,236,237,259,284,285,287,289,292,293,295,297,331,332,333,335,340,342,345,353,361,362,462,470,493,494,495,515,538,547,550,553,560,561,562,563,564,576,584,587,603,611,612,614,616,632,635,639,641,645,647,659,670,694,713,769,770,772,775,777,780,783,784,785,786,798,803,805,818,830,831,833,835,836,838,842,855,856,875,878,879,884,885,895,896,897,914,917,941,942,966,1000,1002,1004,1005,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1130,1132,1134,1141,1142,1145,1152,],[-370,238,-374,-341,-141,301,-140,-377,-346,-372,310,-144,-142,320,-375,238,-345,-143,-371,-348,-349,-343,-373,-369,-376,-350,-342,-380,-139,-347,-141,301,-140,238,-143,-343,-343,238,-156,301,238,-391,238,-399,-392,-398,238,301,-381,613,613,-383,238,238,238,-385,301,238,301,-341,238,-157,-158,-145,-146,-400,-418,-417,-344,-147,-148,-149,-343,301,-343,301,-328,613,-335,613,-152,-386,-329,238,-145,-147,-148,-328,-329,-343,-466,238,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,238,-145,-332,-384,-336,-334,-338,-333,-151,-221,301,238,-343,238,238,238,238,-406,-421,-422,301,238,-337,-623,238,-423,-424,-403,-407,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,-427,-428,-409,-322,-623,-324,-321,]),'EQ':([58,64,76,87,88,90,95,96,101,102,118,124,126,140,141,144,146,149,153,156,157,158,159,160,162,163,166,167,168,171,173,175,176,177,178,179,180,185,212,235,236,237,242,251,255,256,257,259,260,261,262,265,266,268,270,273,274,276,280,281,285,289,292,293,313,315,342,353,355,361,366,387,389,390,460,462,463,468,470,493,494,495,529,530,538,542,543,547,548,550,553,556,560,563,564,587,611,612,614,616,632,641,645,647,651,652,653,654,655,656,659,660,661,662,663,664,665,666,667,668,669,670,713,726,728,729,730,731,732,733,734,736,737,738,739,741,742,743,744,745,746,747,749,750,753,754,755,758,761,762,763,764,765,766,767,768,770,772,775,777,780,783,784,785,786,798,805,818,831,833,835,836,838,842,855,857,895,896,897,941,942,967,968,1000,1002,1004,1005,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1130,1132,1134,1141,1142,1145,1149,1152,],[-381,-341,-346,-136,-378,-144,-138,-142,-137,-379,-345,-348,-349,-350,-342,-380,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,-88,-63,-107,-127,-77,-58,-143,-122,384,-343,-50,-119,-343,-389,-155,-156,-134,-135,-133,-68,-116,525,-132,-113,-60,-123,-112,-131,-126,-53,-81,-91,-100,545,-391,-399,-392,-398,-117,-119,-383,-385,-118,525,-109,-120,-121,-110,-133,525,-132,-131,-341,-384,-157,-158,-114,-124,-146,-125,-115,-400,-387,-418,-417,-388,-344,-149,-343,525,-340,-335,-339,-152,-386,-145,-147,-148,-97,-99,-98,-79,-78,-80,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,384,-329,-466,-390,-84,-73,-75,-82,-86,-69,-71,-85,-74,-95,-70,-83,-106,-57,384,-93,-102,-104,-72,-61,-55,-76,-87,384,-62,-92,-94,-101,-105,-103,-56,-54,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-406,-421,-422,-337,-623,-163,-159,-423,-424,-403,-407,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,-427,-428,-409,-322,-623,-324,-161,-321,]),'AND':([58,64,76,87,88,90,95,96,101,102,118,124,126,140,141,144,146,149,153,154,156,157,158,159,160,161,162,163,166,167,168,170,171,173,175,176,177,178,179,180,182,185,212,235,236,237,242,251,254,255,256,257,258,259,260,261,262,265,266,268,269,270,271,273,274,276,280,281,285,289,292,293,313,315,342,353,355,361,366,387,389,390,460,462,463,468,470,493,494,495,529,530,538,542,543,547,548,550,553,556,560,563,564,587,611,612,614,616,632,638,641,645,647,648,649,651,652,653,654,655,656,657,659,660,661,662,663,664,665,666,667,668,669,670,713,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,749,750,751,752,753,754,755,756,757,758,759,761,762,763,764,765,766,767,768,770,772,775,777,780,783,784,785,786,798,805,818,831,833,835,836,838,842,855,857,895,896,897,941,942,967,968,1000,1002,1004,1005,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1130,1132,1134,1141,1142,1145,1149,1152,],[-381,-341,-346,-136,-378,-144,-138,-142,-137,-379,-345,-348,-349,-350,-342,-380,-139,-347,-130,-30,-141,-128,-140,-129,-108,365,-96,-111,-88,-63,-107,-35,-127,-77,-58,-143,-122,-45,-343,-50,-40,-119,-343,-389,-155,-156,-134,-135,-37,-133,-68,-116,505,523,-132,-113,-60,-123,-112,-131,-32,-126,-42,-53,-81,-91,-100,-47,-391,-399,-392,-398,-117,-119,-383,-385,-118,523,-109,-120,-121,-110,-133,523,-132,-131,-341,-384,-157,-158,-114,-124,-146,-125,-115,-400,-387,-418,-417,-388,-344,-149,-343,523,-340,-335,-339,-152,-386,-36,-145,-147,-148,-31,365,-97,-99,-98,-79,-78,-80,-41,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,-46,-329,-466,-390,-43,-84,-73,-75,-82,-86,-69,-71,-33,-85,-74,-95,-70,-44,-83,-106,-57,-49,-93,-102,-104,-72,-61,-34,365,-55,-76,-87,-39,-38,-48,365,-62,-92,-94,-101,-105,-103,-56,-54,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-406,-421,-422,-337,-623,-163,-159,-423,-424,-403,-407,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,-427,-428,-409,-322,-623,-324,-161,-321,]),'XOR_ASSIGN':([59,60,64,72,73,74,76,78,87,90,95,96,101,109,118,120,124,126,127,140,141,146,149,153,156,157,158,159,171,176,179,185,242,251,255,259,260,268,297,361,515,538,560,561,562,563,564,576,579,584,587,603,611,612,614,616,635,641,645,647,659,670,713,785,786,798,818,831,833,835,836,838,842,914,941,942,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1152,],[253,-130,-341,-141,-128,-140,-346,-129,-136,-144,-138,-142,-137,-127,-345,-143,-348,-349,-343,-350,-342,-139,-347,-130,-141,-128,-140,-129,-127,-143,-343,253,-134,-135,-130,-128,-129,-127,-128,-128,-145,-146,-344,-147,-148,-149,-343,-128,-127,-343,-128,-328,-340,-335,-339,-152,-329,-145,-147,-148,-328,-329,-466,-150,-330,-331,-332,-336,-334,-338,-333,-151,-221,-128,-337,-623,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-321,]),'INT':([3,4,6,9,10,12,13,17,18,19,21,22,24,25,28,38,44,46,47,48,50,51,52,53,54,55,57,61,62,64,65,67,68,69,70,71,77,80,82,83,84,86,89,93,94,98,99,106,107,108,113,114,115,119,121,125,129,130,135,136,138,139,141,142,143,147,151,152,155,164,172,181,183,184,194,202,203,212,216,220,221,222,225,232,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,316,319,320,321,323,325,327,329,338,343,348,350,354,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,386,388,400,406,410,411,417,418,419,421,422,423,424,425,426,427,429,440,441,442,443,444,445,446,447,448,449,450,451,452,453,455,456,458,459,467,479,480,481,482,484,485,486,487,488,489,491,492,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,547,551,552,554,555,560,569,571,572,574,583,589,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,684,685,687,688,690,693,696,698,699,700,706,707,708,711,712,713,714,715,721,723,724,725,777,780,783,784,790,791,792,794,800,801,805,808,809,812,813,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,866,869,873,876,890,893,894,895,896,897,898,899,900,901,902,903,904,908,910,921,922,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,972,973,976,985,986,987,990,993,1000,1002,1004,1005,1008,1010,1011,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1064,1067,1072,1074,1077,1079,1080,1081,1082,1083,1084,1088,1089,1095,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1130,1132,1134,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[132,132,-448,-359,-366,-356,-358,-360,-586,-361,-362,-585,-357,-365,-451,-594,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,132,-341,-189,132,132,-190,-169,-203,-186,-204,132,-172,-362,-198,-196,-199,-262,132,-185,132,-192,-188,-187,132,-201,-170,-352,132,-174,-195,-173,132,-191,132,-342,-200,-197,132,-171,132,132,132,132,132,132,132,-529,-623,-553,-343,-588,-623,-452,132,-354,-623,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,132,-12,-8,-19,132,132,132,132,-205,-249,132,132,132,132,132,132,132,132,-286,132,-279,132,-167,132,132,132,132,-277,-175,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,-623,-351,-439,-430,-623,-567,132,-623,-566,-565,-352,-623,-351,-562,-528,-623,-478,-358,132,-473,-477,-469,-481,-352,-623,-501,-472,-471,-479,-476,-475,-480,-474,132,-524,-623,132,-519,-521,-527,-352,-522,-351,-525,-523,-526,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,-400,132,132,132,132,-344,-281,132,132,-228,132,132,-284,-287,-290,-623,-280,-164,-168,132,132,132,-278,-260,132,-283,132,132,-533,132,132,-441,-559,132,-352,132,-564,-563,-484,132,-470,-483,132,-502,-503,-466,-595,-587,132,-520,132,-516,-401,-405,-402,-404,132,132,132,132,132,132,132,-303,132,-288,-623,-285,-289,-296,-251,132,132,132,132,132,132,132,132,132,132,132,132,132,-536,-534,-440,-442,-623,-487,132,132,132,-406,-421,-422,132,132,132,132,132,132,132,-307,-282,132,132,-306,-297,132,132,132,132,-234,-263,132,-261,132,-185,-231,-308,132,132,-535,132,-443,-444,-486,-482,-570,-500,-506,-423,-424,-403,-407,-411,-408,-410,-310,-309,132,132,132,132,132,-264,132,-271,132,132,132,132,132,-446,-445,-569,132,-505,-412,-426,132,-425,132,132,-314,-312,132,-291,-313,-311,-274,-272,132,-266,132,-265,-276,-232,132,-427,-428,-409,-318,-316,132,-317,-315,-273,-267,132,132,132,-236,132,132,132,]),'RSHIFT_ASSIGN':([59,60,64,72,73,74,76,78,87,90,95,96,101,109,118,120,124,126,127,140,141,146,149,153,156,157,158,159,171,176,179,185,242,251,255,259,260,268,297,361,515,538,560,561,562,563,564,576,579,584,587,603,611,612,614,616,635,641,645,647,659,670,713,785,786,798,818,831,833,835,836,838,842,914,941,942,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1152,],[240,-130,-341,-141,-128,-140,-346,-129,-136,-144,-138,-142,-137,-127,-345,-143,-348,-349,-343,-350,-342,-139,-347,-130,-141,-128,-140,-129,-127,-143,-343,240,-134,-135,-130,-128,-129,-127,-128,-128,-145,-146,-344,-147,-148,-149,-343,-128,-127,-343,-128,-328,-340,-335,-339,-152,-329,-145,-147,-148,-328,-329,-466,-150,-330,-331,-332,-336,-334,-338,-333,-151,-221,-128,-337,-623,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-321,]),'OR':([58,64,76,87,88,90,95,96,101,102,118,124,126,140,141,144,146,149,153,154,156,157,158,159,160,161,162,163,165,166,167,168,170,171,173,175,176,177,178,179,180,182,185,212,235,236,237,242,251,254,255,256,257,258,259,260,261,262,265,266,268,269,270,271,272,273,274,276,280,281,285,289,292,293,313,315,342,353,355,361,366,387,389,390,460,462,463,468,470,493,494,495,529,530,538,542,543,547,548,550,553,556,560,563,564,587,611,612,614,616,632,638,641,645,647,648,649,651,652,653,654,655,656,657,659,660,661,662,663,664,665,666,667,668,669,670,713,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,749,750,751,752,753,754,755,756,757,758,759,761,762,763,764,765,766,767,768,770,772,775,777,780,783,784,785,786,798,805,818,831,833,835,836,838,842,855,857,895,896,897,941,942,967,968,1000,1002,1004,1005,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1130,1132,1134,1141,1142,1145,1149,1152,],[-381,-341,-346,-136,-378,-144,-138,-142,-137,-379,-345,-348,-349,-350,-342,-380,-139,-347,-130,-30,-141,-128,-140,-129,-108,-25,-96,-111,367,-88,-63,-107,-35,-127,-77,-58,-143,-122,-45,-343,-50,-40,-119,-343,-389,-155,-156,-134,-135,-37,-133,-68,-116,-27,524,-132,-113,-60,-123,-112,-131,-32,-126,-42,533,-53,-81,-91,-100,-47,-391,-399,-392,-398,-117,-119,-383,-385,-118,524,-109,-120,-121,-110,-133,524,-132,-131,-341,-384,-157,-158,-114,-124,-146,-125,-115,-400,-387,-418,-417,-388,-344,-149,-343,524,-340,-335,-339,-152,-386,-36,-145,-147,-148,-31,-26,-97,-99,-98,-79,-78,-80,-41,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,-46,-329,-466,-390,-43,-84,-73,-75,-82,-86,-69,-71,-33,-85,-74,-95,-70,-44,-83,-106,-57,-49,-93,-102,-104,-72,-61,-34,-29,-55,-76,-87,-39,-38,-48,-28,-62,-92,-94,-101,-105,-103,-56,-54,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-406,-421,-422,-337,-623,-163,-159,-423,-424,-403,-407,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,-427,-428,-409,-322,-623,-324,-161,-321,]),'CONTINUE':([3,54,55,57,61,65,68,69,70,71,77,80,83,86,89,93,94,99,106,107,108,113,115,119,129,130,135,136,138,142,143,151,194,203,221,233,283,299,311,319,321,325,327,348,350,569,574,592,593,596,597,599,601,602,628,630,637,672,687,700,713,725,812,815,816,817,819,828,849,863,864,908,910,924,925,934,943,948,949,953,957,962,970,1018,1019,1046,1047,1048,1055,1058,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1137,1139,1140,1143,1144,1147,1148,1151,1157,1160,],[104,-193,-206,-202,-194,-189,104,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,104,-192,-188,-187,-201,-170,-174,-195,-173,104,-191,-200,-197,-171,-529,-553,-452,-508,-205,-249,104,-286,-279,-167,104,-277,-175,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,104,-466,-516,-288,-285,-289,-296,-251,104,104,-536,-534,-307,-282,-306,-297,-234,-263,-261,104,-185,-231,-308,-535,-310,-309,-264,104,-271,104,104,-314,-312,-291,-313,-311,-274,-272,104,-266,104,-265,-276,-232,-318,-316,104,-317,-315,-273,-267,104,104,-236,104,104,]),'{':([3,5,7,8,14,16,31,36,42,43,45,54,55,57,61,64,65,68,69,70,71,77,80,83,86,89,93,94,99,100,106,107,108,113,115,119,129,130,135,136,138,141,142,143,144,151,190,191,193,194,196,198,200,201,203,212,218,220,221,222,227,228,230,231,233,236,237,283,285,289,292,293,299,311,318,319,321,325,327,331,335,348,350,353,392,393,394,400,403,405,410,411,413,414,415,428,431,432,433,438,439,440,441,442,444,445,446,447,450,451,452,453,454,455,456,458,459,467,478,494,495,547,550,553,560,569,574,592,593,596,597,599,601,602,611,612,614,625,626,627,628,630,632,637,671,672,679,680,681,685,687,699,700,701,705,706,707,711,712,713,721,722,725,770,772,775,777,780,783,784,795,812,814,815,816,817,819,828,830,831,832,835,839,849,863,864,866,869,870,872,885,890,892,895,896,897,908,910,918,921,924,925,934,941,942,943,948,949,953,957,962,970,971,973,976,979,980,982,986,988,990,994,1000,1002,1004,1005,1008,1010,1011,1018,1019,1023,1028,1037,1039,1046,1047,1048,1051,1055,1058,1064,1067,1069,1070,1071,1074,1078,1079,1080,1082,1088,1089,1097,1101,1102,1104,1110,1111,1112,1113,1114,1115,1118,1119,1123,1130,1132,1134,1135,1136,1137,1139,1140,1142,1143,1144,1147,1148,1150,1151,1157,1160,],[106,-623,195,-455,-623,202,-623,220,-511,-623,232,-193,-206,-202,-194,-341,-189,106,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,106,106,-192,-188,-187,-201,-170,-174,-195,-173,106,-191,-342,-200,-197,-380,-171,-457,-623,-458,-529,-454,-513,-514,-509,-553,-343,-623,106,-452,467,-510,-530,-460,-461,-508,-155,-156,-205,-391,-399,-392,-398,-249,106,106,-286,-279,-167,106,-381,-383,-277,-175,-385,-453,-459,-382,106,-623,220,-439,-430,-463,-515,-465,700,-531,-512,-456,-558,-554,106,-478,106,-473,-477,-469,-481,-501,-472,-471,-479,700,-476,-475,-480,-474,467,-462,-157,-158,-400,-418,-417,-344,-281,-228,-284,-287,-290,-623,-280,-164,-168,832,-335,832,-153,-154,832,-278,-260,-386,-283,-542,-533,-543,-541,-544,-441,-559,-484,106,-532,-557,-470,-483,-502,-503,-466,467,-555,-516,-419,-420,-393,-401,-405,-402,-404,106,-288,106,-285,-289,-296,-251,106,-384,-336,832,-338,944,106,-536,-534,-440,-442,-464,-623,-623,467,-556,-406,-421,-422,-307,-282,-298,832,-306,-297,-234,-337,220,-263,-261,106,-185,-231,-308,-535,-545,-443,-444,-494,-485,-495,-482,-507,-500,-623,-423,-424,-403,-407,-411,-408,-410,-310,-309,832,106,220,832,-264,106,-271,220,106,106,-446,-445,-499,-496,-497,467,-504,-412,-426,-425,-314,-312,-291,-313,220,-311,-274,-272,106,-266,106,-265,220,-276,-232,-427,-428,-409,-318,-316,106,-317,-315,220,-273,-267,106,106,-498,-236,106,106,]),'RSHIFT':([64,76,87,88,90,95,96,101,102,118,124,126,140,141,146,149,153,156,157,158,159,160,162,163,166,167,168,171,173,176,177,179,185,212,235,236,237,242,251,255,256,257,259,260,261,265,266,268,270,274,276,280,284,285,289,292,293,295,313,315,353,355,361,366,387,389,390,460,462,463,468,470,494,495,529,530,538,542,543,547,548,550,553,556,560,563,564,587,611,612,614,616,632,641,645,647,651,652,653,654,655,656,659,660,661,662,663,664,665,670,713,726,728,729,730,731,732,733,734,736,737,738,739,741,742,745,746,747,749,754,755,762,763,764,765,766,769,770,772,775,777,778,779,780,782,783,784,785,786,798,805,818,831,833,835,836,838,842,855,857,895,896,897,941,942,967,968,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1129,1130,1131,1132,1133,1134,1141,1142,1145,1149,1152,],[-341,-346,-136,-378,-144,-138,-142,-137,-379,-345,-348,-349,-350,-342,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,-88,372,-107,-127,-77,-143,-122,-343,-119,-343,-389,-155,-156,-134,-135,-133,498,-116,506,-132,-113,-123,-112,-131,-126,-81,-91,-100,-381,-391,-399,-392,-398,-383,-117,-119,-385,-118,506,-109,-120,-121,-110,-133,506,-132,-131,-341,-157,-158,-114,-124,-146,-125,-115,-400,-387,-418,-417,-388,-344,-149,-343,506,-340,-335,-339,-152,-386,-145,-147,-148,-97,-99,-98,-79,-78,-80,-328,-89,-90,372,372,372,372,-329,-466,-390,-84,372,372,-82,-86,372,372,-85,372,-95,372,-83,-106,-93,-102,-104,372,372,-87,-92,-94,-101,-105,-103,-384,-419,-420,-393,-401,895,896,-405,-380,-402,-404,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-406,-421,-422,-337,-623,-163,-159,895,-423,895,-424,895,-403,-407,895,896,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,895,-427,895,-428,895,-409,-322,-623,-324,-161,-321,]),'GTEQ':([64,76,87,90,95,96,101,118,124,126,140,141,146,149,153,156,157,158,159,160,162,163,166,167,168,171,173,175,176,177,179,185,242,251,255,256,257,259,260,261,265,266,268,270,274,276,280,313,315,355,361,366,387,389,390,460,462,463,468,470,529,530,538,542,543,560,563,564,587,611,612,614,616,641,645,647,651,652,653,654,655,656,659,660,661,662,663,664,665,670,713,728,731,732,736,738,741,742,745,746,747,755,762,763,764,765,766,785,786,798,805,818,831,833,835,836,838,842,857,941,942,967,968,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1149,1152,],[-341,-346,-136,-144,-138,-142,-137,-345,-348,-349,-350,-342,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,-88,-63,-107,-127,-77,380,-143,-122,-343,-119,-134,-135,-133,499,-116,507,-132,-113,-123,-112,-131,-126,-81,-91,-100,-117,-119,-118,507,-109,-120,-121,-110,-133,507,-132,-131,-341,-114,-124,-146,-125,-115,-344,-149,-343,507,-340,-335,-339,-152,-145,-147,-148,-97,-99,-98,-79,-78,-80,-328,-89,-90,-66,-67,-65,-64,-329,-466,-84,-82,-86,-85,-95,-83,-106,-93,-102,-104,-87,-92,-94,-101,-105,-103,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-162,-337,-623,-163,-159,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-161,-321,]),'DEFAULT':([54,55,57,61,65,69,70,71,77,80,83,86,89,93,94,99,107,108,113,115,119,129,130,135,138,142,143,151,194,203,221,233,236,237,283,299,319,321,325,348,350,494,495,569,574,592,593,596,597,599,601,602,625,626,628,630,637,672,687,713,725,812,815,816,817,863,864,879,908,910,924,925,934,943,944,948,953,957,962,970,988,989,1018,1019,1046,1047,1048,1049,1050,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1116,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[-193,-206,-202,-194,-189,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,-192,-188,-187,-201,-170,-174,-195,-173,-191,-200,-197,-171,-529,-553,-452,-508,-155,-156,-205,-249,-286,-279,-167,-277,-175,-157,-158,-281,-228,-284,-287,-290,-623,-280,-164,-168,-153,-154,-278,-260,-283,-533,-559,-466,-516,-288,-285,-289,-296,-536,-534,-623,-307,-282,-306,-297,-234,-263,1045,-261,-185,-231,-308,-535,-507,1074,-310,-309,-264,1045,-271,1045,-268,-314,-312,-291,-313,-311,-274,-272,-270,-266,1045,-265,-269,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'CHAR':([3,4,6,9,10,12,13,17,18,19,21,22,24,25,28,38,44,46,47,48,50,51,52,53,54,55,57,61,62,64,65,67,68,69,70,71,77,80,82,83,84,86,89,93,94,98,99,106,107,108,113,114,115,119,121,125,129,130,135,136,138,139,141,142,143,147,151,152,155,164,172,181,183,184,194,202,203,212,216,220,221,222,225,232,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,316,319,320,321,323,325,327,329,338,343,348,350,354,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,386,388,400,406,410,411,417,418,419,421,422,423,424,425,426,427,429,440,441,442,443,444,445,446,447,448,449,450,451,452,453,455,456,458,459,467,479,480,481,482,484,485,486,487,488,489,491,492,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,547,551,552,554,555,560,569,571,572,574,583,589,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,684,685,687,688,690,693,696,698,699,700,706,707,708,711,712,713,714,715,721,723,724,725,777,780,783,784,790,791,792,794,800,801,805,808,809,812,813,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,866,869,873,876,890,893,894,895,896,897,898,899,900,901,902,903,904,908,910,921,922,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,972,973,976,985,986,987,990,993,1000,1002,1004,1005,1008,1010,1011,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1064,1067,1072,1074,1077,1079,1080,1081,1082,1083,1084,1088,1089,1095,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1130,1132,1134,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[110,110,-448,-359,-366,-356,-358,-360,-586,-361,-362,-585,-357,-365,-451,-594,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,110,-341,-189,110,110,-190,-169,-203,-186,-204,110,-172,-362,-198,-196,-199,-262,110,-185,110,-192,-188,-187,110,-201,-170,-352,110,-174,-195,-173,110,-191,110,-342,-200,-197,110,-171,110,110,110,110,110,110,110,-529,-623,-553,-343,-588,-623,-452,110,-354,-623,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,110,-12,-8,-19,110,110,110,110,-205,-249,110,110,110,110,110,110,110,110,-286,110,-279,110,-167,110,110,110,110,-277,-175,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-623,-351,-439,-430,-623,-567,110,-623,-566,-565,-352,-623,-351,-562,-528,-623,-478,-358,110,-473,-477,-469,-481,-352,-623,-501,-472,-471,-479,-476,-475,-480,-474,110,-524,-623,110,-519,-521,-527,-352,-522,-351,-525,-523,-526,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-400,110,110,110,110,-344,-281,110,110,-228,110,110,-284,-287,-290,-623,-280,-164,-168,110,110,110,-278,-260,110,-283,110,110,-533,110,110,-441,-559,110,-352,110,-564,-563,-484,110,-470,-483,110,-502,-503,-466,-595,-587,110,-520,110,-516,-401,-405,-402,-404,110,110,110,110,110,110,110,-303,110,-288,-623,-285,-289,-296,-251,110,110,110,110,110,110,110,110,110,110,110,110,110,-536,-534,-440,-442,-623,-487,110,110,110,-406,-421,-422,110,110,110,110,110,110,110,-307,-282,110,110,-306,-297,110,110,110,110,-234,-263,110,-261,110,-185,-231,-308,110,110,-535,110,-443,-444,-486,-482,-570,-500,-506,-423,-424,-403,-407,-411,-408,-410,-310,-309,110,110,110,110,110,-264,110,-271,110,110,110,110,110,-446,-445,-569,110,-505,-412,-426,110,-425,110,110,-314,-312,110,-291,-313,-311,-274,-272,110,-266,110,-265,-276,-232,110,-427,-428,-409,-318,-316,110,-317,-315,-273,-267,110,110,110,-236,110,110,110,]),'LSHIFT_ASSIGN':([59,60,64,72,73,74,76,78,87,90,95,96,101,109,118,120,124,126,127,140,141,146,149,153,156,157,158,159,171,176,179,185,242,251,255,259,260,268,297,361,515,538,560,561,562,563,564,576,579,584,587,603,611,612,614,616,635,641,645,647,659,670,713,785,786,798,818,831,833,835,836,838,842,914,941,942,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1152,],[241,-130,-341,-141,-128,-140,-346,-129,-136,-144,-138,-142,-137,-127,-345,-143,-348,-349,-343,-350,-342,-139,-347,-130,-141,-128,-140,-129,-127,-143,-343,241,-134,-135,-130,-128,-129,-127,-128,-128,-145,-146,-344,-147,-148,-149,-343,-128,-127,-343,-128,-328,-340,-335,-339,-152,-329,-145,-147,-148,-328,-329,-466,-150,-330,-331,-332,-336,-334,-338,-333,-151,-221,-128,-337,-623,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-321,]),'WHILE':([3,54,55,57,61,65,68,69,70,71,77,80,83,86,89,93,94,99,106,107,108,113,115,119,129,130,135,136,138,142,143,151,194,203,221,233,283,299,311,319,321,325,327,348,350,351,569,574,592,593,596,597,599,601,602,628,630,637,672,687,700,713,725,812,815,816,817,819,828,849,863,864,908,910,924,925,934,943,948,949,953,957,962,970,1018,1019,1046,1047,1048,1055,1058,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1137,1139,1140,1143,1144,1147,1148,1151,1157,1160,],[111,-193,-206,-202,-194,-189,111,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,111,-192,-188,-187,-201,-170,-174,-195,-173,111,-191,-200,-197,-171,-529,-553,-452,-508,-205,-249,111,-286,-279,-167,111,-277,-175,629,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,111,-466,-516,-288,-285,-289,-296,-251,111,955,-536,-534,-307,-282,-306,-297,-234,-263,-261,955,-185,-231,-308,-535,-310,-309,-264,111,-271,955,111,-314,-312,-291,-313,-311,-274,-272,111,-266,111,-265,-276,-232,-318,-316,111,-317,-315,-273,-267,955,955,-236,955,955,]),'NEW':([3,4,54,55,57,61,62,65,68,69,70,71,77,80,82,83,86,89,93,94,98,99,106,107,108,113,115,119,122,129,130,135,136,138,139,142,143,147,151,152,155,164,181,183,184,194,203,221,222,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,302,303,307,310,311,312,314,319,320,321,323,325,327,328,329,338,343,348,350,356,357,360,363,365,367,368,369,370,371,372,373,374,375,376,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,519,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,569,571,572,574,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,687,700,713,721,725,790,791,792,794,799,800,801,802,805,812,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,890,893,894,902,903,904,908,910,921,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,1018,1019,1020,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1074,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[114,172,-193,-206,-202,-194,172,-189,114,-190,-169,-203,-186,-204,172,-172,-198,-196,-199,-262,172,-185,114,-192,-188,-187,-201,-170,339,-174,-195,-173,114,-191,172,-200,-197,172,-171,172,172,172,172,172,172,-529,-553,-452,172,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,172,-12,-8,-19,172,172,172,172,-205,-249,172,-325,172,172,172,114,114,172,-286,172,-279,172,-167,114,606,172,172,172,-277,-175,172,172,172,-325,172,172,172,172,172,172,172,172,172,172,606,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,-325,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,-281,172,172,-228,-284,-287,-290,-623,-280,-164,-168,172,172,172,-278,-260,172,-283,172,172,-533,172,-559,114,-466,172,-516,172,172,172,172,-325,114,172,606,172,-288,-285,-289,-296,-251,172,172,172,114,172,172,172,172,114,172,172,172,172,-536,-534,172,172,172,172,172,172,-307,-282,172,-306,-297,172,172,172,172,-234,-263,172,-261,114,-185,-231,-308,172,172,-535,-310,-309,-325,114,172,172,172,172,-264,114,-271,114,114,172,114,172,172,-314,-312,-291,-313,-311,-274,-272,114,-266,114,-265,-276,-232,172,-318,-316,114,-317,-315,-273,-267,172,114,114,-236,114,114,114,]),'NATIVE':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,28,29,34,35,37,38,39,40,44,46,47,48,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,125,129,130,135,138,141,142,143,151,194,195,202,203,204,205,206,207,212,214,215,216,220,221,225,226,232,233,283,299,312,316,319,321,325,327,348,350,400,406,417,418,421,422,423,425,426,427,429,430,435,440,441,442,444,445,446,447,449,450,451,452,453,455,456,458,459,479,480,482,484,485,487,488,489,491,492,560,569,574,583,589,592,593,596,597,599,601,602,628,630,637,672,673,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,808,809,812,813,815,816,817,863,864,873,876,881,908,910,924,925,934,943,948,953,957,962,970,985,986,987,990,991,993,1018,1019,1046,1047,1048,1056,1072,1077,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[19,19,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,19,-362,-585,19,-357,-365,-451,19,-608,-610,-612,-594,-611,19,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,19,-192,-188,-187,-201,-170,19,-174,-195,-173,-191,-342,-200,-197,-171,-529,19,19,-553,-619,19,19,19,-343,19,-609,-588,19,-452,-354,-605,19,-508,-205,-249,19,19,-286,-279,-167,19,-277,-175,19,19,19,-567,19,-566,-565,19,19,-562,-528,19,-614,19,-478,-358,-473,-477,-469,-481,19,-501,-472,-471,-479,-476,-475,-480,-474,-524,19,-519,-521,-527,-522,19,-525,-523,-526,-344,-281,-228,19,19,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,19,-559,-564,-563,-484,19,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,-303,19,-288,19,-285,-289,-296,-536,-534,19,-487,-615,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-486,-482,-570,-500,-617,-506,-310,-309,-264,19,-271,19,-569,-505,-314,-312,-291,-313,-311,-274,-272,19,-266,19,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'CASE':([54,55,57,61,65,69,70,71,77,80,83,86,89,93,94,99,107,108,113,115,119,129,130,135,138,142,143,151,194,203,221,233,283,299,319,321,325,348,350,569,574,592,593,596,597,599,601,602,628,630,637,672,687,713,725,812,815,816,817,863,864,908,910,924,925,934,943,944,948,953,957,962,970,1018,1019,1046,1047,1048,1049,1050,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1116,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[-193,-206,-202,-194,-189,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,-192,-188,-187,-201,-170,-174,-195,-173,-191,-200,-197,-171,-529,-553,-452,-508,-205,-249,-286,-279,-167,-277,-175,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,-466,-516,-288,-285,-289,-296,-536,-534,-307,-282,-306,-297,-234,-263,1044,-261,-185,-231,-308,-535,-310,-309,-264,1044,-271,1044,-268,-314,-312,-291,-313,-311,-274,-272,-270,-266,1044,-265,-269,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'TIMES_ASSIGN':([59,60,64,72,73,74,76,78,87,90,95,96,101,109,118,120,124,126,127,140,141,146,149,153,156,157,158,159,171,176,179,185,242,251,255,259,260,268,297,361,515,538,560,561,562,563,564,576,579,584,587,603,611,612,614,616,635,641,645,647,659,670,713,785,786,798,818,831,833,835,836,838,842,914,941,942,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1152,],[239,-130,-341,-141,-128,-140,-346,-129,-136,-144,-138,-142,-137,-127,-345,-143,-348,-349,-343,-350,-342,-139,-347,-130,-141,-128,-140,-129,-127,-143,-343,239,-134,-135,-130,-128,-129,-127,-128,-128,-145,-146,-344,-147,-148,-149,-343,-128,-127,-343,-128,-328,-340,-335,-339,-152,-329,-145,-147,-148,-328,-329,-466,-150,-330,-331,-332,-336,-334,-338,-333,-151,-221,-128,-337,-623,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-321,]),'&':([58,64,76,87,88,90,95,96,101,102,118,124,126,140,141,144,146,149,153,156,157,158,159,160,162,163,166,167,168,171,173,175,176,177,178,179,180,182,185,212,235,236,237,242,251,255,256,257,259,260,261,262,265,266,268,270,271,273,274,276,280,281,284,285,289,291,292,293,295,313,315,342,353,355,361,366,387,389,390,460,462,463,468,470,493,494,495,529,530,538,542,543,547,548,550,553,556,560,563,564,587,611,612,614,616,632,641,645,647,651,652,653,654,655,656,657,659,660,661,662,663,664,665,666,667,668,669,670,713,726,727,728,729,730,731,732,733,734,736,737,738,739,740,741,742,743,744,745,746,747,749,750,753,754,755,758,761,762,763,764,765,766,767,768,769,770,772,775,777,780,783,784,785,786,798,805,818,831,833,835,836,838,842,855,857,868,895,896,897,941,942,967,968,974,975,1000,1002,1004,1005,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1065,1066,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1130,1132,1134,1141,1142,1145,1149,1152,],[-381,-341,-346,-136,-378,-144,-138,-142,-137,-379,-345,-348,-349,-350,-342,-380,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,-88,-63,-107,-127,-77,-58,-143,-122,-45,-343,-50,388,-119,-343,-389,-155,-156,-134,-135,-133,-68,-116,514,-132,-113,-60,-123,-112,-131,-126,532,-53,-81,-91,-100,-47,-381,-391,-399,-380,-392,-398,-383,-117,-119,-383,-385,-118,514,-109,-120,-121,-110,-133,514,-132,-131,-341,-384,-157,-158,-114,-124,-146,-125,-115,-400,-387,-418,-417,-388,-344,-149,-343,514,-340,-335,-339,-152,-386,-145,-147,-148,-97,-99,-98,-79,-78,-80,388,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,-46,-329,-466,-390,388,-84,-73,-75,-82,-86,-69,-71,-85,-74,-95,-70,388,-83,-106,-57,-49,-93,-102,-104,-72,-61,-55,-76,-87,-48,-62,-92,-94,-101,-105,-103,-56,-54,-384,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,972,-406,-421,-422,-337,-623,-163,-159,-436,972,-423,-424,-403,-407,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-438,-437,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,-427,-428,-409,-322,-623,-324,-161,-321,]),'*':([0,64,76,87,90,95,96,101,118,124,126,140,141,146,149,153,156,157,158,159,160,162,163,166,168,171,176,177,179,185,242,251,255,257,259,260,261,265,266,268,270,276,280,313,315,355,361,366,387,389,390,434,460,462,463,468,470,529,530,538,542,543,560,563,564,587,611,612,614,616,641,645,647,651,652,653,659,660,661,670,703,713,738,742,745,746,747,762,763,764,765,766,785,786,798,805,818,831,833,835,836,838,842,855,857,941,942,967,968,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1149,1152,],[3,-341,-346,-136,-144,-138,-142,-137,-345,-348,-349,-350,-342,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,369,-107,-127,-143,-122,-343,-119,-134,-135,-133,-116,517,-132,-113,-123,-112,-131,-126,539,-100,-117,-119,-118,517,-109,-120,-121,-110,702,-133,517,-132,-131,-341,-114,-124,-146,-125,-115,-344,-149,-343,517,-340,-335,-339,-152,-145,-147,-148,-97,-99,-98,-328,369,369,-329,882,-466,369,-106,369,-102,-104,369,369,-101,-105,-103,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-337,-623,-163,-159,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-161,-321,]),'.':([56,58,63,64,72,73,74,75,76,81,87,90,95,96,101,109,110,116,118,120,123,124,126,127,132,133,137,140,141,146,149,150,156,157,158,171,174,176,179,189,211,212,216,219,236,237,259,268,284,285,289,292,293,295,297,300,331,335,337,342,353,361,362,364,379,436,462,468,470,477,493,494,495,515,538,547,550,553,560,561,562,563,564,576,579,584,586,587,603,611,612,614,616,632,635,639,641,642,644,645,647,659,670,694,713,769,770,772,775,777,780,783,784,785,786,798,805,818,830,831,833,835,836,838,842,855,856,875,895,896,897,914,941,942,1000,1002,1004,1005,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1130,1132,1134,1141,1142,1145,1152,],[-370,234,-374,-341,-141,302,-140,-377,-346,-372,-136,-144,-138,-142,-137,328,-375,336,-345,-143,-371,-348,-349,-343,-373,-369,-376,-350,-342,-139,-347,358,-141,363,-140,376,336,-143,-343,391,434,-343,437,437,-155,-156,519,376,546,-391,-399,-392,-398,437,302,557,610,437,617,437,-385,519,336,557,617,703,519,376,-341,437,437,-157,-158,-145,-146,-400,-418,-417,-344,-147,-148,-149,-343,799,802,-343,358,519,-328,-340,-335,-339,-152,-386,-329,854,-145,557,617,-147,-148,-328,-329,-343,-466,437,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-145,-332,437,-336,-334,-338,-333,-151,-221,519,336,-343,-406,-421,-422,1020,-337,-623,-423,-424,-403,-407,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,-427,-428,-409,-322,-623,-324,-321,]),'STRICTFP':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,28,29,34,35,37,38,39,40,44,46,47,48,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,125,129,130,135,138,141,142,143,151,194,195,202,203,204,205,206,207,212,214,215,216,220,221,225,226,232,233,283,299,312,316,319,321,325,327,348,350,400,406,417,418,421,422,423,425,426,427,429,430,435,440,441,442,444,445,446,447,449,450,451,452,453,455,456,458,459,479,480,482,484,485,487,488,489,491,492,560,569,574,583,589,592,593,596,597,599,601,602,628,630,637,672,673,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,808,809,812,813,815,816,817,863,864,873,876,881,908,910,924,925,934,943,948,953,957,962,970,985,986,987,990,991,993,1018,1019,1046,1047,1048,1056,1072,1077,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[25,25,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,25,-362,-585,25,-357,-365,-451,25,-608,-610,-612,-594,-611,25,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,25,-192,-188,-187,-201,-170,25,-174,-195,-173,-191,-342,-200,-197,-171,-529,25,25,-553,-619,25,25,25,-343,25,-609,-588,25,-452,-354,-605,25,-508,-205,-249,25,25,-286,-279,-167,25,-277,-175,25,25,25,-567,25,-566,-565,25,25,-562,-528,25,-614,25,-478,-358,-473,-477,-469,-481,25,-501,-472,-471,-479,-476,-475,-480,-474,-524,25,-519,-521,-527,-522,25,-525,-523,-526,-344,-281,-228,25,25,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,25,-559,-564,-563,-484,25,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,-303,25,-288,25,-285,-289,-296,-536,-534,25,-487,-615,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-486,-482,-570,-500,-617,-506,-310,-309,-264,25,-271,25,-569,-505,-314,-312,-291,-313,-311,-274,-272,25,-266,25,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'SWITCH':([3,54,55,57,61,65,68,69,70,71,77,80,83,86,89,93,94,99,106,107,108,113,115,119,129,130,135,136,138,142,143,151,194,203,221,233,283,299,311,319,321,325,327,348,350,569,574,592,593,596,597,599,601,602,628,630,637,672,687,700,713,725,812,815,816,817,819,828,849,863,864,908,910,924,925,934,943,948,949,953,957,962,970,1018,1019,1046,1047,1048,1055,1058,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1137,1139,1140,1143,1144,1147,1148,1151,1157,1160,],[117,-193,-206,-202,-194,-189,117,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,117,-192,-188,-187,-201,-170,-174,-195,-173,117,-191,-200,-197,-171,-529,-553,-452,-508,-205,-249,117,-286,-279,-167,117,-277,-175,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,117,-466,-516,-288,-285,-289,-296,-251,117,117,-536,-534,-307,-282,-306,-297,-234,-263,-261,117,-185,-231,-308,-535,-310,-309,-264,117,-271,117,117,-314,-312,-291,-313,-311,-274,-272,117,-266,117,-265,-276,-232,-318,-316,117,-317,-315,-273,-267,117,117,-236,117,117,]),'NUM':([3,4,54,55,57,61,62,65,68,69,70,71,77,80,82,83,86,89,93,94,98,99,106,107,108,113,115,119,129,130,135,136,138,139,142,143,147,151,152,155,164,181,183,184,194,203,221,222,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,319,320,321,323,325,327,329,338,343,348,350,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,569,571,572,574,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,687,700,713,721,725,790,791,792,794,800,801,805,812,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,890,893,894,902,903,904,908,910,921,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1074,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[118,118,-193,-206,-202,-194,118,-189,118,-190,-169,-203,-186,-204,118,-172,-198,-196,-199,-262,118,-185,118,-192,-188,-187,-201,-170,-174,-195,-173,118,-191,118,-200,-197,118,-171,118,118,118,118,118,118,-529,-553,-452,118,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,118,-12,-8,-19,118,118,118,118,-205,-249,118,118,118,118,118,118,118,-286,118,-279,118,-167,118,118,118,118,-277,-175,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,-281,118,118,-228,-284,-287,-290,-623,-280,-164,-168,118,118,118,-278,-260,118,-283,118,118,-533,118,-559,118,-466,118,-516,118,118,118,118,118,118,118,-288,-285,-289,-296,-251,118,118,118,118,118,118,118,118,118,118,118,118,118,-536,-534,118,118,118,118,118,118,-307,-282,118,-306,-297,118,118,118,118,-234,-263,118,-261,118,-185,-231,-308,118,118,-535,-310,-309,118,118,118,118,118,-264,118,-271,118,118,118,118,118,118,-314,-312,-291,-313,-311,-274,-272,118,-266,118,-265,-276,-232,118,-318,-316,118,-317,-315,-273,-267,118,118,118,-236,118,118,118,]),'CATCH':([317,319,592,593,597,601,812,816,1097,],[594,-286,594,-287,594,-164,-288,594,-291,]),':':([58,64,76,87,88,90,92,95,96,101,102,105,118,124,126,127,140,141,144,146,149,153,154,156,157,158,159,160,161,162,163,165,166,167,168,170,171,173,175,176,177,178,179,180,182,185,186,187,188,212,235,236,237,242,251,285,289,292,293,313,315,342,352,353,355,366,387,389,390,493,494,495,496,538,547,548,550,553,556,560,563,564,611,612,614,616,625,626,632,638,641,645,647,648,649,650,651,652,653,654,655,656,657,659,660,661,662,663,664,665,666,667,668,669,670,713,726,748,760,770,772,775,777,780,783,784,785,786,798,803,805,818,831,833,835,836,838,842,857,895,896,897,916,917,941,942,951,967,968,969,1000,1002,1004,1005,1008,1010,1011,1017,1022,1029,1037,1038,1040,1041,1042,1043,1045,1051,1060,1062,1079,1080,1082,1087,1098,1102,1105,1107,1108,1109,1117,1118,1125,1130,1132,1134,1141,1142,1145,1149,1152,],[-381,-341,-346,-136,-378,-144,311,-138,-142,-137,-379,323,-345,-348,-349,-230,-350,-342,-380,-139,-347,-130,-30,-141,-128,-140,-129,-108,-25,-96,-111,-20,-88,-63,-107,-35,-127,-77,-58,-143,-122,-45,-343,-50,-40,-119,-1,-3,-4,-343,-389,-155,-156,-134,-135,-391,-399,-392,-398,-117,-119,-383,631,-385,-118,-109,-120,-121,-110,-384,-157,-158,-7,-146,-400,-387,-418,-417,-388,-344,-149,-343,-340,-335,-339,-152,-153,-154,-386,-36,-145,-147,-148,-31,-26,860,-97,-99,-98,-79,-78,-80,-41,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,-46,-329,-466,-390,893,894,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-623,-145,-332,-336,-334,-338,-333,-151,-221,-162,-406,-421,-422,-252,-623,-337,-623,1055,-163,-159,-21,-423,-424,-403,-407,-411,-408,-410,-225,-253,-226,-623,-217,-216,-326,-320,-327,1110,-623,-227,-160,-412,-426,-425,-222,-223,-623,-319,-218,-275,1143,-323,-623,-224,-427,-428,-409,-322,-623,-324,-161,-321,]),'>':([64,76,87,88,90,95,96,101,102,118,124,126,140,141,146,149,153,156,157,158,159,160,162,163,166,167,168,171,173,175,176,177,179,185,212,235,236,237,242,251,255,256,257,259,260,261,265,266,268,270,274,276,280,284,285,286,288,289,291,292,293,295,300,313,315,337,353,354,355,361,366,387,389,390,408,409,460,462,463,468,470,494,495,529,530,538,542,543,547,548,550,553,555,556,560,563,564,587,611,612,614,616,632,641,645,647,651,652,653,654,655,656,659,660,661,662,663,664,665,670,713,726,728,731,732,736,738,741,742,745,746,747,755,762,763,764,765,766,769,770,771,772,773,774,775,777,778,779,780,782,783,784,785,786,798,805,818,831,833,835,836,838,842,855,857,868,895,896,897,901,941,942,967,968,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1065,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1129,1130,1131,1132,1133,1134,1141,1142,1145,1149,1152,],[-341,-346,-136,-378,-144,-138,-142,-137,-379,-345,-348,-349,-350,-342,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,-88,-63,-107,-127,-77,383,-143,-122,-343,-119,-343,-389,-155,-156,-134,-135,-133,504,-116,521,-132,-113,-123,-112,-131,-126,-81,-91,-100,-381,-391,547,553,-399,-380,-392,-398,-383,-388,-117,-119,-387,-385,632,-118,521,-109,-120,-121,-110,-429,685,-133,521,-132,-131,-341,-157,-158,-114,-124,-146,-125,-115,-400,-387,-418,-417,632,-388,-344,-149,-343,521,-340,-335,-339,-152,-386,-145,-147,-148,-97,-99,-98,-79,-78,-80,-328,-89,-90,-66,-67,-65,-64,-329,-466,-390,-84,-82,-86,-85,-95,-83,-106,-93,-102,-104,-87,-92,-94,-101,-105,-103,-384,-419,547,-420,547,547,-393,-401,547,553,-405,-380,-402,-404,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-383,-162,547,-406,-421,-422,632,-337,-623,-163,-159,547,-423,547,-424,547,-403,-407,547,553,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,547,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,547,-427,547,-428,547,-409,-322,-623,-324,-161,-321,]),'INSTANCEOF':([58,64,76,87,88,90,95,96,101,102,118,124,126,140,141,144,146,149,153,156,157,158,159,160,162,163,166,167,168,171,173,175,176,177,179,180,185,212,235,236,237,242,251,255,256,257,259,260,261,262,265,266,268,270,273,274,276,280,285,289,292,293,313,315,342,353,355,361,366,387,389,390,460,462,463,468,470,493,494,495,529,530,538,542,543,547,548,550,553,556,560,563,564,587,611,612,614,616,632,641,645,647,651,652,653,654,655,656,659,660,661,662,663,664,665,666,667,668,670,713,726,728,729,730,731,732,733,734,736,737,738,739,741,742,743,745,746,747,749,750,753,754,755,761,762,763,764,765,766,767,768,770,772,775,777,780,783,784,785,786,798,805,818,831,833,835,836,838,842,855,857,895,896,897,941,942,967,968,1000,1002,1004,1005,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1130,1132,1134,1141,1142,1145,1149,1152,],[-381,-341,-346,-136,-378,-144,-138,-142,-137,-379,-345,-348,-349,-350,-342,-380,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,-88,-63,-107,-127,-77,-58,-143,-122,-343,386,-119,-343,-389,-155,-156,-134,-135,-133,-68,-116,522,-132,-113,-60,-123,-112,-131,-126,535,-81,-91,-100,-391,-399,-392,-398,-117,-119,-383,-385,-118,522,-109,-120,-121,-110,-133,522,-132,-131,-341,-384,-157,-158,-114,-124,-146,-125,-115,-400,-387,-418,-417,-388,-344,-149,-343,522,-340,-335,-339,-152,-386,-145,-147,-148,-97,-99,-98,-79,-78,-80,-328,-89,-90,-66,-67,-65,-64,386,386,-59,-329,-466,-390,-84,-73,-75,-82,-86,-69,-71,-85,-74,-95,-70,-83,-106,386,-93,-102,-104,-72,-61,386,-76,-87,-62,-92,-94,-101,-105,-103,386,386,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-406,-421,-422,-337,-623,-163,-159,-423,-424,-403,-407,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,-427,-428,-409,-322,-623,-324,-161,-321,]),'PACKAGE':([2,9,10,12,13,17,18,19,21,22,24,25,38,40,47,48,50,51,53,64,141,212,216,225,560,714,715,],[32,-359,-366,-356,-358,-360,-586,-361,-362,-585,-357,-365,-594,224,-363,-364,-584,-353,-355,-341,-342,-343,-588,-354,-344,-595,-587,]),'RRSHIFT_ASSIGN':([59,60,64,72,73,74,76,78,87,90,95,96,101,109,118,120,124,126,127,140,141,146,149,153,156,157,158,159,171,176,179,185,242,251,255,259,260,268,297,361,515,538,560,561,562,563,564,576,579,584,587,603,611,612,614,616,635,641,645,647,659,670,713,785,786,798,818,831,833,835,836,838,842,914,941,942,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1152,],[243,-130,-341,-141,-128,-140,-346,-129,-136,-144,-138,-142,-137,-127,-345,-143,-348,-349,-343,-350,-342,-139,-347,-130,-141,-128,-140,-129,-127,-143,-343,243,-134,-135,-130,-128,-129,-127,-128,-128,-145,-146,-344,-147,-148,-149,-343,-128,-127,-343,-128,-328,-340,-335,-339,-152,-329,-145,-147,-148,-328,-329,-466,-150,-330,-331,-332,-336,-334,-338,-333,-151,-221,-128,-337,-623,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-321,]),'ELLIPSIS':([56,58,63,64,75,81,88,91,102,110,123,132,133,137,141,144,212,235,236,237,285,289,292,293,340,342,353,493,494,495,547,548,550,553,556,560,632,726,770,772,775,777,780,783,784,871,895,896,897,1000,1002,1004,1005,1008,1010,1011,1079,1080,1082,1130,1132,1134,],[-370,-381,-374,-341,-377,-372,-378,-368,-379,-375,-371,-373,-369,-376,-342,-380,-343,-389,-155,-156,-391,-399,-392,-398,-367,-383,-385,-384,-157,-158,-400,-387,-418,-417,-388,-344,-386,-390,-419,-420,-393,-401,-405,-402,-404,978,-406,-421,-422,-423,-424,-403,-407,-411,-408,-410,-412,-426,-425,-427,-428,-409,]),'BYTE':([3,4,6,9,10,12,13,17,18,19,21,22,24,25,28,38,44,46,47,48,50,51,52,53,54,55,57,61,62,64,65,67,68,69,70,71,77,80,82,83,84,86,89,93,94,98,99,106,107,108,113,114,115,119,121,125,129,130,135,136,138,139,141,142,143,147,151,152,155,164,172,181,183,184,194,202,203,212,216,220,221,222,225,232,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,316,319,320,321,323,325,327,329,338,343,348,350,354,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,386,388,400,406,410,411,417,418,419,421,422,423,424,425,426,427,429,440,441,442,443,444,445,446,447,448,449,450,451,452,453,455,456,458,459,467,479,480,481,482,484,485,486,487,488,489,491,492,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,547,551,552,554,555,560,569,571,572,574,583,589,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,684,685,687,688,690,693,696,698,699,700,706,707,708,711,712,713,714,715,721,723,724,725,777,780,783,784,790,791,792,794,800,801,805,808,809,812,813,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,866,869,873,876,890,893,894,895,896,897,898,899,900,901,902,903,904,908,910,921,922,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,972,973,976,985,986,987,990,993,1000,1002,1004,1005,1008,1010,1011,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1064,1067,1072,1074,1077,1079,1080,1081,1082,1083,1084,1088,1089,1095,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1130,1132,1134,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[123,123,-448,-359,-366,-356,-358,-360,-586,-361,-362,-585,-357,-365,-451,-594,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,123,-341,-189,123,123,-190,-169,-203,-186,-204,123,-172,-362,-198,-196,-199,-262,123,-185,123,-192,-188,-187,123,-201,-170,-352,123,-174,-195,-173,123,-191,123,-342,-200,-197,123,-171,123,123,123,123,123,123,123,-529,-623,-553,-343,-588,-623,-452,123,-354,-623,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,123,-12,-8,-19,123,123,123,123,-205,-249,123,123,123,123,123,123,123,123,-286,123,-279,123,-167,123,123,123,123,-277,-175,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,-623,-351,-439,-430,-623,-567,123,-623,-566,-565,-352,-623,-351,-562,-528,-623,-478,-358,123,-473,-477,-469,-481,-352,-623,-501,-472,-471,-479,-476,-475,-480,-474,123,-524,-623,123,-519,-521,-527,-352,-522,-351,-525,-523,-526,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,-400,123,123,123,123,-344,-281,123,123,-228,123,123,-284,-287,-290,-623,-280,-164,-168,123,123,123,-278,-260,123,-283,123,123,-533,123,123,-441,-559,123,-352,123,-564,-563,-484,123,-470,-483,123,-502,-503,-466,-595,-587,123,-520,123,-516,-401,-405,-402,-404,123,123,123,123,123,123,123,-303,123,-288,-623,-285,-289,-296,-251,123,123,123,123,123,123,123,123,123,123,123,123,123,-536,-534,-440,-442,-623,-487,123,123,123,-406,-421,-422,123,123,123,123,123,123,123,-307,-282,123,123,-306,-297,123,123,123,123,-234,-263,123,-261,123,-185,-231,-308,123,123,-535,123,-443,-444,-486,-482,-570,-500,-506,-423,-424,-403,-407,-411,-408,-410,-310,-309,123,123,123,123,123,-264,123,-271,123,123,123,123,123,-446,-445,-569,123,-505,-412,-426,123,-425,123,123,-314,-312,123,-291,-313,-311,-274,-272,123,-266,123,-265,-276,-232,123,-427,-428,-409,-318,-316,123,-317,-315,-273,-267,123,123,123,-236,123,123,123,]),'^':([58,64,76,87,88,90,95,96,101,102,118,124,126,140,141,144,146,149,153,156,157,158,159,160,162,163,166,167,168,170,171,173,175,176,177,178,179,180,182,185,212,235,236,237,242,251,254,255,256,257,259,260,261,262,265,266,268,270,271,273,274,276,280,281,285,289,292,293,313,315,342,353,355,361,366,387,389,390,460,462,463,468,470,493,494,495,529,530,538,542,543,547,548,550,553,556,560,563,564,587,611,612,614,616,632,638,641,645,647,651,652,653,654,655,656,657,659,660,661,662,663,664,665,666,667,668,669,670,713,726,727,728,729,730,731,732,733,734,736,737,738,739,740,741,742,743,744,745,746,747,749,750,753,754,755,756,757,758,761,762,763,764,765,766,767,768,770,772,775,777,780,783,784,785,786,798,805,818,831,833,835,836,838,842,855,857,895,896,897,941,942,967,968,1000,1002,1004,1005,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1130,1132,1134,1141,1142,1145,1149,1152,],[-381,-341,-346,-136,-378,-144,-138,-142,-137,-379,-345,-348,-349,-350,-342,-380,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,-88,-63,-107,375,-127,-77,-58,-143,-122,-45,-343,-50,-40,-119,-343,-389,-155,-156,-134,-135,497,-133,-68,-116,510,-132,-113,-60,-123,-112,-131,-126,-42,-53,-81,-91,-100,-47,-391,-399,-392,-398,-117,-119,-383,-385,-118,510,-109,-120,-121,-110,-133,510,-132,-131,-341,-384,-157,-158,-114,-124,-146,-125,-115,-400,-387,-418,-417,-388,-344,-149,-343,510,-340,-335,-339,-152,-386,375,-145,-147,-148,-97,-99,-98,-79,-78,-80,-41,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,-46,-329,-466,-390,-43,-84,-73,-75,-82,-86,-69,-71,-85,-74,-95,-70,-44,-83,-106,-57,-49,-93,-102,-104,-72,-61,-55,-76,-87,375,375,-48,-62,-92,-94,-101,-105,-103,-56,-54,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-406,-421,-422,-337,-623,-163,-159,-423,-424,-403,-407,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,-427,-428,-409,-322,-623,-324,-161,-321,]),'IMPLEMENTS':([5,8,31,43,64,141,144,190,191,193,196,212,218,285,289,292,293,331,335,353,393,394,410,411,431,433,438,547,550,553,560,632,685,701,705,722,770,772,775,777,780,783,784,830,866,869,892,895,896,897,973,976,1000,1002,1004,1005,1008,1010,1011,1064,1067,1079,1080,1082,1130,1132,1134,],[-623,-455,-623,229,-341,-342,-380,-457,229,-458,-454,-343,229,-391,-399,-392,-398,-381,-383,-385,-459,-382,-439,-430,-531,-456,-558,-400,-418,-417,-344,-386,-441,-532,-557,-555,-419,-420,-393,-401,-405,-402,-404,-384,-440,-442,-556,-406,-421,-422,-443,-444,-423,-424,-403,-407,-411,-408,-410,-446,-445,-412,-426,-425,-427,-428,-409,]),'FALSE':([3,4,54,55,57,61,62,65,68,69,70,71,77,80,82,83,86,89,93,94,98,99,106,107,108,113,115,119,129,130,135,136,138,139,142,143,147,151,152,155,164,181,183,184,194,203,221,222,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,319,320,321,323,325,327,329,338,343,348,350,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,569,571,572,574,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,687,700,713,721,725,790,791,792,794,800,801,805,812,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,890,893,894,902,903,904,908,910,921,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1074,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[126,126,-193,-206,-202,-194,126,-189,126,-190,-169,-203,-186,-204,126,-172,-198,-196,-199,-262,126,-185,126,-192,-188,-187,-201,-170,-174,-195,-173,126,-191,126,-200,-197,126,-171,126,126,126,126,126,126,-529,-553,-452,126,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,126,-12,-8,-19,126,126,126,126,-205,-249,126,126,126,126,126,126,126,-286,126,-279,126,-167,126,126,126,126,-277,-175,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,-281,126,126,-228,-284,-287,-290,-623,-280,-164,-168,126,126,126,-278,-260,126,-283,126,126,-533,126,-559,126,-466,126,-516,126,126,126,126,126,126,126,-288,-285,-289,-296,-251,126,126,126,126,126,126,126,126,126,126,126,126,126,-536,-534,126,126,126,126,126,126,-307,-282,126,-306,-297,126,126,126,126,-234,-263,126,-261,126,-185,-231,-308,126,126,-535,-310,-309,126,126,126,126,126,-264,126,-271,126,126,126,126,126,126,-314,-312,-291,-313,-311,-274,-272,126,-266,126,-265,-276,-232,126,-318,-316,126,-317,-315,-273,-267,126,126,126,-236,126,126,126,]),'NAME':([3,4,6,9,10,12,13,17,18,19,21,22,24,25,27,28,30,32,38,44,46,47,48,50,51,52,53,54,55,56,57,58,61,62,63,64,65,67,68,69,70,71,73,75,77,80,81,82,83,84,86,88,89,91,93,94,98,99,102,104,106,107,108,110,113,114,115,116,119,121,123,125,127,128,129,130,131,132,133,135,136,137,138,139,141,142,143,144,147,151,152,155,164,172,181,183,184,192,194,195,197,199,202,203,208,209,210,212,213,216,217,220,221,222,223,224,225,229,232,233,234,235,236,237,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,285,289,292,293,299,300,301,302,303,307,310,311,312,314,316,319,320,321,323,325,327,328,329,330,337,338,339,340,341,342,343,348,350,353,354,356,357,358,360,363,365,367,368,369,370,371,372,373,374,375,376,377,378,380,381,382,383,384,385,386,388,391,395,400,401,402,406,410,411,417,418,419,421,422,423,424,425,426,427,429,434,437,440,441,442,443,444,445,446,447,448,449,450,451,452,453,455,456,458,459,467,476,479,480,481,482,484,485,486,487,488,489,491,492,493,494,495,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,519,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,546,547,548,550,551,552,553,554,555,556,559,560,564,569,571,572,574,576,581,583,584,589,591,592,593,596,597,599,601,602,604,606,610,613,615,620,623,627,628,630,631,632,636,637,640,641,646,658,672,673,678,683,684,685,686,687,688,690,693,694,695,696,698,699,700,703,706,707,708,709,711,712,713,714,715,716,721,723,724,725,726,770,772,775,777,780,783,784,790,791,792,794,799,800,801,802,804,805,808,809,810,812,813,815,816,817,819,820,824,826,827,828,829,832,840,847,849,851,854,858,859,860,863,864,866,869,871,873,874,875,876,883,890,893,894,895,896,897,898,899,900,901,902,903,904,908,910,921,922,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,972,973,976,978,981,985,986,987,990,993,1000,1002,1004,1005,1008,1010,1011,1018,1019,1020,1021,1023,1025,1026,1027,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1064,1067,1072,1074,1077,1079,1080,1081,1082,1083,1084,1088,1089,1095,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1127,1130,1132,1134,1135,1136,1137,1138,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[127,179,-448,-359,-366,-356,-358,-360,-586,-361,-362,-585,-357,-365,212,-451,212,212,-594,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-370,-202,-381,-194,179,-374,-341,-189,212,127,-190,-169,-203,-383,-377,-186,-204,-372,179,-172,-362,-198,-378,-196,-368,-199,-262,179,-185,-379,322,127,-192,-188,-375,-187,212,-201,-367,-170,-352,-371,212,-343,345,-174,-195,349,-373,-369,-173,127,-376,-191,179,-342,-200,-197,-380,179,-171,179,179,179,212,179,179,179,212,-529,-623,408,212,-623,-553,431,432,433,-343,212,-588,438,-623,-452,179,212,212,-354,212,-623,-508,212,-389,-155,-156,-9,-15,-14,-16,-11,-18,-13,-17,-10,179,-12,-8,-19,179,179,179,179,-205,-391,-399,-392,-398,-249,-388,179,564,179,179,179,127,584,179,212,-286,179,-279,179,-167,127,603,179,212,-387,179,212,-367,345,-383,179,-277,-175,-385,212,179,179,635,179,564,179,179,179,179,179,179,179,179,179,179,659,179,179,179,179,179,179,179,179,212,179,670,671,-623,-352,212,-351,-439,-430,-623,-567,694,-623,-566,-565,-352,-623,-351,-562,-528,212,212,-623,-478,-358,694,-473,-477,-469,-481,-352,-623,-501,-472,-471,-479,-476,-475,-480,-474,179,722,-524,-623,212,-519,-521,-527,-352,-522,-351,-525,-523,-526,-384,-157,-158,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,564,179,179,212,179,179,179,179,179,179,179,179,179,179,212,179,179,179,179,179,179,179,212,-400,-387,-418,212,212,-417,212,212,-388,789,-344,-343,-281,179,179,-228,-383,803,212,-343,212,345,-284,-287,-290,-623,-280,-164,-168,821,212,212,179,179,212,345,179,-278,-260,179,-386,852,-283,179,179,789,821,-533,-623,179,408,212,-441,212,-559,212,-352,875,-343,878,-564,-563,-484,127,212,-470,-483,875,884,-502,-503,-466,-595,-587,212,179,-520,212,-516,-390,-419,-420,-393,-401,-405,-402,-404,179,179,179,179,564,584,179,603,917,179,-303,212,345,-288,-623,-285,-289,-296,-251,179,179,212,179,127,179,179,179,179,127,179,212,179,179,179,-536,-534,-440,-442,345,-623,984,-343,-487,992,179,179,179,-406,-421,-422,212,212,212,212,179,179,179,-307,-282,179,212,-306,-297,179,179,179,179,-234,-263,179,-261,127,-185,-231,-308,179,179,-535,212,-443,-444,345,212,-486,-482,-570,-500,-506,-423,-424,-403,-407,-411,-408,-410,-310,-309,564,584,179,-293,345,-294,179,179,179,-264,127,-271,127,584,179,127,179,-446,-445,-569,179,-505,-412,-426,212,-425,212,212,-314,-312,212,-291,-313,-311,-274,-272,127,-266,127,-265,-276,-232,179,212,-427,-428,-409,-318,-316,127,-295,-317,-315,-273,-267,179,127,127,-236,584,127,127,]),'LTEQ':([64,76,87,90,95,96,101,118,124,126,140,141,146,149,153,156,157,158,159,160,162,163,166,167,168,171,173,175,176,177,179,185,242,251,255,256,257,259,260,261,265,266,268,270,274,276,280,313,315,355,361,366,387,389,390,460,462,463,468,470,529,530,538,542,543,560,563,564,587,611,612,614,616,641,645,647,651,652,653,654,655,656,659,660,661,662,663,664,665,670,713,728,731,732,736,738,741,742,745,746,747,755,762,763,764,765,766,785,786,798,805,818,831,833,835,836,838,842,857,941,942,967,968,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1149,1152,],[-341,-346,-136,-144,-138,-142,-137,-345,-348,-349,-350,-342,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,-88,-63,-107,-127,-77,381,-143,-122,-343,-119,-134,-135,-133,500,-116,526,-132,-113,-123,-112,-131,-126,-81,-91,-100,-117,-119,-118,526,-109,-120,-121,-110,-133,526,-132,-131,-341,-114,-124,-146,-125,-115,-344,-149,-343,526,-340,-335,-339,-152,-145,-147,-148,-97,-99,-98,-79,-78,-80,-328,-89,-90,-66,-67,-65,-64,-329,-466,-84,-82,-86,-85,-95,-83,-106,-93,-102,-104,-87,-92,-94,-101,-105,-103,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-162,-337,-623,-163,-159,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-161,-321,]),'REMAINDER_ASSIGN':([59,60,64,72,73,74,76,78,87,90,95,96,101,109,118,120,124,126,127,140,141,146,149,153,156,157,158,159,171,176,179,185,242,251,255,259,260,268,297,361,515,538,560,561,562,563,564,576,579,584,587,603,611,612,614,616,635,641,645,647,659,670,713,785,786,798,818,831,833,835,836,838,842,914,941,942,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1152,],[244,-130,-341,-141,-128,-140,-346,-129,-136,-144,-138,-142,-137,-127,-345,-143,-348,-349,-343,-350,-342,-139,-347,-130,-141,-128,-140,-129,-127,-143,-343,244,-134,-135,-130,-128,-129,-127,-128,-128,-145,-146,-344,-147,-148,-149,-343,-128,-127,-343,-128,-328,-340,-335,-339,-152,-329,-145,-147,-148,-328,-329,-466,-150,-330,-331,-332,-336,-334,-338,-333,-151,-221,-128,-337,-623,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-321,]),'OR_ASSIGN':([59,60,64,72,73,74,76,78,87,90,95,96,101,109,118,120,124,126,127,140,141,146,149,153,156,157,158,159,171,176,179,185,242,251,255,259,260,268,297,361,515,538,560,561,562,563,564,576,579,584,587,603,611,612,614,616,635,641,645,647,659,670,713,785,786,798,818,831,833,835,836,838,842,914,941,942,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1152,],[245,-130,-341,-141,-128,-140,-346,-129,-136,-144,-138,-142,-137,-127,-345,-143,-348,-349,-343,-350,-342,-139,-347,-130,-141,-128,-140,-129,-127,-143,-343,245,-134,-135,-130,-128,-129,-127,-128,-128,-145,-146,-344,-147,-148,-149,-343,-128,-127,-343,-128,-328,-340,-335,-339,-152,-329,-145,-147,-148,-328,-329,-466,-150,-330,-331,-332,-336,-334,-338,-333,-151,-221,-128,-337,-623,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-321,]),'BREAK':([3,54,55,57,61,65,68,69,70,71,77,80,83,86,89,93,94,99,106,107,108,113,115,119,129,130,135,136,138,142,143,151,194,203,221,233,283,299,311,319,321,325,327,348,350,569,574,592,593,596,597,599,601,602,628,630,637,672,687,700,713,725,812,815,816,817,819,828,849,863,864,908,910,924,925,934,943,948,949,953,957,962,970,1018,1019,1046,1047,1048,1055,1058,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1137,1139,1140,1143,1144,1147,1148,1151,1157,1160,],[131,-193,-206,-202,-194,-189,131,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,131,-192,-188,-187,-201,-170,-174,-195,-173,131,-191,-200,-197,-171,-529,-553,-452,-508,-205,-249,131,-286,-279,-167,131,-277,-175,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,131,-466,-516,-288,-285,-289,-296,-251,131,131,-536,-534,-307,-282,-306,-297,-234,-263,-261,131,-185,-231,-308,-535,-310,-309,-264,131,-271,131,131,-314,-312,-291,-313,-311,-274,-272,131,-266,131,-265,-276,-232,-318,-316,131,-317,-315,-273,-267,131,131,-236,131,131,]),'BOOLEAN':([3,4,6,9,10,12,13,17,18,19,21,22,24,25,28,38,44,46,47,48,50,51,52,53,54,55,57,61,62,64,65,67,68,69,70,71,77,80,82,83,84,86,89,93,94,98,99,106,107,108,113,114,115,119,121,125,129,130,135,136,138,139,141,142,143,147,151,152,155,164,172,181,183,184,194,202,203,212,216,220,221,222,225,232,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,316,319,320,321,323,325,327,329,338,343,348,350,354,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,386,388,400,406,410,411,417,418,419,421,422,423,424,425,426,427,429,440,441,442,443,444,445,446,447,448,449,450,451,452,453,455,456,458,459,467,479,480,481,482,484,485,486,487,488,489,491,492,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,547,551,552,554,555,560,569,571,572,574,583,589,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,684,685,687,688,690,693,696,698,699,700,706,707,708,711,712,713,714,715,721,723,724,725,777,780,783,784,790,791,792,794,800,801,805,808,809,812,813,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,866,869,873,876,890,893,894,895,896,897,898,899,900,901,902,903,904,908,910,921,922,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,972,973,976,985,986,987,990,993,1000,1002,1004,1005,1008,1010,1011,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1064,1067,1072,1074,1077,1079,1080,1081,1082,1083,1084,1088,1089,1095,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1130,1132,1134,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[133,133,-448,-359,-366,-356,-358,-360,-586,-361,-362,-585,-357,-365,-451,-594,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,133,-341,-189,133,133,-190,-169,-203,-186,-204,133,-172,-362,-198,-196,-199,-262,133,-185,133,-192,-188,-187,133,-201,-170,-352,133,-174,-195,-173,133,-191,133,-342,-200,-197,133,-171,133,133,133,133,133,133,133,-529,-623,-553,-343,-588,-623,-452,133,-354,-623,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,133,-12,-8,-19,133,133,133,133,-205,-249,133,133,133,133,133,133,133,133,-286,133,-279,133,-167,133,133,133,133,-277,-175,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,-623,-351,-439,-430,-623,-567,133,-623,-566,-565,-352,-623,-351,-562,-528,-623,-478,-358,133,-473,-477,-469,-481,-352,-623,-501,-472,-471,-479,-476,-475,-480,-474,133,-524,-623,133,-519,-521,-527,-352,-522,-351,-525,-523,-526,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,-400,133,133,133,133,-344,-281,133,133,-228,133,133,-284,-287,-290,-623,-280,-164,-168,133,133,133,-278,-260,133,-283,133,133,-533,133,133,-441,-559,133,-352,133,-564,-563,-484,133,-470,-483,133,-502,-503,-466,-595,-587,133,-520,133,-516,-401,-405,-402,-404,133,133,133,133,133,133,133,-303,133,-288,-623,-285,-289,-296,-251,133,133,133,133,133,133,133,133,133,133,133,133,133,-536,-534,-440,-442,-623,-487,133,133,133,-406,-421,-422,133,133,133,133,133,133,133,-307,-282,133,133,-306,-297,133,133,133,133,-234,-263,133,-261,133,-185,-231,-308,133,133,-535,133,-443,-444,-486,-482,-570,-500,-506,-423,-424,-403,-407,-411,-408,-410,-310,-309,133,133,133,133,133,-264,133,-271,133,133,133,133,133,-446,-445,-569,133,-505,-412,-426,133,-425,133,133,-314,-312,133,-291,-313,-311,-274,-272,133,-266,133,-265,-276,-232,133,-427,-428,-409,-318,-316,133,-317,-315,-273,-267,133,133,133,-236,133,133,133,]),'VOLATILE':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,28,29,34,35,37,38,39,40,44,46,47,48,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,125,129,130,135,138,141,142,143,151,194,195,202,203,204,205,206,207,212,214,215,216,220,221,225,226,232,233,283,299,312,316,319,321,325,327,348,350,400,406,417,418,421,422,423,425,426,427,429,430,435,440,441,442,444,445,446,447,449,450,451,452,453,455,456,458,459,479,480,482,484,485,487,488,489,491,492,560,569,574,583,589,592,593,596,597,599,601,602,628,630,637,672,673,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,808,809,812,813,815,816,817,863,864,873,876,881,908,910,924,925,934,943,948,953,957,962,970,985,986,987,990,991,993,1018,1019,1046,1047,1048,1056,1072,1077,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[48,48,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,48,-362,-585,48,-357,-365,-451,48,-608,-610,-612,-594,-611,48,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,48,-192,-188,-187,-201,-170,48,-174,-195,-173,-191,-342,-200,-197,-171,-529,48,48,-553,-619,48,48,48,-343,48,-609,-588,48,-452,-354,-605,48,-508,-205,-249,48,48,-286,-279,-167,48,-277,-175,48,48,48,-567,48,-566,-565,48,48,-562,-528,48,-614,48,-478,-358,-473,-477,-469,-481,48,-501,-472,-471,-479,-476,-475,-480,-474,-524,48,-519,-521,-527,-522,48,-525,-523,-526,-344,-281,-228,48,48,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,48,-559,-564,-563,-484,48,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,-303,48,-288,48,-285,-289,-296,-536,-534,48,-487,-615,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-486,-482,-570,-500,-617,-506,-310,-309,-264,48,-271,48,-569,-505,-314,-312,-291,-313,-311,-274,-272,48,-266,48,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'PUBLIC':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,28,29,34,35,37,38,39,40,44,46,47,48,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,125,129,130,135,138,141,142,143,151,194,195,202,203,204,205,206,207,212,214,215,216,220,221,225,226,232,233,283,299,312,316,319,321,325,327,348,350,400,406,417,418,421,422,423,425,426,427,429,430,435,440,441,442,444,445,446,447,449,450,451,452,453,455,456,458,459,479,480,482,484,485,487,488,489,491,492,560,569,574,583,589,592,593,596,597,599,601,602,628,630,637,672,673,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,808,809,812,813,815,816,817,863,864,873,876,881,908,910,924,925,934,943,948,953,957,962,970,985,986,987,990,991,993,1018,1019,1046,1047,1048,1056,1072,1077,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[53,53,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,53,-362,-585,53,-357,-365,-451,53,-608,-610,-612,-594,-611,53,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,53,-192,-188,-187,-201,-170,53,-174,-195,-173,-191,-342,-200,-197,-171,-529,53,53,-553,-619,53,53,53,-343,53,-609,-588,53,-452,-354,-605,53,-508,-205,-249,53,53,-286,-279,-167,53,-277,-175,53,53,53,-567,53,-566,-565,53,53,-562,-528,53,-614,53,-478,-358,-473,-477,-469,-481,53,-501,-472,-471,-479,-476,-475,-480,-474,-524,53,-519,-521,-527,-522,53,-525,-523,-526,-344,-281,-228,53,53,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,53,-559,-564,-563,-484,53,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,-303,53,-288,53,-285,-289,-296,-536,-534,53,-487,-615,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-486,-482,-570,-500,-617,-506,-310,-309,-264,53,-271,53,-569,-505,-314,-312,-291,-313,-311,-274,-272,53,-266,53,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'~':([4,62,82,98,139,147,152,155,164,181,183,184,222,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,301,303,307,310,314,320,323,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,721,790,791,792,794,801,805,820,824,827,829,832,840,847,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,964,965,1023,1035,1039,1044,1057,1059,1074,1126,1146,],[181,267,181,181,181,181,181,267,181,181,181,181,267,-9,-15,-14,-16,-11,-18,-13,-17,-10,181,-12,-8,-19,181,181,181,181,181,181,181,181,267,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,267,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,267,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,267,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,267,181,181,]),'DO':([3,54,55,57,61,65,68,69,70,71,77,80,83,86,89,93,94,99,106,107,108,113,115,119,129,130,135,136,138,142,143,151,194,203,221,233,283,299,311,319,321,325,327,348,350,569,574,592,593,596,597,599,601,602,628,630,637,672,687,700,713,725,812,815,816,817,819,828,849,863,864,908,910,924,925,934,943,948,949,953,957,962,970,1018,1019,1046,1047,1048,1055,1058,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1137,1139,1140,1143,1144,1147,1148,1151,1157,1160,],[136,-193,-206,-202,-194,-189,136,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,136,-192,-188,-187,-201,-170,-174,-195,-173,136,-191,-200,-197,-171,-529,-553,-452,-508,-205,-249,136,-286,-279,-167,136,-277,-175,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,136,-466,-516,-288,-285,-289,-296,-251,136,136,-536,-534,-307,-282,-306,-297,-234,-263,-261,136,-185,-231,-308,-535,-310,-309,-264,136,-271,136,136,-314,-312,-291,-313,-311,-274,-272,136,-266,136,-265,-276,-232,-318,-316,136,-317,-315,-273,-267,136,136,-236,136,136,]),'ABSTRACT':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,28,29,34,35,37,38,39,40,44,46,47,48,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,125,129,130,135,138,141,142,143,151,194,195,202,203,204,205,206,207,212,214,215,216,220,221,225,226,232,233,283,299,312,316,319,321,325,327,348,350,400,406,417,418,421,422,423,425,426,427,429,430,435,440,441,442,444,445,446,447,449,450,451,452,453,455,456,458,459,479,480,482,484,485,487,488,489,491,492,560,569,574,583,589,592,593,596,597,599,601,602,628,630,637,672,673,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,808,809,812,813,815,816,817,863,864,873,876,881,908,910,924,925,934,943,948,953,957,962,970,985,986,987,990,991,993,1018,1019,1046,1047,1048,1056,1072,1077,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[9,9,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,9,-362,-585,9,-357,-365,-451,9,-608,-610,-612,-594,-611,9,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,9,-192,-188,-187,-201,-170,9,-174,-195,-173,-191,-342,-200,-197,-171,-529,9,9,-553,-619,9,9,9,-343,9,-609,-588,9,-452,-354,-605,9,-508,-205,-249,9,9,-286,-279,-167,9,-277,-175,9,9,9,-567,9,-566,-565,9,9,-562,-528,9,-614,9,-478,-358,-473,-477,-469,-481,9,-501,-472,-471,-479,-476,-475,-480,-474,-524,9,-519,-521,-527,-522,9,-525,-523,-526,-344,-281,-228,9,9,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,9,-559,-564,-563,-484,9,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,-303,9,-288,9,-285,-289,-296,-536,-534,9,-487,-615,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-486,-482,-570,-500,-617,-506,-310,-309,-264,9,-271,9,-569,-505,-314,-312,-291,-313,-311,-274,-272,9,-266,9,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'ASSERT':([3,54,55,57,61,65,68,69,70,71,77,80,83,86,89,93,94,99,106,107,108,113,115,119,129,130,135,136,138,142,143,151,194,203,221,233,283,299,311,319,321,325,327,348,350,569,574,592,593,596,597,599,601,602,628,630,637,672,687,700,713,725,812,815,816,817,819,828,849,863,864,908,910,924,925,934,943,948,949,953,957,962,970,1018,1019,1046,1047,1048,1055,1058,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1137,1139,1140,1143,1144,1147,1148,1151,1157,1160,],[139,-193,-206,-202,-194,-189,139,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,139,-192,-188,-187,-201,-170,-174,-195,-173,139,-191,-200,-197,-171,-529,-553,-452,-508,-205,-249,139,-286,-279,-167,139,-277,-175,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,139,-466,-516,-288,-285,-289,-296,-251,139,139,-536,-534,-307,-282,-306,-297,-234,-263,-261,139,-185,-231,-308,-535,-310,-309,-264,139,-271,139,139,-314,-312,-291,-313,-311,-274,-272,139,-266,139,-265,-276,-232,-318,-316,139,-317,-315,-273,-267,139,139,-236,139,139,]),'LSHIFT':([64,76,87,90,95,96,101,118,124,126,140,141,146,149,153,156,157,158,159,160,162,163,166,167,168,171,173,176,177,179,185,242,251,255,256,257,259,260,261,265,266,268,270,274,276,280,313,315,355,361,366,387,389,390,460,462,463,468,470,529,530,538,542,543,560,563,564,587,611,612,614,616,641,645,647,651,652,653,654,655,656,659,660,661,662,663,664,665,670,713,728,729,730,731,732,733,734,736,737,738,739,741,742,745,746,747,749,754,755,762,763,764,765,766,785,786,798,805,818,831,833,835,836,838,842,855,857,941,942,967,968,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1149,1152,],[-341,-346,-136,-144,-138,-142,-137,-345,-348,-349,-350,-342,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,-88,373,-107,-127,-77,-143,-122,-343,-119,-134,-135,-133,501,-116,511,-132,-113,-123,-112,-131,-126,-81,-91,-100,-117,-119,-118,511,-109,-120,-121,-110,-133,511,-132,-131,-341,-114,-124,-146,-125,-115,-344,-149,-343,511,-340,-335,-339,-152,-145,-147,-148,-97,-99,-98,-79,-78,-80,-328,-89,-90,373,373,373,373,-329,-466,-84,373,373,-82,-86,373,373,-85,373,-95,373,-83,-106,-93,-102,-104,373,373,-87,-92,-94,-101,-105,-103,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-337,-623,-163,-159,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-161,-321,]),'NULL':([3,4,54,55,57,61,62,65,68,69,70,71,77,80,82,83,86,89,93,94,98,99,106,107,108,113,115,119,129,130,135,136,138,139,142,143,147,151,152,155,164,181,183,184,194,203,221,222,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,319,320,321,323,325,327,329,338,343,348,350,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,569,571,572,574,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,687,700,713,721,725,790,791,792,794,800,801,805,812,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,890,893,894,902,903,904,908,910,921,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1074,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[140,140,-193,-206,-202,-194,140,-189,140,-190,-169,-203,-186,-204,140,-172,-198,-196,-199,-262,140,-185,140,-192,-188,-187,-201,-170,-174,-195,-173,140,-191,140,-200,-197,140,-171,140,140,140,140,140,140,-529,-553,-452,140,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,140,-12,-8,-19,140,140,140,140,-205,-249,140,140,140,140,140,140,140,-286,140,-279,140,-167,140,140,140,140,-277,-175,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,-281,140,140,-228,-284,-287,-290,-623,-280,-164,-168,140,140,140,-278,-260,140,-283,140,140,-533,140,-559,140,-466,140,-516,140,140,140,140,140,140,140,-288,-285,-289,-296,-251,140,140,140,140,140,140,140,140,140,140,140,140,140,-536,-534,140,140,140,140,140,140,-307,-282,140,-306,-297,140,140,140,140,-234,-263,140,-261,140,-185,-231,-308,140,140,-535,-310,-309,140,140,140,140,140,-264,140,-271,140,140,140,140,140,140,-314,-312,-291,-313,-311,-274,-272,140,-266,140,-265,-276,-232,140,-318,-316,140,-317,-315,-273,-267,140,140,140,-236,140,140,140,]),'!':([4,62,82,98,139,147,152,155,164,181,183,184,222,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,301,303,307,310,314,320,323,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,721,790,791,792,794,801,805,820,824,827,829,832,840,847,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,964,965,1023,1035,1039,1044,1057,1059,1074,1126,1146,],[183,277,183,183,183,183,183,277,183,183,183,183,277,-9,-15,-14,-16,-11,-18,-13,-17,-10,183,-12,-8,-19,183,183,183,183,183,183,183,183,277,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,277,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,277,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,277,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,277,183,183,]),'%':([64,76,87,90,95,96,101,118,124,126,140,141,146,149,153,156,157,158,159,160,162,163,166,168,171,176,177,179,185,242,251,255,257,259,260,261,265,266,268,270,276,280,313,315,355,361,366,387,389,390,460,462,463,468,470,529,530,538,542,543,560,563,564,587,611,612,614,616,641,645,647,651,652,653,659,660,661,670,713,738,742,745,746,747,762,763,764,765,766,785,786,798,805,818,831,833,835,836,838,842,855,857,941,942,967,968,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1149,1152,],[-341,-346,-136,-144,-138,-142,-137,-345,-348,-349,-350,-342,-139,-347,-130,-141,-128,-140,-129,-108,-96,-111,370,-107,-127,-143,-122,-343,-119,-134,-135,-133,-116,512,-132,-113,-123,-112,-131,-126,540,-100,-117,-119,-118,512,-109,-120,-121,-110,-133,512,-132,-131,-341,-114,-124,-146,-125,-115,-344,-149,-343,512,-340,-335,-339,-152,-145,-147,-148,-97,-99,-98,-328,370,370,-329,-466,370,-106,370,-102,-104,370,370,-101,-105,-103,-150,-330,-331,-145,-332,-336,-334,-338,-333,-151,-221,-128,-162,-337,-623,-163,-159,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-161,-321,]),')':([18,22,38,50,56,58,60,63,64,72,75,76,78,79,81,87,88,90,95,96,101,102,103,110,118,120,123,124,126,132,133,137,140,141,144,145,146,149,153,154,156,157,158,159,160,161,162,163,165,166,167,168,170,171,173,175,176,177,178,179,180,182,185,186,187,188,212,216,222,235,236,237,242,251,254,255,256,257,258,259,260,261,262,263,265,266,268,269,270,271,272,273,274,275,276,279,280,281,282,285,289,292,293,303,313,315,331,335,342,343,345,353,355,357,361,362,366,387,389,390,417,421,449,460,461,462,463,464,465,466,468,469,470,471,473,474,475,493,494,495,496,529,530,538,542,543,547,548,550,553,556,560,563,564,565,566,567,568,570,571,572,575,587,588,590,600,608,611,612,614,615,616,618,622,624,625,626,632,633,634,638,639,641,642,643,644,645,647,648,649,651,652,653,654,655,656,657,659,660,661,662,663,664,665,666,667,668,669,670,678,689,690,691,692,697,710,713,714,715,720,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,749,750,751,752,753,754,755,756,757,758,759,761,762,763,764,765,766,767,768,770,772,775,777,780,783,784,785,786,790,791,792,796,797,798,805,806,807,808,818,820,824,827,829,830,831,833,835,836,837,838,840,842,844,846,851,853,855,857,865,876,886,888,889,891,895,896,897,902,903,904,905,906,907,909,913,919,923,926,927,928,929,930,931,933,935,941,942,945,946,947,963,964,966,967,968,969,977,983,985,987,993,996,997,998,1000,1002,1004,1005,1008,1010,1011,1012,1013,1014,1017,1021,1024,1029,1030,1031,1032,1034,1035,1037,1038,1040,1041,1042,1043,1051,1052,1060,1061,1062,1063,1068,1072,1077,1079,1080,1082,1087,1090,1091,1092,1093,1094,1096,1098,1102,1103,1105,1107,1117,1118,1122,1124,1125,1130,1132,1134,1141,1142,1145,1149,1152,1156,1158,],[-586,-585,-594,-584,-370,-381,-211,-374,-341,-213,-377,-346,-210,-209,-372,-136,-378,-144,-138,-142,-137,-379,-208,-375,-345,-212,-371,-348,-349,-373,-369,-376,-350,-342,-380,-207,-139,-347,-130,-30,-141,-128,-140,-129,-108,-25,-96,-111,-20,-88,-63,-107,-35,-127,-77,-58,-143,-122,-45,-343,-50,-40,-119,-1,-3,-4,-343,-588,-623,-389,-155,-156,-134,-135,-37,-133,-68,-116,-27,515,-132,-113,-60,-2,-123,-112,-131,-32,-126,-42,-22,-53,-81,538,-91,-6,-100,-47,-5,-391,-399,-392,-398,-623,-117,-119,-381,-383,-383,-623,-623,-385,-118,-623,641,-623,-109,-120,-121,-110,-623,-623,-623,-133,714,-575,-132,715,-596,-589,-131,-591,-341,-590,-574,-577,-576,-384,-157,-158,-7,-114,-124,-146,-125,-115,-400,-387,-418,-417,-388,-344,-149,-343,793,-546,-548,-547,795,-623,-623,-242,805,-623,-301,819,828,-340,-335,-339,-623,-152,839,842,-182,-153,-154,-386,849,850,-36,-623,-145,858,859,-153,-147,-148,-31,-26,-97,-99,-98,-79,-78,-80,-41,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,-46,-329,-623,872,-489,-488,-490,879,885,-466,-595,-587,-581,-390,-43,-84,-73,-75,-82,-86,-69,-71,-33,-85,-74,-95,-70,-44,-83,-106,-57,-49,-93,-102,-104,-72,-61,-34,-29,-55,-76,-87,-39,-38,-48,-28,-62,-92,-94,-101,-105,-103,-56,-54,-419,-420,-393,-401,-405,-402,-404,-150,-330,-623,-623,-623,911,912,-331,-145,918,-300,-299,-332,-623,-623,-623,-623,-384,-336,-334,-338,-333,942,-151,-623,-221,-183,-184,-623,965,-128,-162,971,-487,-592,-580,-579,-593,-406,-421,-422,-623,-623,-623,1015,1016,1017,-549,-243,-302,1028,1029,-623,-623,-623,1033,-623,1036,1037,-337,-623,1051,-623,1053,1060,-623,-623,-163,-159,-21,-492,-491,-486,-570,-506,-578,-24,-23,-423,-424,-403,-407,-411,-408,-410,1085,1086,1087,-225,-623,-304,-226,1098,1099,1100,1102,-623,-623,-217,-216,-326,-320,-327,-623,1118,-227,1125,-160,1126,-493,-569,-505,-412,-426,-425,-222,-247,1137,-246,-248,-305,-292,-223,-623,1142,-319,-218,-323,-623,1147,1148,-224,-427,-428,-409,-322,-623,-324,-161,-321,-623,1160,]),'-':([4,62,64,76,82,87,90,95,96,98,101,118,124,126,139,140,141,146,147,149,152,153,155,156,157,158,159,160,162,163,164,166,168,171,173,176,177,179,181,183,184,185,222,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,255,257,259,260,261,264,265,266,267,268,270,274,276,277,278,280,301,303,307,310,313,314,315,320,323,329,338,343,355,356,357,360,361,365,366,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,387,388,389,390,460,462,463,467,468,470,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,529,530,531,532,533,534,536,537,538,539,540,541,542,543,544,545,560,563,564,571,572,587,611,612,613,614,615,616,627,631,640,641,645,647,651,652,653,654,655,656,659,660,661,670,678,713,721,728,731,732,736,738,741,742,745,746,747,755,762,763,764,765,766,785,786,790,791,792,794,798,801,805,818,820,824,827,829,831,832,833,835,836,838,840,842,847,851,855,857,859,860,890,893,894,902,903,904,921,927,928,929,931,941,942,946,964,967,968,1017,1023,1029,1035,1037,1038,1039,1040,1041,1042,1043,1044,1051,1057,1059,1060,1062,1074,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1146,1149,1152,],[184,278,-341,-346,184,-136,-144,-138,-142,184,-137,-345,-348,-349,184,-350,-342,-139,184,-347,184,-130,278,-141,-128,-140,-129,-108,-96,-111,184,-88,-107,-127,378,-143,-122,-343,184,184,184,-119,278,-9,-15,-14,-134,-16,-11,-18,-13,-17,-10,184,-12,-135,-8,-19,-133,-116,508,-132,-113,184,-123,-112,184,-131,-126,537,-91,184,184,-100,184,184,184,184,-117,278,-119,184,184,184,184,184,-118,184,184,184,508,184,-109,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,-120,184,-121,-110,-133,508,-132,278,-131,-341,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,-114,-124,184,184,184,184,184,184,-146,184,184,184,-125,-115,184,184,-344,-149,-343,184,184,508,-340,-335,184,-339,184,-152,184,184,184,-145,-147,-148,-97,-99,-98,378,378,378,-328,-89,-90,-329,184,-466,278,378,378,378,378,-95,378,-106,-93,-102,-104,378,-92,-94,-101,-105,-103,-150,-330,184,184,184,184,-331,184,-145,-332,184,184,184,184,-336,184,-334,-338,-333,-151,184,-221,184,184,-128,-162,184,184,278,184,184,184,184,184,184,184,184,184,184,-337,-623,184,184,-163,-159,-225,184,-226,184,-623,-217,184,-216,-326,-320,-327,184,-623,184,184,-227,-160,278,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,184,-161,-321,]),'PRIVATE':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,28,29,34,35,37,38,39,40,44,46,47,48,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,125,129,130,135,138,141,142,143,151,194,195,202,203,204,205,206,207,212,214,215,216,220,221,225,226,232,233,283,299,312,316,319,321,325,327,348,350,400,406,417,418,421,422,423,425,426,427,429,430,435,440,441,442,444,445,446,447,449,450,451,452,453,455,456,458,459,479,480,482,484,485,487,488,489,491,492,560,569,574,583,589,592,593,596,597,599,601,602,628,630,637,672,673,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,808,809,812,813,815,816,817,863,864,873,876,881,908,910,924,925,934,943,948,953,957,962,970,985,986,987,990,991,993,1018,1019,1046,1047,1048,1056,1072,1077,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[24,24,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,24,-362,-585,24,-357,-365,-451,24,-608,-610,-612,-594,-611,24,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,24,-192,-188,-187,-201,-170,24,-174,-195,-173,-191,-342,-200,-197,-171,-529,24,24,-553,-619,24,24,24,-343,24,-609,-588,24,-452,-354,-605,24,-508,-205,-249,24,24,-286,-279,-167,24,-277,-175,24,24,24,-567,24,-566,-565,24,24,-562,-528,24,-614,24,-478,-358,-473,-477,-469,-481,24,-501,-472,-471,-479,-476,-475,-480,-474,-524,24,-519,-521,-527,-522,24,-525,-523,-526,-344,-281,-228,24,24,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,24,-559,-564,-563,-484,24,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,-303,24,-288,24,-285,-289,-296,-536,-534,24,-487,-615,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-486,-482,-570,-500,-617,-506,-310,-309,-264,24,-271,24,-569,-505,-314,-312,-291,-313,-311,-274,-272,24,-266,24,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'=':([59,60,64,72,73,74,76,78,87,90,95,96,101,109,118,120,124,126,127,140,141,146,149,153,156,157,158,159,171,176,179,185,212,236,237,242,251,255,259,260,268,297,345,347,361,470,494,495,515,538,560,561,562,563,564,576,579,584,587,603,611,612,614,616,624,625,626,635,641,645,647,659,670,713,785,786,798,803,811,818,831,833,835,836,838,842,878,884,887,914,916,917,920,941,942,1017,1022,1029,1037,1038,1040,1041,1042,1043,1051,1060,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1152,],[252,-130,-341,-141,-128,-140,-346,-129,-136,-144,-138,-142,-137,-127,-345,-143,-348,-349,-343,-350,-342,-139,-347,-130,-141,-128,-140,-129,-127,-143,-343,252,-343,-155,-156,-134,-135,-130,-128,-129,-127,-128,-623,627,-128,721,-157,-158,-145,-146,-344,-147,-148,-149,-343,-128,-127,-343,-128,-328,-340,-335,-339,-152,-182,-153,-154,-329,-145,-147,-148,-328,-329,-466,-150,-330,-331,-623,921,-332,-336,-334,-338,-333,-151,-221,-623,-623,721,-128,-182,-623,1023,-337,-623,-225,-182,-226,-623,-217,-216,-326,-320,-327,-623,-227,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-321,]),'CLASS':([2,3,6,9,10,11,12,13,15,17,18,19,20,21,22,23,24,25,26,28,29,34,35,37,38,39,40,44,46,47,48,49,50,51,52,53,54,55,57,61,64,65,69,70,71,77,80,83,84,86,89,93,94,99,106,107,108,113,115,119,121,125,129,130,135,138,141,142,143,151,194,202,203,204,205,206,207,212,214,215,216,220,221,225,226,232,233,283,299,302,319,321,325,326,327,336,348,350,363,400,418,419,422,423,424,425,426,427,429,430,435,440,441,442,443,444,445,446,447,448,450,451,452,453,455,456,458,459,479,480,481,482,484,485,486,487,488,489,491,492,519,557,560,569,574,592,593,596,597,599,601,602,617,628,630,637,672,687,696,698,699,700,704,706,707,711,712,713,714,715,723,725,799,812,815,816,817,863,864,881,908,910,924,925,934,943,948,953,957,962,970,986,990,991,1018,1019,1020,1046,1047,1048,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1139,1140,1143,1144,1151,],[-623,-623,-448,-359,-366,-618,-356,-358,-613,-360,-586,-361,-623,-362,-585,-623,-357,-365,210,-451,-623,-608,-610,-612,-594,-611,-351,-449,-447,-363,-364,-352,-584,-353,-450,-355,-193,-206,-202,-194,-341,-189,-190,-169,-203,-186,-204,-172,-362,-198,-196,-199,-262,-185,-623,-192,-188,-187,-201,-170,-352,-351,-174,-195,-173,-191,-342,-200,-197,-171,-529,-623,-553,-619,-351,-623,-623,-343,-623,-609,-588,-623,-452,-354,-605,-623,-508,-205,-249,563,-286,-279,-167,-352,-623,616,-277,-175,563,-623,-567,210,-566,-565,-352,-623,-351,-562,-528,-623,-614,-623,-478,-358,210,-473,-477,-469,-481,-352,-501,-472,-471,-479,-476,-475,-480,-474,-524,-623,210,-519,-521,-527,-352,-522,-351,-525,-523,-526,563,785,-344,-281,-228,-284,-287,-290,-623,-280,-164,-168,838,-278,-260,-283,-533,-559,-564,-563,-484,-623,-616,-470,-483,-502,-503,-466,-595,-587,-520,-516,563,-288,-285,-289,-296,-536,-534,-615,-307,-282,-306,-297,-234,-263,-261,-185,-231,-308,-535,-482,-500,-617,-310,-309,563,-264,-623,-271,-314,-312,-291,-313,-311,-274,-272,-623,-266,-623,-265,-276,-232,-318,-316,-317,-315,-273,-267,-236,]),'FINALLY':([317,319,592,593,595,596,597,601,812,816,817,1097,],[-623,-286,-289,-287,814,-290,-623,-164,-288,-289,814,-291,]),'MINUSMINUS':([0,3,4,54,55,57,59,60,61,62,64,65,68,69,70,71,72,73,74,76,77,78,80,82,83,86,87,89,90,93,94,95,96,98,99,101,106,107,108,109,113,115,118,119,120,124,126,127,129,130,135,136,138,139,140,141,142,143,146,147,149,151,152,153,155,156,157,158,159,164,171,176,179,181,183,184,185,194,203,221,222,233,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,255,259,260,264,267,268,277,278,283,297,299,301,303,307,310,311,312,314,315,319,320,321,323,325,327,329,338,343,348,350,356,357,360,361,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,460,462,463,467,468,470,472,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,538,539,540,541,544,545,560,561,562,563,564,569,571,572,574,576,579,584,587,592,593,596,597,599,601,602,603,611,612,613,614,615,616,627,628,630,631,635,637,640,641,645,647,659,670,672,678,687,700,713,721,725,785,786,790,791,792,794,798,800,801,805,812,815,816,817,818,819,820,824,827,828,829,831,832,833,835,836,838,840,842,847,849,851,855,859,860,863,864,890,893,894,902,903,904,908,910,914,921,924,925,927,928,929,931,934,941,942,943,946,948,949,953,957,962,964,970,1017,1018,1019,1021,1023,1029,1035,1037,1038,1039,1040,1041,1042,1043,1044,1046,1047,1048,1051,1055,1056,1057,1058,1059,1060,1074,1087,1088,1089,1097,1098,1101,1102,1104,1105,1107,1110,1111,1112,1113,1114,1115,1117,1118,1119,1123,1125,1135,1136,1137,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1151,1152,1156,1157,1160,],[4,147,147,-193,-206,-202,251,-130,-194,147,-341,-189,147,-190,-169,-203,-141,-128,-140,-346,-186,-129,-204,147,-172,-198,-136,-196,-144,-199,-262,-138,-142,147,-185,-137,147,-192,-188,-127,-187,-201,-345,-170,-143,-348,-349,-343,-174,-195,-173,147,-191,147,-350,-342,-200,-197,-139,147,-347,-171,147,-130,147,-141,-128,-140,-129,147,-127,-143,-343,147,147,147,251,-529,-553,-452,147,-508,-9,-15,-14,-134,-16,-11,-18,-13,-17,-10,147,-12,-135,-8,-19,-130,-128,-129,147,147,-127,147,147,-205,-128,-249,147,147,147,147,147,147,147,251,-286,147,-279,147,-167,147,147,147,147,-277,-175,147,147,147,-128,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,-130,-128,-129,147,-127,-341,251,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,-145,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,-146,147,147,147,147,147,-344,-147,-148,-149,-343,-281,147,147,-228,-128,-127,-343,-128,-284,-287,-290,-623,-280,-164,-168,-328,-340,-335,147,-339,147,-152,147,-278,-260,147,-329,-283,147,-145,-147,-148,-328,-329,-533,147,-559,147,-466,147,-516,-150,-330,147,147,147,147,-331,147,147,-145,-288,-285,-289,-296,-332,-251,147,147,147,147,147,-336,147,-334,-338,-333,-151,147,-221,147,147,147,-128,147,147,-536,-534,147,147,147,147,147,147,-307,-282,-128,147,-306,-297,147,147,147,147,-234,-337,-623,-263,147,-261,147,-185,-231,-308,147,-535,-225,-310,-309,147,147,-226,147,-623,-217,147,-216,-326,-320,-327,147,-264,147,-271,-623,147,147,147,147,147,-227,147,-222,-314,-312,-291,-223,-313,-623,-311,-319,-218,-274,-272,147,-266,147,-265,-323,-623,-276,-232,-224,-318,-316,147,-317,-315,-322,-623,-273,-267,-324,147,147,147,-236,-321,147,147,147,]),']':([58,64,76,87,88,90,95,96,101,102,118,124,126,140,141,144,146,149,153,154,156,157,158,159,160,161,162,163,165,166,167,168,170,171,173,175,176,177,178,179,180,182,185,186,187,188,212,235,236,237,238,242,251,285,289,292,293,301,313,315,342,353,355,366,387,389,390,493,494,495,496,538,547,548,550,553,556,558,560,563,564,573,598,611,612,613,614,616,632,638,641,645,647,648,649,651,652,653,654,655,656,657,659,660,661,662,663,664,665,666,667,668,669,670,713,726,770,772,775,777,780,783,784,785,786,798,805,818,831,833,834,835,836,838,842,857,895,896,897,941,942,967,968,969,1000,1002,1004,1005,1008,1010,1011,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1062,1079,1080,1082,1087,1098,1102,1105,1107,1117,1118,1125,1130,1132,1134,1141,1142,1145,1149,1152,],[-381,-341,-346,-136,-378,-144,-138,-142,-137,-379,-345,-348,-349,-350,-342,-380,-139,-347,-130,-30,-141,-128,-140,-129,-108,-25,-96,-111,-20,-88,-63,-107,-35,-127,-77,-58,-143,-122,-45,-343,-50,-40,-119,-1,-3,-4,-343,-389,-155,-156,495,-134,-135,-391,-399,-392,-398,495,-117,-119,-383,-385,-118,-109,-120,-121,-110,-384,-157,-158,-7,-146,-400,-387,-418,-417,-388,786,-344,-149,-343,798,818,-340,-335,835,-339,-152,-386,-36,-145,-147,-148,-31,-26,-97,-99,-98,-79,-78,-80,-41,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,-46,-329,-466,-390,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-145,-332,-336,-334,941,-338,-333,-151,-221,-162,-406,-421,-422,-337,-623,-163,-159,-21,-423,-424,-403,-407,-411,-408,-410,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-160,-412,-426,-425,-222,-223,-623,-319,-218,-323,-623,-224,-427,-428,-409,-322,-623,-324,-161,-321,]),'IF':([3,54,55,57,61,65,68,69,70,71,77,80,83,86,89,93,94,99,106,107,108,113,115,119,129,130,135,136,138,142,143,151,194,203,221,233,283,299,311,319,321,325,327,348,350,569,574,592,593,596,597,599,601,602,628,630,637,672,687,700,713,725,812,815,816,817,819,828,849,863,864,908,910,924,925,934,943,948,949,953,957,962,970,1018,1019,1046,1047,1048,1055,1058,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1137,1139,1140,1143,1144,1147,1148,1151,1157,1160,],[148,-193,-206,-202,-194,-189,148,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,148,-192,-188,-187,-201,-170,-174,-195,-173,148,-191,-200,-197,-171,-529,-553,-452,-508,-205,-249,148,-286,-279,-167,148,-277,-175,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,148,-466,-516,-288,-285,-289,-296,-251,148,961,-536,-534,-307,-282,-306,-297,-234,-263,-261,961,-185,-231,-308,-535,-310,-309,-264,148,-271,961,148,-314,-312,-291,-313,-311,-274,-272,148,-266,148,-265,-276,-232,-318,-316,148,-317,-315,-273,-267,961,961,-236,961,961,]),'STRING_LITERAL':([3,4,54,55,57,61,62,65,68,69,70,71,77,80,82,83,86,89,93,94,98,99,106,107,108,113,115,119,129,130,135,136,138,139,142,143,147,151,152,155,164,181,183,184,194,203,221,222,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,319,320,321,323,325,327,329,338,343,348,350,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,569,571,572,574,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,687,700,713,721,725,790,791,792,794,800,801,805,812,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,890,893,894,902,903,904,908,910,921,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1074,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[149,149,-193,-206,-202,-194,149,-189,149,-190,-169,-203,-186,-204,149,-172,-198,-196,-199,-262,149,-185,149,-192,-188,-187,-201,-170,-174,-195,-173,149,-191,149,-200,-197,149,-171,149,149,149,149,149,149,-529,-553,-452,149,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,149,-12,-8,-19,149,149,149,149,-205,-249,149,149,149,149,149,149,149,-286,149,-279,149,-167,149,149,149,149,-277,-175,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,-281,149,149,-228,-284,-287,-290,-623,-280,-164,-168,149,149,149,-278,-260,149,-283,149,149,-533,149,-559,149,-466,149,-516,149,149,149,149,149,149,149,-288,-285,-289,-296,-251,149,149,149,149,149,149,149,149,149,149,149,149,149,-536,-534,149,149,149,149,149,149,-307,-282,149,-306,-297,149,149,149,149,-234,-263,149,-261,149,-185,-231,-308,149,149,-535,-310,-309,149,149,149,149,149,-264,149,-271,149,149,149,149,149,149,-314,-312,-291,-313,-311,-274,-272,149,-266,149,-265,-276,-232,149,-318,-316,149,-317,-315,-273,-267,149,149,149,-236,149,149,149,]),'SUPER':([3,4,54,55,57,61,62,65,68,69,70,71,77,80,82,83,85,86,89,93,94,98,99,106,107,108,113,115,119,129,130,135,136,138,139,142,143,147,151,152,155,164,181,183,184,194,203,221,222,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,285,288,289,292,293,299,301,302,303,307,310,311,312,314,319,320,321,323,325,327,328,329,338,343,348,350,356,357,360,363,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,519,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,547,550,553,559,569,571,572,574,592,593,596,597,599,601,602,604,613,615,627,628,630,631,637,640,641,672,678,687,700,713,721,725,770,772,775,777,779,780,783,784,790,791,792,794,799,800,801,805,812,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,890,893,894,895,896,897,902,903,904,908,910,921,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,1000,1002,1004,1005,1007,1008,1010,1011,1018,1019,1020,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1074,1079,1080,1082,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1130,1132,1134,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[150,189,-193,-206,-202,-194,189,-189,150,-190,-169,-203,-186,-204,189,-172,309,-198,-196,-199,-262,189,-185,150,-192,-188,-187,-201,-170,-174,-195,-173,150,-191,189,-200,-197,189,-171,189,189,189,189,189,189,-529,-553,-452,189,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,189,-12,-8,-19,189,189,189,189,-205,-391,552,-399,-392,-398,-249,189,562,189,189,189,150,586,189,-286,189,-279,189,-167,150,607,189,189,189,-277,-175,189,189,189,647,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,647,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,-400,-418,-417,788,-281,189,189,-228,-284,-287,-290,-623,-280,-164,-168,823,189,189,189,-278,-260,189,-283,189,189,-533,189,-559,150,-466,189,-516,-419,-420,-393,-401,899,-405,-402,-404,189,189,189,189,647,586,189,189,-288,-285,-289,-296,-251,189,189,189,150,189,189,189,189,150,189,189,189,189,-536,-534,189,189,189,-406,-421,-422,189,189,189,-307,-282,189,-306,-297,189,189,189,189,-234,-263,189,-261,150,-185,-231,-308,189,189,-535,-423,-424,-403,-407,1083,-411,-408,-410,-310,-309,647,586,189,189,189,189,-264,150,-271,150,586,189,150,189,189,-412,-426,-425,-314,-312,-291,-313,-311,-274,-272,150,-266,150,-265,-276,-232,189,-427,-428,-409,-318,-316,150,-317,-315,-273,-267,189,150,150,-236,586,150,150,]),'FLOAT':([3,4,6,9,10,12,13,17,18,19,21,22,24,25,28,38,44,46,47,48,50,51,52,53,54,55,57,61,62,64,65,67,68,69,70,71,77,80,82,83,84,86,89,93,94,98,99,106,107,108,113,114,115,119,121,125,129,130,135,136,138,139,141,142,143,147,151,152,155,164,172,181,183,184,194,202,203,212,216,220,221,222,225,232,233,239,240,241,243,244,245,246,247,248,249,250,252,253,264,267,277,278,283,299,301,303,307,310,311,312,314,316,319,320,321,323,325,327,329,338,343,348,350,354,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,386,388,400,406,410,411,417,418,419,421,422,423,424,425,426,427,429,440,441,442,443,444,445,446,447,448,449,450,451,452,453,455,456,458,459,467,479,480,481,482,484,485,486,487,488,489,491,492,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,547,551,552,554,555,560,569,571,572,574,583,589,592,593,596,597,599,601,602,613,615,627,628,630,631,637,640,641,672,678,684,685,687,688,690,693,696,698,699,700,706,707,708,711,712,713,714,715,721,723,724,725,777,780,783,784,790,791,792,794,800,801,805,808,809,812,813,815,816,817,819,820,824,827,828,829,832,840,847,849,851,858,859,860,863,864,866,869,873,876,890,893,894,895,896,897,898,899,900,901,902,903,904,908,910,921,922,924,925,927,928,929,931,934,943,946,948,949,953,957,962,964,965,970,972,973,976,985,986,987,990,993,1000,1002,1004,1005,1008,1010,1011,1018,1019,1021,1023,1035,1039,1044,1046,1047,1048,1055,1056,1057,1058,1059,1064,1067,1072,1074,1077,1079,1080,1081,1082,1083,1084,1088,1089,1095,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1126,1130,1132,1134,1135,1136,1137,1139,1140,1143,1144,1146,1147,1148,1151,1156,1157,1160,],[137,137,-448,-359,-366,-356,-358,-360,-586,-361,-362,-585,-357,-365,-451,-594,-449,-447,-363,-364,-584,-353,-450,-355,-193,-206,-202,-194,137,-341,-189,137,137,-190,-169,-203,-186,-204,137,-172,-362,-198,-196,-199,-262,137,-185,137,-192,-188,-187,137,-201,-170,-352,137,-174,-195,-173,137,-191,137,-342,-200,-197,137,-171,137,137,137,137,137,137,137,-529,-623,-553,-343,-588,-623,-452,137,-354,-623,-508,-9,-15,-14,-16,-11,-18,-13,-17,-10,137,-12,-8,-19,137,137,137,137,-205,-249,137,137,137,137,137,137,137,137,-286,137,-279,137,-167,137,137,137,137,-277,-175,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,-623,-351,-439,-430,-623,-567,137,-623,-566,-565,-352,-623,-351,-562,-528,-623,-478,-358,137,-473,-477,-469,-481,-352,-623,-501,-472,-471,-479,-476,-475,-480,-474,137,-524,-623,137,-519,-521,-527,-352,-522,-351,-525,-523,-526,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,-400,137,137,137,137,-344,-281,137,137,-228,137,137,-284,-287,-290,-623,-280,-164,-168,137,137,137,-278,-260,137,-283,137,137,-533,137,137,-441,-559,137,-352,137,-564,-563,-484,137,-470,-483,137,-502,-503,-466,-595,-587,137,-520,137,-516,-401,-405,-402,-404,137,137,137,137,137,137,137,-303,137,-288,-623,-285,-289,-296,-251,137,137,137,137,137,137,137,137,137,137,137,137,137,-536,-534,-440,-442,-623,-487,137,137,137,-406,-421,-422,137,137,137,137,137,137,137,-307,-282,137,137,-306,-297,137,137,137,137,-234,-263,137,-261,137,-185,-231,-308,137,137,-535,137,-443,-444,-486,-482,-570,-500,-506,-423,-424,-403,-407,-411,-408,-410,-310,-309,137,137,137,137,137,-264,137,-271,137,137,137,137,137,-446,-445,-569,137,-505,-412,-426,137,-425,137,137,-314,-312,137,-291,-313,-311,-274,-272,137,-266,137,-265,-276,-232,137,-427,-428,-409,-318,-316,137,-317,-315,-273,-267,137,137,137,-236,137,137,137,]),'PLUS_ASSIGN':([59,60,64,72,73,74,76,78,87,90,95,96,101,109,118,120,124,126,127,140,141,146,149,153,156,157,158,159,171,176,179,185,242,251,255,259,260,268,297,361,515,538,560,561,562,563,564,576,579,584,587,603,611,612,614,616,635,641,645,647,659,670,713,785,786,798,818,831,833,835,836,838,842,914,941,942,1017,1029,1037,1038,1040,1041,1042,1043,1051,1060,1087,1098,1102,1105,1107,1117,1118,1125,1141,1142,1145,1152,],[250,-130,-341,-141,-128,-140,-346,-129,-136,-144,-138,-142,-137,-127,-345,-143,-348,-349,-343,-350,-342,-139,-347,-130,-141,-128,-140,-129,-127,-143,-343,250,-134,-135,-130,-128,-129,-127,-128,-128,-145,-146,-344,-147,-148,-149,-343,-128,-127,-343,-128,-328,-340,-335,-339,-152,-329,-145,-147,-148,-328,-329,-466,-150,-330,-331,-332,-336,-334,-338,-333,-151,-221,-128,-337,-623,-225,-226,-623,-217,-216,-326,-320,-327,-623,-227,-222,-223,-623,-319,-218,-323,-623,-224,-322,-623,-324,-321,]),'}':([6,18,22,28,38,44,46,50,52,54,55,57,58,61,64,65,69,70,71,76,77,80,83,86,87,88,89,90,93,94,95,96,99,101,102,106,107,108,113,115,118,119,124,126,129,130,135,138,140,141,142,143,144,146,149,151,153,154,156,157,158,159,160,161,162,163,165,166,167,168,170,171,173,175,176,177,178,179,180,182,185,186,187,188,194,195,202,203,212,216,220,221,232,233,235,236,237,242,251,254,256,257,258,261,262,265,266,269,270,271,272,273,274,276,280,281,283,285,289,292,293,299,313,315,319,321,324,325,326,327,342,348,350,353,355,366,387,389,390,396,397,398,399,400,401,403,404,405,416,418,422,423,424,425,427,429,440,441,444,445,446,447,448,450,451,452,453,455,456,457,458,459,460,462,463,467,468,473,474,475,479,480,482,483,484,485,486,487,489,491,492,493,494,495,496,529,530,538,542,543,547,548,550,553,556,560,563,564,569,574,592,593,596,597,599,601,602,611,612,614,616,628,630,632,637,638,641,645,647,648,649,651,652,653,654,655,656,657,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,679,680,681,682,687,696,698,699,700,706,707,711,712,713,714,715,717,718,719,720,723,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,749,750,751,752,753,754,755,756,757,758,759,761,762,763,764,765,766,767,768,770,772,775,777,780,783,784,785,786,798,805,812,815,816,817,818,831,832,833,835,836,838,842,844,846,857,861,862,863,864,880,888,889,890,895,896,897,908,910,924,925,934,936,937,938,939,940,941,942,943,944,948,953,957,962,967,968,969,970,971,986,990,995,996,997,998,1000,1002,1004,1005,1008,1010,1011,1017,1018,1019,1029,1037,1038,1039,1040,1041,1042,1043,1046,1047,1048,1049,1050,1051,1060,1062,1079,1080,1082,1087,1088,1089,1097,1098,1101,1102,1104,1105,1106,1107,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1123,1125,1130,1132,1134,1135,1136,1139,1140,1141,1142,1143,1144,1145,1149,1151,1152,],[-448,-586,-585,-451,-594,-449,-447,-584,-450,-193,-206,-202,-381,-194,-341,-189,-190,-169,-203,-346,-186,-204,-172,-198,-136,-378,-196,-144,-199,-262,-138,-142,-185,-137,-379,-623,-192,-188,-187,-201,-345,-170,-348,-349,-174,-195,-173,-191,-350,-342,-200,-197,-380,-139,-347,-171,-130,-30,-141,-128,-140,-129,-108,-25,-96,-111,-20,-88,-63,-107,-35,-127,-77,-58,-143,-122,-45,-343,-50,-40,-119,-1,-3,-4,-529,-623,-623,-553,-343,-588,-623,-452,-623,-508,-389,-155,-156,-134,-135,-37,-68,-116,-27,-113,-60,-123,-112,-32,-126,-42,-22,-53,-81,-91,-100,-47,-205,-391,-399,-392,-398,-249,-117,-119,-286,-279,601,-167,-166,-165,-383,-277,-175,-385,-118,-109,-120,-121,-110,-550,672,-623,-623,-623,-551,-623,-537,-540,687,-567,-566,-565,-561,-560,-562,-528,-467,-478,-473,-477,-469,-481,-468,-501,-472,-471,-479,-476,-475,713,-480,-474,-133,-575,-132,720,-131,-574,-577,-576,-524,-517,-519,725,-521,-527,-518,-522,-525,-523,-526,-384,-157,-158,-7,-114,-124,-146,-125,-115,-400,-387,-418,-417,-388,-344,-149,-343,-281,-228,-284,-287,-290,-623,-280,-164,-168,-340,-335,-339,-152,-278,-260,-386,-283,-36,-145,-147,-148,-31,-26,-97,-99,-98,-79,-78,-80,-41,-328,-89,-90,-66,-67,-65,-64,-51,-52,-59,-46,-329,-542,-533,-623,863,-551,864,-552,-543,-541,-544,-539,-559,-564,-563,-484,-623,-470,-483,-502,-503,-466,-595,-587,888,889,-582,-581,-520,-516,-390,-43,-84,-73,-75,-82,-86,-69,-71,-33,-85,-74,-95,-70,-44,-83,-106,-57,-49,-93,-102,-104,-72,-61,-34,-29,-55,-76,-87,-39,-38,-48,-28,-62,-92,-94,-101,-105,-103,-56,-54,-419,-420,-393,-401,-405,-402,-404,-150,-330,-331,-145,-288,-285,-289,-296,-332,-336,-623,-334,-338,-333,-151,-221,-183,-184,-162,970,-538,-536,-534,990,-580,-579,996,-406,-421,-422,-307,-282,-306,-297,-234,-214,1038,-219,-215,1040,-337,-623,-263,1046,-261,-185,-231,-308,-163,-159,-21,-535,-545,-482,-500,-583,-578,-24,-23,-423,-424,-403,-407,-411,-408,-410,-225,-310,-309,-226,-623,-217,1107,-216,-326,-320,-327,-264,1113,-271,1115,-268,-623,-227,-160,-412,-426,-425,-222,-314,-312,-291,-223,-313,-623,-311,-319,-220,-218,-274,-272,-270,-266,1144,-265,-269,-323,-623,-276,-232,-224,-427,-428,-409,-318,-316,-317,-315,-322,-623,-273,-267,-324,-161,-236,-321,]),'THROW':([3,54,55,57,61,65,68,69,70,71,77,80,83,86,89,93,94,99,106,107,108,113,115,119,129,130,135,136,138,142,143,151,194,203,221,233,283,299,311,319,321,325,327,348,350,569,574,592,593,596,597,599,601,602,628,630,637,672,687,700,713,725,812,815,816,817,819,828,849,863,864,908,910,924,925,934,943,948,949,953,957,962,970,1018,1019,1046,1047,1048,1055,1058,1088,1089,1097,1101,1104,1110,1111,1112,1113,1114,1115,1119,1123,1135,1136,1137,1139,1140,1143,1144,1147,1148,1151,1157,1160,],[152,-193,-206,-202,-194,-189,152,-190,-169,-203,-186,-204,-172,-198,-196,-199,-262,-185,152,-192,-188,-187,-201,-170,-174,-195,-173,152,-191,-200,-197,-171,-529,-553,-452,-508,-205,-249,152,-286,-279,-167,152,-277,-175,-281,-228,-284,-287,-290,-623,-280,-164,-168,-278,-260,-283,-533,-559,152,-466,-516,-288,-285,-289,-296,-251,152,152,-536,-534,-307,-282,-306,-297,-234,-263,-261,152,-185,-231,-308,-535,-310,-309,-264,152,-271,152,152,-314,-312,-291,-313,-311,-274,-272,152,-266,152,-265,-276,-232,-318,-316,152,-317,-315,-273,-267,152,152,-236,152,152,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'expression_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'variable_declarators':([128,341,581,695,709,804,],[344,621,344,877,877,621,]),'wildcard_bounds1':([288,779,1007,],[550,550,550,]),'unary_expression_not_plus_minus_not_name':([62,155,222,314,467,721,890,1074,],[257,257,257,257,257,257,257,257,]),'enum_header':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'explicit_constructor_invocation':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'formal_parameter_list_opt':([417,421,449,],[689,697,710,]),'additional_bound_list':([868,],[975,]),'throw_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'generic_type':([3,67,106,114,125,172,192,199,229,312,316,327,330,339,354,386,419,443,481,522,535,551,552,554,555,583,589,606,620,640,684,686,688,693,700,708,724,809,826,854,898,899,900,901,922,972,981,1047,1056,1081,1083,1084,1095,1112,1114,1127,],[58,284,58,331,58,331,331,331,331,58,58,58,331,331,284,58,58,58,58,58,58,284,284,284,284,58,58,331,331,284,284,331,58,58,58,58,58,58,331,331,284,284,284,284,58,284,331,58,58,284,284,284,58,58,58,331,]),'reference_type1':([67,354,551,552,554,555,640,684,898,899,900,901,972,1081,1083,1084,],[293,293,770,772,293,293,293,869,770,772,293,293,1064,770,772,293,]),'enum_body_declarations_opt':([195,398,399,673,],[397,674,676,861,]),'exclusive_or_expression_not_name':([62,155,222,314,467,721,890,1074,],[254,254,254,254,254,254,254,254,]),'switch_labels':([944,1049,],[1047,1114,]),'post_decrement_expression':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,700,721,790,791,792,794,800,801,805,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,965,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[60,153,255,60,153,153,60,60,153,153,153,255,153,153,153,153,460,153,153,153,153,153,153,153,153,153,60,60,255,153,153,60,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,460,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,60,460,153,153,153,153,60,153,153,153,153,153,60,153,153,153,153,60,153,153,153,153,460,153,153,153,153,153,153,153,153,153,153,153,60,153,153,60,153,153,153,153,60,60,60,153,60,153,460,60,60,153,60,153,60,60,60,60,60,]),'conditional_expression_not_name':([62,155,222,314,467,721,890,1074,],[279,279,473,279,473,473,473,473,]),'block_statements_opt':([106,700,],[324,880,]),'assert_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'class_type_elt':([981,1127,],[1071,1150,]),'inclusive_or_expression':([4,82,139,152,249,301,303,307,310,320,323,329,338,343,356,357,365,367,368,505,520,523,524,533,534,571,572,613,615,627,631,678,790,791,792,794,801,820,824,827,829,832,840,847,851,860,893,894,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,648,154,154,735,154,751,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,]),'switch_label':([944,1047,1049,1114,],[1048,1111,1048,1111,]),'dims_opt':([345,362,639,803,878,879,884,885,917,966,],[624,643,853,916,624,988,624,988,1022,1063,]),'comma_opt':([832,],[940,]),'while_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'try_block':([100,318,],[317,597,]),'variable_initializer':([627,832,921,1023,1039,],[845,938,1024,1094,1106,]),'for_update_opt':([1021,1156,],[1091,1158,]),'statement_expression':([3,68,106,136,311,312,327,700,800,828,849,949,1021,1047,1055,1056,1058,1112,1114,1137,1147,1148,1156,1157,1160,],[66,66,66,66,66,575,66,66,913,66,66,66,575,66,66,575,66,66,66,66,66,66,575,66,66,]),'single_static_import_declaration':([2,23,29,207,],[37,37,37,37,]),'resources':([316,],[588,]),'interface_member_declarations_opt':([232,],[483,]),'enhanced_for_statement_header':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[68,68,68,68,68,68,68,68,949,949,68,949,68,68,68,68,949,949,949,949,]),'for_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,]),'local_variable_declaration_statement':([3,106,327,700,1047,1112,1114,],[70,70,70,70,70,70,70,]),'try_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,]),'enum_constant':([195,673,],[404,862,]),'semi_opt':([588,],[806,]),'enum_constant_header':([195,673,],[405,405,]),'compilation_unit':([2,],[33,]),'if_then_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,]),'dims_loop':([58,73,116,157,174,259,284,287,295,297,340,342,345,361,362,462,493,576,587,639,769,803,855,856,878,879,884,885,914,917,966,],[236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,236,]),'method_header_name':([220,232,400,440,480,],[449,449,449,449,449,]),'import_declaration':([2,23,29,207,],[34,34,215,215,]),'reference_type3':([901,1081,1083,1084,],[1011,1130,1132,1011,]),'reference_type2':([555,898,899,900,901,1081,1083,1084,],[784,1000,1002,784,784,1000,1002,784,]),'class_instance_creation_expression':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,700,721,790,791,792,794,800,801,805,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,965,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[72,156,156,72,156,156,72,72,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,72,72,156,156,156,72,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,72,156,156,156,156,156,72,156,156,156,156,156,72,156,156,156,156,72,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,72,156,156,72,156,156,156,156,72,72,72,156,72,156,156,72,72,156,72,156,72,72,72,72,72,]),'package_declaration_name':([2,],[41,]),'static_initializer':([220,400,440,],[451,451,451,]),'catches':([317,597,],[592,816,]),'annotation_method_header_default_value_opt':([989,],[1075,]),'resource':([316,809,],[590,919,]),'name':([3,4,27,30,32,62,67,68,82,98,106,114,125,136,139,147,152,155,164,172,181,183,184,192,199,213,222,223,224,229,234,249,264,267,277,278,301,303,307,310,311,312,314,316,320,323,327,329,330,338,339,343,354,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,386,388,402,419,443,467,481,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,546,551,552,554,555,571,572,583,589,606,610,613,615,620,627,631,640,641,678,684,686,688,693,700,708,721,724,790,791,792,794,800,801,805,809,820,824,826,827,828,829,832,840,847,849,851,854,858,859,860,890,893,894,898,899,900,901,902,903,904,921,922,927,928,929,931,946,949,964,965,972,981,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1081,1083,1084,1095,1112,1114,1126,1127,1137,1146,1147,1148,1156,1157,1160,],[73,157,211,216,219,259,295,297,157,157,73,335,342,297,157,157,157,361,157,335,157,157,157,335,335,436,462,216,477,335,493,157,157,157,157,157,157,157,157,157,297,576,587,342,157,157,73,157,335,157,335,157,295,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,342,157,216,342,342,462,342,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,342,157,157,157,157,157,157,157,157,157,157,342,157,157,157,157,157,157,157,769,295,295,295,295,157,157,342,342,335,830,157,157,335,157,157,855,157,157,295,335,342,342,73,342,462,342,157,157,157,157,914,157,157,342,157,157,335,157,297,157,157,157,157,297,157,335,157,157,157,462,157,157,295,295,295,295,157,157,157,157,342,157,157,157,157,157,297,157,157,295,335,914,157,157,157,157,73,297,576,157,297,157,462,295,295,295,342,73,73,157,335,297,157,297,297,914,297,297,]),'interface_member_declarations':([232,],[480,]),'type_argument_list2':([555,901,],[777,777,]),'labeled_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,]),'argument_list_opt':([303,343,357,571,572,615,678,790,791,792,820,824,827,829,840,851,902,903,904,927,928,929,931,946,964,1035,],[565,622,634,796,797,837,865,905,906,907,926,930,933,935,945,963,1012,1013,1014,1030,1031,1032,1034,1052,1061,1103,]),'type_argument_list':([67,354,555,640,901,],[290,290,781,290,1009,]),'type_argument_list3':([901,],[1005,]),'post_increment_expression':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,700,721,790,791,792,794,800,801,805,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,965,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[78,159,260,78,159,159,78,78,159,159,159,260,159,159,159,159,463,159,159,159,159,159,159,159,159,159,78,78,260,159,159,78,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,463,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,78,463,159,159,159,159,78,159,159,159,159,159,78,159,159,159,159,78,159,159,159,159,463,159,159,159,159,159,159,159,159,159,159,159,78,159,159,78,159,159,159,159,78,78,78,159,78,159,463,78,78,159,78,159,78,78,78,78,78,]),'conditional_or_expression_not_name':([62,155,222,314,467,721,890,1074,],[272,272,272,272,272,272,272,272,]),'pre_decrement_expression':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,678,700,721,790,791,792,794,800,801,820,824,827,828,829,832,840,847,849,851,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1137,1146,1147,1148,1156,1157,1160,],[79,160,261,79,160,160,79,79,160,160,160,261,160,160,160,160,261,160,160,160,160,160,160,160,160,160,79,79,261,160,160,79,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,261,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,79,261,160,160,160,160,79,160,160,160,160,79,160,160,160,160,79,160,160,160,261,160,160,160,160,160,160,160,160,160,160,160,79,160,79,160,160,160,160,79,79,79,160,79,160,261,79,79,79,160,79,79,79,79,79,]),'while_statement_no_short_if':([849,949,1055,1147,1148,1157,1160,],[958,958,958,958,958,958,958,]),'conditional_and_expression':([4,82,139,152,249,301,303,307,310,320,323,329,338,343,356,357,367,368,520,524,533,534,571,572,613,615,627,631,678,790,791,792,794,801,820,824,827,829,832,840,847,851,860,893,894,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,649,161,161,752,759,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,]),'try_statement_with_resources':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,]),'inclusive_or_expression_not_name':([62,155,222,314,467,721,890,1074,],[269,269,269,269,269,269,269,269,]),'relational_expression_not_name':([62,155,222,314,467,721,890,1074,],[262,262,262,262,262,262,262,262,]),'interface_declaration':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[6,83,6,6,6,83,6,6,6,6,441,479,83,441,6,6,441,479,83,83,83,83,]),'unary_expression':([4,82,98,139,147,152,164,181,183,184,249,264,267,277,278,301,303,307,310,320,323,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,678,790,791,792,794,801,820,824,827,829,832,840,847,851,859,860,893,894,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[162,162,313,162,355,162,366,387,389,390,162,529,530,542,543,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,651,652,653,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,742,162,162,162,746,747,162,162,162,162,162,162,162,162,162,162,162,162,162,162,764,765,766,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,968,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,]),'constructor_header_name':([202,220,400,425,440,],[417,417,417,417,417,]),'interface_type':([199,229,686,],[413,413,870,]),'type_arguments':([3,68,106,114,136,144,172,291,302,311,327,328,339,358,361,363,376,391,519,587,606,700,782,799,802,828,849,949,1020,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[85,85,85,330,85,353,330,353,559,85,85,604,620,636,639,646,658,636,646,639,826,85,353,646,658,85,85,85,646,85,85,85,85,85,85,85,85,85,85,]),'enum_declarations':([195,398,399,673,],[396,396,396,396,]),'method_header_throws_clause':([872,994,],[979,979,]),'type_parameter1':([197,683,],[410,866,]),'break_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,]),'unary_expression_not_plus_minus':([4,82,98,139,147,152,164,181,183,184,249,264,267,277,278,301,303,307,310,320,323,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,790,791,792,794,801,805,820,824,827,829,832,840,847,851,858,859,860,893,894,902,903,904,921,927,928,929,931,946,964,965,1023,1035,1039,1044,1057,1059,1126,1146,],[163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,857,163,163,163,163,163,163,857,163,163,163,163,163,163,163,163,967,163,163,163,163,163,163,163,163,163,163,163,163,163,163,1062,163,163,163,163,163,163,1149,163,]),'assignment_expression_not_name':([62,155,314,],[263,263,263,]),'constructor_header':([202,220,400,425,440,],[428,428,428,428,428,]),'class_or_interface_type':([3,67,106,114,125,172,192,199,229,312,316,327,330,339,354,386,419,443,481,522,535,551,552,554,555,583,589,606,620,640,684,686,688,693,700,708,724,809,826,854,898,899,900,901,922,972,981,1047,1056,1081,1083,1084,1095,1112,1114,1127,],[88,88,88,332,88,332,394,415,415,88,88,88,394,394,88,88,88,88,88,88,88,88,88,88,88,88,88,394,394,88,88,415,88,88,88,88,88,88,394,966,88,88,88,88,88,88,394,88,88,88,88,88,88,88,88,394,]),'switch_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,]),'enum_constant_header_name':([195,673,],[403,403,]),'class_header_implements_opt':([43,191,218,],[228,392,439,]),'type_declarations':([2,23,29,207,],[20,206,214,430,]),'interface_member_declaration':([232,480,],[482,723,]),'annotation_method_header_name':([202,425,],[421,421,]),'member_value':([222,467,721,890,1074,],[465,719,891,995,1128,]),'array_access':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,700,721,790,791,792,794,800,801,805,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,965,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,]),'package_declaration':([2,],[23,]),'enum_body':([7,],[194,]),'reference_type':([3,67,106,125,312,316,327,354,386,419,443,481,522,535,551,552,554,555,583,589,640,684,688,693,700,708,724,809,898,899,900,901,922,972,1047,1056,1081,1083,1084,1095,1112,1114,],[91,286,91,91,91,91,91,286,668,91,91,91,750,761,771,773,774,778,91,91,286,868,91,91,91,91,91,91,999,1001,1003,1006,91,1065,91,91,1129,1131,1133,91,91,91,]),'if_then_else_statement_no_short_if':([849,949,1055,1147,1148,1157,1160,],[950,950,950,950,950,950,950,]),'label':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[92,92,92,92,92,92,92,92,951,951,92,951,92,92,92,92,951,951,951,951,]),'variable_declarator':([128,341,581,623,695,709,804,],[346,346,346,843,346,346,346,]),'continue_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,]),'member_value_pairs':([222,],[466,]),'argument_list':([303,343,357,571,572,615,678,790,791,792,820,824,827,829,840,851,902,903,904,927,928,929,931,946,964,1035,],[566,566,566,566,566,566,566,566,566,566,566,566,566,566,566,566,566,566,566,566,566,566,566,566,566,566,]),'class_type_list':([981,],[1070,]),'variable_declarator_id':([128,341,581,591,623,695,709,804,810,871,978,1026,],[347,347,347,811,347,347,347,347,920,977,1068,1096,]),'annotation_type_member_declarations':([202,],[425,]),'array_creation_without_array_initializer':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,700,721,790,791,792,794,800,801,805,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,965,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,]),'conditional_or_expression':([4,82,139,152,249,301,303,307,310,320,323,329,338,343,356,357,368,520,534,571,572,613,615,627,631,678,790,791,792,794,801,820,824,827,829,832,840,847,851,860,893,894,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,]),'type_argument2':([555,900,901,1084,],[783,1004,783,1004,]),'field_access':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,700,721,790,791,792,794,800,801,805,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,965,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,]),'type_argument3':([901,1084,],[1010,1134,]),'qualified_name':([3,4,27,30,32,62,67,68,82,98,106,114,125,136,139,147,152,155,164,172,181,183,184,192,199,213,222,223,224,229,234,249,264,267,277,278,301,303,307,310,311,312,314,316,320,323,327,329,330,338,339,343,354,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,386,388,402,419,443,467,481,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,546,551,552,554,555,571,572,583,589,606,610,613,615,620,627,631,640,641,678,684,686,688,693,700,708,721,724,790,791,792,794,800,801,805,809,820,824,826,827,828,829,832,840,847,849,851,854,858,859,860,890,893,894,898,899,900,901,902,903,904,921,922,927,928,929,931,946,949,964,965,972,981,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1081,1083,1084,1095,1112,1114,1126,1127,1137,1146,1147,1148,1156,1157,1160,],[141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,]),'class_type':([114,172,192,330,339,606,620,826,981,1127,],[334,334,393,609,619,825,841,932,1069,1069,]),'single_member_annotation':([2,3,20,23,29,40,106,125,195,202,205,206,207,214,220,222,232,312,316,327,400,406,417,421,425,426,430,440,449,467,480,488,583,589,673,700,721,809,813,873,890,1047,1056,1074,1112,1114,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'type_argument1':([67,354,554,555,640,900,901,1084,],[292,292,775,292,292,775,292,775,]),'multiplicative_expression':([4,82,139,152,249,301,303,307,310,320,323,329,338,343,356,357,360,365,367,368,372,373,374,375,377,378,380,381,382,383,384,385,388,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,513,514,516,520,521,523,524,525,526,527,528,531,532,533,534,536,537,544,545,571,572,613,615,627,631,640,678,790,791,792,794,801,820,824,827,829,832,840,847,851,860,893,894,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,660,661,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,738,166,166,166,166,166,745,166,166,166,166,166,166,166,166,166,166,166,166,762,763,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,]),'catch_clause':([317,592,597,816,],[593,812,593,812,]),'type_parameters':([8,42,419,431,438,443,481,722,],[196,227,693,701,705,708,724,892,]),'interface_header_extends':([14,],[198,]),'statement_without_trailing_substatement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[99,99,99,99,99,99,99,99,953,953,99,953,99,99,99,99,953,953,953,953,]),'for_update':([1021,1156,],[1092,1092,]),'constant_expression':([1044,],[1109,]),'array_creation_with_array_initializer':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,700,721,790,791,792,794,800,801,805,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,965,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,]),'statement_expression_list':([312,1021,1056,1156,],[577,1093,577,1093,]),'arguments_opt':([403,],[680,]),'array_type':([3,67,106,125,312,316,327,354,386,419,443,481,522,535,551,552,554,555,583,589,640,684,688,693,700,708,724,809,898,899,900,901,922,972,1047,1056,1081,1083,1084,1095,1112,1114,],[102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,]),'switch_block_statement':([944,1049,],[1050,1116,]),'normal_annotation':([2,3,20,23,29,40,106,125,195,202,205,206,207,214,220,222,232,312,316,327,400,406,417,421,425,426,430,440,449,467,480,488,583,589,673,700,721,809,813,873,890,1047,1056,1074,1112,1114,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'postfix_expression_not_name':([62,155,222,314,467,721,890,1074,],[265,265,265,265,265,265,265,265,]),'primary_no_new_array':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,700,721,790,791,792,794,800,801,805,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,965,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,]),'wildcard2':([555,900,901,1084,],[780,780,780,780,]),'type_argument':([67,354,554,555,640,900,901,1084,],[294,294,776,294,294,776,294,776,]),'annotation_name':([2,3,20,23,29,40,106,125,195,202,205,206,207,214,220,222,232,312,316,327,400,406,417,421,425,426,430,440,449,467,480,488,583,589,673,700,721,809,813,873,890,1047,1056,1074,1112,1114,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'member_value_array_initializer':([222,467,721,890,1074,],[474,474,474,474,474,]),'class_header_extends_opt':([5,31,],[191,218,]),'trailing_semicolon':([588,],[809,]),'dim_with_or_without_exprs':([332,333,],[611,614,]),'interface_header_name':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'catch_formal_parameter':([813,],[923,]),'pre_increment_expression':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,678,700,721,790,791,792,794,800,801,820,824,827,828,829,832,840,847,849,851,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1137,1146,1147,1148,1156,1157,1160,],[103,168,266,103,168,168,103,103,168,168,168,266,168,168,168,168,266,168,168,168,168,168,168,168,168,168,103,103,266,168,168,103,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,266,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,103,266,168,168,168,168,103,168,168,168,168,103,168,168,168,168,103,168,168,168,266,168,168,168,168,168,168,168,168,168,168,168,103,168,103,168,168,168,168,103,103,103,168,103,168,266,103,103,103,168,103,103,103,103,103,]),'assignment_operator':([59,185,],[249,249,]),'type_parameter':([197,683,],[412,867,]),'enhanced_for_statement_header_init':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,]),'class_body_declarations_opt':([220,400,],[457,677,]),'member_value_pairs_opt':([222,],[464,]),'expression':([4,82,139,152,301,303,307,310,320,323,329,338,343,356,357,368,520,534,571,572,613,615,627,631,678,790,791,792,794,801,820,824,827,829,832,840,847,851,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[169,305,352,359,558,567,570,573,598,600,608,618,567,633,567,650,748,760,567,567,834,567,844,848,567,567,567,567,909,305,567,567,567,567,844,567,947,567,567,567,567,844,567,567,567,567,567,567,844,567,844,1108,1122,1124,305,]),'block':([3,68,100,106,136,220,311,318,327,400,440,442,700,795,814,828,849,949,1028,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[107,107,319,107,107,459,107,319,107,459,459,707,107,910,924,107,107,107,1097,107,107,107,107,107,107,107,107,107,107,]),'if_then_else_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,]),'for_init_opt':([312,1056,],[578,1121,]),'enhanced_for_statement_no_short_if':([849,949,1055,1147,1148,1157,1160,],[954,954,954,954,954,954,954,]),'modifiers_opt':([2,3,20,23,29,106,195,202,206,207,214,220,232,327,400,417,421,425,430,440,449,480,673,700,813,873,1047,1112,1114,],[26,26,26,26,26,26,395,419,26,26,26,443,481,26,443,688,688,419,26,443,688,481,395,26,922,688,26,26,26,]),'annotation_type_member_declarations_opt':([202,],[416,]),'exclusive_or_expression':([4,82,139,152,249,301,303,307,310,320,323,329,338,343,356,357,360,365,367,368,505,520,523,524,528,531,533,534,571,572,613,615,627,631,678,790,791,792,794,801,820,824,827,829,832,840,847,851,860,893,894,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,638,170,170,170,170,170,170,170,756,757,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,]),'primary':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,700,721,790,791,792,794,800,801,805,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,965,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[109,171,268,109,171,171,109,109,171,171,171,268,171,171,171,171,468,171,171,171,171,171,171,171,171,171,109,579,268,171,171,109,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,468,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,109,468,171,171,171,171,579,171,171,171,171,171,109,171,171,171,171,109,171,171,171,171,468,171,171,171,171,171,171,171,171,171,171,171,109,171,171,579,171,171,171,171,109,109,579,171,109,171,468,109,109,171,109,171,109,109,579,109,109,]),'for_init':([312,1056,],[580,580,]),'type_argument_list1':([67,354,555,640,901,],[285,285,285,285,285,]),'method_body':([428,454,],[699,711,]),'marker_annotation':([2,3,20,23,29,40,106,125,195,202,205,206,207,214,220,222,232,312,316,327,400,406,417,421,425,426,430,440,449,467,480,488,583,589,673,700,721,809,813,873,890,1047,1056,1074,1112,1114,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'block_statement':([3,106,327,700,1047,1112,1114,],[112,325,602,325,325,602,325,]),'static_import_on_demand_declaration':([2,23,29,207,],[15,15,15,15,]),'one_dim_loop':([58,73,116,157,174,236,259,284,287,295,297,340,342,345,361,362,462,493,576,587,639,769,803,855,856,878,879,884,885,914,917,966,],[237,237,237,237,237,494,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,]),'single_type_import_declaration':([2,23,29,207,],[35,35,35,35,]),'additive_expression':([4,82,139,152,249,301,303,307,310,320,323,329,338,343,356,357,360,365,367,368,372,373,374,375,380,381,382,383,384,385,388,497,498,499,500,501,502,503,504,505,506,507,509,510,511,513,514,520,521,523,524,525,526,527,528,531,532,533,534,544,545,571,572,613,615,627,631,640,678,790,791,792,794,801,820,824,827,829,832,840,847,851,860,893,894,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,654,655,656,173,173,173,173,173,173,173,173,173,728,173,173,731,732,173,173,173,736,173,173,173,741,173,173,173,173,173,173,173,173,755,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,]),'simple_name':([3,4,27,30,32,62,67,68,82,98,106,114,125,136,139,147,152,155,164,172,181,183,184,192,199,213,222,223,224,229,234,249,264,267,277,278,301,302,303,307,310,311,312,314,316,320,323,327,329,330,338,339,343,354,356,357,360,363,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,386,388,402,419,434,437,443,467,481,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,519,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,546,551,552,554,555,571,572,583,589,606,610,613,615,620,627,631,640,641,678,684,686,688,693,700,703,708,716,721,724,790,791,792,794,799,800,801,805,809,820,824,826,827,828,829,832,840,847,849,851,854,858,859,860,890,893,894,898,899,900,901,902,903,904,921,922,927,928,929,931,946,949,964,965,972,981,1020,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1081,1083,1084,1095,1112,1114,1126,1127,1137,1146,1147,1148,1156,1157,1160,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,470,64,64,64,64,64,64,64,64,64,64,560,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,560,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,560,560,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,560,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,560,64,887,64,64,64,64,64,64,560,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,560,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'wildcard_bounds3':([1007,],[1080,]),'class_body_opt':([942,1037,1051,1102,1118,1142,],[1042,1105,1117,1141,1145,1152,]),'enum_constants':([195,],[398,]),'class_header_extends':([5,31,],[190,190,]),'switch_block':([839,],[943,]),'method_header_extended_dims':([879,885,],[989,994,]),'method_declaration':([220,400,440,],[445,445,445,]),'finally':([595,817,],[815,925,]),'synchronized_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,]),'shift_expression':([4,82,139,152,249,301,303,307,310,320,323,329,338,343,356,357,360,365,367,368,375,380,381,382,383,384,385,388,497,499,500,503,504,505,507,509,510,513,514,520,521,523,524,525,526,528,531,532,533,534,544,545,571,572,613,615,627,631,640,678,790,791,792,794,801,820,824,827,829,832,840,847,851,860,893,894,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,662,663,664,665,167,167,167,167,729,730,733,734,167,737,739,167,167,167,167,749,167,167,167,754,167,167,167,167,167,167,167,167,167,167,167,167,167,739,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,]),'primitive_type':([3,4,62,67,68,82,98,106,114,125,136,139,147,152,155,164,172,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,316,320,323,327,329,338,343,354,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,386,388,419,443,467,481,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,522,523,524,525,526,527,528,531,532,533,534,535,536,537,539,540,541,544,545,551,552,554,555,571,572,583,589,613,615,627,631,640,641,678,684,688,693,700,708,721,724,790,791,792,794,800,801,805,809,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,898,899,900,901,902,903,904,921,922,927,928,929,931,946,949,964,965,972,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1081,1083,1084,1095,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[116,174,174,287,174,174,174,116,333,340,174,174,174,174,362,174,333,174,174,174,174,174,174,174,174,174,174,174,174,174,174,116,362,340,174,174,116,174,174,174,287,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,287,174,340,340,174,340,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,287,174,174,174,174,174,174,174,174,174,174,287,174,174,174,174,174,174,174,287,287,287,287,174,174,340,340,174,174,174,174,856,174,174,287,340,340,116,340,174,340,174,174,174,174,174,174,174,340,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,287,287,287,287,174,174,174,174,340,174,174,174,174,174,174,174,174,287,174,174,174,174,174,116,174,116,174,174,174,174,287,287,287,340,116,116,174,174,174,174,174,174,174,174,]),'literal':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,700,721,790,791,792,794,800,801,805,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,965,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,]),'class_body_declaration':([220,400,440,],[446,446,706,]),'relational_expression':([4,82,139,152,249,301,303,307,310,320,323,329,338,343,356,357,360,365,367,368,375,384,385,388,497,505,510,513,514,520,523,524,525,528,531,532,533,534,544,545,571,572,613,615,627,631,678,790,791,792,794,801,820,824,827,829,832,840,847,851,860,893,894,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,]),'statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[119,299,119,351,574,119,119,934,957,299,119,574,1123,119,119,1151,934,957,1123,1151,]),'additional_bound':([868,975,],[974,1066,]),'method_invocation':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,700,721,790,791,792,794,800,801,805,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,965,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[120,176,176,120,176,176,120,120,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,120,120,176,176,176,120,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,120,176,176,176,176,176,120,176,176,176,176,176,120,176,176,176,176,120,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,120,176,176,120,176,176,176,176,120,120,120,176,120,176,176,120,120,176,120,176,120,120,120,120,120,]),'catch_type':([922,],[1026,]),'type':([3,106,125,312,316,327,419,443,481,583,589,688,693,700,708,724,809,922,1047,1056,1095,1112,1114,],[128,128,341,581,591,128,695,709,709,804,810,871,874,128,883,883,591,1027,128,581,1138,128,128,]),'import_declarations':([2,23,],[29,207,]),'interface_header_extends_opt':([14,],[201,]),'labeled_statement_no_short_if':([849,949,1055,1147,1148,1157,1160,],[956,956,956,956,956,956,956,]),'type_parameter_list':([197,],[407,]),'wildcard1':([67,354,554,555,640,900,901,1084,],[289,289,289,289,289,289,289,289,]),'annotation_type_declaration_header_name':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'class_body':([36,405,942,1037,1051,1102,1118,1142,],[221,682,1041,1041,1041,1041,1041,1041,]),'class_instance_creation_expression_name':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,700,721,790,791,792,794,800,801,805,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,965,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,]),'additional_bound1':([868,975,],[976,1067,]),'cast_expression':([4,62,82,98,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,314,320,323,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,721,790,791,792,794,801,805,820,824,827,829,832,840,847,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,964,965,1023,1035,1039,1044,1057,1059,1074,1126,1146,],[177,270,177,177,177,177,177,270,177,177,177,177,270,177,177,177,177,177,177,177,177,177,270,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,270,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,270,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,270,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,270,177,177,]),'variable_initializers':([832,],[937,]),'and_expression_not_name':([62,155,222,314,467,721,890,1074,],[271,271,271,271,271,271,271,271,]),'class_header':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'shift_expression_not_name':([62,155,222,314,467,721,890,1074,],[256,256,256,256,256,256,256,256,]),'equality_expression':([4,82,139,152,249,301,303,307,310,320,323,329,338,343,356,357,360,365,367,368,375,388,497,505,510,514,520,523,524,528,531,532,533,534,571,572,613,615,627,631,678,790,791,792,794,801,820,824,827,829,832,840,847,851,860,893,894,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,669,178,178,178,744,178,178,178,178,178,758,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,]),'interface_type_list':([199,229,],[414,478,]),'type_import_on_demand_declaration':([2,23,29,207,],[39,39,39,39,]),'modifiers':([2,3,20,23,29,106,195,202,206,207,214,220,232,312,316,327,400,417,421,425,430,440,449,480,673,700,809,813,873,1047,1056,1112,1114,],[40,125,205,205,205,125,406,426,205,205,205,426,488,583,589,125,426,406,406,426,205,426,406,488,406,125,589,406,406,125,583,125,125,]),'member_values':([467,],[718,]),'expression_not_name':([62,155,314,],[275,275,275,]),'enum_header_name':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'enum_declaration':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[44,129,44,44,44,129,44,44,44,44,453,489,129,453,44,44,453,489,129,129,129,129,]),'method_header':([220,232,400,440,480,],[454,490,454,454,490,]),'type_parameter_header':([197,683,],[409,409,]),'empty_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,]),'method_header_throws_clause_opt':([872,994,],[980,1078,]),'class_member_declaration':([220,400,440,],[452,452,452,]),'instanceof_expression':([4,82,139,152,249,301,303,307,310,320,323,329,338,343,356,357,360,365,367,368,375,384,385,388,497,505,510,513,514,520,523,524,525,528,531,532,533,534,544,545,571,572,613,615,627,631,678,790,791,792,794,801,820,824,827,829,832,840,847,851,860,893,894,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,666,667,180,180,180,180,743,180,180,180,180,753,180,180,180,180,180,767,768,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,]),'instanceof_expression_not_name':([62,155,222,314,467,721,890,1074,],[273,273,273,273,273,273,273,273,]),'field_declaration':([202,220,232,400,425,440,480,],[429,456,429,456,429,456,429,]),'empty':([2,3,5,14,20,23,29,31,43,82,106,191,195,202,206,207,214,218,220,222,232,303,312,317,327,343,345,357,362,398,399,400,403,417,421,425,430,440,449,480,571,572,588,597,615,639,673,678,700,790,791,792,801,803,813,820,824,827,829,832,840,851,872,873,878,879,884,885,902,903,904,917,927,928,929,931,942,946,964,966,989,994,1021,1035,1037,1047,1051,1056,1102,1112,1114,1118,1142,1146,1156,],[49,121,193,200,121,121,121,193,231,306,326,231,401,424,121,121,121,231,448,471,486,568,582,596,121,568,626,568,626,675,675,448,681,690,690,121,121,121,690,121,568,568,807,596,568,626,401,568,326,568,568,568,306,626,121,568,568,568,568,939,568,568,982,121,626,626,626,626,568,568,568,626,568,568,568,568,1043,568,568,626,1076,982,1090,568,1043,121,1043,582,1043,121,121,1043,1043,306,1090,]),'local_variable_declaration':([3,106,312,327,700,1047,1056,1112,1114,],[134,134,585,134,134,134,585,134,134,]),'modifier':([2,3,20,23,29,40,106,125,195,202,205,206,207,214,220,232,312,316,327,400,406,417,421,425,426,430,440,449,480,488,583,589,673,700,809,813,873,1047,1056,1112,1114,],[51,51,51,51,51,225,51,225,51,51,225,51,51,51,51,51,51,51,51,51,225,51,51,51,225,51,51,51,51,225,225,225,51,51,51,51,51,51,51,51,51,]),'annotation_type_declaration':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[52,135,52,52,52,135,52,52,52,52,458,492,135,458,52,52,458,492,135,135,135,135,]),'additive_expression_not_name':([62,155,222,314,467,721,890,1074,],[274,274,274,274,274,274,274,274,]),'wildcard3':([901,1084,],[1008,1008,]),'class_body_declarations':([220,400,],[440,440,]),'formal_parameter_list':([417,421,449,],[691,691,691,]),'abstract_method_declaration':([220,232,400,440,480,],[450,487,450,450,487,]),'enhanced_for_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,]),'class_header_name1':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'type_declaration':([2,20,23,29,202,206,207,214,425,430,],[11,204,11,11,418,204,11,204,418,204,]),'multiplicative_expression_not_name':([62,155,222,314,467,721,890,1074,],[276,276,276,276,276,276,276,276,]),'interface_body':([45,],[233,]),'interface_header_name1':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'annotation_type_declaration_header':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'and_expression':([4,82,139,152,249,301,303,307,310,320,323,329,338,343,356,357,360,365,367,368,375,497,505,510,520,523,524,528,531,533,534,571,572,613,615,627,631,678,790,791,792,794,801,820,824,827,829,832,840,847,851,860,893,894,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,657,727,182,740,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,]),'annotation_method_header':([202,425,],[420,420,]),'goal':([0,],[1,]),'resource_specification':([100,],[318,]),'wildcard_bounds2':([779,1007,],[897,897,]),'arguments':([403,],[679,]),'class_header_name':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'postfix_expression':([3,4,62,68,82,98,106,136,139,147,152,155,164,181,183,184,222,249,264,267,277,278,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,360,365,367,368,369,370,371,372,373,374,375,377,378,380,381,382,383,384,385,388,467,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,516,517,518,520,521,523,524,525,526,527,528,531,532,533,534,536,537,539,540,541,544,545,571,572,613,615,627,631,640,641,678,700,721,790,791,792,794,800,801,805,820,824,827,828,829,832,840,847,849,851,858,859,860,890,893,894,902,903,904,921,927,928,929,931,946,949,964,965,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1074,1112,1114,1126,1137,1146,1147,1148,1156,1157,1160,],[59,185,59,59,185,315,59,59,185,315,185,59,315,315,315,315,472,185,315,315,315,315,185,185,185,185,59,59,59,185,185,59,185,185,185,185,185,315,315,315,185,315,315,315,315,315,315,315,315,315,315,315,315,315,315,315,315,472,315,315,315,315,315,315,315,315,315,315,315,315,315,315,315,315,315,315,315,315,315,185,315,315,315,315,315,315,315,315,315,315,185,315,315,315,315,315,315,315,185,185,185,185,185,185,315,315,185,59,472,185,185,185,185,59,185,315,185,185,185,59,185,185,185,185,59,185,315,315,315,472,315,315,185,185,185,185,185,185,185,185,185,59,185,315,59,185,185,185,185,59,59,59,185,59,185,472,59,59,315,59,185,59,59,59,59,59,]),'return_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,]),'additional_bound_list1':([868,],[973,]),'dim_with_or_without_expr':([332,333,611,614,],[612,612,831,831,]),'do_statement':([3,68,106,136,311,327,700,828,849,949,1047,1055,1058,1112,1114,1137,1147,1148,1157,1160,],[143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,]),'constant_declaration':([202,232,425,480,],[423,484,423,484,]),'unary_expression_not_name':([62,155,222,314,467,721,890,1074,],[280,280,280,280,280,280,280,280,]),'type_parameter_list1':([197,],[411,]),'equality_expression_not_name':([62,155,222,314,467,721,890,1074,],[281,281,281,281,281,281,281,281,]),'block_statements':([106,700,1047,1114,],[327,327,1112,1112,]),'default_value':([989,],[1073,]),'annotation_type_body':([16,],[203,]),'assignment_expression':([4,82,139,152,249,301,303,307,310,320,323,329,338,343,356,357,368,520,534,571,572,613,615,627,631,678,790,791,792,794,801,820,824,827,829,832,840,847,851,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[186,186,186,186,496,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,]),'class_or_interface':([3,67,106,114,125,172,192,199,229,312,316,327,330,339,354,386,419,443,481,522,535,551,552,554,555,583,589,606,620,640,684,686,688,693,700,708,724,809,826,854,898,899,900,901,922,972,981,1047,1056,1081,1083,1084,1095,1112,1114,1127,],[144,291,144,144,144,144,144,144,144,144,144,144,144,144,291,144,144,144,144,144,144,291,291,291,782,144,144,144,144,291,291,144,144,144,144,144,144,144,144,144,782,782,782,782,144,291,144,144,144,782,782,782,144,144,144,144,]),'wildcard_bounds':([288,779,1007,],[549,549,549,]),'assignment':([3,4,62,68,82,106,136,139,152,155,249,301,303,307,310,311,312,314,320,323,327,329,338,343,356,357,368,520,534,571,572,613,615,627,631,678,700,790,791,792,794,800,801,820,824,827,828,829,832,840,847,849,851,902,903,904,921,927,928,929,931,946,949,964,1021,1023,1035,1039,1044,1047,1055,1056,1057,1058,1059,1112,1114,1137,1146,1147,1148,1156,1157,1160,],[145,187,282,145,187,145,145,187,187,282,187,187,187,187,187,145,145,282,187,187,145,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,145,187,187,187,187,145,187,187,187,187,145,187,187,187,187,145,187,187,187,187,187,187,187,187,187,187,145,187,145,187,187,187,187,145,145,145,187,145,187,145,145,145,187,145,145,145,145,145,]),'for_statement_no_short_if':([849,949,1055,1147,1148,1157,1160,],[959,959,959,959,959,959,959,]),'union_type':([922,],[1025,]),'dims':([58,73,116,157,174,259,284,287,295,297,340,342,345,361,362,462,493,576,587,639,769,803,855,856,878,879,884,885,914,917,966,],[235,300,337,364,379,364,235,548,556,364,548,556,625,642,644,364,726,300,642,625,726,625,300,337,625,625,625,625,364,625,625,]),'conditional_and_expression_not_name':([62,155,222,314,467,721,890,1074,],[258,258,258,258,258,258,258,258,]),'statement_no_short_if':([849,949,1055,1147,1148,1157,1160,],[960,1054,1120,1154,1155,1159,1161,]),'catches_opt':([317,597,],[595,817,]),'member_value_pair':([222,716,],[469,886,]),'annotation':([2,3,20,23,29,40,106,125,195,202,205,206,207,214,220,222,232,312,316,327,400,406,417,421,425,426,430,440,449,467,480,488,583,589,673,700,721,809,813,873,890,1047,1056,1074,1112,1114,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,475,10,10,10,10,10,10,10,10,10,10,10,10,10,475,10,10,10,10,10,10,475,10,10,10,475,10,10,475,10,10,]),'array_initializer':([611,614,627,832,921,1023,1039,],[833,836,846,846,846,846,846,]),'formal_parameter':([417,421,449,873,],[692,692,692,983,]),'interface_header':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'annotation_type_member_declaration':([202,425,],[427,698,]),'expression_opt':([82,801,1146,],[304,915,1153,]),'class_declaration':([2,3,20,23,29,106,202,206,207,214,220,232,327,400,425,430,440,480,700,1047,1112,1114,],[46,151,46,46,46,151,46,46,46,46,455,491,151,455,46,46,455,491,151,151,151,151,]),'single_member_annotation_member_value':([222,],[461,]),'wildcard':([67,354,554,555,640,900,901,1084,],[296,296,296,296,296,296,296,296,]),'conditional_expression':([4,82,139,152,249,301,303,307,310,320,323,329,338,343,356,357,368,520,534,571,572,613,615,627,631,678,790,791,792,794,801,820,824,827,829,832,840,847,851,860,893,894,902,903,904,921,927,928,929,931,946,964,1023,1035,1039,1044,1057,1059,1146,],[188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,969,997,998,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,]),'class_header_implements':([43,191,218,],[230,230,230,]),'switch_block_statements':([944,],[1049,]),'constructor_declaration':([202,220,400,425,440,],[422,444,444,422,444,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> goal","S'",1,None,None,None),
+  ('expression -> assignment_expression','expression',1,'p_expression','parser.py',107),
+  ('expression_not_name -> assignment_expression_not_name','expression_not_name',1,'p_expression_not_name','parser.py',111),
+  ('assignment_expression -> assignment','assignment_expression',1,'p_assignment_expression','parser.py',115),
+  ('assignment_expression -> conditional_expression','assignment_expression',1,'p_assignment_expression','parser.py',116),
+  ('assignment_expression_not_name -> assignment','assignment_expression_not_name',1,'p_assignment_expression_not_name','parser.py',120),
+  ('assignment_expression_not_name -> conditional_expression_not_name','assignment_expression_not_name',1,'p_assignment_expression_not_name','parser.py',121),
+  ('assignment -> postfix_expression assignment_operator assignment_expression','assignment',3,'p_assignment','parser.py',125),
+  ('assignment_operator -> =','assignment_operator',1,'p_assignment_operator','parser.py',129),
+  ('assignment_operator -> TIMES_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',130),
+  ('assignment_operator -> DIVIDE_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',131),
+  ('assignment_operator -> REMAINDER_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',132),
+  ('assignment_operator -> PLUS_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',133),
+  ('assignment_operator -> MINUS_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',134),
+  ('assignment_operator -> LSHIFT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',135),
+  ('assignment_operator -> RSHIFT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',136),
+  ('assignment_operator -> RRSHIFT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',137),
+  ('assignment_operator -> AND_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',138),
+  ('assignment_operator -> OR_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',139),
+  ('assignment_operator -> XOR_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',140),
+  ('conditional_expression -> conditional_or_expression','conditional_expression',1,'p_conditional_expression','parser.py',144),
+  ('conditional_expression -> conditional_or_expression ? expression : conditional_expression','conditional_expression',5,'p_conditional_expression','parser.py',145),
+  ('conditional_expression_not_name -> conditional_or_expression_not_name','conditional_expression_not_name',1,'p_conditional_expression_not_name','parser.py',152),
+  ('conditional_expression_not_name -> conditional_or_expression_not_name ? expression : conditional_expression','conditional_expression_not_name',5,'p_conditional_expression_not_name','parser.py',153),
+  ('conditional_expression_not_name -> name ? expression : conditional_expression','conditional_expression_not_name',5,'p_conditional_expression_not_name','parser.py',154),
+  ('conditional_or_expression -> conditional_and_expression','conditional_or_expression',1,'p_conditional_or_expression','parser.py',167),
+  ('conditional_or_expression -> conditional_or_expression OR conditional_and_expression','conditional_or_expression',3,'p_conditional_or_expression','parser.py',168),
+  ('conditional_or_expression_not_name -> conditional_and_expression_not_name','conditional_or_expression_not_name',1,'p_conditional_or_expression_not_name','parser.py',172),
+  ('conditional_or_expression_not_name -> conditional_or_expression_not_name OR conditional_and_expression','conditional_or_expression_not_name',3,'p_conditional_or_expression_not_name','parser.py',173),
+  ('conditional_or_expression_not_name -> name OR conditional_and_expression','conditional_or_expression_not_name',3,'p_conditional_or_expression_not_name','parser.py',174),
+  ('conditional_and_expression -> inclusive_or_expression','conditional_and_expression',1,'p_conditional_and_expression','parser.py',178),
+  ('conditional_and_expression -> conditional_and_expression AND inclusive_or_expression','conditional_and_expression',3,'p_conditional_and_expression','parser.py',179),
+  ('conditional_and_expression_not_name -> inclusive_or_expression_not_name','conditional_and_expression_not_name',1,'p_conditional_and_expression_not_name','parser.py',183),
+  ('conditional_and_expression_not_name -> conditional_and_expression_not_name AND inclusive_or_expression','conditional_and_expression_not_name',3,'p_conditional_and_expression_not_name','parser.py',184),
+  ('conditional_and_expression_not_name -> name AND inclusive_or_expression','conditional_and_expression_not_name',3,'p_conditional_and_expression_not_name','parser.py',185),
+  ('inclusive_or_expression -> exclusive_or_expression','inclusive_or_expression',1,'p_inclusive_or_expression','parser.py',189),
+  ('inclusive_or_expression -> inclusive_or_expression | exclusive_or_expression','inclusive_or_expression',3,'p_inclusive_or_expression','parser.py',190),
+  ('inclusive_or_expression_not_name -> exclusive_or_expression_not_name','inclusive_or_expression_not_name',1,'p_inclusive_or_expression_not_name','parser.py',194),
+  ('inclusive_or_expression_not_name -> inclusive_or_expression_not_name | exclusive_or_expression','inclusive_or_expression_not_name',3,'p_inclusive_or_expression_not_name','parser.py',195),
+  ('inclusive_or_expression_not_name -> name | exclusive_or_expression','inclusive_or_expression_not_name',3,'p_inclusive_or_expression_not_name','parser.py',196),
+  ('exclusive_or_expression -> and_expression','exclusive_or_expression',1,'p_exclusive_or_expression','parser.py',200),
+  ('exclusive_or_expression -> exclusive_or_expression ^ and_expression','exclusive_or_expression',3,'p_exclusive_or_expression','parser.py',201),
+  ('exclusive_or_expression_not_name -> and_expression_not_name','exclusive_or_expression_not_name',1,'p_exclusive_or_expression_not_name','parser.py',205),
+  ('exclusive_or_expression_not_name -> exclusive_or_expression_not_name ^ and_expression','exclusive_or_expression_not_name',3,'p_exclusive_or_expression_not_name','parser.py',206),
+  ('exclusive_or_expression_not_name -> name ^ and_expression','exclusive_or_expression_not_name',3,'p_exclusive_or_expression_not_name','parser.py',207),
+  ('and_expression -> equality_expression','and_expression',1,'p_and_expression','parser.py',211),
+  ('and_expression -> and_expression & equality_expression','and_expression',3,'p_and_expression','parser.py',212),
+  ('and_expression_not_name -> equality_expression_not_name','and_expression_not_name',1,'p_and_expression_not_name','parser.py',216),
+  ('and_expression_not_name -> and_expression_not_name & equality_expression','and_expression_not_name',3,'p_and_expression_not_name','parser.py',217),
+  ('and_expression_not_name -> name & equality_expression','and_expression_not_name',3,'p_and_expression_not_name','parser.py',218),
+  ('equality_expression -> instanceof_expression','equality_expression',1,'p_equality_expression','parser.py',222),
+  ('equality_expression -> equality_expression EQ instanceof_expression','equality_expression',3,'p_equality_expression','parser.py',223),
+  ('equality_expression -> equality_expression NEQ instanceof_expression','equality_expression',3,'p_equality_expression','parser.py',224),
+  ('equality_expression_not_name -> instanceof_expression_not_name','equality_expression_not_name',1,'p_equality_expression_not_name','parser.py',228),
+  ('equality_expression_not_name -> equality_expression_not_name EQ instanceof_expression','equality_expression_not_name',3,'p_equality_expression_not_name','parser.py',229),
+  ('equality_expression_not_name -> name EQ instanceof_expression','equality_expression_not_name',3,'p_equality_expression_not_name','parser.py',230),
+  ('equality_expression_not_name -> equality_expression_not_name NEQ instanceof_expression','equality_expression_not_name',3,'p_equality_expression_not_name','parser.py',231),
+  ('equality_expression_not_name -> name NEQ instanceof_expression','equality_expression_not_name',3,'p_equality_expression_not_name','parser.py',232),
+  ('instanceof_expression -> relational_expression','instanceof_expression',1,'p_instanceof_expression','parser.py',236),
+  ('instanceof_expression -> instanceof_expression INSTANCEOF reference_type','instanceof_expression',3,'p_instanceof_expression','parser.py',237),
+  ('instanceof_expression_not_name -> relational_expression_not_name','instanceof_expression_not_name',1,'p_instanceof_expression_not_name','parser.py',241),
+  ('instanceof_expression_not_name -> name INSTANCEOF reference_type','instanceof_expression_not_name',3,'p_instanceof_expression_not_name','parser.py',242),
+  ('instanceof_expression_not_name -> instanceof_expression_not_name INSTANCEOF reference_type','instanceof_expression_not_name',3,'p_instanceof_expression_not_name','parser.py',243),
+  ('relational_expression -> shift_expression','relational_expression',1,'p_relational_expression','parser.py',247),
+  ('relational_expression -> relational_expression > shift_expression','relational_expression',3,'p_relational_expression','parser.py',248),
+  ('relational_expression -> relational_expression < shift_expression','relational_expression',3,'p_relational_expression','parser.py',249),
+  ('relational_expression -> relational_expression GTEQ shift_expression','relational_expression',3,'p_relational_expression','parser.py',250),
+  ('relational_expression -> relational_expression LTEQ shift_expression','relational_expression',3,'p_relational_expression','parser.py',251),
+  ('relational_expression_not_name -> shift_expression_not_name','relational_expression_not_name',1,'p_relational_expression_not_name','parser.py',255),
+  ('relational_expression_not_name -> shift_expression_not_name < shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',256),
+  ('relational_expression_not_name -> name < shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',257),
+  ('relational_expression_not_name -> shift_expression_not_name > shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',258),
+  ('relational_expression_not_name -> name > shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',259),
+  ('relational_expression_not_name -> shift_expression_not_name GTEQ shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',260),
+  ('relational_expression_not_name -> name GTEQ shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',261),
+  ('relational_expression_not_name -> shift_expression_not_name LTEQ shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',262),
+  ('relational_expression_not_name -> name LTEQ shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',263),
+  ('shift_expression -> additive_expression','shift_expression',1,'p_shift_expression','parser.py',267),
+  ('shift_expression -> shift_expression LSHIFT additive_expression','shift_expression',3,'p_shift_expression','parser.py',268),
+  ('shift_expression -> shift_expression RSHIFT additive_expression','shift_expression',3,'p_shift_expression','parser.py',269),
+  ('shift_expression -> shift_expression RRSHIFT additive_expression','shift_expression',3,'p_shift_expression','parser.py',270),
+  ('shift_expression_not_name -> additive_expression_not_name','shift_expression_not_name',1,'p_shift_expression_not_name','parser.py',274),
+  ('shift_expression_not_name -> shift_expression_not_name LSHIFT additive_expression','shift_expression_not_name',3,'p_shift_expression_not_name','parser.py',275),
+  ('shift_expression_not_name -> name LSHIFT additive_expression','shift_expression_not_name',3,'p_shift_expression_not_name','parser.py',276),
+  ('shift_expression_not_name -> shift_expression_not_name RSHIFT additive_expression','shift_expression_not_name',3,'p_shift_expression_not_name','parser.py',277),
+  ('shift_expression_not_name -> name RSHIFT additive_expression','shift_expression_not_name',3,'p_shift_expression_not_name','parser.py',278),
+  ('shift_expression_not_name -> shift_expression_not_name RRSHIFT additive_expression','shift_expression_not_name',3,'p_shift_expression_not_name','parser.py',279),
+  ('shift_expression_not_name -> name RRSHIFT additive_expression','shift_expression_not_name',3,'p_shift_expression_not_name','parser.py',280),
+  ('additive_expression -> multiplicative_expression','additive_expression',1,'p_additive_expression','parser.py',284),
+  ('additive_expression -> additive_expression + multiplicative_expression','additive_expression',3,'p_additive_expression','parser.py',285),
+  ('additive_expression -> additive_expression - multiplicative_expression','additive_expression',3,'p_additive_expression','parser.py',286),
+  ('additive_expression_not_name -> multiplicative_expression_not_name','additive_expression_not_name',1,'p_additive_expression_not_name','parser.py',290),
+  ('additive_expression_not_name -> additive_expression_not_name + multiplicative_expression','additive_expression_not_name',3,'p_additive_expression_not_name','parser.py',291),
+  ('additive_expression_not_name -> name + multiplicative_expression','additive_expression_not_name',3,'p_additive_expression_not_name','parser.py',292),
+  ('additive_expression_not_name -> additive_expression_not_name - multiplicative_expression','additive_expression_not_name',3,'p_additive_expression_not_name','parser.py',293),
+  ('additive_expression_not_name -> name - multiplicative_expression','additive_expression_not_name',3,'p_additive_expression_not_name','parser.py',294),
+  ('multiplicative_expression -> unary_expression','multiplicative_expression',1,'p_multiplicative_expression','parser.py',298),
+  ('multiplicative_expression -> multiplicative_expression * unary_expression','multiplicative_expression',3,'p_multiplicative_expression','parser.py',299),
+  ('multiplicative_expression -> multiplicative_expression / unary_expression','multiplicative_expression',3,'p_multiplicative_expression','parser.py',300),
+  ('multiplicative_expression -> multiplicative_expression % unary_expression','multiplicative_expression',3,'p_multiplicative_expression','parser.py',301),
+  ('multiplicative_expression_not_name -> unary_expression_not_name','multiplicative_expression_not_name',1,'p_multiplicative_expression_not_name','parser.py',305),
+  ('multiplicative_expression_not_name -> multiplicative_expression_not_name * unary_expression','multiplicative_expression_not_name',3,'p_multiplicative_expression_not_name','parser.py',306),
+  ('multiplicative_expression_not_name -> name * unary_expression','multiplicative_expression_not_name',3,'p_multiplicative_expression_not_name','parser.py',307),
+  ('multiplicative_expression_not_name -> multiplicative_expression_not_name / unary_expression','multiplicative_expression_not_name',3,'p_multiplicative_expression_not_name','parser.py',308),
+  ('multiplicative_expression_not_name -> name / unary_expression','multiplicative_expression_not_name',3,'p_multiplicative_expression_not_name','parser.py',309),
+  ('multiplicative_expression_not_name -> multiplicative_expression_not_name % unary_expression','multiplicative_expression_not_name',3,'p_multiplicative_expression_not_name','parser.py',310),
+  ('multiplicative_expression_not_name -> name % unary_expression','multiplicative_expression_not_name',3,'p_multiplicative_expression_not_name','parser.py',311),
+  ('unary_expression -> pre_increment_expression','unary_expression',1,'p_unary_expression','parser.py',315),
+  ('unary_expression -> pre_decrement_expression','unary_expression',1,'p_unary_expression','parser.py',316),
+  ('unary_expression -> + unary_expression','unary_expression',2,'p_unary_expression','parser.py',317),
+  ('unary_expression -> - unary_expression','unary_expression',2,'p_unary_expression','parser.py',318),
+  ('unary_expression -> unary_expression_not_plus_minus','unary_expression',1,'p_unary_expression','parser.py',319),
+  ('unary_expression_not_name -> pre_increment_expression','unary_expression_not_name',1,'p_unary_expression_not_name','parser.py',326),
+  ('unary_expression_not_name -> pre_decrement_expression','unary_expression_not_name',1,'p_unary_expression_not_name','parser.py',327),
+  ('unary_expression_not_name -> + unary_expression','unary_expression_not_name',2,'p_unary_expression_not_name','parser.py',328),
+  ('unary_expression_not_name -> - unary_expression','unary_expression_not_name',2,'p_unary_expression_not_name','parser.py',329),
+  ('unary_expression_not_name -> unary_expression_not_plus_minus_not_name','unary_expression_not_name',1,'p_unary_expression_not_name','parser.py',330),
+  ('pre_increment_expression -> PLUSPLUS unary_expression','pre_increment_expression',2,'p_pre_increment_expression','parser.py',337),
+  ('pre_decrement_expression -> MINUSMINUS unary_expression','pre_decrement_expression',2,'p_pre_decrement_expression','parser.py',341),
+  ('unary_expression_not_plus_minus -> postfix_expression','unary_expression_not_plus_minus',1,'p_unary_expression_not_plus_minus','parser.py',345),
+  ('unary_expression_not_plus_minus -> ~ unary_expression','unary_expression_not_plus_minus',2,'p_unary_expression_not_plus_minus','parser.py',346),
+  ('unary_expression_not_plus_minus -> ! unary_expression','unary_expression_not_plus_minus',2,'p_unary_expression_not_plus_minus','parser.py',347),
+  ('unary_expression_not_plus_minus -> cast_expression','unary_expression_not_plus_minus',1,'p_unary_expression_not_plus_minus','parser.py',348),
+  ('unary_expression_not_plus_minus_not_name -> postfix_expression_not_name','unary_expression_not_plus_minus_not_name',1,'p_unary_expression_not_plus_minus_not_name','parser.py',355),
+  ('unary_expression_not_plus_minus_not_name -> ~ unary_expression','unary_expression_not_plus_minus_not_name',2,'p_unary_expression_not_plus_minus_not_name','parser.py',356),
+  ('unary_expression_not_plus_minus_not_name -> ! unary_expression','unary_expression_not_plus_minus_not_name',2,'p_unary_expression_not_plus_minus_not_name','parser.py',357),
+  ('unary_expression_not_plus_minus_not_name -> cast_expression','unary_expression_not_plus_minus_not_name',1,'p_unary_expression_not_plus_minus_not_name','parser.py',358),
+  ('postfix_expression -> primary','postfix_expression',1,'p_postfix_expression','parser.py',365),
+  ('postfix_expression -> name','postfix_expression',1,'p_postfix_expression','parser.py',366),
+  ('postfix_expression -> post_increment_expression','postfix_expression',1,'p_postfix_expression','parser.py',367),
+  ('postfix_expression -> post_decrement_expression','postfix_expression',1,'p_postfix_expression','parser.py',368),
+  ('postfix_expression_not_name -> primary','postfix_expression_not_name',1,'p_postfix_expression_not_name','parser.py',372),
+  ('postfix_expression_not_name -> post_increment_expression','postfix_expression_not_name',1,'p_postfix_expression_not_name','parser.py',373),
+  ('postfix_expression_not_name -> post_decrement_expression','postfix_expression_not_name',1,'p_postfix_expression_not_name','parser.py',374),
+  ('post_increment_expression -> postfix_expression PLUSPLUS','post_increment_expression',2,'p_post_increment_expression','parser.py',378),
+  ('post_decrement_expression -> postfix_expression MINUSMINUS','post_decrement_expression',2,'p_post_decrement_expression','parser.py',382),
+  ('primary -> primary_no_new_array','primary',1,'p_primary','parser.py',386),
+  ('primary -> array_creation_with_array_initializer','primary',1,'p_primary','parser.py',387),
+  ('primary -> array_creation_without_array_initializer','primary',1,'p_primary','parser.py',388),
+  ('primary_no_new_array -> literal','primary_no_new_array',1,'p_primary_no_new_array','parser.py',392),
+  ('primary_no_new_array -> THIS','primary_no_new_array',1,'p_primary_no_new_array','parser.py',393),
+  ('primary_no_new_array -> class_instance_creation_expression','primary_no_new_array',1,'p_primary_no_new_array','parser.py',394),
+  ('primary_no_new_array -> field_access','primary_no_new_array',1,'p_primary_no_new_array','parser.py',395),
+  ('primary_no_new_array -> method_invocation','primary_no_new_array',1,'p_primary_no_new_array','parser.py',396),
+  ('primary_no_new_array -> array_access','primary_no_new_array',1,'p_primary_no_new_array','parser.py',397),
+  ('primary_no_new_array -> ( name )','primary_no_new_array',3,'p_primary_no_new_array2','parser.py',401),
+  ('primary_no_new_array -> ( expression_not_name )','primary_no_new_array',3,'p_primary_no_new_array2','parser.py',402),
+  ('primary_no_new_array -> name . THIS','primary_no_new_array',3,'p_primary_no_new_array3','parser.py',406),
+  ('primary_no_new_array -> name . SUPER','primary_no_new_array',3,'p_primary_no_new_array3','parser.py',407),
+  ('primary_no_new_array -> name . CLASS','primary_no_new_array',3,'p_primary_no_new_array4','parser.py',412),
+  ('primary_no_new_array -> name dims . CLASS','primary_no_new_array',4,'p_primary_no_new_array4','parser.py',413),
+  ('primary_no_new_array -> primitive_type dims . CLASS','primary_no_new_array',4,'p_primary_no_new_array4','parser.py',414),
+  ('primary_no_new_array -> primitive_type . CLASS','primary_no_new_array',3,'p_primary_no_new_array4','parser.py',415),
+  ('dims_opt -> dims','dims_opt',1,'p_dims_opt','parser.py',422),
+  ('dims_opt -> empty','dims_opt',1,'p_dims_opt2','parser.py',426),
+  ('dims -> dims_loop','dims',1,'p_dims','parser.py',430),
+  ('dims_loop -> one_dim_loop','dims_loop',1,'p_dims_loop','parser.py',434),
+  ('dims_loop -> dims_loop one_dim_loop','dims_loop',2,'p_dims_loop','parser.py',435),
+  ('one_dim_loop -> [ ]','one_dim_loop',2,'p_one_dim_loop','parser.py',442),
+  ('cast_expression -> ( primitive_type dims_opt ) unary_expression','cast_expression',5,'p_cast_expression','parser.py',446),
+  ('cast_expression -> ( name type_arguments dims_opt ) unary_expression_not_plus_minus','cast_expression',6,'p_cast_expression2','parser.py',450),
+  ('cast_expression -> ( name type_arguments . class_or_interface_type dims_opt ) unary_expression_not_plus_minus','cast_expression',8,'p_cast_expression3','parser.py',454),
+  ('cast_expression -> ( name ) unary_expression_not_plus_minus','cast_expression',4,'p_cast_expression4','parser.py',460),
+  ('cast_expression -> ( name dims ) unary_expression_not_plus_minus','cast_expression',5,'p_cast_expression5','parser.py',465),
+  ('block -> { block_statements_opt }','block',3,'p_block','parser.py',472),
+  ('block_statements_opt -> block_statements','block_statements_opt',1,'p_block_statements_opt','parser.py',476),
+  ('block_statements_opt -> empty','block_statements_opt',1,'p_block_statements_opt2','parser.py',480),
+  ('block_statements -> block_statement','block_statements',1,'p_block_statements','parser.py',484),
+  ('block_statements -> block_statements block_statement','block_statements',2,'p_block_statements','parser.py',485),
+  ('block_statement -> local_variable_declaration_statement','block_statement',1,'p_block_statement','parser.py',492),
+  ('block_statement -> statement','block_statement',1,'p_block_statement','parser.py',493),
+  ('block_statement -> class_declaration','block_statement',1,'p_block_statement','parser.py',494),
+  ('block_statement -> interface_declaration','block_statement',1,'p_block_statement','parser.py',495),
+  ('block_statement -> annotation_type_declaration','block_statement',1,'p_block_statement','parser.py',496),
+  ('block_statement -> enum_declaration','block_statement',1,'p_block_statement','parser.py',497),
+  ('local_variable_declaration_statement -> local_variable_declaration ;','local_variable_declaration_statement',2,'p_local_variable_declaration_statement','parser.py',501),
+  ('local_variable_declaration -> type variable_declarators','local_variable_declaration',2,'p_local_variable_declaration','parser.py',505),
+  ('local_variable_declaration -> modifiers type variable_declarators','local_variable_declaration',3,'p_local_variable_declaration2','parser.py',509),
+  ('variable_declarators -> variable_declarator','variable_declarators',1,'p_variable_declarators','parser.py',513),
+  ('variable_declarators -> variable_declarators , variable_declarator','variable_declarators',3,'p_variable_declarators','parser.py',514),
+  ('variable_declarator -> variable_declarator_id','variable_declarator',1,'p_variable_declarator','parser.py',521),
+  ('variable_declarator -> variable_declarator_id = variable_initializer','variable_declarator',3,'p_variable_declarator','parser.py',522),
+  ('variable_declarator_id -> NAME dims_opt','variable_declarator_id',2,'p_variable_declarator_id','parser.py',529),
+  ('variable_initializer -> expression','variable_initializer',1,'p_variable_initializer','parser.py',533),
+  ('variable_initializer -> array_initializer','variable_initializer',1,'p_variable_initializer','parser.py',534),
+  ('statement -> statement_without_trailing_substatement','statement',1,'p_statement','parser.py',538),
+  ('statement -> labeled_statement','statement',1,'p_statement','parser.py',539),
+  ('statement -> if_then_statement','statement',1,'p_statement','parser.py',540),
+  ('statement -> if_then_else_statement','statement',1,'p_statement','parser.py',541),
+  ('statement -> while_statement','statement',1,'p_statement','parser.py',542),
+  ('statement -> for_statement','statement',1,'p_statement','parser.py',543),
+  ('statement -> enhanced_for_statement','statement',1,'p_statement','parser.py',544),
+  ('statement_without_trailing_substatement -> block','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',548),
+  ('statement_without_trailing_substatement -> expression_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',549),
+  ('statement_without_trailing_substatement -> assert_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',550),
+  ('statement_without_trailing_substatement -> empty_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',551),
+  ('statement_without_trailing_substatement -> switch_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',552),
+  ('statement_without_trailing_substatement -> do_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',553),
+  ('statement_without_trailing_substatement -> break_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',554),
+  ('statement_without_trailing_substatement -> continue_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',555),
+  ('statement_without_trailing_substatement -> return_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',556),
+  ('statement_without_trailing_substatement -> synchronized_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',557),
+  ('statement_without_trailing_substatement -> throw_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',558),
+  ('statement_without_trailing_substatement -> try_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',559),
+  ('statement_without_trailing_substatement -> try_statement_with_resources','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',560),
+  ('expression_statement -> statement_expression ;','expression_statement',2,'p_expression_statement','parser.py',564),
+  ('expression_statement -> explicit_constructor_invocation','expression_statement',1,'p_expression_statement','parser.py',565),
+  ('statement_expression -> assignment','statement_expression',1,'p_statement_expression','parser.py',569),
+  ('statement_expression -> pre_increment_expression','statement_expression',1,'p_statement_expression','parser.py',570),
+  ('statement_expression -> pre_decrement_expression','statement_expression',1,'p_statement_expression','parser.py',571),
+  ('statement_expression -> post_increment_expression','statement_expression',1,'p_statement_expression','parser.py',572),
+  ('statement_expression -> post_decrement_expression','statement_expression',1,'p_statement_expression','parser.py',573),
+  ('statement_expression -> method_invocation','statement_expression',1,'p_statement_expression','parser.py',574),
+  ('statement_expression -> class_instance_creation_expression','statement_expression',1,'p_statement_expression','parser.py',575),
+  ('comma_opt -> ,','comma_opt',1,'p_comma_opt','parser.py',579),
+  ('comma_opt -> empty','comma_opt',1,'p_comma_opt','parser.py',580),
+  ('array_initializer -> { comma_opt }','array_initializer',3,'p_array_initializer','parser.py',584),
+  ('array_initializer -> { variable_initializers }','array_initializer',3,'p_array_initializer2','parser.py',588),
+  ('array_initializer -> { variable_initializers , }','array_initializer',4,'p_array_initializer2','parser.py',589),
+  ('variable_initializers -> variable_initializer','variable_initializers',1,'p_variable_initializers','parser.py',593),
+  ('variable_initializers -> variable_initializers , variable_initializer','variable_initializers',3,'p_variable_initializers','parser.py',594),
+  ('method_invocation -> NAME ( argument_list_opt )','method_invocation',4,'p_method_invocation','parser.py',601),
+  ('method_invocation -> name . type_arguments NAME ( argument_list_opt )','method_invocation',7,'p_method_invocation2','parser.py',605),
+  ('method_invocation -> primary . type_arguments NAME ( argument_list_opt )','method_invocation',7,'p_method_invocation2','parser.py',606),
+  ('method_invocation -> SUPER . type_arguments NAME ( argument_list_opt )','method_invocation',7,'p_method_invocation2','parser.py',607),
+  ('method_invocation -> name . NAME ( argument_list_opt )','method_invocation',6,'p_method_invocation3','parser.py',611),
+  ('method_invocation -> primary . NAME ( argument_list_opt )','method_invocation',6,'p_method_invocation3','parser.py',612),
+  ('method_invocation -> SUPER . NAME ( argument_list_opt )','method_invocation',6,'p_method_invocation3','parser.py',613),
+  ('labeled_statement -> label : statement','labeled_statement',3,'p_labeled_statement','parser.py',617),
+  ('labeled_statement_no_short_if -> label : statement_no_short_if','labeled_statement_no_short_if',3,'p_labeled_statement_no_short_if','parser.py',622),
+  ('label -> NAME','label',1,'p_label','parser.py',627),
+  ('if_then_statement -> IF ( expression ) statement','if_then_statement',5,'p_if_then_statement','parser.py',631),
+  ('if_then_else_statement -> IF ( expression ) statement_no_short_if ELSE statement','if_then_else_statement',7,'p_if_then_else_statement','parser.py',635),
+  ('if_then_else_statement_no_short_if -> IF ( expression ) statement_no_short_if ELSE statement_no_short_if','if_then_else_statement_no_short_if',7,'p_if_then_else_statement_no_short_if','parser.py',639),
+  ('while_statement -> WHILE ( expression ) statement','while_statement',5,'p_while_statement','parser.py',643),
+  ('while_statement_no_short_if -> WHILE ( expression ) statement_no_short_if','while_statement_no_short_if',5,'p_while_statement_no_short_if','parser.py',647),
+  ('for_statement -> FOR ( for_init_opt ; expression_opt ; for_update_opt ) statement','for_statement',9,'p_for_statement','parser.py',651),
+  ('for_statement_no_short_if -> FOR ( for_init_opt ; expression_opt ; for_update_opt ) statement_no_short_if','for_statement_no_short_if',9,'p_for_statement_no_short_if','parser.py',655),
+  ('for_init_opt -> for_init','for_init_opt',1,'p_for_init_opt','parser.py',659),
+  ('for_init_opt -> empty','for_init_opt',1,'p_for_init_opt','parser.py',660),
+  ('for_init -> statement_expression_list','for_init',1,'p_for_init','parser.py',664),
+  ('for_init -> local_variable_declaration','for_init',1,'p_for_init','parser.py',665),
+  ('statement_expression_list -> statement_expression','statement_expression_list',1,'p_statement_expression_list','parser.py',669),
+  ('statement_expression_list -> statement_expression_list , statement_expression','statement_expression_list',3,'p_statement_expression_list','parser.py',670),
+  ('expression_opt -> expression','expression_opt',1,'p_expression_opt','parser.py',677),
+  ('expression_opt -> empty','expression_opt',1,'p_expression_opt','parser.py',678),
+  ('for_update_opt -> for_update','for_update_opt',1,'p_for_update_opt','parser.py',682),
+  ('for_update_opt -> empty','for_update_opt',1,'p_for_update_opt','parser.py',683),
+  ('for_update -> statement_expression_list','for_update',1,'p_for_update','parser.py',687),
+  ('enhanced_for_statement -> enhanced_for_statement_header statement','enhanced_for_statement',2,'p_enhanced_for_statement','parser.py',691),
+  ('enhanced_for_statement_no_short_if -> enhanced_for_statement_header statement_no_short_if','enhanced_for_statement_no_short_if',2,'p_enhanced_for_statement_no_short_if','parser.py',695),
+  ('enhanced_for_statement_header -> enhanced_for_statement_header_init : expression )','enhanced_for_statement_header',4,'p_enhanced_for_statement_header','parser.py',699),
+  ('enhanced_for_statement_header_init -> FOR ( type NAME dims_opt','enhanced_for_statement_header_init',5,'p_enhanced_for_statement_header_init','parser.py',704),
+  ('enhanced_for_statement_header_init -> FOR ( modifiers type NAME dims_opt','enhanced_for_statement_header_init',6,'p_enhanced_for_statement_header_init2','parser.py',708),
+  ('statement_no_short_if -> statement_without_trailing_substatement','statement_no_short_if',1,'p_statement_no_short_if','parser.py',712),
+  ('statement_no_short_if -> labeled_statement_no_short_if','statement_no_short_if',1,'p_statement_no_short_if','parser.py',713),
+  ('statement_no_short_if -> if_then_else_statement_no_short_if','statement_no_short_if',1,'p_statement_no_short_if','parser.py',714),
+  ('statement_no_short_if -> while_statement_no_short_if','statement_no_short_if',1,'p_statement_no_short_if','parser.py',715),
+  ('statement_no_short_if -> for_statement_no_short_if','statement_no_short_if',1,'p_statement_no_short_if','parser.py',716),
+  ('statement_no_short_if -> enhanced_for_statement_no_short_if','statement_no_short_if',1,'p_statement_no_short_if','parser.py',717),
+  ('assert_statement -> ASSERT expression ;','assert_statement',3,'p_assert_statement','parser.py',721),
+  ('assert_statement -> ASSERT expression : expression ;','assert_statement',5,'p_assert_statement','parser.py',722),
+  ('empty_statement -> ;','empty_statement',1,'p_empty_statement','parser.py',729),
+  ('switch_statement -> SWITCH ( expression ) switch_block','switch_statement',5,'p_switch_statement','parser.py',733),
+  ('switch_block -> { }','switch_block',2,'p_switch_block','parser.py',737),
+  ('switch_block -> { switch_block_statements }','switch_block',3,'p_switch_block2','parser.py',741),
+  ('switch_block -> { switch_labels }','switch_block',3,'p_switch_block3','parser.py',745),
+  ('switch_block -> { switch_block_statements switch_labels }','switch_block',4,'p_switch_block4','parser.py',749),
+  ('switch_block_statements -> switch_block_statement','switch_block_statements',1,'p_switch_block_statements','parser.py',753),
+  ('switch_block_statements -> switch_block_statements switch_block_statement','switch_block_statements',2,'p_switch_block_statements','parser.py',754),
+  ('switch_block_statement -> switch_labels block_statements','switch_block_statement',2,'p_switch_block_statement','parser.py',761),
+  ('switch_labels -> switch_label','switch_labels',1,'p_switch_labels','parser.py',765),
+  ('switch_labels -> switch_labels switch_label','switch_labels',2,'p_switch_labels','parser.py',766),
+  ('switch_label -> CASE constant_expression :','switch_label',3,'p_switch_label','parser.py',773),
+  ('switch_label -> DEFAULT :','switch_label',2,'p_switch_label','parser.py',774),
+  ('constant_expression -> expression','constant_expression',1,'p_constant_expression','parser.py',781),
+  ('do_statement -> DO statement WHILE ( expression ) ;','do_statement',7,'p_do_statement','parser.py',785),
+  ('break_statement -> BREAK ;','break_statement',2,'p_break_statement','parser.py',789),
+  ('break_statement -> BREAK NAME ;','break_statement',3,'p_break_statement','parser.py',790),
+  ('continue_statement -> CONTINUE ;','continue_statement',2,'p_continue_statement','parser.py',797),
+  ('continue_statement -> CONTINUE NAME ;','continue_statement',3,'p_continue_statement','parser.py',798),
+  ('return_statement -> RETURN expression_opt ;','return_statement',3,'p_return_statement','parser.py',805),
+  ('synchronized_statement -> SYNCHRONIZED ( expression ) block','synchronized_statement',5,'p_synchronized_statement','parser.py',809),
+  ('throw_statement -> THROW expression ;','throw_statement',3,'p_throw_statement','parser.py',813),
+  ('try_statement -> TRY try_block catches','try_statement',3,'p_try_statement','parser.py',817),
+  ('try_statement -> TRY try_block catches_opt finally','try_statement',4,'p_try_statement','parser.py',818),
+  ('try_block -> block','try_block',1,'p_try_block','parser.py',825),
+  ('catches -> catch_clause','catches',1,'p_catches','parser.py',829),
+  ('catches -> catches catch_clause','catches',2,'p_catches','parser.py',830),
+  ('catches_opt -> catches','catches_opt',1,'p_catches_opt','parser.py',837),
+  ('catches_opt -> empty','catches_opt',1,'p_catches_opt2','parser.py',841),
+  ('catch_clause -> CATCH ( catch_formal_parameter ) block','catch_clause',5,'p_catch_clause','parser.py',845),
+  ('catch_formal_parameter -> modifiers_opt catch_type variable_declarator_id','catch_formal_parameter',3,'p_catch_formal_parameter','parser.py',849),
+  ('catch_type -> union_type','catch_type',1,'p_catch_type','parser.py',853),
+  ('union_type -> type','union_type',1,'p_union_type','parser.py',857),
+  ('union_type -> union_type | type','union_type',3,'p_union_type','parser.py',858),
+  ('try_statement_with_resources -> TRY resource_specification try_block catches_opt','try_statement_with_resources',4,'p_try_statement_with_resources','parser.py',865),
+  ('try_statement_with_resources -> TRY resource_specification try_block catches_opt finally','try_statement_with_resources',5,'p_try_statement_with_resources','parser.py',866),
+  ('resource_specification -> ( resources semi_opt )','resource_specification',4,'p_resource_specification','parser.py',873),
+  ('semi_opt -> ;','semi_opt',1,'p_semi_opt','parser.py',877),
+  ('semi_opt -> empty','semi_opt',1,'p_semi_opt','parser.py',878),
+  ('resources -> resource','resources',1,'p_resources','parser.py',882),
+  ('resources -> resources trailing_semicolon resource','resources',3,'p_resources','parser.py',883),
+  ('trailing_semicolon -> ;','trailing_semicolon',1,'p_trailing_semicolon','parser.py',890),
+  ('resource -> type variable_declarator_id = variable_initializer','resource',4,'p_resource','parser.py',894),
+  ('resource -> modifiers type variable_declarator_id = variable_initializer','resource',5,'p_resource2','parser.py',898),
+  ('finally -> FINALLY block','finally',2,'p_finally','parser.py',902),
+  ('explicit_constructor_invocation -> THIS ( argument_list_opt ) ;','explicit_constructor_invocation',5,'p_explicit_constructor_invocation','parser.py',906),
+  ('explicit_constructor_invocation -> SUPER ( argument_list_opt ) ;','explicit_constructor_invocation',5,'p_explicit_constructor_invocation','parser.py',907),
+  ('explicit_constructor_invocation -> type_arguments SUPER ( argument_list_opt ) ;','explicit_constructor_invocation',6,'p_explicit_constructor_invocation2','parser.py',911),
+  ('explicit_constructor_invocation -> type_arguments THIS ( argument_list_opt ) ;','explicit_constructor_invocation',6,'p_explicit_constructor_invocation2','parser.py',912),
+  ('explicit_constructor_invocation -> primary . SUPER ( argument_list_opt ) ;','explicit_constructor_invocation',7,'p_explicit_constructor_invocation3','parser.py',916),
+  ('explicit_constructor_invocation -> name . SUPER ( argument_list_opt ) ;','explicit_constructor_invocation',7,'p_explicit_constructor_invocation3','parser.py',917),
+  ('explicit_constructor_invocation -> primary . THIS ( argument_list_opt ) ;','explicit_constructor_invocation',7,'p_explicit_constructor_invocation3','parser.py',918),
+  ('explicit_constructor_invocation -> name . THIS ( argument_list_opt ) ;','explicit_constructor_invocation',7,'p_explicit_constructor_invocation3','parser.py',919),
+  ('explicit_constructor_invocation -> primary . type_arguments SUPER ( argument_list_opt ) ;','explicit_constructor_invocation',8,'p_explicit_constructor_invocation4','parser.py',923),
+  ('explicit_constructor_invocation -> name . type_arguments SUPER ( argument_list_opt ) ;','explicit_constructor_invocation',8,'p_explicit_constructor_invocation4','parser.py',924),
+  ('explicit_constructor_invocation -> primary . type_arguments THIS ( argument_list_opt ) ;','explicit_constructor_invocation',8,'p_explicit_constructor_invocation4','parser.py',925),
+  ('explicit_constructor_invocation -> name . type_arguments THIS ( argument_list_opt ) ;','explicit_constructor_invocation',8,'p_explicit_constructor_invocation4','parser.py',926),
+  ('class_instance_creation_expression -> NEW type_arguments class_type ( argument_list_opt ) class_body_opt','class_instance_creation_expression',7,'p_class_instance_creation_expression','parser.py',930),
+  ('class_instance_creation_expression -> NEW class_type ( argument_list_opt ) class_body_opt','class_instance_creation_expression',6,'p_class_instance_creation_expression2','parser.py',934),
+  ('class_instance_creation_expression -> primary . NEW type_arguments class_type ( argument_list_opt ) class_body_opt','class_instance_creation_expression',9,'p_class_instance_creation_expression3','parser.py',938),
+  ('class_instance_creation_expression -> primary . NEW class_type ( argument_list_opt ) class_body_opt','class_instance_creation_expression',8,'p_class_instance_creation_expression4','parser.py',942),
+  ('class_instance_creation_expression -> class_instance_creation_expression_name NEW class_type ( argument_list_opt ) class_body_opt','class_instance_creation_expression',7,'p_class_instance_creation_expression5','parser.py',946),
+  ('class_instance_creation_expression -> class_instance_creation_expression_name NEW type_arguments class_type ( argument_list_opt ) class_body_opt','class_instance_creation_expression',8,'p_class_instance_creation_expression6','parser.py',950),
+  ('class_instance_creation_expression_name -> name .','class_instance_creation_expression_name',2,'p_class_instance_creation_expression_name','parser.py',954),
+  ('class_body_opt -> class_body','class_body_opt',1,'p_class_body_opt','parser.py',958),
+  ('class_body_opt -> empty','class_body_opt',1,'p_class_body_opt','parser.py',959),
+  ('field_access -> primary . NAME','field_access',3,'p_field_access','parser.py',963),
+  ('field_access -> SUPER . NAME','field_access',3,'p_field_access','parser.py',964),
+  ('array_access -> name [ expression ]','array_access',4,'p_array_access','parser.py',968),
+  ('array_access -> primary_no_new_array [ expression ]','array_access',4,'p_array_access','parser.py',969),
+  ('array_access -> array_creation_with_array_initializer [ expression ]','array_access',4,'p_array_access','parser.py',970),
+  ('array_creation_with_array_initializer -> NEW primitive_type dim_with_or_without_exprs array_initializer','array_creation_with_array_initializer',4,'p_array_creation_with_array_initializer','parser.py',974),
+  ('array_creation_with_array_initializer -> NEW class_or_interface_type dim_with_or_without_exprs array_initializer','array_creation_with_array_initializer',4,'p_array_creation_with_array_initializer','parser.py',975),
+  ('dim_with_or_without_exprs -> dim_with_or_without_expr','dim_with_or_without_exprs',1,'p_dim_with_or_without_exprs','parser.py',979),
+  ('dim_with_or_without_exprs -> dim_with_or_without_exprs dim_with_or_without_expr','dim_with_or_without_exprs',2,'p_dim_with_or_without_exprs','parser.py',980),
+  ('dim_with_or_without_expr -> [ expression ]','dim_with_or_without_expr',3,'p_dim_with_or_without_expr','parser.py',987),
+  ('dim_with_or_without_expr -> [ ]','dim_with_or_without_expr',2,'p_dim_with_or_without_expr','parser.py',988),
+  ('array_creation_without_array_initializer -> NEW primitive_type dim_with_or_without_exprs','array_creation_without_array_initializer',3,'p_array_creation_without_array_initializer','parser.py',995),
+  ('array_creation_without_array_initializer -> NEW class_or_interface_type dim_with_or_without_exprs','array_creation_without_array_initializer',3,'p_array_creation_without_array_initializer','parser.py',996),
+  ('name -> simple_name','name',1,'p_name','parser.py',1002),
+  ('name -> qualified_name','name',1,'p_name','parser.py',1003),
+  ('simple_name -> NAME','simple_name',1,'p_simple_name','parser.py',1007),
+  ('qualified_name -> name . simple_name','qualified_name',3,'p_qualified_name','parser.py',1011),
+  ('literal -> NUM','literal',1,'p_literal','parser.py',1018),
+  ('literal -> CHAR_LITERAL','literal',1,'p_literal','parser.py',1019),
+  ('literal -> STRING_LITERAL','literal',1,'p_literal','parser.py',1020),
+  ('literal -> TRUE','literal',1,'p_literal','parser.py',1021),
+  ('literal -> FALSE','literal',1,'p_literal','parser.py',1022),
+  ('literal -> NULL','literal',1,'p_literal','parser.py',1023),
+  ('modifiers_opt -> modifiers','modifiers_opt',1,'p_modifiers_opt','parser.py',1029),
+  ('modifiers_opt -> empty','modifiers_opt',1,'p_modifiers_opt2','parser.py',1033),
+  ('modifiers -> modifier','modifiers',1,'p_modifiers','parser.py',1037),
+  ('modifiers -> modifiers modifier','modifiers',2,'p_modifiers','parser.py',1038),
+  ('modifier -> PUBLIC','modifier',1,'p_modifier','parser.py',1045),
+  ('modifier -> PROTECTED','modifier',1,'p_modifier','parser.py',1046),
+  ('modifier -> PRIVATE','modifier',1,'p_modifier','parser.py',1047),
+  ('modifier -> STATIC','modifier',1,'p_modifier','parser.py',1048),
+  ('modifier -> ABSTRACT','modifier',1,'p_modifier','parser.py',1049),
+  ('modifier -> FINAL','modifier',1,'p_modifier','parser.py',1050),
+  ('modifier -> NATIVE','modifier',1,'p_modifier','parser.py',1051),
+  ('modifier -> SYNCHRONIZED','modifier',1,'p_modifier','parser.py',1052),
+  ('modifier -> TRANSIENT','modifier',1,'p_modifier','parser.py',1053),
+  ('modifier -> VOLATILE','modifier',1,'p_modifier','parser.py',1054),
+  ('modifier -> STRICTFP','modifier',1,'p_modifier','parser.py',1055),
+  ('modifier -> annotation','modifier',1,'p_modifier','parser.py',1056),
+  ('type -> primitive_type','type',1,'p_type','parser.py',1060),
+  ('type -> reference_type','type',1,'p_type','parser.py',1061),
+  ('primitive_type -> BOOLEAN','primitive_type',1,'p_primitive_type','parser.py',1065),
+  ('primitive_type -> VOID','primitive_type',1,'p_primitive_type','parser.py',1066),
+  ('primitive_type -> BYTE','primitive_type',1,'p_primitive_type','parser.py',1067),
+  ('primitive_type -> SHORT','primitive_type',1,'p_primitive_type','parser.py',1068),
+  ('primitive_type -> INT','primitive_type',1,'p_primitive_type','parser.py',1069),
+  ('primitive_type -> LONG','primitive_type',1,'p_primitive_type','parser.py',1070),
+  ('primitive_type -> CHAR','primitive_type',1,'p_primitive_type','parser.py',1071),
+  ('primitive_type -> FLOAT','primitive_type',1,'p_primitive_type','parser.py',1072),
+  ('primitive_type -> DOUBLE','primitive_type',1,'p_primitive_type','parser.py',1073),
+  ('reference_type -> class_or_interface_type','reference_type',1,'p_reference_type','parser.py',1077),
+  ('reference_type -> array_type','reference_type',1,'p_reference_type','parser.py',1078),
+  ('class_or_interface_type -> class_or_interface','class_or_interface_type',1,'p_class_or_interface_type','parser.py',1082),
+  ('class_or_interface_type -> generic_type','class_or_interface_type',1,'p_class_or_interface_type','parser.py',1083),
+  ('class_type -> class_or_interface_type','class_type',1,'p_class_type','parser.py',1087),
+  ('class_or_interface -> name','class_or_interface',1,'p_class_or_interface','parser.py',1091),
+  ('class_or_interface -> generic_type . name','class_or_interface',3,'p_class_or_interface','parser.py',1092),
+  ('generic_type -> class_or_interface type_arguments','generic_type',2,'p_generic_type','parser.py',1099),
+  ('generic_type -> class_or_interface < >','generic_type',3,'p_generic_type2','parser.py',1104),
+  ('array_type -> primitive_type dims','array_type',2,'p_array_type','parser.py',1119),
+  ('array_type -> name dims','array_type',2,'p_array_type','parser.py',1120),
+  ('array_type -> generic_type dims','array_type',2,'p_array_type2','parser.py',1124),
+  ('array_type -> generic_type . name dims','array_type',4,'p_array_type3','parser.py',1129),
+  ('type_arguments -> < type_argument_list1','type_arguments',2,'p_type_arguments','parser.py',1133),
+  ('type_argument_list1 -> type_argument1','type_argument_list1',1,'p_type_argument_list1','parser.py',1137),
+  ('type_argument_list1 -> type_argument_list , type_argument1','type_argument_list1',3,'p_type_argument_list1','parser.py',1138),
+  ('type_argument_list -> type_argument','type_argument_list',1,'p_type_argument_list','parser.py',1145),
+  ('type_argument_list -> type_argument_list , type_argument','type_argument_list',3,'p_type_argument_list','parser.py',1146),
+  ('type_argument -> reference_type','type_argument',1,'p_type_argument','parser.py',1153),
+  ('type_argument -> wildcard','type_argument',1,'p_type_argument','parser.py',1154),
+  ('type_argument1 -> reference_type1','type_argument1',1,'p_type_argument1','parser.py',1158),
+  ('type_argument1 -> wildcard1','type_argument1',1,'p_type_argument1','parser.py',1159),
+  ('reference_type1 -> reference_type >','reference_type1',2,'p_reference_type1','parser.py',1163),
+  ('reference_type1 -> class_or_interface < type_argument_list2','reference_type1',3,'p_reference_type1','parser.py',1164),
+  ('type_argument_list2 -> type_argument2','type_argument_list2',1,'p_type_argument_list2','parser.py',1172),
+  ('type_argument_list2 -> type_argument_list , type_argument2','type_argument_list2',3,'p_type_argument_list2','parser.py',1173),
+  ('type_argument2 -> reference_type2','type_argument2',1,'p_type_argument2','parser.py',1180),
+  ('type_argument2 -> wildcard2','type_argument2',1,'p_type_argument2','parser.py',1181),
+  ('reference_type2 -> reference_type RSHIFT','reference_type2',2,'p_reference_type2','parser.py',1185),
+  ('reference_type2 -> class_or_interface < type_argument_list3','reference_type2',3,'p_reference_type2','parser.py',1186),
+  ('type_argument_list3 -> type_argument3','type_argument_list3',1,'p_type_argument_list3','parser.py',1194),
+  ('type_argument_list3 -> type_argument_list , type_argument3','type_argument_list3',3,'p_type_argument_list3','parser.py',1195),
+  ('type_argument3 -> reference_type3','type_argument3',1,'p_type_argument3','parser.py',1202),
+  ('type_argument3 -> wildcard3','type_argument3',1,'p_type_argument3','parser.py',1203),
+  ('reference_type3 -> reference_type RRSHIFT','reference_type3',2,'p_reference_type3','parser.py',1207),
+  ('wildcard -> ?','wildcard',1,'p_wildcard','parser.py',1211),
+  ('wildcard -> ? wildcard_bounds','wildcard',2,'p_wildcard','parser.py',1212),
+  ('wildcard_bounds -> EXTENDS reference_type','wildcard_bounds',2,'p_wildcard_bounds','parser.py',1219),
+  ('wildcard_bounds -> SUPER reference_type','wildcard_bounds',2,'p_wildcard_bounds','parser.py',1220),
+  ('wildcard1 -> ? >','wildcard1',2,'p_wildcard1','parser.py',1227),
+  ('wildcard1 -> ? wildcard_bounds1','wildcard1',2,'p_wildcard1','parser.py',1228),
+  ('wildcard_bounds1 -> EXTENDS reference_type1','wildcard_bounds1',2,'p_wildcard_bounds1','parser.py',1235),
+  ('wildcard_bounds1 -> SUPER reference_type1','wildcard_bounds1',2,'p_wildcard_bounds1','parser.py',1236),
+  ('wildcard2 -> ? RSHIFT','wildcard2',2,'p_wildcard2','parser.py',1243),
+  ('wildcard2 -> ? wildcard_bounds2','wildcard2',2,'p_wildcard2','parser.py',1244),
+  ('wildcard_bounds2 -> EXTENDS reference_type2','wildcard_bounds2',2,'p_wildcard_bounds2','parser.py',1251),
+  ('wildcard_bounds2 -> SUPER reference_type2','wildcard_bounds2',2,'p_wildcard_bounds2','parser.py',1252),
+  ('wildcard3 -> ? RRSHIFT','wildcard3',2,'p_wildcard3','parser.py',1259),
+  ('wildcard3 -> ? wildcard_bounds3','wildcard3',2,'p_wildcard3','parser.py',1260),
+  ('wildcard_bounds3 -> EXTENDS reference_type3','wildcard_bounds3',2,'p_wildcard_bounds3','parser.py',1267),
+  ('wildcard_bounds3 -> SUPER reference_type3','wildcard_bounds3',2,'p_wildcard_bounds3','parser.py',1268),
+  ('type_parameter_header -> NAME','type_parameter_header',1,'p_type_parameter_header','parser.py',1275),
+  ('type_parameters -> < type_parameter_list1','type_parameters',2,'p_type_parameters','parser.py',1279),
+  ('type_parameter_list -> type_parameter','type_parameter_list',1,'p_type_parameter_list','parser.py',1283),
+  ('type_parameter_list -> type_parameter_list , type_parameter','type_parameter_list',3,'p_type_parameter_list','parser.py',1284),
+  ('type_parameter -> type_parameter_header','type_parameter',1,'p_type_parameter','parser.py',1291),
+  ('type_parameter -> type_parameter_header EXTENDS reference_type','type_parameter',3,'p_type_parameter','parser.py',1292),
+  ('type_parameter -> type_parameter_header EXTENDS reference_type additional_bound_list','type_parameter',4,'p_type_parameter','parser.py',1293),
+  ('additional_bound_list -> additional_bound','additional_bound_list',1,'p_additional_bound_list','parser.py',1302),
+  ('additional_bound_list -> additional_bound_list additional_bound','additional_bound_list',2,'p_additional_bound_list','parser.py',1303),
+  ('additional_bound -> & reference_type','additional_bound',2,'p_additional_bound','parser.py',1310),
+  ('type_parameter_list1 -> type_parameter1','type_parameter_list1',1,'p_type_parameter_list1','parser.py',1314),
+  ('type_parameter_list1 -> type_parameter_list , type_parameter1','type_parameter_list1',3,'p_type_parameter_list1','parser.py',1315),
+  ('type_parameter1 -> type_parameter_header >','type_parameter1',2,'p_type_parameter1','parser.py',1322),
+  ('type_parameter1 -> type_parameter_header EXTENDS reference_type1','type_parameter1',3,'p_type_parameter1','parser.py',1323),
+  ('type_parameter1 -> type_parameter_header EXTENDS reference_type additional_bound_list1','type_parameter1',4,'p_type_parameter1','parser.py',1324),
+  ('additional_bound_list1 -> additional_bound1','additional_bound_list1',1,'p_additional_bound_list1','parser.py',1333),
+  ('additional_bound_list1 -> additional_bound_list additional_bound1','additional_bound_list1',2,'p_additional_bound_list1','parser.py',1334),
+  ('additional_bound1 -> & reference_type1','additional_bound1',2,'p_additional_bound1','parser.py',1341),
+  ('type_declaration -> class_declaration','type_declaration',1,'p_type_declaration','parser.py',1347),
+  ('type_declaration -> interface_declaration','type_declaration',1,'p_type_declaration','parser.py',1348),
+  ('type_declaration -> enum_declaration','type_declaration',1,'p_type_declaration','parser.py',1349),
+  ('type_declaration -> annotation_type_declaration','type_declaration',1,'p_type_declaration','parser.py',1350),
+  ('type_declaration -> ;','type_declaration',1,'p_type_declaration2','parser.py',1354),
+  ('class_declaration -> class_header class_body','class_declaration',2,'p_class_declaration','parser.py',1358),
+  ('class_header -> class_header_name class_header_extends_opt class_header_implements_opt','class_header',3,'p_class_header','parser.py',1364),
+  ('class_header_name -> class_header_name1 type_parameters','class_header_name',2,'p_class_header_name','parser.py',1370),
+  ('class_header_name -> class_header_name1','class_header_name',1,'p_class_header_name','parser.py',1371),
+  ('class_header_name1 -> modifiers_opt CLASS NAME','class_header_name1',3,'p_class_header_name1','parser.py',1379),
+  ('class_header_extends_opt -> class_header_extends','class_header_extends_opt',1,'p_class_header_extends_opt','parser.py',1383),
+  ('class_header_extends_opt -> empty','class_header_extends_opt',1,'p_class_header_extends_opt','parser.py',1384),
+  ('class_header_extends -> EXTENDS class_type','class_header_extends',2,'p_class_header_extends','parser.py',1388),
+  ('class_header_implements_opt -> class_header_implements','class_header_implements_opt',1,'p_class_header_implements_opt','parser.py',1392),
+  ('class_header_implements_opt -> empty','class_header_implements_opt',1,'p_class_header_implements_opt','parser.py',1393),
+  ('class_header_implements -> IMPLEMENTS interface_type_list','class_header_implements',2,'p_class_header_implements','parser.py',1397),
+  ('interface_type_list -> interface_type','interface_type_list',1,'p_interface_type_list','parser.py',1401),
+  ('interface_type_list -> interface_type_list , interface_type','interface_type_list',3,'p_interface_type_list','parser.py',1402),
+  ('interface_type -> class_or_interface_type','interface_type',1,'p_interface_type','parser.py',1409),
+  ('class_body -> { class_body_declarations_opt }','class_body',3,'p_class_body','parser.py',1413),
+  ('class_body_declarations_opt -> class_body_declarations','class_body_declarations_opt',1,'p_class_body_declarations_opt','parser.py',1417),
+  ('class_body_declarations_opt -> empty','class_body_declarations_opt',1,'p_class_body_declarations_opt2','parser.py',1421),
+  ('class_body_declarations -> class_body_declaration','class_body_declarations',1,'p_class_body_declarations','parser.py',1425),
+  ('class_body_declarations -> class_body_declarations class_body_declaration','class_body_declarations',2,'p_class_body_declarations','parser.py',1426),
+  ('class_body_declaration -> class_member_declaration','class_body_declaration',1,'p_class_body_declaration','parser.py',1433),
+  ('class_body_declaration -> static_initializer','class_body_declaration',1,'p_class_body_declaration','parser.py',1434),
+  ('class_body_declaration -> constructor_declaration','class_body_declaration',1,'p_class_body_declaration','parser.py',1435),
+  ('class_body_declaration -> block','class_body_declaration',1,'p_class_body_declaration2','parser.py',1439),
+  ('class_member_declaration -> field_declaration','class_member_declaration',1,'p_class_member_declaration','parser.py',1443),
+  ('class_member_declaration -> class_declaration','class_member_declaration',1,'p_class_member_declaration','parser.py',1444),
+  ('class_member_declaration -> method_declaration','class_member_declaration',1,'p_class_member_declaration','parser.py',1445),
+  ('class_member_declaration -> interface_declaration','class_member_declaration',1,'p_class_member_declaration','parser.py',1446),
+  ('class_member_declaration -> enum_declaration','class_member_declaration',1,'p_class_member_declaration','parser.py',1447),
+  ('class_member_declaration -> annotation_type_declaration','class_member_declaration',1,'p_class_member_declaration','parser.py',1448),
+  ('class_member_declaration -> ;','class_member_declaration',1,'p_class_member_declaration2','parser.py',1452),
+  ('field_declaration -> modifiers_opt type variable_declarators ;','field_declaration',4,'p_field_declaration','parser.py',1456),
+  ('static_initializer -> STATIC block','static_initializer',2,'p_static_initializer','parser.py',1460),
+  ('constructor_declaration -> constructor_header method_body','constructor_declaration',2,'p_constructor_declaration','parser.py',1464),
+  ('constructor_header -> constructor_header_name formal_parameter_list_opt ) method_header_throws_clause_opt','constructor_header',4,'p_constructor_header','parser.py',1470),
+  ('constructor_header_name -> modifiers_opt type_parameters NAME (','constructor_header_name',4,'p_constructor_header_name','parser.py',1476),
+  ('constructor_header_name -> modifiers_opt NAME (','constructor_header_name',3,'p_constructor_header_name','parser.py',1477),
+  ('formal_parameter_list_opt -> formal_parameter_list','formal_parameter_list_opt',1,'p_formal_parameter_list_opt','parser.py',1484),
+  ('formal_parameter_list_opt -> empty','formal_parameter_list_opt',1,'p_formal_parameter_list_opt2','parser.py',1488),
+  ('formal_parameter_list -> formal_parameter','formal_parameter_list',1,'p_formal_parameter_list','parser.py',1492),
+  ('formal_parameter_list -> formal_parameter_list , formal_parameter','formal_parameter_list',3,'p_formal_parameter_list','parser.py',1493),
+  ('formal_parameter -> modifiers_opt type variable_declarator_id','formal_parameter',3,'p_formal_parameter','parser.py',1500),
+  ('formal_parameter -> modifiers_opt type ELLIPSIS variable_declarator_id','formal_parameter',4,'p_formal_parameter','parser.py',1501),
+  ('method_header_throws_clause_opt -> method_header_throws_clause','method_header_throws_clause_opt',1,'p_method_header_throws_clause_opt','parser.py',1508),
+  ('method_header_throws_clause_opt -> empty','method_header_throws_clause_opt',1,'p_method_header_throws_clause_opt','parser.py',1509),
+  ('method_header_throws_clause -> THROWS class_type_list','method_header_throws_clause',2,'p_method_header_throws_clause','parser.py',1513),
+  ('class_type_list -> class_type_elt','class_type_list',1,'p_class_type_list','parser.py',1517),
+  ('class_type_list -> class_type_list , class_type_elt','class_type_list',3,'p_class_type_list','parser.py',1518),
+  ('class_type_elt -> class_type','class_type_elt',1,'p_class_type_elt','parser.py',1525),
+  ('method_body -> { block_statements_opt }','method_body',3,'p_method_body','parser.py',1529),
+  ('method_declaration -> abstract_method_declaration','method_declaration',1,'p_method_declaration','parser.py',1533),
+  ('method_declaration -> method_header method_body','method_declaration',2,'p_method_declaration','parser.py',1534),
+  ('abstract_method_declaration -> method_header ;','abstract_method_declaration',2,'p_abstract_method_declaration','parser.py',1544),
+  ('method_header -> method_header_name formal_parameter_list_opt ) method_header_extended_dims method_header_throws_clause_opt','method_header',5,'p_method_header','parser.py',1551),
+  ('method_header_name -> modifiers_opt type_parameters type NAME (','method_header_name',5,'p_method_header_name','parser.py',1558),
+  ('method_header_name -> modifiers_opt type NAME (','method_header_name',4,'p_method_header_name','parser.py',1559),
+  ('method_header_extended_dims -> dims_opt','method_header_extended_dims',1,'p_method_header_extended_dims','parser.py',1566),
+  ('interface_declaration -> interface_header interface_body','interface_declaration',2,'p_interface_declaration','parser.py',1570),
+  ('interface_header -> interface_header_name interface_header_extends_opt','interface_header',2,'p_interface_header','parser.py',1577),
+  ('interface_header_name -> interface_header_name1 type_parameters','interface_header_name',2,'p_interface_header_name','parser.py',1582),
+  ('interface_header_name -> interface_header_name1','interface_header_name',1,'p_interface_header_name','parser.py',1583),
+  ('interface_header_name1 -> modifiers_opt INTERFACE NAME','interface_header_name1',3,'p_interface_header_name1','parser.py',1591),
+  ('interface_header_extends_opt -> interface_header_extends','interface_header_extends_opt',1,'p_interface_header_extends_opt','parser.py',1595),
+  ('interface_header_extends_opt -> empty','interface_header_extends_opt',1,'p_interface_header_extends_opt2','parser.py',1599),
+  ('interface_header_extends -> EXTENDS interface_type_list','interface_header_extends',2,'p_interface_header_extends','parser.py',1603),
+  ('interface_body -> { interface_member_declarations_opt }','interface_body',3,'p_interface_body','parser.py',1607),
+  ('interface_member_declarations_opt -> interface_member_declarations','interface_member_declarations_opt',1,'p_interface_member_declarations_opt','parser.py',1611),
+  ('interface_member_declarations_opt -> empty','interface_member_declarations_opt',1,'p_interface_member_declarations_opt2','parser.py',1615),
+  ('interface_member_declarations -> interface_member_declaration','interface_member_declarations',1,'p_interface_member_declarations','parser.py',1619),
+  ('interface_member_declarations -> interface_member_declarations interface_member_declaration','interface_member_declarations',2,'p_interface_member_declarations','parser.py',1620),
+  ('interface_member_declaration -> constant_declaration','interface_member_declaration',1,'p_interface_member_declaration','parser.py',1627),
+  ('interface_member_declaration -> abstract_method_declaration','interface_member_declaration',1,'p_interface_member_declaration','parser.py',1628),
+  ('interface_member_declaration -> class_declaration','interface_member_declaration',1,'p_interface_member_declaration','parser.py',1629),
+  ('interface_member_declaration -> interface_declaration','interface_member_declaration',1,'p_interface_member_declaration','parser.py',1630),
+  ('interface_member_declaration -> enum_declaration','interface_member_declaration',1,'p_interface_member_declaration','parser.py',1631),
+  ('interface_member_declaration -> annotation_type_declaration','interface_member_declaration',1,'p_interface_member_declaration','parser.py',1632),
+  ('interface_member_declaration -> ;','interface_member_declaration',1,'p_interface_member_declaration2','parser.py',1636),
+  ('constant_declaration -> field_declaration','constant_declaration',1,'p_constant_declaration','parser.py',1640),
+  ('enum_declaration -> enum_header enum_body','enum_declaration',2,'p_enum_declaration','parser.py',1644),
+  ('enum_header -> enum_header_name class_header_implements_opt','enum_header',2,'p_enum_header','parser.py',1650),
+  ('enum_header_name -> modifiers_opt ENUM NAME','enum_header_name',3,'p_enum_header_name','parser.py',1655),
+  ('enum_header_name -> modifiers_opt ENUM NAME type_parameters','enum_header_name',4,'p_enum_header_name','parser.py',1656),
+  ('enum_body -> { enum_body_declarations_opt }','enum_body',3,'p_enum_body','parser.py',1663),
+  ('enum_body -> { , enum_body_declarations_opt }','enum_body',4,'p_enum_body2','parser.py',1667),
+  ('enum_body -> { enum_constants , enum_body_declarations_opt }','enum_body',5,'p_enum_body3','parser.py',1671),
+  ('enum_body -> { enum_constants enum_body_declarations_opt }','enum_body',4,'p_enum_body4','parser.py',1675),
+  ('enum_constants -> enum_constant','enum_constants',1,'p_enum_constants','parser.py',1679),
+  ('enum_constants -> enum_constants , enum_constant','enum_constants',3,'p_enum_constants','parser.py',1680),
+  ('enum_constant -> enum_constant_header class_body','enum_constant',2,'p_enum_constant','parser.py',1687),
+  ('enum_constant -> enum_constant_header','enum_constant',1,'p_enum_constant','parser.py',1688),
+  ('enum_constant_header -> enum_constant_header_name arguments_opt','enum_constant_header',2,'p_enum_constant_header','parser.py',1695),
+  ('enum_constant_header_name -> modifiers_opt NAME','enum_constant_header_name',2,'p_enum_constant_header_name','parser.py',1700),
+  ('arguments_opt -> arguments','arguments_opt',1,'p_arguments_opt','parser.py',1704),
+  ('arguments_opt -> empty','arguments_opt',1,'p_arguments_opt2','parser.py',1708),
+  ('arguments -> ( argument_list_opt )','arguments',3,'p_arguments','parser.py',1712),
+  ('argument_list_opt -> argument_list','argument_list_opt',1,'p_argument_list_opt','parser.py',1716),
+  ('argument_list_opt -> empty','argument_list_opt',1,'p_argument_list_opt2','parser.py',1720),
+  ('argument_list -> expression','argument_list',1,'p_argument_list','parser.py',1724),
+  ('argument_list -> argument_list , expression','argument_list',3,'p_argument_list','parser.py',1725),
+  ('enum_body_declarations_opt -> enum_declarations','enum_body_declarations_opt',1,'p_enum_body_declarations_opt','parser.py',1732),
+  ('enum_body_declarations_opt -> empty','enum_body_declarations_opt',1,'p_enum_body_declarations_opt2','parser.py',1736),
+  ('enum_declarations -> ; class_body_declarations_opt','enum_declarations',2,'p_enum_body_declarations','parser.py',1740),
+  ('annotation_type_declaration -> annotation_type_declaration_header annotation_type_body','annotation_type_declaration',2,'p_annotation_type_declaration','parser.py',1744),
+  ('annotation_type_declaration_header -> annotation_type_declaration_header_name class_header_extends_opt class_header_implements_opt','annotation_type_declaration_header',3,'p_annotation_type_declaration_header','parser.py',1751),
+  ('annotation_type_declaration_header_name -> modifiers @ INTERFACE NAME','annotation_type_declaration_header_name',4,'p_annotation_type_declaration_header_name','parser.py',1757),
+  ('annotation_type_declaration_header_name -> modifiers @ INTERFACE NAME type_parameters','annotation_type_declaration_header_name',5,'p_annotation_type_declaration_header_name2','parser.py',1761),
+  ('annotation_type_declaration_header_name -> @ INTERFACE NAME type_parameters','annotation_type_declaration_header_name',4,'p_annotation_type_declaration_header_name3','parser.py',1765),
+  ('annotation_type_declaration_header_name -> @ INTERFACE NAME','annotation_type_declaration_header_name',3,'p_annotation_type_declaration_header_name4','parser.py',1769),
+  ('annotation_type_body -> { annotation_type_member_declarations_opt }','annotation_type_body',3,'p_annotation_type_body','parser.py',1773),
+  ('annotation_type_member_declarations_opt -> annotation_type_member_declarations','annotation_type_member_declarations_opt',1,'p_annotation_type_member_declarations_opt','parser.py',1777),
+  ('annotation_type_member_declarations_opt -> empty','annotation_type_member_declarations_opt',1,'p_annotation_type_member_declarations_opt2','parser.py',1781),
+  ('annotation_type_member_declarations -> annotation_type_member_declaration','annotation_type_member_declarations',1,'p_annotation_type_member_declarations','parser.py',1785),
+  ('annotation_type_member_declarations -> annotation_type_member_declarations annotation_type_member_declaration','annotation_type_member_declarations',2,'p_annotation_type_member_declarations','parser.py',1786),
+  ('annotation_type_member_declaration -> annotation_method_header ;','annotation_type_member_declaration',2,'p_annotation_type_member_declaration','parser.py',1793),
+  ('annotation_type_member_declaration -> constant_declaration','annotation_type_member_declaration',1,'p_annotation_type_member_declaration','parser.py',1794),
+  ('annotation_type_member_declaration -> constructor_declaration','annotation_type_member_declaration',1,'p_annotation_type_member_declaration','parser.py',1795),
+  ('annotation_type_member_declaration -> type_declaration','annotation_type_member_declaration',1,'p_annotation_type_member_declaration','parser.py',1796),
+  ('annotation_method_header -> annotation_method_header_name formal_parameter_list_opt ) method_header_extended_dims annotation_method_header_default_value_opt','annotation_method_header',5,'p_annotation_method_header','parser.py',1800),
+  ('annotation_method_header_name -> modifiers_opt type_parameters type NAME (','annotation_method_header_name',5,'p_annotation_method_header_name','parser.py',1807),
+  ('annotation_method_header_name -> modifiers_opt type NAME (','annotation_method_header_name',4,'p_annotation_method_header_name','parser.py',1808),
+  ('annotation_method_header_default_value_opt -> default_value','annotation_method_header_default_value_opt',1,'p_annotation_method_header_default_value_opt','parser.py',1815),
+  ('annotation_method_header_default_value_opt -> empty','annotation_method_header_default_value_opt',1,'p_annotation_method_header_default_value_opt','parser.py',1816),
+  ('default_value -> DEFAULT member_value','default_value',2,'p_default_value','parser.py',1820),
+  ('member_value -> conditional_expression_not_name','member_value',1,'p_member_value','parser.py',1824),
+  ('member_value -> name','member_value',1,'p_member_value','parser.py',1825),
+  ('member_value -> annotation','member_value',1,'p_member_value','parser.py',1826),
+  ('member_value -> member_value_array_initializer','member_value',1,'p_member_value','parser.py',1827),
+  ('member_value_array_initializer -> { member_values , }','member_value_array_initializer',4,'p_member_value_array_initializer','parser.py',1831),
+  ('member_value_array_initializer -> { member_values }','member_value_array_initializer',3,'p_member_value_array_initializer','parser.py',1832),
+  ('member_value_array_initializer -> { , }','member_value_array_initializer',3,'p_member_value_array_initializer2','parser.py',1836),
+  ('member_value_array_initializer -> { }','member_value_array_initializer',2,'p_member_value_array_initializer2','parser.py',1837),
+  ('member_values -> member_value','member_values',1,'p_member_values','parser.py',1841),
+  ('member_values -> member_values , member_value','member_values',3,'p_member_values','parser.py',1842),
+  ('annotation -> normal_annotation','annotation',1,'p_annotation','parser.py',1849),
+  ('annotation -> marker_annotation','annotation',1,'p_annotation','parser.py',1850),
+  ('annotation -> single_member_annotation','annotation',1,'p_annotation','parser.py',1851),
+  ('normal_annotation -> annotation_name ( member_value_pairs_opt )','normal_annotation',4,'p_normal_annotation','parser.py',1855),
+  ('annotation_name -> @ name','annotation_name',2,'p_annotation_name','parser.py',1859),
+  ('member_value_pairs_opt -> member_value_pairs','member_value_pairs_opt',1,'p_member_value_pairs_opt','parser.py',1863),
+  ('member_value_pairs_opt -> empty','member_value_pairs_opt',1,'p_member_value_pairs_opt2','parser.py',1867),
+  ('member_value_pairs -> member_value_pair','member_value_pairs',1,'p_member_value_pairs','parser.py',1871),
+  ('member_value_pairs -> member_value_pairs , member_value_pair','member_value_pairs',3,'p_member_value_pairs','parser.py',1872),
+  ('member_value_pair -> simple_name = member_value','member_value_pair',3,'p_member_value_pair','parser.py',1879),
+  ('marker_annotation -> annotation_name','marker_annotation',1,'p_marker_annotation','parser.py',1883),
+  ('single_member_annotation -> annotation_name ( single_member_annotation_member_value )','single_member_annotation',4,'p_single_member_annotation','parser.py',1887),
+  ('single_member_annotation_member_value -> member_value','single_member_annotation_member_value',1,'p_single_member_annotation_member_value','parser.py',1891),
+  ('compilation_unit -> package_declaration','compilation_unit',1,'p_compilation_unit','parser.py',1897),
+  ('compilation_unit -> package_declaration import_declarations','compilation_unit',2,'p_compilation_unit2','parser.py',1901),
+  ('compilation_unit -> package_declaration import_declarations type_declarations','compilation_unit',3,'p_compilation_unit3','parser.py',1905),
+  ('compilation_unit -> package_declaration type_declarations','compilation_unit',2,'p_compilation_unit4','parser.py',1909),
+  ('compilation_unit -> import_declarations','compilation_unit',1,'p_compilation_unit5','parser.py',1913),
+  ('compilation_unit -> type_declarations','compilation_unit',1,'p_compilation_unit6','parser.py',1917),
+  ('compilation_unit -> import_declarations type_declarations','compilation_unit',2,'p_compilation_unit7','parser.py',1921),
+  ('compilation_unit -> empty','compilation_unit',1,'p_compilation_unit8','parser.py',1925),
+  ('package_declaration -> package_declaration_name ;','package_declaration',2,'p_package_declaration','parser.py',1929),
+  ('package_declaration_name -> modifiers PACKAGE name','package_declaration_name',3,'p_package_declaration_name','parser.py',1936),
+  ('package_declaration_name -> PACKAGE name','package_declaration_name',2,'p_package_declaration_name','parser.py',1937),
+  ('import_declarations -> import_declaration','import_declarations',1,'p_import_declarations','parser.py',1944),
+  ('import_declarations -> import_declarations import_declaration','import_declarations',2,'p_import_declarations','parser.py',1945),
+  ('import_declaration -> single_type_import_declaration','import_declaration',1,'p_import_declaration','parser.py',1952),
+  ('import_declaration -> type_import_on_demand_declaration','import_declaration',1,'p_import_declaration','parser.py',1953),
+  ('import_declaration -> single_static_import_declaration','import_declaration',1,'p_import_declaration','parser.py',1954),
+  ('import_declaration -> static_import_on_demand_declaration','import_declaration',1,'p_import_declaration','parser.py',1955),
+  ('single_type_import_declaration -> IMPORT name ;','single_type_import_declaration',3,'p_single_type_import_declaration','parser.py',1959),
+  ('type_import_on_demand_declaration -> IMPORT name . * ;','type_import_on_demand_declaration',5,'p_type_import_on_demand_declaration','parser.py',1963),
+  ('single_static_import_declaration -> IMPORT STATIC name ;','single_static_import_declaration',4,'p_single_static_import_declaration','parser.py',1967),
+  ('static_import_on_demand_declaration -> IMPORT STATIC name . * ;','static_import_on_demand_declaration',6,'p_static_import_on_demand_declaration','parser.py',1971),
+  ('type_declarations -> type_declaration','type_declarations',1,'p_type_declarations','parser.py',1975),
+  ('type_declarations -> type_declarations type_declaration','type_declarations',2,'p_type_declarations','parser.py',1976),
+  ('goal -> PLUSPLUS compilation_unit','goal',2,'p_goal_compilation_unit','parser.py',1987),
+  ('goal -> MINUSMINUS expression','goal',2,'p_goal_expression','parser.py',1991),
+  ('goal -> * block_statement','goal',2,'p_goal_statement','parser.py',1995),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',2002),
+]
@@ -0,0 +1,180 @@
+'''
+Traverse an AST once, calling the handlers of several visitors as it goes.
+
+Walking the tree with SourceElement.accept() looks up the visit_ and leave_
+methods of the visitor by name at every node, and a separate walk is needed
+for every visitor. A Walker instead looks up the handlers once for each
+class of node it meets, and only calls the handlers a visitor actually
+defines. The defaults provided by Visitor (which visit everything and do
+nothing) are skipped.
+
+The order nodes are visited in, and which nodes are visited, is the same as
+for accept(), so each visitor sees exactly what it would have seen had it
+walked the tree on its own. The tree is walked using a stack rather than by
+recursion, so deeply nested code (such as a long chain of else ifs or string
+concatenations) can't exceed Python's recursion limit.
+
+iter_nodes() generates the nodes of a tree in the same order, for when
+there's no need to write a visitor.
+'''
+
+from .model import SourceElement, Try
+
+__all__ = ('Walker', 'walk', 'iter_nodes')
+
+# The handlers defined by each visitor class for each node class
+_handlers = {}
+
+# The actions held on the stack of nodes still to be walked
+_VISIT = 0
+_VISIT_ONLY = 1
+_LEAVE = 2
+
+
+def walk(tree, *visitors):
+    '''
+    Walk the tree once with all of the visitors given.
+    '''
+    Walker(visitors).walk(tree)
+
+
+class Walker(object):
+    '''
+    Walk an AST with several visitors at once.
+
+    Each visitor follows the same rules as for accept(): if its visit_
+    method for a node returns False, the visitor doesn't see any of the
+    node's children, although its leave_ method is still called for the node.
+    When none of the visitors want to see a node's children, they aren't
+    walked at all.
+    '''
+
+    def __init__(self, visitors):
+        '''
+        Initialise the Walker class.
+
+        Args:
+            visitors: The visitors to call while walking.
+        '''
+        self._visitors = tuple(visitors)
+        # Handlers for each node class, as a list of (visitor, visit, leave)
+        self._dispatch = {}
+
+    def walk(self, tree):
+        '''
+        Walk the tree, calling the handlers of each of the visitors.
+        '''
+        stack = []
+        if isinstance(tree, SourceElement):
+            stack.append((_VISIT, tree, self._visitors))
+        while stack:
+            action, node, active = stack.pop()
+            if action == _LEAVE:
+                for visitor, visit, leave in self._get_dispatch(
+                        node.__class__):
+                    if (leave != None) and (visitor in active):
+                        leave(visitor, node)
+            elif action == _VISIT_ONLY:
+                self._visit(node, active)
+            elif node.__class__ is Try:
+                # Follow Try.accept(), which walks the statements of the
+                # block (but not the block itself), only visits the catch
+                # clauses, and doesn't leave the try statement
+                inner = self._visit(node, active)
+                if node._finally:
+                    stack.append((_VISIT, node._finally, active))
+                for catch in reversed(node.catches):
+                    stack.append((_VISIT_ONLY, catch, active))
+                if inner:
+                    for statement in reversed(list(node.block)):
+                        stack.append((_VISIT, statement, inner))
+            else:
+                dispatch = self._get_dispatch(node.__class__)
+                inner = active
+                if dispatch:
+                    inner = self._visit(node, active)
+                    # Nothing needs doing on the way back up most nodes
+                    for visitor, visit, leave in dispatch:
+                        if leave != None:
+                            stack.append((_LEAVE, node, active))
+                            break
+                if inner:
+                    for child in reversed(_children(node)):
+                        stack.append((_VISIT, child, inner))
+
+    def _get_dispatch(self, node_class):
+        '''
+        Internal method, return the handlers for a node class, as a list
+        containing a (visitor, visit, leave) tuple for each visitor that
+        handles it.
+        '''
+        dispatch = self._dispatch.get(node_class)
+        if dispatch == None:
+            dispatch = []
+            for visitor in self._visitors:
+                key = (visitor.__class__, node_class)
+                handlers = _handlers.get(key)
+                if handlers == None:
+                    # Only look at the class, so that the default handlers
+                    # created by Visitor.__getattr__() aren't found
+                    name = node_class.__name__
+                    handlers = (
+                        getattr(visitor.__class__, 'visit_' + name, None),
+                        getattr(visitor.__class__, 'leave_' + name, None))
+                    _handlers[key] = handlers
+                if handlers != (None, None):
+                    dispatch.append((visitor, ) + handlers)
+            self._dispatch[node_class] = dispatch
+        return dispatch
+
+    def _visit(self, node, active):
+        '''
+        Internal method, call the visit_ handlers for a node, and return the
+        visitors in active that want to see the node's children.
+        '''
+        inner = active
+        for visitor, visit, leave in self._get_dispatch(node.__class__):
+            if (visit != None) and (visitor in active) and not visit(
+                    visitor, node):
+                inner = tuple(item for item in inner if item is not visitor)
+        return inner
+
+
+def iter_nodes(tree, type=None):
+    '''
+    Generate the nodes of a tree in the order they'd be visited.
+
+    Unlike accept(), every node is generated, including the catch clauses of
+    try statements and the blocks they contain.
+
+    Args:
+        tree: The tree to search.
+        type: If given, only nodes that are instances of this class (or
+            tuple of classes) are generated.
+    '''
+    stack = []
+    if isinstance(tree, SourceElement):
+        stack.append(tree)
+    while stack:
+        node = stack.pop()
+        if (type == None) or isinstance(node, type):
+            yield node
+        stack.extend(reversed(_children(node)))
+
+
+def _children(node):
+    '''
+    For internal use, return a list of the nodes held in the fields of a
+    node.
+    '''
+    children = []
+    for name in node._fields:
+        field = getattr(node, name)
+        if field:
+            if isinstance(field, (list, tuple)):
+                for element in field:
+                    if isinstance(element, SourceElement):
+                        children.append(element)
+            elif isinstance(field, SourceElement):
+                children.append(field)
+    return children
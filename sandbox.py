@@ -0,0 +1,151 @@
+# vim: et:ts=4:textwidth=80
+
+# Automark
+#
+# David Llewellyn-Jones
+# Liverpool John Moores University
+# 18/12/2014
+# Released under the GPL v.3. See the LICENSE file for more details.
+
+"""
+Provide isolated build folders so that submissions can be marked at the
+same time.
+
+Marking a submission writes its source, class files and any data files into
+a build folder, and some tasks remove files from it. Each submission is
+therefore given a sandbox folder of its own from a SandboxPool. Once the
+marking is complete the sandbox is returned to the pool, emptied by a
+background thread and reused for a later submission. When a sandbox is
+removed, the warm JVM server using it as its working directory (if any) is
+stopped.
+"""
+
+import os
+import shutil
+import threading
+
+from Queue import Queue
+from tempfile import mkdtemp
+from warmjvm import WarmJVM
+
+__all__ = ('SandboxPool')
+
+
+class SandboxPool(object):
+    """
+    Hand out empty build folders, tidying them up in the background once
+    they've been finished with.
+
+    Any files or folders in a sandbox named in the keep list (for example,
+    the compiled helper programs) survive the tidy up, so they only need to
+    be created once per sandbox.
+    """
+
+    # Files and folders left in place when a sandbox is tidied up
+    KEEP = ['tools']
+
+    def __init__(self, folder):
+        """
+        Initialise the SandboxPool class.
+
+        Attributes:
+            folder: Folder to create the sandbox folders in.
+        """
+        self._folder = folder
+        self._free = []
+        self._lock = threading.Lock()
+        self._dirty = Queue()
+        self._cleaner = None
+        self._cleaner_pid = None
+
+    def acquire(self):
+        """
+        Return the path of an empty sandbox folder for the sole use of the
+        caller, until it's passed to release().
+        """
+        with self._lock:
+            sandbox = None
+            if len(self._free) > 0:
+                sandbox = self._free.pop()
+        if sandbox == None:
+            if not os.path.exists(self._folder):
+                try:
+                    os.makedirs(self._folder)
+                except OSError:
+                    # Another process created it first
+                    pass
+            sandbox = mkdtemp(prefix='sandbox-', dir=self._folder)
+        return sandbox
+
+    def release(self, sandbox):
+        """
+        Return a sandbox folder to the pool.
+
+        The folder is tidied up by a background thread, so the caller can
+        move on straight away.
+        """
+        self._start_cleaner()
+        self._dirty.put(sandbox)
+
+    def wait(self):
+        """
+        Block until all of the released sandboxes have been tidied up.
+        """
+        if self._cleaner != None:
+            self._dirty.join()
+
+    def close(self):
+        """
+        Wait for the released sandboxes to be tidied up, then remove them.
+        """
+        self.wait()
+        with self._lock:
+            for sandbox in self._free:
+                SandboxPool._remove(sandbox)
+            self._free = []
+
+    @staticmethod
+    def _remove(sandbox):
+        """
+        For internal use, stop the warm JVM server using a sandbox, if
+        there is one, and remove the sandbox.
+        """
+        WarmJVM.shutdown(sandbox)
+        shutil.rmtree(sandbox, True)
+
+    def _start_cleaner(self):
+        """
+        For internal use, start the background thread that tidies the
+        sandboxes if it isn't already running in this process.
+        """
+        with self._lock:
+            if (self._cleaner == None) or (self._cleaner_pid != os.getpid()):
+                # Threads don't survive a fork, so there's one per process
+                self._dirty = Queue()
+                self._cleaner = threading.Thread(target=self._clean)
+                self._cleaner.daemon = True
+                self._cleaner_pid = os.getpid()
+                self._cleaner.start()
+
+    def _clean(self):
+        """
+        For internal use, tidy up released sandboxes and return them to the
+        free list.
+        """
+        while True:
+            sandbox = self._dirty.get()
+            try:
+                for name in os.listdir(sandbox):
+                    if name not in SandboxPool.KEEP:
+                        path = os.path.join(sandbox, name)
+                        if os.path.isdir(path) and not os.path.islink(path):
+                            shutil.rmtree(path, True)
+                        else:
+                            os.remove(path)
+                with self._lock:
+                    self._free.append(sandbox)
+            except OSError:
+                # Something's left that can't be removed, so don't reuse it
+                SandboxPool._remove(sandbox)
+            finally:
+                self._dirty.task_done()
@@ -0,0 +1,224 @@
+# vim: et:ts=4:textwidth=80
+
+# Automark
+#
+# David Llewellyn-Jones
+# Liverpool John Moores University
+# 18/12/2014
+# Released under the GPL v.3. See the LICENSE file for more details.
+
+"""
+Index the submissions in a marking folder in a single pass.
+
+The marking folder is listed once, and a Manifest of the zip archives and
+java files is built for every folder in it, so the submission for a student
+can be found without listing their folder again. Metadata folders
+(__MACOSX) are skipped entirely.
+
+If the scandir package is installed it's used to list the folders, since it
+avoids a separate stat() call for every file. Otherwise os.listdir() is
+used.
+"""
+
+import os
+
+from zipfile import ZipFile
+
+try:
+    from scandir import scandir
+except ImportError:
+    # Fall back to listing the folders using os.listdir()
+    scandir = None
+
+__all__ = ('SubmissionIndex', 'Manifest')
+
+
+class Manifest(object):
+    """
+    The zip archives and java files found in a folder and its subfolders, in
+    the order os.walk() would find them.
+    """
+
+    def __init__(self, folder):
+        """
+        Initialise the Manifest class.
+
+        Attributes:
+            folder: The folder the manifest is for.
+        """
+        self.folder = folder
+        self.archives = []
+        self.sources = []
+        self.archived = {}
+
+    @staticmethod
+    def scan(folder):
+        """
+        Return the manifest for a single folder.
+        """
+        return SubmissionIndex(folder).get('.')
+
+    def get_archive(self):
+        """
+        Return the last zip archive found, or an empty string if there
+        isn't one.
+        """
+        archive = ''
+        if len(self.archives) > 0:
+            archive = self.archives[-1]
+        return archive
+
+    def get_java_file(self):
+        """
+        Return the last java file found, or an empty string if there isn't
+        one.
+        """
+        java_file = ''
+        if len(self.sources) > 0:
+            java_file = self.sources[-1]
+        return java_file
+
+    def add_extracted(self, names):
+        """
+        Add the java files extracted from an archive into the folder, given
+        the names of the archive's contents.
+        """
+        for name in names:
+            self._add_member(name)
+
+    def add_archived(self, archive, names):
+        """
+        Add the java files held in an archive as though they'd been
+        extracted into the folder, without extracting them. Their contents
+        can be read from the archive using read_source().
+
+        Args:
+            archive: The zip archive.
+            names: The names of the archive's contents.
+        """
+        for name in names:
+            path = self._add_member(name)
+            if path != None:
+                self.archived[path] = [archive, name]
+
+    def read_source(self, path):
+        """
+        Return the contents of a java file held in an archive, given the path
+        it would have if it were extracted, or None if it isn't in an
+        archive.
+        """
+        source = None
+        if path in self.archived:
+            archive_file, name = self.archived[path]
+            with ZipFile(archive_file, 'r') as archive:
+                source = archive.read(name)
+        return source
+
+    def _add_member(self, name):
+        """
+        For internal use, add a java file from an archive to the sources,
+        given its name in the archive.
+
+        Returns the path of the file in the folder, or None if it isn't a
+        java file.
+        """
+        path = None
+        parts = name.split('/')
+        if (name.endswith('.java')) and ('__MACOSX' not in parts[:-1]):
+            path = os.path.join(self.folder, *parts)
+            if path not in self.sources:
+                self.sources.append(path)
+        return path
+
+
+class SubmissionIndex(object):
+    """
+    Manifests for every folder within a marking folder, built by listing
+    the marking folder once.
+    """
+
+    def __init__(self, marking_dir):
+        """
+        Initialise the SubmissionIndex class, listing the marking folder.
+
+        Attributes:
+            marking_dir: The folder to index.
+        """
+        self._marking_dir = marking_dir
+        self._manifests = {}
+        self._scan(marking_dir, '.', [])
+
+    def get(self, name):
+        """
+        Return the manifest for a folder, given its path relative to the
+        marking folder, or None if there's no such folder.
+        """
+        return self._manifests.get(name)
+
+    def get_names(self):
+        """
+        Return the paths of all of the folders, relative to the marking
+        folder.
+        """
+        return self._manifests.keys()
+
+    def _scan(self, folder, name, parents):
+        """
+        For internal use, add a folder and its subfolders to the index. Any
+        archives and java files found are added to the manifests of the
+        folder and its parents.
+        """
+        manifest = Manifest(folder)
+        self._manifests[name] = manifest
+        manifests = parents + [manifest]
+        subfolders = []
+        for entry_name, kind in SubmissionIndex._list(folder):
+            path = os.path.join(folder, entry_name)
+            if kind == 'folder':
+                if entry_name != '__MACOSX':
+                    subfolders.append(entry_name)
+            elif kind == 'link':
+                # As with os.walk(), links to folders aren't followed
+                pass
+            elif entry_name.endswith('.zip'):
+                for owner in manifests:
+                    owner.archives.append(path)
+            elif entry_name.endswith('.java'):
+                for owner in manifests:
+                    owner.sources.append(path)
+        for entry_name in subfolders:
+            subfolder_name = entry_name
+            if name != '.':
+                subfolder_name = os.path.join(name, entry_name)
+            self._scan(os.path.join(folder, entry_name), subfolder_name,
+                manifests)
+
+    @staticmethod
+    def _list(folder):
+        """
+        For internal use, return the names of the entries in a folder, and
+        whether each is a folder, a link to a folder or a file.
+        """
+        entries = []
+        try:
+            if scandir != None:
+                for entry in scandir(folder):
+                    kind = 'file'
+                    if entry.is_dir():
+                        kind = 'folder'
+                        if entry.is_symlink():
+                            kind = 'link'
+                    entries.append([entry.name, kind])
+            else:
+                for entry_name in os.listdir(folder):
+                    path = os.path.join(folder, entry_name)
+                    kind = 'file'
+                    if os.path.isdir(path):
+                        kind = 'folder'
+                        if os.path.islink(path):
+                            kind = 'link'
+                    entries.append([entry_name, kind])
+        except OSError:
+            # The folder can't be read, so is treated as empty
+            pass
+        return entries
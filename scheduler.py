@@ -0,0 +1,497 @@
+# vim: et:ts=4:textwidth=80
+
+# Automark
+#
+# David Llewellyn-Jones
+# Liverpool John Moores University
+# 18/12/2014
+# Released under the GPL v.3. See the LICENSE file for more details.
+
+"""
+Compile and execute many submissions at once from a single thread.
+
+By default each ExecCode submission is compiled and executed by a thread of
+its own. If ExecCode.scheduler is set to a Scheduler, submissions are
+instead handed to it. The scheduler starts the compiler and Java VM for up
+to a fixed number of submissions at a time, and uses select() to pass input
+to and collect output from all of them in a single thread. Submissions are
+still created and queried through the usual ExecCode methods.
+
+Each stage has its own time limit: the compiler is given
+Scheduler.compile_timeout seconds and the program the usual execution time
+limit. A submission can be cancelled at any point, in which case its
+process is killed and it completes with an internal error.
+"""
+
+import atexit
+import errno
+import os
+import select
+import threading
+
+from collections import deque
+from time import time
+from execcode import ExecCode, OutputBuffer, _monotonic
+
+__all__ = ('Scheduler')
+
+
+class Scheduler(object):
+    """
+    Run ExecCode submissions through their compilation and execution stages
+    from a single thread.
+    """
+
+    # The stages a submission passes through once it's been started
+    _COMPILING = 1
+    _EXECUTING = 2
+
+    # How often to check for processes that have closed their output but
+    # not yet exited, in seconds
+    _EXIT_POLL = 0.05
+
+    def __init__(self, max_running=8, compile_timeout=60.0):
+        """
+        Initialise the Scheduler class.
+
+        Attributes:
+            max_running: The maximum number of submissions to compile or
+                execute at the same time.
+            compile_timeout: Time limit for compiling a submission, in
+                seconds.
+        """
+        self.max_running = max(1, max_running)
+        self.compile_timeout = compile_timeout
+        self._waiting = deque()
+        self._running = []
+        self._cancelled = set()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._thread_pid = None
+        self._wakeup = None
+        self._closing = False
+
+    def submit(self, submission):
+        """
+        Queue an ExecCode.Submission to be compiled and executed.
+        """
+        with self._lock:
+            self._start_thread()
+            self._waiting.append(submission)
+        self._wake()
+
+    def cancel(self, submission):
+        """
+        Stop a submission that's waiting or in progress.
+        """
+        with self._lock:
+            self._cancelled.add(submission)
+        self._wake()
+
+    def close(self):
+        """
+        Wait for the submissions that have been queued to complete, then
+        stop the scheduler thread.
+        """
+        with self._lock:
+            thread = self._thread
+            if (thread == None) or (self._thread_pid != os.getpid()):
+                return
+            self._closing = True
+        self._wake()
+        thread.join()
+        with self._lock:
+            os.close(self._wakeup[0])
+            os.close(self._wakeup[1])
+            self._thread = None
+            self._closing = False
+
+    def _start_thread(self):
+        """
+        For internal use, start the scheduler thread if it isn't already
+        running in this process.
+        """
+        if (self._thread == None) or (self._thread_pid != os.getpid()):
+            # Threads don't survive a fork, so there's one per process
+            self._waiting = deque()
+            self._running = []
+            self._wakeup = os.pipe()
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread_pid = os.getpid()
+            self._thread.start()
+            atexit.register(self.close)
+
+    def _wake(self):
+        """
+        For internal use, interrupt the scheduler thread's wait so it
+        notices new or cancelled submissions.
+        """
+        try:
+            os.write(self._wakeup[1], 'x')
+        except OSError:
+            pass
+
+    def _run(self):
+        """
+        For internal use, the scheduler thread's main loop.
+        """
+        while True:
+            self._start_waiting()
+            with self._lock:
+                if self._closing and (len(self._running) == 0) and (
+                        len(self._waiting) == 0):
+                    break
+            readers = {self._wakeup[0]: None}
+            writers = {}
+            timeout = None
+            now = _monotonic()
+            for job in self._running:
+                for descriptor in job.readers:
+                    readers[descriptor] = job
+                if job.writer != None:
+                    writers[job.writer] = job
+                remaining = max(0.0, job.deadline - now)
+                if (len(job.readers) == 0) or job.killed:
+                    # Waiting for the process to exit
+                    remaining = min(remaining, Scheduler._EXIT_POLL)
+                if (timeout == None) or (remaining < timeout):
+                    timeout = remaining
+
+            try:
+                readable, writable, _ = select.select(
+                    readers.keys(), writers.keys(), [], timeout)
+            except select.error as error:
+                if error.args[0] != errno.EINTR:
+                    raise
+                readable = []
+                writable = []
+
+            for descriptor in writable:
+                writers[descriptor].write_input()
+            for descriptor in readable:
+                if descriptor == self._wakeup[0]:
+                    os.read(descriptor, 4096)
+                else:
+                    readers[descriptor].read_output(descriptor)
+
+            with self._lock:
+                cancelled = self._cancelled
+                self._cancelled = set()
+            for job in list(self._running):
+                if job.submission in cancelled:
+                    job.cancel()
+                self._advance(job)
+
+    def _start_waiting(self):
+        """
+        For internal use, start as many of the waiting submissions as there
+        is space for.
+        """
+        while len(self._running) < self.max_running:
+            with self._lock:
+                if len(self._waiting) == 0:
+                    break
+                submission = self._waiting.popleft()
+                cancelled = submission in self._cancelled
+                self._cancelled.discard(submission)
+            job = _Job(submission, self.compile_timeout)
+            try:
+                if cancelled:
+                    job.cancel()
+                    job.finish()
+                elif job.start():
+                    self._running.append(job)
+            except Exception:
+                # Don't leave anyone waiting for the submission
+                job.fail()
+
+    def _advance(self, job):
+        """
+        For internal use, move a submission on to its next stage if the
+        current one has finished.
+        """
+        try:
+            if not job.check_exited():
+                return
+            if job.stage == Scheduler._COMPILING:
+                if job.compiled():
+                    job.execute()
+                else:
+                    job.finish()
+            else:
+                job.executed()
+                job.finish()
+        except Exception:
+            # Don't leave anyone waiting for the submission
+            job.fail()
+        if job.finished:
+            self._running.remove(job)
+
+
+class _Job(object):
+    """
+    Internal class, the state of a submission being run by the scheduler.
+    """
+
+    def __init__(self, submission, compile_timeout):
+        """
+        Initialise the _Job class.
+        """
+        self.submission = submission
+        self.stage = None
+        self.process = None
+        self.readers = []
+        self.writer = None
+        self.deadline = 0
+        self.finished = False
+        self.killed = False
+        self._compile_timeout = compile_timeout
+        self._pending = ''
+        self._stdout = None
+        self._stderr = None
+        self._outputs = {}
+        self._execution_key = None
+        self._compile_key = None
+        self._cancelled = False
+
+    def start(self):
+        """
+        Start compiling the submission, unless the results can be reused
+        from a previous compilation or execution.
+
+        Returns False if the submission has already completed.
+        """
+        submission = self.submission
+        if ExecCode.execution_cache != None:
+            self._execution_key = submission._get_execution_key()
+            if submission._replay_execution(self._execution_key):
+                self.finish()
+                return False
+
+        compile_result, self._compile_key = submission._reuse_compiled(
+            submission._tempfolder, submission._tempsource)
+        if compile_result != None:
+            if submission._compiled(compile_result):
+                self.execute()
+            else:
+                self.finish()
+        elif ExecCode._which('javac') == None:
+            submission._compiled([False,
+                'Java compiler javac could not be found'])
+            self.execute()
+        else:
+            submission._set_submission_status('OK', 1, 0)
+            self.stage = Scheduler._COMPILING
+            self._start_process(ExecCode.Submission._javac_command(
+                submission._tempfolder, submission._tempsource),
+                self._compile_timeout, '')
+        return not self.finished
+
+    def execute(self):
+        """
+        Start executing the compiled submission.
+        """
+        submission = self.submission
+        self.stage = Scheduler._EXECUTING
+        if ExecCode._which('java') == None:
+            # The Java VM could not be found
+            print 'Java VM could not be found'
+            submission._executed([None, u'', u''])
+            self.finish()
+        else:
+            submission._time_start = submission._time_end = time()
+            self.process = ExecCode.Submission._start_program(
+                submission._tempfolder, submission._classname)
+            self._watch(submission._maxexectime, submission._input)
+
+    def compiled(self):
+        """
+        Record the result of the compilation.
+
+        Returns True if the submission compiled and is ready to execute.
+        """
+        submission = self.submission
+        output = self._stdout.getvalue()
+        result = self.process.returncode
+        if self._cancelled:
+            result = None
+        submission._compiler_finished(
+            submission._tempfolder, self._compile_key, result, output)
+        return submission._compiled([result, output]) and \
+            not self._cancelled
+
+    def executed(self):
+        """
+        Record the result of the execution.
+        """
+        submission = self.submission
+        output = self._stdout
+        error = self._stderr
+        result = self.process.returncode
+        if self._cancelled:
+            result = None
+        submission._executed([result,
+            submission._truncate(output, error)[0].decode('utf-8', 'replace'),
+            error.getvalue().decode('utf-8', 'replace')])
+
+    def finish(self):
+        """
+        Store the results of the execution if necessary, then wake up
+        anyone waiting for the submission.
+        """
+        submission = self.submission
+        if self._cancelled:
+            submission._set_submission_status('OK', 0, 20)
+        elif self._execution_key != None:
+            submission._store_execution(self._execution_key)
+        self.finished = True
+        submission._finish()
+
+    def fail(self):
+        """
+        Stop the submission after something went wrong, so that it
+        completes with an internal error.
+        """
+        self._kill()
+        self._close_pipes()
+        self.readers = []
+        self.writer = None
+        self.submission._set_submission_status('OK', 0, 20)
+        self.finished = True
+        self.submission._finish()
+
+    def cancel(self):
+        """
+        Stop the submission, killing its process if it has one.
+        """
+        self._cancelled = True
+        self._kill()
+
+    def write_input(self):
+        """
+        Pass the next chunk of input to the process.
+
+        No more than a writable pipe is guaranteed to have room for is
+        written, since blocking would hold up every other submission.
+        """
+        if self.writer == None:
+            # The process has been killed
+            return
+        try:
+            written = os.write(
+                self.writer, self._pending[:ExecCode._WRITE_SIZE])
+        except OSError as error:
+            if error.errno != errno.EPIPE:
+                raise
+            # The program isn't reading any more input
+            written = len(self._pending)
+        self._pending = self._pending[written:]
+        if len(self._pending) == 0:
+            # Closing stdin lets the program see the end of input
+            self.process.stdin.close()
+            self.writer = None
+
+    def read_output(self, descriptor):
+        """
+        Collect the next chunk of output from the process.
+        """
+        if descriptor not in self.readers:
+            # The process has been killed
+            return
+        data = os.read(descriptor, ExecCode._CHUNK_SIZE)
+        if len(data) == 0:
+            self.readers.remove(descriptor)
+        else:
+            self._outputs[descriptor].write(data)
+            if self._outputs[descriptor].truncated and (
+                    self.stage == Scheduler._EXECUTING):
+                # Too much!
+                self.submission._outputlimitexceeded = True
+                self._kill()
+
+    def check_exited(self):
+        """
+        Check whether the current stage's process has finished, killing it
+        if it's run out of time.
+
+        Returns True once the process has exited and all of its output has
+        been collected.
+        """
+        if self.process == None:
+            return False
+        if (_monotonic() >= self.deadline) and not self.killed:
+            # Too long!
+            if self.stage == Scheduler._EXECUTING:
+                self.submission._timelimitexceeded = True
+            self._kill()
+        if len(self.readers) > 0:
+            return False
+        pid, status, usage = ExecCode.Submission._wait4(self.process)
+        if pid == 0:
+            return False
+        if self.stage == Scheduler._EXECUTING:
+            self.submission._program_exited(self.process, status, usage)
+        else:
+            ExecCode.Submission._record_exit(self.process, status)
+        self._close_pipes()
+        return True
+
+    def _start_process(self, command, timeout, input):
+        """
+        For internal use, start a compiler process.
+        """
+        self.process = ExecCode.Submission._popen(command)
+        self._watch(timeout, input)
+
+    def _close_pipes(self):
+        """
+        For internal use, close the current process's pipes so their file
+        descriptors aren't left open until it's garbage collected.
+        """
+        if self.process != None:
+            for pipe in [self.process.stdin, self.process.stdout,
+                    self.process.stderr]:
+                if (pipe != None) and not pipe.closed:
+                    pipe.close()
+
+    def _watch(self, timeout, input):
+        """
+        For internal use, set up the input and output of the current
+        process and its deadline.
+        """
+        self.deadline = _monotonic() + timeout
+        self.killed = False
+        self.readers = [self.process.stdout.fileno()]
+        if self.process.stderr != None:
+            self.readers.append(self.process.stderr.fileno())
+        self._stdout = OutputBuffer(ExecCode.output_limit)
+        self._stderr = OutputBuffer(ExecCode.output_limit)
+        self._outputs = {self.readers[0]: self._stdout}
+        if len(self.readers) > 1:
+            self._outputs[self.readers[1]] = self._stderr
+        self._pending = input
+        if isinstance(self._pending, unicode):
+            self._pending = self._pending.encode('utf-8')
+        self.writer = None
+        if len(self._pending) > 0:
+            self.writer = self.process.stdin.fileno()
+        else:
+            self.process.stdin.close()
+
+    def _kill(self):
+        """
+        For internal use, kill the current process if it's still running.
+
+        Its output is no longer collected, since anything it started may
+        keep the pipes open.
+        """
+        if (self.process != None) and (self.process.returncode == None):
+            self.killed = True
+            self.readers = []
+            self.writer = None
+            try:
+                self.process.kill()
+            except OSError:
+                # It's already exited
+                pass
@@ -13,13 +13,34 @@ Load in a Java file and create various transformed copies of the code.
 The file is loaded in and either refactored or transformed in various ways. 
 Some of the transformations alter the semantics of the program to allow 
 it to be executed in the constrained Automark environment.
+
+Submissions made up of several files are combined into a single program for 
+compilation. The file containing main() is marked, and the classes from the 
+other files are appended to it.
 """
 
-from re import sub
+from contextlib import closing
+import threading
+
+from re import escape, match, search, sub
 from collections import namedtuple
+from cStringIO import StringIO
+from plyjext.model import ClassDeclaration, MethodDeclaration
 from plyjext.parser import Parser
 
-__all__ = ('load_source')
+__all__ = ('load_source', 'transform_source', 'parse_source', 
+    'declares_main', 'get_type_names', 'combine_sources')
+
+
+# The parser is created once, when the module is imported, using the tables 
+# generated in advance in the plyjext package. Worker processes inherit it. 
+# A parser can only parse one piece of code at a time, so threads take turns
+_parser = Parser()
+_parser_lock = threading.Lock()
+
+# ParseCache used to avoid parsing source that's been parsed before, or None 
+# to always parse
+parse_cache = None
 
 
 Program = namedtuple(
@@ -27,7 +48,7 @@ Program = namedtuple(
     'line_number', 'line_character_start'])
 
 
-def load_source(filename):
+def load_source(filename, source=None, program_tree=None):
     """
     Load a Java source file and refactor/transform it in various ways.
     
@@ -37,6 +58,11 @@ def load_source(filename):
     
     Args:
         filename: The Java program to load.
+        source: The contents of the Java program, if they've already been 
+            read, for example from a zip archive (optional). The file isn't 
+            read if this is provided.
+        program_tree: The AST for the program, if it's already been parsed 
+            by parse_source() (optional).
         
     Returns:
         The structure contains the code in various forms.
@@ -51,10 +77,224 @@ def load_source(filename):
             each line of code. These relate to the code after blank lines 
             have been removed.
     """
-    # Load in the program from file
-    full_program = ''
-    with open(filename) as file:
-        full_program = file.read()
+    full_program, program, line_number, line_character_start = \
+        _transform_lines(filename, source)
+
+    # Store a line-delimited version of the program 
+    program_lines = program.splitlines()
+    
+    # Store a AST version of the program
+    if program_tree == None:
+        program_tree = _parse(full_program)
+
+    # Store all of the various ways of interpreting the program code
+    program_structure = Program(
+        program, program_lines, full_program, program_tree, line_number, 
+        line_character_start)
+
+    return program_structure
+
+
+def transform_source(filename, source=None):
+    """
+    Load a Java source file and transform it ready for compilation.
+    
+    This performs the same transformations as load_source(), but without 
+    generating the AST, so is much quicker if only the code is needed.
+    
+    Args:
+        filename: The Java program to load.
+        source: The contents of the Java program, if they've already been 
+            read (optional).
+        
+    Returns:
+        Program as a single string with blank lines removed, and some 
+        imports switched to command-line alternatives.
+    """
+    return _transform_lines(filename, source)[1]
+
+
+def parse_source(filename, source=None):
+    """
+    Load a Java source file and generate its AST.
+    
+    Args:
+        filename: The Java program to load.
+        source: The contents of the Java program, if they've already been 
+            read (optional).
+        
+    Returns:
+        List containing the code and the AST for the code, which is None if 
+        the code couldn't be parsed.
+    """
+    if source == None:
+        with open(filename) as file:
+            source = file.read()
+    return [source, _parse(source)]
+
+
+def declares_main(program_tree, source):
+    """
+    Check whether an AST declares a top level class with a main() method.
+    
+    Args:
+        program_tree: AST for the code, as returned by parse_source().
+        source: The code. If it couldn't be parsed, this is searched for a 
+            main() method instead.
+        
+    Returns:
+        True if the code has a public static main() method that could be 
+        executed.
+    """
+    found = False
+    if program_tree == None:
+        found = search(r'public\s+static\s+void\s+main\s*\(', source) != None
+    else:
+        for declaration in program_tree.type_declarations:
+            if isinstance(declaration, ClassDeclaration):
+                for member in declaration.body or []:
+                    if isinstance(member, MethodDeclaration) and (
+                            member.name == 'main') and (
+                            'public' in member.modifiers) and (
+                            'static' in member.modifiers):
+                        found = True
+    return found
+
+
+def get_type_names(program_tree):
+    """
+    Return the names of the top level classes, interfaces and enums declared 
+    by an AST.
+    """
+    names = []
+    if program_tree != None:
+        for declaration in program_tree.type_declarations:
+            if hasattr(declaration, 'name'):
+                names.append(declaration.name)
+    return names
+
+
+def combine_sources(program, program_tree, companions):
+    """
+    Combine the files of a multi-file submission into a single program.
+    
+    The classes declared by the other files are appended to the program, 
+    and their imports moved to the start. Since the package lines are 
+    removed when the code is transformed, any imports of the submission's 
+    own packages are dropped, and the other files' top level classes have 
+    their public modifiers removed, as only one class in a file can be 
+    public.
+    
+    Args:
+        program: The transformed code of the file containing main(), as 
+            returned by transform_source().
+        program_tree: AST for the file containing main().
+        companions: List of [program, program_tree] pairs for the other 
+            files, which are transformed and parsed in the same way.
+        
+    Returns:
+        The code to compile.
+    """
+    if len(companions) == 0:
+        return program
+
+    packages = set()
+    for tree in [program_tree] + [tree for _, tree in companions]:
+        if (tree != None) and (tree.package_declaration != None):
+            packages.add(tree.package_declaration.name.value)
+
+    imports = ''
+    bodies = ''
+    for companion, tree in companions:
+        body = ''
+        for line in companion.splitlines(True):
+            if _is_import(line):
+                if not _imports_package(line, packages):
+                    imports += line
+            else:
+                body += line
+        for name in get_type_names(tree):
+            body = sub(r'\bpublic\s+((?:(?:abstract|final|strictfp)\s+)*'
+                r'(?:class|interface|enum)\s+' + escape(name) + r'\b)', 
+                r'\1', body, count=1)
+        bodies += '\n' + body
+
+    main = ''
+    for line in program.splitlines(True):
+        if not (_is_import(line) and _imports_package(line, packages)):
+            main += line
+    return imports + main + bodies
+
+
+def _parse(code):
+    """
+    Generate the AST for a piece of Java code.
+    
+    For internal use, returns None if the code couldn't be parsed. If the 
+    same code has been parsed before, the AST is taken from the parse cache 
+    if there is one.
+    """
+    cache_key = None
+    if parse_cache != None:
+        cache_key = parse_cache.get_key(code)
+        found, program_tree = parse_cache.get_tree(cache_key)
+        if found:
+            return program_tree
+    with _parser_lock:
+        program_tree = _parser.parse_string(code)
+    if cache_key != None:
+        parse_cache.put_tree(cache_key, program_tree)
+    return program_tree
+
+
+def _is_import(line):
+    """
+    Check whether a line of Java code is an import.
+    
+    For internal use by combine_sources().
+    """
+    return match(r'\s*import\s', line) != None
+
+
+def _imports_package(line, packages):
+    """
+    Check whether an import line imports from one of the given packages.
+    
+    For internal use by combine_sources().
+    """
+    imported = match(r'\s*import\s+(?:static\s+)?([\w.]+?)(?:\.\*)?\s*;', 
+        line)
+    found = False
+    if imported != None:
+        name = imported.group(1)
+        for package in packages:
+            if name.startswith(package + '.') or (name == package):
+                found = True
+    return found
+
+
+def _transform_lines(filename, source=None):
+    """
+    Load a Java source file and transform it a line at a time.
+    
+    For internal use, performs the line-based transformations needed by 
+    load_source() and transform_source().
+    
+    Args:
+        filename: The Java program to load.
+        source: The contents of the Java program, if they've already been 
+            read (optional).
+        
+    Returns:
+        List containing the original code, the transformed code, the 
+        original line number for each transformed line and the character 
+        index for the start of each transformed line.
+    """
+    # Load in the program from file, unless it's been provided
+    full_program = source
+    if full_program == None:
+        with open(filename) as file:
+            full_program = file.read()
 
     program = ""
     line_number = []
@@ -63,9 +303,9 @@ def load_source(filename):
     lines_read = 1
     lines_added = 0
     character_pos = 0
-    # Read in thee file a line at a time
-    with open(filename) as file:
-        for line in file.xreadlines():
+    # Read in thee program a line at a time
+    with closing(StringIO(full_program)) as file:
+        for line in file:
             # Remove the package identifier (it'll cause problems for 
             # compilation).
             if not line.startswith('package '):
@@ -92,17 +332,4 @@ def load_source(filename):
                     character_pos += len(line)
             lines_read += 1
 
-    # Store a line-delimited version of the program 
-    program_lines = program.splitlines()
-    
-    # Store a AST version of the program
-    parser = Parser()
-    program_tree = parser.parse_string(full_program)
-
-    # Store all of the various ways of interpreting the program code
-    program_structure = Program(
-        program, program_lines, full_program, program_tree, line_number, 
-        line_character_start)
-
-    return program_structure
-
+    return [full_program, program, line_number, line_character_start]
@@ -0,0 +1,243 @@
+# vim: et:ts=4:textwidth=80
+
+# Automark
+#
+# David Llewellyn-Jones
+# Liverpool John Moores University
+# 18/12/2014
+# Released under the GPL v.3. See the LICENSE file for more details.
+
+"""
+A local stand-in for a Sphere Engine style code execution server.
+
+Submissions sent by the remote backend (see backends.py) are compiled and
+executed locally using ExecCode, each in a sandbox folder of its own. This
+allows execution to be spread across several marking hosts, and the remote
+backend to be tested without access to Sphere Engine.
+
+The server speaks JSON over HTTP, with connections kept open between
+requests:
+
+    POST <prefix>/submissions/batch
+        Create the submissions in the request's 'submissions' list. Each
+        holds the same values as passed to createSubmission(), plus the class
+        name, the contents of any input files (base64 encoded, or null if
+        missing) and the names of any output files. Returns a link for each.
+    GET <prefix>/submissions?links=<link>,<link>,...
+        Return the status and result of each submission. Once a submission
+        has completed its details are included, along with the contents of
+        any output files, and the submission is forgotten.
+"""
+
+import base64
+import json
+import os
+import threading
+import urlparse
+import uuid
+
+from argparse import ArgumentParser
+from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from SocketServer import ThreadingMixIn
+from execcode import ExecCode
+from sandbox import SandboxPool
+from scheduler import Scheduler
+
+__all__ = ('StandInServer')
+
+
+class StandInServer(ThreadingMixIn, HTTPServer):
+    """
+    Serve requests to compile and execute submissions, each on a thread of
+    its own.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, build_dir, prefix=''):
+        """
+        Initialise the StandInServer class.
+
+        Attributes:
+            address: Host and port to listen on.
+            build_dir: Folder to create the sandboxes for the submissions in.
+            prefix: Path the requests are made relative to (optional).
+        """
+        HTTPServer.__init__(self, address, _RequestHandler)
+        self.prefix = prefix.rstrip('/')
+        self._sandboxes = SandboxPool(os.path.join(build_dir, 'sandboxes'))
+        self._submissions = {}
+        self._lock = threading.Lock()
+
+    def create_submission(self, request):
+        """
+        Start compiling and executing a submission in a sandbox of its own.
+
+        Returns the response for the submission, including its link.
+        """
+        sandbox = self._sandboxes.acquire()
+        try:
+            files = request.get('files') or {}
+            for name, contents in files.items():
+                if (contents != None) and (os.path.basename(name) == name):
+                    with open(os.path.join(sandbox, name), 'wb') as file:
+                        file.write(base64.b64decode(contents))
+            output_files = [name for name in request.get('outputFiles', [])
+                if os.path.basename(name) == name]
+            source_code = request['sourceCode']
+            if isinstance(source_code, unicode):
+                source_code = source_code.encode('utf-8')
+            execution = ExecCode(
+                sandbox, request['classname'], files.keys(), output_files)
+            execution.createSubmission(request.get('user', ''),
+                request.get('password', ''), source_code,
+                request.get('language', 10), request.get('input', ''),
+                request.get('run', True), request.get('private', True))
+        except (KeyError, IOError, OSError, TypeError) as error:
+            self._sandboxes.release(sandbox)
+            print 'Failed to create submission: {}'.format(error)
+            return {'error': 'INTERNAL_ERROR'}
+        link = uuid.uuid4().hex
+        with self._lock:
+            self._submissions[link] = [execution, sandbox, output_files]
+        return {'error': 'OK', 'link': link}
+
+    def get_submission(self, link):
+        """
+        Return the status of a submission, with its details and output files
+        if it's completed.
+        """
+        with self._lock:
+            entry = self._submissions.get(link)
+        if entry == None:
+            return {'error': 'PASTE_NOT_FOUND'}
+        execution, sandbox, output_files = entry
+        response = {}
+        for item in execution.getSubmissionStatus('', '', link)['item']:
+            response[item.key] = item.value
+        if response['status'] == 0:
+            details = execution.getSubmissionDetails(
+                '', '', link, False, False, True, True, True)
+            for item in details['item']:
+                response[item.key] = item.value
+                if isinstance(item.value, str):
+                    # The compiler output may not be valid UTF-8
+                    response[item.key] = item.value.decode('utf-8', 'replace')
+            response['files'] = {}
+            for name in output_files:
+                path = os.path.join(sandbox, name)
+                if os.path.exists(path):
+                    with open(path, 'rb') as file:
+                        response['files'][name] = base64.b64encode(
+                            file.read())
+            with self._lock:
+                del self._submissions[link]
+            self._sandboxes.release(sandbox)
+        return response
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """
+    Internal class, handle the requests made on a single connection.
+    """
+
+    # Keep connections open between requests
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        """
+        Handle a request to create submissions.
+        """
+        if self._get_path()[0] != '/submissions/batch':
+            self._reply(404, {'error': 'NOT_FOUND'})
+            return
+        try:
+            length = int(self.headers.getheader('content-length', 0))
+            request = json.loads(self.rfile.read(length))
+            submissions = request['submissions']
+        except (KeyError, TypeError, ValueError):
+            self._reply(400, {'error': 'BAD_REQUEST'})
+            return
+        self._reply(200, {'error': 'OK', 'submissions': [
+            self.server.create_submission(submission)
+            for submission in submissions]})
+
+    def do_GET(self):
+        """
+        Handle a request for the status of submissions.
+        """
+        path, query = self._get_path()
+        if path != '/submissions':
+            self._reply(404, {'error': 'NOT_FOUND'})
+            return
+        submissions = {}
+        for links in urlparse.parse_qs(query).get('links', []):
+            for link in links.split(','):
+                submissions[link] = self.server.get_submission(link)
+        self._reply(200, {'error': 'OK', 'submissions': submissions})
+
+    def log_message(self, format, *args):
+        """
+        Don't log every request, since there are many of them.
+        """
+        pass
+
+    def _get_path(self):
+        """
+        For internal use, return the path requested relative to the
+        server's prefix, and the query string.
+        """
+        parts = urlparse.urlsplit(self.path)
+        path = parts.path
+        if path.startswith(self.server.prefix):
+            path = path[len(self.server.prefix):]
+        return [path, parts.query]
+
+    def _reply(self, code, response):
+        """
+        For internal use, send a JSON response.
+        """
+        data = json.dumps(response)
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+# Run as a script, but skip this bit if the code is being imported
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description='Local stand-in for a Sphere Engine code execution '
+            'server.')
+    parser.add_argument(
+        '-p', '--port', metavar='PORT', type=int,
+        help='Port to listen on (default 8080)', default=8080)
+    parser.add_argument(
+        '--host', metavar='HOST', type=str,
+        help='Address to listen on (default localhost)',
+        default='localhost')
+    parser.add_argument(
+        '--prefix', metavar='PATH', type=str,
+        help='Path the API is served from (default /api)', default='/api')
+    parser.add_argument(
+        '-b', '--builddir', metavar='BUILD', type=str,
+        help='Folder to output build files to (default ./build-standin)',
+        default='./build-standin')
+    parser.add_argument(
+        '--in-flight', metavar='SUBMISSIONS', type=int,
+        help='Number of submissions to compile and execute at once, managed '
+            'from a single thread (default: a thread per submission)',
+        default=None)
+
+    # Apply these arguments
+    args = parser.parse_args()
+    if args.in_flight != None:
+        ExecCode.scheduler = Scheduler(args.in_flight)
+    server = StandInServer((args.host, args.port), args.builddir, args.prefix)
+    print 'Serving on http://{}:{:d}{}'.format(
+        args.host, args.port, server.prefix)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,126 @@
+# vim: et:ts=4:textwidth=80
+
+# Automark
+#
+# David Llewellyn-Jones
+# Liverpool John Moores University
+# 18/12/2014
+# Released under the GPL v.3. See the LICENSE file for more details.
+
+"""
+Remember how each student was marked, so unchanged students needn't be
+marked again.
+
+The state is held in an SQLite database. For each student it records a
+hash of their submission, the task they were marked against, the version
+of the marking code and settings used, and the rows output to the summary
+file. When marking is re-run, a student whose submission, task and marking
+version all match can have their previous rows reused.
+"""
+
+import cPickle
+import hashlib
+import inspect
+import os
+import sqlite3
+
+from time import time
+
+__all__ = ('MarkingState')
+
+
+class MarkingState(object):
+    """
+    An SQLite database recording the results of marking each student.
+    """
+
+    def __init__(self, filename):
+        """
+        Initialise the MarkingState class, creating the database if it
+        doesn't already exist.
+
+        Attributes:
+            filename: The file to store the database in.
+        """
+        folder = os.path.dirname(filename)
+        if (folder != '') and not os.path.exists(folder):
+            os.makedirs(folder)
+        self._connection = sqlite3.connect(filename)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS students ('
+                'username TEXT PRIMARY KEY, task INTEGER, version TEXT, '
+                'submission TEXT, rows BLOB, marked REAL)')
+
+    def get_rows(self, username, task, version, submission):
+        """
+        Return the rows output to the summary file when the student was
+        last marked.
+
+        Returns whether the student was marked with the same submission,
+        task and version, and if so the rows (which may be None if there
+        was nothing to mark).
+        """
+        found = False
+        rows = None
+        record = self._connection.execute(
+            'SELECT task, version, submission, rows FROM students '
+            'WHERE username = ?', (username, )).fetchone()
+        if (record != None) and (record[0] == task) and (
+                record[1] == version) and (record[2] == submission):
+            found = True
+            rows = cPickle.loads(str(record[3]))
+        return [found, rows]
+
+    def put_rows(self, username, task, version, submission, rows):
+        """
+        Record the rows output to the summary file for a student.
+        """
+        with self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO students VALUES (?, ?, ?, ?, ?, ?)',
+                (username, task, version, submission, sqlite3.Binary(
+                cPickle.dumps(rows, cPickle.HIGHEST_PROTOCOL)), time()))
+
+    def close(self):
+        """
+        Close the database.
+        """
+        self._connection.close()
+
+    @staticmethod
+    def hash_submission(manifest):
+        """
+        Return a hash of a student's submission, given the manifest of their
+        folder (see scanner.py).
+
+        If the folder contains any zip archives, only these are hashed, so
+        that the files extracted from them when marking don't change the
+        hash. Otherwise the java files are hashed.
+        """
+        key = hashlib.sha1()
+        for path in sorted(manifest.archives or manifest.sources):
+            key.update(os.path.relpath(path, manifest.folder) + '\0')
+            with open(path, 'rb') as file:
+                key.update(hashlib.sha1(file.read()).hexdigest())
+        return key.hexdigest()
+
+    @staticmethod
+    def hash_version(modules, files, settings):
+        """
+        Return a hash identifying the version of the marking code and the
+        settings used for marking.
+
+        Args:
+            modules: The python modules that affect the marks.
+            files: Other files that affect the marks or feedback, such as
+                the feedback template.
+            settings: A list of settings that affect the marks.
+        """
+        key = hashlib.sha1()
+        paths = [inspect.getsourcefile(module) for module in modules]
+        for path in paths + files:
+            with open(path, 'rb') as file:
+                key.update(hashlib.sha1(file.read()).hexdigest())
+        key.update(repr(settings))
+        return key.hexdigest()
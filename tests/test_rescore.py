@@ -0,0 +1,156 @@
+# vim: et:ts=4:textwidth=80
+
+# Automark
+#
+# David Llewellyn-Jones
+# Liverpool John Moores University
+# 18/12/2014
+# Released under the GPL v.3. See the LICENSE file for more details.
+
+"""
+Check that each task scores the same when rescored from its artifacts.
+
+Each task marks a small program (compiling and executing it with the local 
+backend), then the artifacts are pickled and unpickled, as they are by 
+batchmark's --collect and --rescore options, and used to score the program 
+again. The tests are skipped if javac can't be found.
+
+Run from the top folder using:
+
+    python -m unittest discover tests
+"""
+
+import cPickle
+import os
+import shutil
+import sys
+import unittest
+
+from distutils.spawn import find_executable
+from tempfile import mkdtemp
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import automarktask1
+import automarktask2
+import automarktask3
+import automarktask4
+
+# A program to mark, which echoes its input to stdout and to an output file 
+# (which task 3 expects). It also declares the account details that task 4 
+# looks for.
+PROGRAM = """import java.io.IOException;
+import java.io.PrintWriter;
+import java.util.Scanner;
+
+public class Program {
+    private static String accountName = "Alice";
+    private static String password = "secret";
+    private static String accountNumber = "12345";
+
+    // Echo each line of input
+    public static void main(String[] args) throws IOException {
+        Scanner scanner = new Scanner(System.in);
+        PrintWriter writer = new PrintWriter("output.txt");
+        while (scanner.hasNextLine()) {
+            String line = scanner.nextLine();
+            System.out.println(line);
+            writer.println(line);
+        }
+        writer.close();
+    }
+}
+"""
+
+# A program that echoes its input to stdout, but doesn't create an output 
+# file
+NO_OUTPUT_PROGRAM = """import java.util.Scanner;
+
+public class Program {
+    // Echo each line of input
+    public static void main(String[] args) {
+        Scanner scanner = new Scanner(System.in);
+        while (scanner.hasNextLine()) {
+            System.out.println(scanner.nextLine());
+        }
+    }
+}
+"""
+
+
+class RescoreTest(unittest.TestCase):
+    """
+    Mark a program for each task, then rescore it from the artifacts.
+    """
+
+    def setUp(self):
+        if find_executable('javac') == None:
+            self.skipTest('javac is needed to execute the programs')
+        self._folder = mkdtemp()
+        self._build_dir = os.path.join(self._folder, 'build')
+        os.makedirs(self._build_dir)
+        self._credentials_file = os.path.join(self._folder, 'credentials.txt')
+        with open(self._credentials_file, 'w') as file:
+            file.write('user\npassword\n')
+
+    def tearDown(self):
+        shutil.rmtree(self._folder, True)
+
+    def _check_rescore(self, task, drop_tree=False, program=PROGRAM):
+        """
+        Mark a program using the task module given, then check it gets the 
+        same results when rescored from the artifacts. If drop_tree is 
+        True, the AST is left out of the artifacts, as it is when it's too 
+        deeply nested to pickle.
+
+        Returns the results of the first marking.
+        """
+        filename = os.path.join(self._folder, 'Program.java')
+        with open(filename, 'w') as file:
+            file.write(program)
+
+        marks = task.Automark(
+            filename, self._credentials_file, self._build_dir)
+        artifacts = cPickle.loads(cPickle.dumps(
+            marks.get_artifacts(), cPickle.HIGHEST_PROTOCOL))
+        if drop_tree:
+            artifacts['program_structure'] = \
+                artifacts['program_structure']._replace(program_tree=None)
+        rescored = task.Automark(
+            filename, self._credentials_file, self._build_dir, artifacts)
+
+        self.assertEqual(marks.get_scores(), rescored.get_scores())
+        self.assertEqual(
+            marks.get_internal_stats(), rescored.get_internal_stats())
+        self.assertEqual(marks.get_output_checks(), rescored.get_output_checks())
+        self.assertEqual(
+            marks.get_execution_comments(), rescored.get_execution_comments())
+        self.assertEqual(marks.get_error_list(), rescored.get_error_list())
+        return marks
+
+    def test_task1(self):
+        self._check_rescore(automarktask1)
+
+    def test_task2(self):
+        self._check_rescore(automarktask2)
+
+    def test_task3(self):
+        self._check_rescore(automarktask3)
+
+    def test_task4(self):
+        self._check_rescore(automarktask4)
+
+    def test_without_tree(self):
+        self._check_rescore(automarktask2, True)
+
+    def test_task3_without_output_file(self):
+        marks = self._check_rescore(
+            automarktask3, program=NO_OUTPUT_PROGRAM)
+        # The output file checks fail, rather than the marking
+        self.assertFalse(marks.get_output_checks()[4])
+        self.assertIn("didn't create an output file", 
+            marks.get_execution_comments())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,6 +19,7 @@ This is a git push test.
 
 from re import search
 from plyjext.model import Visitor
+from plyjext.walker import walk
 
 __all__ = ('check_variable_name_quality')
 
@@ -43,7 +44,7 @@ def check_variable_name_quality(program, threshold):
     # Search the AST for any variable declarations
 	find_vars = Variable_Visitor()
 	if program.program_tree != None:
-		program.program_tree.accept(find_vars)
+		walk(program.program_tree, find_vars)
 	variable_short = 0
 	variable_enumeration = 0
 	
@@ -0,0 +1,221 @@
+# vim: et:ts=4:textwidth=80
+
+# Automark
+#
+# David Llewellyn-Jones
+# Liverpool John Moores University
+# 18/12/2014
+# Released under the GPL v.3. See the LICENSE file for more details.
+
+"""
+Compile and execute Java programs using a long-lived JVM.
+
+Starting a JVM is the most expensive part of compiling and executing a
+small program, and doing it locally requires two of them (javac and java).
+The WarmJVM class instead keeps a single JVM running the ExecServer helper
+from the java/tools folder. Source code is passed to it over a pipe,
+compiled in memory using the javax.tools compiler API and executed in a
+fresh class loader, with stdin and stdout redirected.
+
+The server runs with the build folder as its working directory, so one
+server is used per build folder. Any data files the program reads or writes
+should therefore be placed in the build folder, as with ExecCode. A server
+should be stopped using WarmJVM.shutdown() when its build folder is
+removed, as SandboxPool does, so that servers don't build up.
+"""
+
+import atexit
+import os
+import struct
+import threading
+
+from subprocess import PIPE, Popen
+from javatools import compile_helper, get_shim_jar
+
+__all__ = ('WarmJVM')
+
+
+class WarmJVM(object):
+    """
+    Client for a JVM running the ExecServer helper.
+
+    Use WarmJVM.get_server() to get the shared server for a build folder,
+    rather than creating instances directly.
+    """
+
+    # Commands understood by the server
+    _COMMAND_RUN = 1
+    _COMMAND_QUIT = 2
+
+    # Servers shared between submissions, keyed by build folder
+    _servers = {}
+    _servers_lock = threading.Lock()
+
+    def __init__(self, tempfolder):
+        """
+        Initialise the WarmJVM class.
+
+        Attributes:
+            tempfolder: The build folder to use as the working directory.
+        """
+        self._tempfolder = os.path.abspath(tempfolder)
+        self._helperfolder = os.path.join(self._tempfolder, 'tools')
+        self._lock = threading.Lock()
+        self._process = None
+
+    @classmethod
+    def get_server(cls, tempfolder):
+        """
+        Return the server for the given build folder, creating it if needed.
+        """
+        key = os.path.abspath(tempfolder)
+        with cls._servers_lock:
+            if key not in cls._servers:
+                cls._servers[key] = WarmJVM(key)
+            server = cls._servers[key]
+        return server
+
+    @classmethod
+    def shutdown(cls, tempfolder):
+        """
+        Stop the server for the given build folder, if there is one.
+        """
+        with cls._servers_lock:
+            server = cls._servers.pop(os.path.abspath(tempfolder), None)
+        if server != None:
+            server.close()
+
+    @classmethod
+    def shutdown_all(cls):
+        """
+        Stop all of the running servers.
+        """
+        with cls._servers_lock:
+            for server in cls._servers.values():
+                server.close()
+            cls._servers = {}
+
+    def run(self, classname, source, input, timeout, output_limit):
+        """
+        Compile and execute a program.
+
+        Args:
+            classname: The name of the class containing main().
+            source: The Java source code.
+            input: Text to pass to the program on stdin.
+            timeout: Time limit for the execution in seconds.
+            output_limit: The number of bytes of stdout and of stderr to 
+                keep. A program that writes more is stopped, and only the 
+                start and end of its output are returned.
+
+        Returns:
+            A list containing the ideone result code, the compiler output,
+            the program's stdout, the program's stderr, the time taken to 
+            execute in seconds and whether the output was truncated. None 
+            is returned if the server failed, in which case the program 
+            should be executed some other way.
+        """
+        with self._lock:
+            result = None
+            try:
+                if not self._is_running():
+                    self._start()
+                self._send_request(
+                    classname, source, input, timeout, output_limit)
+                result = self._read_response()
+            except (IOError, OSError, struct.error):
+                # The server has died, perhaps due to the program calling
+                # System.exit(). It'll be restarted next time
+                self._stop()
+        return result
+
+    def close(self):
+        """
+        Stop the server if it's running.
+        """
+        with self._lock:
+            if self._is_running():
+                try:
+                    self._process.stdin.write(
+                        struct.pack('>i', WarmJVM._COMMAND_QUIT))
+                    self._process.stdin.flush()
+                except IOError:
+                    pass
+            self._stop()
+
+    def _is_running(self):
+        """
+        For internal use, check whether the server process is alive.
+        """
+        return (self._process != None) and (self._process.poll() == None)
+
+    def _start(self):
+        """
+        For internal use, compile the helper if necessary and start it.
+        """
+        if not compile_helper('ExecServer', self._helperfolder):
+            raise OSError('Could not compile the ExecServer helper')
+
+        shim_jar = get_shim_jar(self._helperfolder)
+        self._process = Popen(
+            ['java', '-cp', self._helperfolder, 'ExecServer', shim_jar],
+            shell=False, cwd=self._tempfolder, stdin=PIPE, stdout=PIPE)
+
+    def _stop(self):
+        """
+        For internal use, kill the server process.
+        """
+        if self._process != None:
+            if self._process.poll() == None:
+                self._process.kill()
+            self._process.wait()
+            self._process = None
+
+    def _send_request(self, classname, source, input, timeout, output_limit):
+        """
+        For internal use, send a compile and execute request to the server.
+        """
+        request = struct.pack('>i', WarmJVM._COMMAND_RUN)
+        for value in [classname, source, input]:
+            if isinstance(value, unicode):
+                value = value.encode('utf-8')
+            request += struct.pack('>i', len(value)) + value
+        request += struct.pack('>ii', int(timeout * 1000), output_limit)
+        self._process.stdin.write(request)
+        self._process.stdin.flush()
+
+    def _read_response(self):
+        """
+        For internal use, read the server's response to a request.
+        """
+        result = self._read_int()
+        cmpinfo = self._read_string()
+        output = self._read_string()
+        stderr = self._read_string()
+        time = self._read_int() / 1000.0
+        truncated = self._read_int() != 0
+        return [result, cmpinfo, output, stderr, time, truncated]
+
+    def _read_bytes(self, length):
+        """
+        For internal use, read a fixed number of bytes from the server.
+        """
+        data = self._process.stdout.read(length)
+        if len(data) < length:
+            raise IOError('Server closed the connection')
+        return data
+
+    def _read_int(self):
+        """
+        For internal use, read a big-endian int from the server.
+        """
+        return struct.unpack('>i', self._read_bytes(4))[0]
+
+    def _read_string(self):
+        """
+        For internal use, read a length-prefixed UTF-8 string.
+        """
+        return self._read_bytes(self._read_int()).decode('utf-8')
+
+
+atexit.register(WarmJVM.shutdown_all)